@@ -33,6 +33,29 @@ def _parse_bool(value: str | None, default: bool) -> bool:
     return default
 
 
+def _parse_channel_pairs(value: str | None, default: tuple[str, ...]) -> tuple[str, ...]:
+    """ "FAM/HEX,CY5/HEX" -> ("FAM/HEX", "CY5/HEX"); geçersiz girdiler atlanır."""
+    if value is None or not value.strip():
+        return default
+    pairs: list[str] = []
+    for raw in value.split(","):
+        parts = [p.strip().upper() for p in raw.split("/")]
+        if len(parts) == 2 and all(parts) and parts[0] != parts[1]:
+            label = "/".join(parts)
+            if label not in pairs:
+                pairs.append(label)
+    return tuple(pairs) or default
+
+
+def _parse_int(value: str | None, default: int) -> int:
+    if value is None or not value.strip():
+        return default
+    try:
+        return max(int(value.strip()), 0)
+    except ValueError:
+        return default
+
+
 @dataclass(frozen=True, slots=True)
 class AppSettings:
     app_name: str = "pharmalizer"
@@ -47,6 +70,17 @@ class AppSettings:
     log_dir: Path = Path("logs")
     log_to_console: bool = True
 
+    # Multi-plate session: aktif olmayan plakaların eğri dizileri için bellek bütçesi
+    session_curve_budget_mb: int = 64
+    # Düşük bellek modu: categorical/float32 sonuç şeması, koordinat stringleri atılır
+    low_memory: bool = False
+    # Kalıcı analiz sonucu cache'i (0: kapalı)
+    result_cache_mb: int = 32
+    # Oturum arşivinde eğri kodlaması: 0 kayıpsız float32, 16 kuantize delta (~2x küçük, kayıplı)
+    session_curve_bits: int = 0
+    # Hedef/referans kanal çiftleri (ilki birincil); ek kanallar RDML'den okunur
+    channel_pairs: tuple[str, ...] = ("FAM/HEX",)
+
     @staticmethod
     def from_env() -> "AppSettings":
         env = Environment.parse(os.getenv("ENVIRONMENT"))
@@ -62,6 +96,12 @@ class AppSettings:
             default=(env != Environment.PRODUCTION),
         )
 
+        session_curve_budget_mb = _parse_int(os.getenv("SESSION_CURVE_BUDGET_MB"), 64)
+        result_cache_mb = _parse_int(os.getenv("RESULT_CACHE_MB"), 32)
+        session_curve_bits = _parse_int(os.getenv("SESSION_CURVE_BITS"), 0)
+        if session_curve_bits not in (0, 16):
+            session_curve_bits = 0
+
         return AppSettings(
             environment=env,
             warmup_enabled=warmup_enabled,
@@ -69,4 +109,9 @@ class AppSettings:
             log_level=log_level,
             log_dir=log_dir,
             log_to_console=log_to_console,
+            session_curve_budget_mb=session_curve_budget_mb,
+            low_memory=_parse_bool(os.getenv("LOW_MEMORY"), False),
+            result_cache_mb=result_cache_mb,
+            session_curve_bits=session_curve_bits,
+            channel_pairs=_parse_channel_pairs(os.getenv("CHANNEL_PAIRS"), ("FAM/HEX",)),
         )
@@ -41,6 +41,11 @@ class PCRGraphStyle:
     overlay_hover_width: float = 3.0 # Hover etkisi en üstte ve en kalın
     overlay_preview_width: float = 2.0
     overlay_roi_width: float = 1.0
+
+    # Çoklu plaka karşılaştırması (aktif plakanın altında)
+    compare_line_width: float = 1.0
+    compare_band_alpha: float = 0.22
+    compare_curve_budget: int = 1500  # görünümde tam çizilecek en fazla eğri (tüm plakalar)
     
     legend_frame_facecolor: str = COLOR_STYLES.PLOT_LEGEND_BG_HEX
     legend_frame_edgecolor: str = COLOR_STYLES.PLOT_GRID_HEX
@@ -32,6 +32,12 @@ class ColoredBoxController(QObject):
         self.cfg.carrier_threshold = float(v)
 
     def define_box_color(self):
-        df = DataStore.get_df_copy()
-        self.last_result = self.service.compute(df, self.cfg)
+        # Servis yalnızca okur; paylaşılan snapshot ve kuyu indeksi yeterli
+        snapshot = DataStore.get_snapshot()
+        self.last_result = self.service.compute(snapshot.df, self.cfg, snapshot.wells)
+        self.calculationCompleted.emit(self.last_result)
+
+    def apply_result(self, result):
+        """Worker'da hesaplanmış sonucu (AnalysisBundle.box_result) yayınlar."""
+        self.last_result = list(result)
         self.calculationCompleted.emit(self.last_result)
@@ -2,22 +2,40 @@
 # app/controllers/graph/graph_controller.py
 from __future__ import annotations
 
+import logging
+from typing import TYPE_CHECKING, Set
+
 from PyQt5.QtCore import QObject
+from PyQt5.QtWidgets import QComboBox, QMenu, QPushButton, QToolButton
 
+from app.services.curve_transforms import CURVE_MODE_LABELS, CurveMode
 from app.views.ui.ui import Ui_MainWindow
 from app.views.widgets.pcr_graph_view import PCRGraphView
 
+if TYPE_CHECKING:
+    from app.models.main_model import MainModel
+
+logger = logging.getLogger(__name__)
+
 
 class GraphController(QObject):
     """
-    PCR grafik görünürlüğünü checkbox'lar ile kontrol eden controller.
-    UI (checkbox) -> View (PCRGraphView) iletişimini üstlenir.
+    PCR grafik görünürlüğünü checkbox'lar, eğri gösterimini mod seçici, döngü oynatmayı
+    buton ile kontrol eden controller. UI (checkbox, combobox, buton) -> View (PCRGraphView)
+    iletişimini üstlenir. model verilirse açık diğer plakalar "Karşılaştır" menüsünden
+    aktif plakanın altına bindirilir.
     """
 
-    def __init__(self, ui: Ui_MainWindow, graph_view: PCRGraphView | None = None):
+    def __init__(self, ui: Ui_MainWindow, graph_view: PCRGraphView | None = None, model: "MainModel | None" = None):
         super().__init__()
         self.ui = ui
         self.graph_view = graph_view
+        self.model = model
+        # Karşılaştırmaya seçilen plakalar (run_id)
+        self._compare_ids: Set[str] = set()
+        self.curve_mode_combo = self._build_curve_mode_combo()
+        self.playback_button = self._build_playback_button()
+        self.compare_button = self._build_compare_button()
 
         self._connect_signals()
         self.reset_checkboxes()
@@ -25,6 +43,37 @@ class GraphController(QObject):
     def _connect_signals(self) -> None:
         self.ui.checkBox_FAM.toggled.connect(self._on_fam_toggled)
         self.ui.checkBox_HEX.toggled.connect(self._on_hex_toggled)
+        self.curve_mode_combo.currentIndexChanged.connect(self._on_curve_mode_changed)
+        self.playback_button.clicked.connect(self._on_playback_clicked)
+        self.compare_button.menu().aboutToShow.connect(self._populate_compare_menu)
+
+    def _build_curve_mode_combo(self) -> QComboBox:
+        """Mod seçici üretilen ui.py'ye dokunmadan kanal checkbox'larının yanına eklenir."""
+        combo = QComboBox(self.ui.centralwidget)
+        combo.setObjectName("comboBox_curve_mode")
+        combo.setStyleSheet("color: White; background-color: transparent;")
+        for mode, label in CURVE_MODE_LABELS.items():
+            combo.addItem(label, mode.value)
+        self.ui.horizontalLayout_2.addWidget(combo)
+        return combo
+
+    def _build_playback_button(self) -> QPushButton:
+        button = QPushButton("Oynat", self.ui.centralwidget)
+        button.setObjectName("pushButton_playback")
+        button.setStyleSheet("color: White; background-color: transparent;")
+        self.ui.horizontalLayout_2.addWidget(button)
+        return button
+
+    def _build_compare_button(self) -> QToolButton:
+        button = QToolButton(self.ui.centralwidget)
+        button.setObjectName("toolButton_compare")
+        button.setText("Karşılaştır")
+        button.setStyleSheet("color: White; background-color: transparent;")
+        button.setPopupMode(QToolButton.InstantPopup)
+        button.setMenu(QMenu(button))
+        button.setEnabled(self.model is not None)
+        self.ui.horizontalLayout_2.addWidget(button)
+        return button
 
     def set_graph_view(self, graph_view: PCRGraphView) -> None:
         """
@@ -32,6 +81,7 @@ class GraphController(QObject):
         """
         self.graph_view = graph_view
         self._sync_visibility()
+        self._on_curve_mode_changed(self.curve_mode_combo.currentIndex())
 
     def reset_checkboxes(self) -> None:
         """
@@ -47,6 +97,65 @@ class GraphController(QObject):
     def _on_hex_toggled(self, checked: bool) -> None:
         self._sync_visibility(hex_visible=bool(checked))
 
+    def _on_curve_mode_changed(self, index: int) -> None:
+        if self.graph_view is None or index < 0:
+            return
+        self.graph_view.set_curve_mode(CurveMode.parse(self.curve_mode_combo.itemData(index)))
+
+    def _populate_compare_menu(self) -> None:
+        """Menü her açılışta açık plakalardan kurulur (aktif plaka hariç)."""
+        menu = self.compare_button.menu()
+        menu.clear()
+        candidates = self.model.compare_candidates() if self.model is not None else []
+        if not candidates:
+            menu.addAction("Karşılaştırılacak başka plaka yok").setEnabled(False)
+            return
+        for run_id, label in candidates:
+            action = menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(run_id in self._compare_ids)
+            action.setToolTip(run_id)
+            action.toggled.connect(lambda checked, rid=run_id: self._on_compare_toggled(rid, checked))
+        menu.addSeparator()
+        clear = menu.addAction("Karşılaştırmayı temizle")
+        clear.setEnabled(bool(self._compare_ids))
+        clear.triggered.connect(self.clear_compare)
+
+    def _on_compare_toggled(self, run_id: str, checked: bool) -> None:
+        if checked:
+            self._compare_ids.add(run_id)
+        else:
+            self._compare_ids.discard(run_id)
+        self.refresh_compare()
+
+    def refresh_compare(self) -> None:
+        """
+        Seçili plakaları grafiğe yeniden bindirir; aktif olan ya da kapanan plakalar
+        seçimden düşer (plaka değişiminde çağrılır).
+        """
+        if self.graph_view is None or self.model is None:
+            return
+        available = {run_id for run_id, _ in self.model.compare_candidates()}
+        self._compare_ids &= available
+        if not self._compare_ids:
+            self.graph_view.clear_compare_plates()
+            return
+        ordered = [run_id for run_id in self.model.sessions.run_ids() if run_id in self._compare_ids]
+        self.graph_view.set_compare_plates(self.model.compare_stores(ordered))
+
+    def clear_compare(self) -> None:
+        self._compare_ids.clear()
+        if self.graph_view is not None:
+            self.graph_view.clear_compare_plates()
+
+    def _on_playback_clicked(self) -> None:
+        if self.graph_view is None:
+            return
+        if self.graph_view.playing:
+            self.graph_view.stop_playback()
+        else:
+            self.graph_view.play_run()
+
     def _sync_visibility(
         self,
         fam_visible: bool | None = None,
@@ -8,16 +8,21 @@ from app.controllers.app.export_controller import ExportController
 from app.controllers.well.well_edit_controller import WellEditController
 from app.controllers.table.table_controller import AppTableController
 from app.controllers.app.drag_drop_controller import DragDropController
+from app.services.analysis_bundle import AnalysisBundle
 from app.services.interaction_store import InteractionStore
 from app.services.pcr_data_service import PCRDataService
 from app.services.export.export_options import ExportOptions
-from app.services.data_store import DataStore
+from app.services.colored_box_service import ColoredBoxService
+from app.services.data_store import ChangeKind, DataChange, DataStore
+from app.services.regression_plot_service import RegressionPlotService
+from app.services.summary_engine import SUMMARY_COLUMNS
 from app.controllers.interaction.interaction_controller import InteractionController
 from app.views.main_view import MainView
 from app.models.main_model import MainModel
 from app.views.widgets.pcr_plate.pcr_plate_widget import PCRPlateWidget
 from app.views.widgets.regression_graph_view import RegressionGraphView
 from app.views.widgets.pcr_graph_view import PCRGraphView
+from app.views.widgets.threshold_sweep_view import ThresholdSweepView
 from app.controllers.graph.graph_controller import GraphController
 
 logger = logging.getLogger(__name__)
@@ -51,6 +56,7 @@ class MainController:
         self.graph_drawer: Optional[PCRGraphView] = None
         self.regression_graph_view: Optional[RegressionGraphView] = None
         self.plate_widget: Optional[PCRPlateWidget] = None
+        self.threshold_sweep_view: Optional[ThresholdSweepView] = None
 
         # Well managers
         self.referans_kuyu_manager: Optional[WellEditController] = None
@@ -87,6 +93,9 @@ class MainController:
         v.carrier_range_changed.connect(lambda val: self._validate_and_set_range(val, "carrier"))
         v.uncertain_range_changed.connect(lambda val: self._validate_and_set_range(val, "uncertain"))
         v.close_requested.connect(self._on_close_requested)
+        v.threshold_sweep_requested.connect(self._on_threshold_sweep_requested)
+        v.session_save_requested.connect(self._on_session_save_requested)
+        v.session_open_requested.connect(self._on_session_open_requested)
 
     def _wire_model_signals_once(self) -> None:
         if self._model_wired:
@@ -105,6 +114,9 @@ class MainController:
         m.analysis_error.connect(self.view.show_warning)
         m.analysis_summary_ready.connect(self._on_analysis_summary_ready)
 
+        # partial refresh on DataStore column edits
+        m.data_changed.connect(self._on_data_changed)
+
     def _disconnect_model_signals_safely(self) -> None:
         """
         Qt disconnect can throw if not connected; wrap safely.
@@ -137,6 +149,10 @@ class MainController:
             m.analysis_summary_ready.disconnect(self._on_analysis_summary_ready)
         except Exception:
             pass
+        try:
+            m.data_changed.disconnect(self._on_data_changed)
+        except Exception:
+            pass
 
         self._model_wired = False
 
@@ -162,7 +178,7 @@ class MainController:
         layout_graph.addWidget(self.graph_drawer)
 
         # Graph controller once; can swap graph view if needed, but we keep a single graph view.
-        self.graph_controller = GraphController(ui=self.view.ui, graph_view=self.graph_drawer)
+        self.graph_controller = GraphController(ui=self.view.ui, graph_view=self.graph_drawer, model=self.model)
 
         # Regression graph
         layout_reg = self.view.ensure_regression_graph_container()
@@ -278,8 +294,9 @@ class MainController:
         if self.graph_controller is not None:
             try:
                 self.graph_controller.reset_checkboxes()
+                self.graph_controller.clear_compare()
             except Exception:
-                logger.exception("GraphController.reset_checkboxes failed")
+                logger.exception("GraphController reset failed")
 
     def _safe_reset(self, obj) -> None:
         """
@@ -349,12 +366,37 @@ class MainController:
 
         if success:
             self.view.set_analyze_enabled(True)
-            self.model.import_rdml(rdml_path)
             self.model.set_file_name_from_rdml(file_name)
+            session = self.model.import_rdml(rdml_path)
             self.view.set_title_label(self.model.state.file_name)
+            self._show_session(session.analyzed)
         else:
             self.view.set_analyze_enabled(False)
 
+    def _show_session(self, analyzed: bool) -> None:
+        """
+        Plaka değişiminde görünümleri aktif oturuma göre yeniler: analizli plaka
+        yeniden analiz edilmeden geri yüklenir, diğerlerinde sonuç görünümleri sıfırlanır.
+        """
+        self.interaction_store.clear_selection()
+        self.interaction_store.set_hover(None)
+        if self.graph_controller is not None:
+            # Yeni aktif plaka karşılaştırmadan düşer; öncekinin yakalanan eğrileri kullanılır
+            self.graph_controller.refresh_compare()
+
+        if analyzed:
+            self._refresh_result_views(DataStore.get_snapshot().df)
+            self._refresh_live_summary()
+            return
+
+        self.view.reset_box_colors()
+        self.view.reset_summary_labels()
+        if self.regression_graph_view is not None:
+            try:
+                self.regression_graph_view.reset()
+            except Exception:
+                logger.exception("RegressionGraphView.reset failed")
+
     def _on_import_requested(self) -> None:
         if self._closing:
             return
@@ -384,6 +426,81 @@ class MainController:
             return
         self.model.run_analysis()
 
+    def _on_threshold_sweep_requested(self) -> None:
+        if self._closing:
+            return
+
+        try:
+            result = self.model.build_threshold_sweep()
+        except ValueError as e:
+            self.view.show_warning(str(e))
+            return
+        except Exception:
+            logger.exception("Threshold sweep failed")
+            self.view.show_warning("Eşik taraması sırasında beklenmeyen bir hata oluştu.")
+            return
+
+        if result is None:
+            self.view.show_warning("Eşik taraması için önce analiz yapılmalıdır.")
+            return
+
+        if self.threshold_sweep_view is None:
+            self.threshold_sweep_view = ThresholdSweepView(parent=self.view)
+        self.threshold_sweep_view.set_result(result)
+        self.threshold_sweep_view.show()
+        self.threshold_sweep_view.raise_()
+
+    def _on_session_save_requested(self) -> None:
+        if self._closing or not len(self.model.sessions):
+            return
+
+        path = self.view.select_session_save_path(self.model.state.file_name)
+        if not path:
+            return
+        try:
+            self.model.save_session(path, selection=self.interaction_store.selected_wells)
+        except (OSError, ValueError) as e:
+            self.view.show_warning(f"Oturum kaydedilemedi:\n{e}")
+        except Exception:
+            logger.exception("Session save failed")
+            self.view.show_warning("Oturum kaydedilirken beklenmeyen bir hata oluştu.")
+
+    def _on_session_open_requested(self) -> None:
+        if self._closing:
+            return
+
+        path = self.view.select_session_open_path()
+        if not path:
+            return
+        try:
+            session, selection = self.model.load_session(path)
+        except (OSError, ValueError) as e:
+            self.view.show_warning(f"Oturum açılamadı:\n{e}")
+            return
+        except Exception:
+            logger.exception("Session load failed")
+            self.view.show_warning("Oturum açılırken beklenmeyen bir hata oluştu.")
+            return
+
+        self.apply_loaded_session(session, selection)
+
+    def apply_loaded_session(self, session, selection) -> None:
+        """Yüklenen oturumun config, plaka ve seçimini görünümlere uygular."""
+        config = self.model.analysis_service.config
+        self.view.set_analysis_config(
+            float(config.carrier_range),
+            float(config.uncertain_range),
+            bool(config.checkbox_status),
+        )
+        if self.referans_kuyu_manager is not None:
+            self.referans_kuyu_manager.line_edit.setText(str(config.referance_well))
+
+        self.view.set_analyze_enabled(True)
+        self.view.set_title_label(self.model.state.file_name)
+        self.view.set_dragdrop_label(session.file_name or session.rdml_path)
+        self._show_session(session.analyzed)
+        self.interaction_store.set_selection(selection)
+
     def _on_stats_toggled(self, checked: bool) -> None:
         if self._closing:
             return
@@ -407,6 +524,7 @@ class MainController:
                 if val < self.model.get_uncertain_range():
                     self.model.set_carrier_range(val)
                     self.table_controller.set_carrier_range(val)
+                    self._refresh_colored_boxes_threshold(val)
                 else:
                     raise ValueError("Taşıyıcı aralığı belirsiz aralığından düşük olmalıdır.")
 
@@ -420,6 +538,8 @@ class MainController:
                 else:
                     raise ValueError("Belirsiz aralığı taşıyıcı aralığından yüksek olmalıdır.")
 
+            self._refresh_live_summary()
+
         except ValueError as e:
             self.view.show_warning(str(e))
         except Exception:
@@ -427,6 +547,19 @@ class MainController:
             logger.exception("Range validation/set failed")
             self.view.show_warning("Aralık ayarlanırken beklenmeyen bir hata oluştu.")
 
+    def _refresh_colored_boxes_threshold(self, carrier: float) -> None:
+        cb = self.model.colored_box_controller
+        cb.set_carrier_threshold(carrier)
+        # Analiz sonucu yoksa kutular başlangıç renginde kalsın
+        if self.model.summary_engine is not None:
+            cb.define_box_color()
+
+    def _refresh_live_summary(self) -> None:
+        """Eşik değişiminde özet etiketlerini O(log n) ile günceller."""
+        summary = self.model.build_live_summary()
+        if summary is not None:
+            self.view.update_summary_labels(summary)
+
     def _on_analysis_progress(self, percent: int, message: str) -> None:
         if self._closing:
             return
@@ -434,9 +567,10 @@ class MainController:
         # self.view.ui.statusbar.showMessage(f"{message} ({percent}%)")
         pass
 
-    def _on_async_analysis_finished(self, success: bool) -> None:
+    def _on_async_analysis_finished(self, success: bool, bundle: Optional[AnalysisBundle] = None) -> None:
         """
-        Keep this callback fast: update minimal required UI.
+        Keep this callback fast: view models arrive prebuilt in the bundle,
+        only models/items are swapped here.
         """
         if self._closing:
             return
@@ -445,6 +579,27 @@ class MainController:
             self.view.show_warning("Analiz başarısız oldu.")
             return
 
+        snapshot = DataStore.get_snapshot()
+        if bundle is None or bundle.version != snapshot.version:
+            # Oturum geçişi veya eski bundle: görünümler snapshot'tan kurulur
+            self._refresh_result_views(snapshot.df)
+            return
+
+        self.model.colored_box_controller.apply_result(bundle.box_result)
+
+        if self.table_controller is not None and bundle.table is not None:
+            try:
+                self.table_controller.set_table_frame(bundle.table)
+            except Exception:
+                logger.exception("set_table_frame failed")
+
+        if self.regression_graph_view is not None and bundle.regression is not None:
+            try:
+                self.regression_graph_view.render_data(bundle.regression)
+            except Exception:
+                logger.exception("RegressionGraphView.render_data failed")
+
+    def _refresh_result_views(self, df) -> None:
         # Color calc
         try:
             self.model.colored_box_controller.define_box_color()
@@ -458,19 +613,48 @@ class MainController:
             except Exception:
                 logger.exception("load_csv_to_table failed")
 
-        # Avoid heavy copying if possible; but keep compatibility with current DataStore API.
-        try:
-            df = DataStore.get_df_copy()
-        except Exception:
-            logger.exception("DataStore.get_df_copy failed")
-            df = None
-
+        # Immutable snapshot: shared read, no copy needed.
         if self.regression_graph_view is not None and df is not None:
             try:
                 self.regression_graph_view.update(df)
             except Exception:
                 logger.exception("RegressionGraphView.update failed")
 
+    def _on_data_changed(self, change: DataChange) -> None:
+        """
+        Only COLUMNS events are handled here; RESET/CLEAR are covered by the
+        analysis-finished and reset flows. Each consumer refreshes only when
+        a column it depends on was touched.
+        """
+        if self._closing or change.kind != ChangeKind.COLUMNS:
+            return
+
+        if self.table_controller is not None:
+            try:
+                self.table_controller.apply_data_change(change)
+            except Exception:
+                logger.exception("Table partial refresh failed")
+
+        if change.touches(ColoredBoxService.DEPENDS):
+            try:
+                self.model.colored_box_controller.define_box_color()
+            except Exception:
+                logger.exception("define_box_color failed")
+
+        if change.touches(SUMMARY_COLUMNS):
+            self.model.rebuild_summary_engine()
+            self._refresh_live_summary()
+
+        if self.regression_graph_view is not None and change.touches(RegressionPlotService.REQUIRED):
+            df = DataStore.get_snapshot().df
+            if df is not None:
+                try:
+                    self.regression_graph_view.update(df)
+                except Exception:
+                    logger.exception("RegressionGraphView.update failed")
+
+        # PCR curve cache is keyed on the coordinate columns' version; nothing to do here.
+
     def _on_analysis_summary_ready(self, summary) -> None:
         if self._closing:
             return
@@ -1,11 +1,13 @@
 # app\controllers\table\table_controller.py
 # app/controllers/table/table_controller.py
+import logging
+from typing import Optional, Tuple
+
 import pandas as pd
 
 from PyQt5.QtGui import QStandardItemModel
 
 from app.constants.table_config import (
-    CSV_FILE_HEADERS,
     DROPDOWN_COLUMN,
     DROPDOWN_OPTIONS,
     ITEM_STYLES,
@@ -13,12 +15,15 @@ from app.constants.table_config import (
     TABLE_WIDGET_HEADERS,
 )
 from app.controllers.table.table_interaction_controller import TableInteractionController
-from app.services.data_store import DataStore
+from app.services.analysis_bundle import table_frame
+from app.services.data_store import ChangeKind, DataChange, DataStore
 from app.services.pcr_data_service import PCRDataService
+from app.utils.pandas_utils import round_numeric
 from app.views.table.editable_table_model import EditableTableModel
 from app.views.table.drop_down_delegate import DropDownDelegate
 from app.views.table.table_view_widget import TableViewWidget
 
+logger = logging.getLogger(__name__)
 
 class AppTableController:
     """
@@ -76,33 +81,62 @@ class AppTableController:
     def set_carrier_range(self, val: float):
         self.carrier_range = float(val)
         if isinstance(self.table_model, EditableTableModel):
-            self.table_model.carrier_range = self.carrier_range
+            self.table_model.set_thresholds(self.carrier_range, self.uncertain_range)
 
     def set_uncertain_range(self, val: float):
         self.uncertain_range = float(val)
         if isinstance(self.table_model, EditableTableModel):
-            self.table_model.uncertain_range = self.uncertain_range
+            self.table_model.set_thresholds(self.carrier_range, self.uncertain_range)
+
+    def apply_data_change(self, change: DataChange) -> None:
+        """DataStore kolon olayını yalnızca görünen ve etkilenen hücrelere uygular."""
+        if change.kind != ChangeKind.COLUMNS or not isinstance(self.table_model, EditableTableModel):
+            return
+
+        snapshot = DataStore.get_snapshot()
+        if snapshot.empty:
+            return
+
+        for column in change.columns:
+            if column not in self.table_model.headers or column not in snapshot.df.columns:
+                continue
+            values = snapshot.df[column]
+            if column in self.round_columns:
+                values = self._rounded(values, self.round_columns[column], change.rows)
+            self.table_model.update_column(column, values, rows=change.rows)
+
+    @staticmethod
+    def _rounded(values: pd.Series, digits: int, rows: Optional[Tuple[int, ...]]) -> pd.Series:
+        """Yalnızca değişen satırları yuvarlar; rows None ise tüm kolon."""
+        if rows is None:
+            return round_numeric(values, digits)
+        positions = sorted({int(r) for r in rows if 0 <= int(r) < len(values)})
+        subset = values.iloc[positions]
+        rounded = round_numeric(subset, digits)
+        if not positions or rounded is subset:
+            return values
+        out = values.copy()
+        out.iloc[positions] = rounded.to_numpy()
+        return out
+
+    def _on_cell_edited(self, row: int, column: str, value) -> None:
+        # Tablo satır sırası snapshot ile aynıdır (Hasta No sıralı, reset_index)
+        try:
+            DataStore.set_cell(row, column, value)
+        except (ValueError, IndexError):
+            logger.exception("Tablo düzenlemesi DataStore'a yazılamadı")
 
     def load_csv_to_table(self):
-        df = DataStore.get_df_copy()
-        if df is None or df.empty:
+        snapshot = DataStore.get_snapshot()
+        if snapshot.empty:
             raise ValueError("No data loaded. DataStore is empty.")
 
-        df = self._round_columns(df)
-        df = self._filter_columns(df)
-        self._update_model(df)
-
-    def _round_columns(self, df):
-        for col, digits in self.round_columns.items():
-            if col in df.columns:
-                df[col] = df[col].apply(lambda x: round(x, digits) if pd.notna(x) else x)
-        return df
+        # Önce kolon seçimi: yeni frame copy-on-write, snapshot'a dokunulmaz
+        self._update_model(table_frame(snapshot.df))
 
-    def _filter_columns(self, df):
-        csv_headers = CSV_FILE_HEADERS
-        table_headers = TABLE_WIDGET_HEADERS
-        filtered_columns = [col for col in table_headers if col in csv_headers]
-        return df[filtered_columns]
+    def set_table_frame(self, df):
+        """Worker'da hazırlanmış görüntü frame'ini (AnalysisBundle.table) doğrudan basar."""
+        self._update_model(df)
 
     def _update_model(self, df):
         if self.dropdown_column not in df.columns:
@@ -126,6 +160,7 @@ class AppTableController:
                 carrier_range=self.carrier_range,
                 uncertain_range=self.uncertain_range,
             )
+            self.table_model.cellEdited.connect(self._on_cell_edited)
             self.table_widget.setModel(self.table_model)
             if self.table_interaction is not None:
                 self.table_interaction.attach_selection_model()
@@ -1,19 +1,35 @@
 # app\models\main_model.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 from PyQt5.QtCore import QObject, QThread, pyqtSignal
 
 from app.controllers.analysis.colored_box_controller import ColoredBoxController
-from app.services.analysis_service import AnalysisService
+from app.services.analysis_bundle import AnalysisBundle
+from app.services.analysis_service import ALGORITHM_VERSION, OVERRIDE_COL, AnalysisService
+from app.services.analysis_steps.channel_pairs import channels_of, parse_pairs
+from app.services.history.history_service import HistoryService
 from app.services.rdml_service import RDMLService
-from app.services.data_store import DataStore
+from app.services.curve_archive import CurveArchive
+from app.services.curve_store import CurveStore
+from app.services.data_store import ChangeKind, DataChange, DataStore
 from app.services.pcr_data_service import PCRDataService
+from app.services.result_cache import ResultCache
+from app.services.analysis_summary import AnalysisSummary
+from app.services.session_archive import ArchivedPlate, SessionArchive, SessionArchiveData
+from app.services.session_store import DEFAULT_CURVE_BUDGET_BYTES, PlateSession, SessionStore
+from app.services.summary_engine import SummaryEngine
+from app.services.threshold_sweep import ThresholdSweepResult, ThresholdSweepService
 from app.models.workers.analysis_worker import AnalysisWorker
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class MainState:
@@ -29,25 +45,49 @@ class MainModel(QObject):
 
     analysis_busy = pyqtSignal(bool)
     analysis_progress = pyqtSignal(int, str)
-    analysis_finished = pyqtSignal(bool)
+    analysis_finished = pyqtSignal(bool, object)  # (success, AnalysisBundle_or_none)
     analysis_summary_ready = pyqtSignal(object)
     analysis_error = pyqtSignal(str)
-
-    def __init__(self):
+    # DataStore olayları hangi thread'den gelirse gelsin UI thread'ine kuyruklanır
+    data_changed = pyqtSignal(object)
+
+    def __init__(
+        self,
+        curve_budget_bytes: int = DEFAULT_CURVE_BUDGET_BYTES,
+        curve_archive: Optional[CurveArchive] = None,
+        low_memory: bool = False,
+        result_cache: Optional[ResultCache] = None,
+        history: Optional[HistoryService] = None,
+        session_curve_bits: int = 0,
+        channel_pairs: Sequence[str] = ("FAM/HEX",),
+    ):
         super().__init__()
 
         self.state = MainState()
         self.rdml_df: Optional[pd.DataFrame] = None
+        self.summary_engine: Optional[SummaryEngine] = None
+        # Aktif sonucun cache anahtarı; Nihai Sonuç düzenlemeleri buna kaydedilir
+        self.result_key: Optional[str] = None
 
         self.colored_box_controller = ColoredBoxController()
-        self.analysis_service = AnalysisService()
+        self.result_cache = result_cache
+        self.history = history
+        # Oturum dosyasında eğri kodlaması (0: kayıpsız, 16: CurveCodec)
+        self.session_curve_bits = session_curve_bits
+        self.analysis_service = AnalysisService(result_cache=result_cache)
+        self.analysis_service.set_channel_pairs(channel_pairs)
         self.data_manager = PCRDataService()
+        # Açılan plakalar; tekrar bırakılan dosya yeniden ayrıştırılmaz.
+        # Bütçeyi aşan eğriler arşive (diske eşlenmiş) taşınır.
+        self.sessions = SessionStore(curve_budget_bytes, archive=curve_archive, lean=low_memory)
 
         # Thread-per-analysis state
         self._analysis_thread: Optional[QThread] = None
         self._worker: Optional[AnalysisWorker] = None
         self._busy = False
 
+        DataStore.subscribe(self._on_data_store_changed)
+
     # ---------------- State ----------------
     def set_file_name_from_rdml(self, file_name: str) -> None:
         if file_name.lower().endswith(".rdml"):
@@ -56,15 +96,168 @@ class MainModel(QObject):
 
     def reset_data(self) -> None:
         DataStore.clear()
+        self.sessions.clear()
         self.rdml_df = None
+        self.summary_engine = None
+        self.result_key = None
         self.state.rdml_path = ""
 
-    def import_rdml(self, file_path: str) -> None:
-        df = RDMLService.rdml_to_dataframe(file_path)
-        DataStore.set_df(df)
-        PCRDataService.clear_cache()
-        self.rdml_df = df
+    def import_rdml(self, file_path: str) -> PlateSession:
+        """
+        Daha önce açılmış plaka ise oturumundan O(1) geri yüklenir (ayrıştırma yok);
+        değilse RDML okunur ve yeni oturum açılır.
+        """
+        self._capture_active_session()
+
+        run_id = SessionStore.run_id_for(file_path)
+        session = self.sessions.get(run_id)
+        if session is None:
+            df = RDMLService.rdml_to_dataframe(file_path, self._extra_rdml_channels())
+            session = self.sessions.add(run_id, df, rdml_path=file_path, file_name=self.state.file_name)
+        self._publish_session(session)
         self.state.rdml_path = file_path
+        return session
+
+    def _extra_rdml_channels(self) -> Tuple[str, ...]:
+        """İkincil kanal çiftlerinin FAM/HEX dışındaki kanalları (import sırasında okunur)."""
+        channels = channels_of(parse_pairs(self.analysis_service.config.channel_pairs))
+        return tuple(ch for ch in channels if ch not in ("FAM", "HEX"))
+
+    def _publish_session(self, session: PlateSession) -> None:
+        """Plakayı aktif yapar ve DataStore'a yayınlar; eğriler varsa yeniden ayrıştırılmaz."""
+        self.sessions.activate(session.run_id)
+        snapshot = DataStore.set_df(session.df)
+        PCRDataService.clear_cache()
+        if session.curves is not None:
+            PCRDataService.adopt_store(session.curves, snapshot)
+
+        self.summary_engine = session.summary_engine
+        self.result_key = session.result_key
+        self.rdml_df = session.df
+        self.state.rdml_path = session.rdml_path
+
+    # ---------------- Session archive ----------------
+    def save_session(self, path: str, *, selection: Iterable[str] = ()) -> None:
+        """Açık tüm plakaları (eğriler, sonuçlar, config, düzeltmeler, seçim) tek dosyaya yazar."""
+        self._capture_active_session()
+        if not len(self.sessions):
+            raise ValueError("Kaydedilecek plaka yok.")
+
+        plates = []
+        for run_id in self.sessions.run_ids():
+            session = self.sessions.get(run_id)
+            curves = session.curves
+            if curves is None and session.analyzed and session.has_coordinates:
+                curves = CurveStore.from_frame(session.df, version=0)
+            overrides = {}
+            if self.result_cache is not None and session.result_key:
+                overrides = self.result_cache.overrides(session.result_key)
+            plates.append(
+                ArchivedPlate(
+                    run_id=run_id,
+                    rdml_path=session.rdml_path,
+                    file_name=session.file_name,
+                    df=session.df,
+                    curves=curves,
+                    result_key=session.result_key,
+                    input_key=session.input_key,
+                    analyzed=session.analyzed,
+                    overrides=overrides,
+                )
+            )
+
+        SessionArchive.save(
+            path,
+            SessionArchiveData(
+                plates=tuple(plates),
+                active_id=self.sessions.active_id,
+                config=self.analysis_service.config_fields(),
+                selection=tuple(sorted(selection)),
+            ),
+            curve_bits=self.session_curve_bits or None,
+        )
+
+    def load_session(self, path: str) -> tuple[PlateSession, Tuple[str, ...]]:
+        """
+        Arşivdeki plakaları oturumlara yükler ve aktif plakayı yayınlar.
+        Dönüş: (aktif oturum, kaydedilen seçim). Config analiz servisine uygulanır.
+        """
+        data = SessionArchive.load(path)
+        if not data.plates:
+            raise ValueError("Oturum dosyasında plaka yok.")
+
+        DataStore.clear()
+        self.sessions.clear()
+        for plate in data.plates:
+            self.sessions.add(
+                plate.run_id,
+                plate.df,
+                rdml_path=plate.rdml_path,
+                file_name=plate.file_name,
+                input_key=plate.input_key,
+            )
+            self.sessions.capture(
+                plate.run_id,
+                None,
+                summary_engine=SummaryEngine.from_df(plate.df) if plate.analyzed else None,
+                curves=plate.curves,
+                result_key=plate.result_key,
+            )
+            if self.result_cache is not None and plate.result_key:
+                for well_id, value in plate.overrides.items():
+                    self.result_cache.set_override(plate.result_key, well_id, value)
+
+        config = self.analysis_service.config
+        for name, value in data.config.items():
+            if hasattr(config, name):
+                setattr(config, name, value)
+
+        active = self.sessions.get(data.active_id) if data.active_id else None
+        active = active or self.sessions.get(self.sessions.run_ids()[-1])
+        self._publish_session(active)
+        self.state.file_name = active.file_name
+        return active, data.selection
+
+    def compare_candidates(self) -> List[Tuple[str, str]]:
+        """Aktif plaka dışındaki açık plakalar: (run_id, etiket), en eskiden en yeniye."""
+        out = []
+        for run_id in self.sessions.run_ids():
+            session = self.sessions.get(run_id)
+            if run_id == self.sessions.active_id or session is None:
+                continue
+            out.append((run_id, session.file_name or os.path.basename(session.rdml_path) or run_id))
+        return out
+
+    def compare_stores(self, run_ids: Iterable[str]) -> Dict[str, CurveStore]:
+        """Karşılaştırma için etiket -> CurveStore; aktif ve eğrisi olmayan plakalar atlanır."""
+        labels = dict(self.compare_candidates())
+        out: Dict[str, CurveStore] = {}
+        for run_id in run_ids:
+            if run_id not in labels:
+                continue
+            try:
+                store = self.sessions.curves_for(run_id)
+            except (OSError, ValueError):
+                logger.exception("Karşılaştırma eğrileri okunamadı: %s", run_id)
+                continue
+            if store is None:
+                continue
+            label = labels[run_id]
+            out[run_id if label in out else label] = store
+        return out
+
+    def _capture_active_session(self) -> None:
+        """Aktif plakanın düzenlemelerini, analizini ve eğrilerini oturumuna yazar."""
+        run_id = self.sessions.active_id
+        if run_id is None:
+            return
+        self.sessions.capture(
+            run_id,
+            DataStore.get_df(),
+            summary_engine=self.summary_engine,
+            curves=PCRDataService.peek_curve_store(),
+            result_key=self.result_key,
+        )
 
     # ---------------- Analysis (thread-per-run) ----------------
     def run_analysis(self) -> None:
@@ -74,6 +267,20 @@ class MainModel(QObject):
         self._busy = True
         self.analysis_busy.emit(True)
 
+        # Sonuç anahtarı ham girdiden: yeniden analiz ve düzenlemeler anahtarı (ve düzeltmeleri) kaydırmaz
+        session = self.sessions.active
+        self.analysis_service.input_key = session.input_key if session is not None else None
+
+        # Koordinat stringleri atılmış (düşük bellek) plaka: analiz ham veriden tekrar okunur
+        if session is not None and not session.has_coordinates and session.rdml_path:
+            try:
+                DataStore.set_df(RDMLService.rdml_to_dataframe(session.rdml_path, self._extra_rdml_channels()))
+            except Exception as e:
+                self._busy = False
+                self.analysis_busy.emit(False)
+                self.analysis_error.emit(str(e))
+                return
+
         self._start_new_analysis_thread()
 
     def cancel_analysis(self) -> None:
@@ -89,7 +296,7 @@ class MainModel(QObject):
         self._cleanup_analysis_thread(non_blocking=True)
 
         thread = QThread(self)
-        worker = AnalysisWorker(self.analysis_service)
+        worker = AnalysisWorker(self.analysis_service, replace(self.colored_box_controller.cfg))
         worker.moveToThread(thread)
 
         # signals
@@ -109,13 +316,79 @@ class MainModel(QObject):
 
         thread.start()
 
-    def _on_worker_finished(self, success: bool, summary) -> None:
+    def _on_data_store_changed(self, change: DataChange) -> None:
+        self._record_overrides(change)
+        self.data_changed.emit(change)
+
+    def _record_overrides(self, change: DataChange) -> None:
+        """
+        Kullanıcının Nihai Sonuç düzenlemeleri hesaplanan cache'ten ayrı saklanır
+        ve geçmiş kaydına işlenir.
+        """
+        if (
+            (self.result_cache is None and self.history is None)
+            or not self.result_key
+            or change.kind != ChangeKind.COLUMNS
+            or OVERRIDE_COL not in change.columns
+            or change.rows is None
+        ):
+            return
+        snapshot = DataStore.get_snapshot()
+        if snapshot.empty or snapshot.wells is None:
+            return
+        column = snapshot.df[OVERRIDE_COL]
+        try:
+            for row in change.rows:
+                value = column.iloc[row]
+                value = None if pd.isna(value) else str(value)
+                well_id = snapshot.wells.well_ids[row]
+                if self.result_cache is not None:
+                    self.result_cache.set_override(self.result_key, well_id, value)
+                if self.history is not None:
+                    self.history.update_final_result(self.result_key, well_id, value)
+        except (OSError, sqlite3.Error):
+            logger.exception("Override could not be saved")
+
+    def _record_history(self) -> None:
+        if self.history is None:
+            return
+        df = DataStore.get_df()
+        if df is None or df.empty:
+            return
+        try:
+            self.history.record_run(
+                df,
+                plate_name=self.state.file_name,
+                rdml_path=self.state.rdml_path,
+                config=self.analysis_service.config_fields(),
+                algorithm_version=ALGORITHM_VERSION,
+                run_key=self.result_key,
+            )
+        except (OSError, ValueError, sqlite3.Error):
+            logger.exception("Run history could not be saved")
+
+    def rebuild_summary_engine(self) -> None:
+        """Özet kolonları düzenlendiğinde motoru güncel snapshot'tan yeniden kurar."""
+        if self.summary_engine is None:
+            return
+        self.summary_engine = SummaryEngine.from_df(DataStore.get_df())
+
+    def _on_worker_finished(self, success: bool, bundle: Optional[AnalysisBundle]) -> None:
+        if success:
+            self.result_key = self.analysis_service.last_result_key
+            self._record_history()
+        if bundle is not None:
+            self.summary_engine = bundle.summary_engine
+            snapshot = DataStore.get_snapshot()
+            # Worker'ın ayrıştırdığı eğriler, snapshot hâlâ aynıysa benimsenir
+            if bundle.curves is not None and bundle.version == snapshot.version:
+                PCRDataService.adopt_store(bundle.curves, snapshot)
         # UI'ye durum bildir (önce)
         self._busy = False
         self.analysis_busy.emit(False)
-        self.analysis_finished.emit(bool(success))
-        if summary is not None:
-            self.analysis_summary_ready.emit(summary)
+        self.analysis_finished.emit(bool(success), bundle)
+        if bundle is not None and bundle.summary is not None:
+            self.analysis_summary_ready.emit(bundle.summary)
         # Thread'i kapat (non-blocking)
         self._cleanup_analysis_thread(non_blocking=True)
 
@@ -156,6 +429,7 @@ class MainModel(QObject):
         except Exception:
             pass
 
+        DataStore.unsubscribe(self._on_data_store_changed)
         self._cleanup_analysis_thread(non_blocking=False)
 
     # ---------------- Config passthrough ----------------
@@ -176,3 +450,36 @@ class MainModel(QObject):
 
     def get_uncertain_range(self) -> float:
         return float(self.analysis_service.config.uncertain_range)
+
+    def build_live_summary(self) -> Optional[AnalysisSummary]:
+        """Mevcut eşiklerle son analizin özetini yeniden üretir (analiz yoksa None)."""
+        if self.summary_engine is None:
+            return None
+        config = self.analysis_service.config
+        return self.summary_engine.summary(
+            float(config.carrier_range),
+            float(config.uncertain_range),
+            use_without_reference=bool(config.checkbox_status),
+        )
+
+    # ---------------- Threshold sweep ----------------
+    def build_threshold_sweep(self) -> Optional[ThresholdSweepResult]:
+        """
+        Son analiz sonucunun oranları üzerinde, mevcut eşikler etrafında tarama yapar.
+        Analiz sonucu yoksa None döner.
+        """
+        df = DataStore.get_df()
+        if df is None or df.empty:
+            return None
+
+        carrier = self.get_carrier_range()
+        uncertain = self.get_uncertain_range()
+        carrier_values, uncertain_values = ThresholdSweepService.default_grid(carrier, uncertain)
+        return ThresholdSweepService.sweep_frame(
+            df,
+            carrier_values,
+            uncertain_values,
+            baseline=(carrier, uncertain),
+            use_without_reference=bool(self.analysis_service.config.checkbox_status),
+            plate_id=self.state.file_name,
+        )
@@ -2,20 +2,22 @@
 from __future__ import annotations
 import traceback
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
-import pandas as pd
 
-from app.services.analysis_summary import AnalysisSummary
-from app.services.summary_calc import build_summary_from_df
+from app.services.analysis_bundle import AnalysisBundle
+from app.services.colored_box_service import ColoredBoxConfig
+from app.services.data_store import DataStore
 
 
 class AnalysisWorker(QObject):
-    finished = pyqtSignal(bool, object)  # (success, summary_or_none)
+    finished = pyqtSignal(bool, object)  # (success, AnalysisBundle_or_none)
     error = pyqtSignal(str)
     progress = pyqtSignal(int, str)
 
-    def __init__(self, analysis_service):
+    def __init__(self, analysis_service, box_config: ColoredBoxConfig | None = None):
         super().__init__()
         self._service = analysis_service
+        # UI thread'indeki config'in kopyası; worker çalışırken değişmez
+        self._box_config = box_config or ColoredBoxConfig()
         self._running = False
         self._cancel_requested = False
 
@@ -59,19 +61,22 @@ class AnalysisWorker(QObject):
                 is_cancelled=self._is_cancelled,
             )
 
-            final_df = getattr(self._service, "last_df", None)
-            config = getattr(self._service, "config", None)
-            use_without_reference = bool(getattr(config, "checkbox_status", False))
-
-            summary: AnalysisSummary | None = None
-            if isinstance(final_df, pd.DataFrame):
-                summary = build_summary_from_df(
-                    final_df,
-                    use_without_reference=use_without_reference,
+            bundle: AnalysisBundle | None = None
+            if success:
+                # Tablo, kontrol kutuları, regresyon ve eğriler burada kurulur;
+                # UI thread'i yalnızca hazır modelleri yerleştirir
+                self._progress(95, "Görünümler hazırlanıyor...")
+                config = getattr(self._service, "config", None)
+                bundle = AnalysisBundle.build(
+                    DataStore.get_snapshot(),
+                    box_config=self._box_config,
+                    carrier_range=float(getattr(config, "carrier_range", 0.0)),
+                    uncertain_range=float(getattr(config, "uncertain_range", 0.0)),
+                    use_without_reference=bool(getattr(config, "checkbox_status", False)),
                 )
 
             self._progress(100, "Tamamlandı.")
-            self.finished.emit(bool(success), summary)
+            self.finished.emit(bool(success), bundle)
 
         except Exception as e:
             tb = traceback.format_exc()
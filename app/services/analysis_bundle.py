@@ -0,0 +1,108 @@
+# app\services\analysis_bundle.py
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from app.constants.table_config import CSV_FILE_HEADERS, ROUND_COLUMNS, TABLE_WIDGET_HEADERS
+from app.services.analysis_summary import AnalysisSummary
+from app.services.colored_box_service import ColoredBoxConfig, ColoredBoxService
+from app.services.curve_store import CHANNEL_COLUMNS, CurveStore
+from app.services.data_store import DataSnapshot
+from app.services.regression_plot_service import RegressionPlotData, RegressionPlotService
+from app.services.summary_engine import SummaryEngine
+from app.utils.pandas_utils import round_numeric
+
+logger = logging.getLogger(__name__)
+
+
+def table_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Tabloda gösterilecek kolonlar, ROUND_COLUMNS'a göre yuvarlanmış (yeni frame)."""
+    columns = [col for col in TABLE_WIDGET_HEADERS if col in CSV_FILE_HEADERS]
+    out = df[columns]
+    for col, digits in ROUND_COLUMNS.items():
+        if col not in out.columns:
+            continue
+        out[col] = round_numeric(out[col], digits)
+    return out
+
+
+@dataclass(frozen=True)
+class AnalysisBundle:
+    """
+    Analiz sonrası tüm görünüm modelleri; worker thread'inde bir kez kurulur,
+    UI thread'i yalnızca model/item değiştirir. Üretilemeyen parça None kalır.
+
+    version: kurulduğu DataStore snapshot versiyonu (eskiyse UI yeniden kurar)
+    table: tablo görüntü frame'i (salt-okunur kullanılmalı)
+    box_result: [homozigot, heterozigot, NTC] kontrol kutuları
+    """
+
+    version: int
+    table: Optional[pd.DataFrame] = None
+    box_result: Tuple[bool, bool, bool] = (False, False, False)
+    regression: Optional[RegressionPlotData] = None
+    curves: Optional[CurveStore] = None
+    summary: Optional[AnalysisSummary] = None
+    summary_engine: Optional[SummaryEngine] = None
+
+    @classmethod
+    def build(
+        cls,
+        snapshot: DataSnapshot,
+        *,
+        box_config: ColoredBoxConfig,
+        carrier_range: float,
+        uncertain_range: float,
+        use_without_reference: bool,
+    ) -> "AnalysisBundle":
+        if snapshot.empty:
+            return cls(version=snapshot.version)
+        df = snapshot.df
+
+        table = None
+        try:
+            table = table_frame(df)
+        except Exception:
+            logger.exception("Table frame could not be built")
+
+        box_result = (False, False, False)
+        try:
+            box_result = tuple(ColoredBoxService().compute(df, box_config, snapshot.wells))
+        except Exception:
+            logger.exception("Colored box result could not be computed")
+
+        regression = None
+        try:
+            regression = RegressionPlotService.build(df)
+        except Exception:
+            logger.exception("Regression plot data could not be built")
+
+        # Eğriler burada ayrıştırılır; ilk kuyu seçimi UI'da parse beklemez
+        curves = None
+        if all(c in df.columns for c in CHANNEL_COLUMNS):
+            try:
+                curves = CurveStore.from_frame(df, version=snapshot.version, wells=snapshot.wells)
+            except Exception:
+                logger.exception("Curve store could not be built")
+
+        # Oranlar bir kez sıralanır; eşik değişimlerinde UI aynı motoru kullanır
+        engine = SummaryEngine.from_df(df)
+        summary = engine.summary(
+            float(carrier_range),
+            float(uncertain_range),
+            use_without_reference=bool(use_without_reference),
+        )
+
+        return cls(
+            version=snapshot.version,
+            table=table,
+            box_result=box_result,
+            regression=regression,
+            curves=curves,
+            summary=summary,
+            summary_engine=engine,
+        )
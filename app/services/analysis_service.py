@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 from app.services.analysis_steps.calculate_regression import CalculateRegression
-from dataclasses import dataclass
-from typing import Callable, Optional
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
 import pandas as pd
 
+from app.services.data_store import DataStore
 from app.services.pipeline import Pipeline, Step, CancelledError
+from app.services.result_cache import ResultCache
+from app.services.result_schema import ensure_category
+from app.services.well_index import WellIndex
 
 from app.services.analysis_steps.calculate_with_referance import CalculateWithReferance
+from app.services.analysis_steps.channel_pairs import parse_pairs
 from app.services.analysis_steps.calculate_without_reference import CalculateWithoutReference
 from app.services.analysis_steps.configurate_result_csv import ConfigurateResultCSV
 from app.services.analysis_steps.csv_processor import CSVProcessor
@@ -16,6 +22,12 @@ from app.services.analysis_steps.csv_processor import CSVProcessor
 ProgressCb = Callable[[int, str], None]
 IsCancelled = Callable[[], bool]
 
+logger = logging.getLogger(__name__)
+
+# Analiz adımlarının çıktısını değiştiren her düzenlemede artırılmalı (ResultCache anahtarı)
+ALGORITHM_VERSION = "2"
+OVERRIDE_COL = "Nihai Sonuç"
+
 
 @dataclass
 class AnalysisConfig:
@@ -23,14 +35,22 @@ class AnalysisConfig:
     checkbox_status: bool = True
     carrier_range: float = 0.5999
     uncertain_range: float = 0.6199
+    # Hedef/referans kanal çiftleri; ilki birincil (sınıflandırma) çifttir
+    channel_pairs: Tuple[str, ...] = ("FAM/HEX",)
 
 
 class AnalysisService:
-    def __init__(self, config: Optional[AnalysisConfig] = None):
+    def __init__(self, config: Optional[AnalysisConfig] = None, result_cache: Optional[ResultCache] = None):
         self.config = config or AnalysisConfig()
+        self.result_cache = result_cache
         self._cancelled = False
         self.last_df: Optional[pd.DataFrame] = None
         self.last_summary = None
+        # Son çalıştırmanın cache anahtarı ve sonucun cache'ten gelip gelmediği
+        self.last_result_key: Optional[str] = None
+        self.last_from_cache = False
+        # Ham girdi frame'inin özeti (ResultCache.input_digest); verilmezse DataStore snapshot'ı özetlenir
+        self.input_key: Optional[str] = None
 
     def cancel(self) -> None:
         self._cancelled = True
@@ -56,6 +76,10 @@ class AnalysisService:
             raise ValueError("Belirsiz aralığı taşıyıcı aralığından yüksek olmalıdır.")
         self.config.uncertain_range = v
 
+    def set_channel_pairs(self, pairs) -> None:
+        """Uygulamada CHANNEL_PAIRS ortam değişkeninden (AppSettings.channel_pairs) MainModel ile ayarlanır."""
+        self.config.channel_pairs = tuple(p.label for p in parse_pairs(pairs))
+
     def run(
         self,
         progress_cb: Optional[ProgressCb] = None,
@@ -64,32 +88,52 @@ class AnalysisService:
         # Her run başlangıcında cancel flag sıfırla
         self._cancelled = False
         self.last_df = None
+        self.last_result_key = None
+        self.last_from_cache = False
         is_cancelled = is_cancelled or self._is_cancelled
 
         def progress(p: int, msg: str) -> None:
             if progress_cb:
                 progress_cb(int(p), str(msg))
 
+        key = self._result_key()
+        overrides: Dict[str, Any] = {}
+        if key and self.result_cache is not None:
+            overrides = self.result_cache.overrides(key)
+            if self._publish_cached(key, overrides, progress):
+                return True
+
         # Step instance'ları
+        pairs = parse_pairs(self.config.channel_pairs)
         ref_step = CalculateWithReferance(
             self.config.referance_well,
             self.config.carrier_range,
             self.config.uncertain_range,
+            pairs=pairs,
         )
-        reg_step = CalculateRegression()
+        reg_step = CalculateRegression(pairs)
         sw_step = CalculateWithoutReference(
             carrier_range=self.config.carrier_range,
             uncertain_range=self.config.uncertain_range,
         )
-        post_step = ConfigurateResultCSV(self.config.checkbox_status)
+        post_step = ConfigurateResultCSV(self.config.checkbox_status, pairs=pairs)
+
+        computed: Dict[str, pd.DataFrame] = {}
+
+        def apply_overrides(df: pd.DataFrame) -> pd.DataFrame:
+            computed["df"] = df.copy(deep=False)
+            return self.apply_overrides(df, overrides)
 
         steps = [
-            Step("CSV hazırlama", CSVProcessor.process),
+            Step("CSV hazırlama", lambda df: CSVProcessor.process(df, pairs)),
             Step("Referanslı hesaplama", ref_step.process),
             Step("Regresyon", reg_step.process),
             Step("Referanssız hesaplama", sw_step.process),
             Step("Sonuç CSV formatlama", post_step.process),
         ]
+        if overrides:
+            # Manuel düzeltmeler ayrı adım: cache'e yalnızca hesaplanan çıktı yazılır
+            steps.append(Step("Manuel düzeltmeler", apply_overrides))
 
         try:
             out_df = Pipeline.run(
@@ -103,8 +147,68 @@ class AnalysisService:
             # Cancel bir hata değil → False dön
             return False
 
+        reference_ok = bool(getattr(ref_step, "last_success", True))
+        self.last_result_key = key
+        if key and self.result_cache is not None:
+            try:
+                self.result_cache.put(key, computed.get("df", out_df), reference_ok=reference_ok)
+            except Exception:
+                logger.exception("Result cache write failed")
+
         # referans kuyusu başarısızsa checkbox zorla True
-        if not getattr(ref_step, "last_success", True):
+        if not reference_ok:
             self.config.checkbox_status = True
 
-        return True
\ No newline at end of file
+        return True
+
+    # ---------------- Result cache ----------------
+    def config_fields(self) -> Dict[str, Any]:
+        return asdict(self.config)
+
+    def _result_key(self) -> Optional[str]:
+        """
+        Cache kapalı olsa da hesaplanır; geçmiş kayıtları da bu anahtarla eşlenir.
+        Snapshot yeniden analizde önceki sonucu (ve düzenlemeleri) taşır; anahtarın
+        sabit kalması için çağıran input_key'i import edilen ham frame'den sabitlemelidir.
+        """
+        try:
+            digest = self.input_key
+            if digest is None:
+                snapshot = DataStore.get_snapshot()
+                if snapshot.empty:
+                    return None
+                digest = ResultCache.input_digest(snapshot.df)
+            return ResultCache.key_for_digest(digest, self.config_fields(), ALGORITHM_VERSION)
+        except Exception:
+            logger.exception("Result cache key could not be computed")
+            return None
+
+    def _publish_cached(self, key: str, overrides: Dict[str, Any], progress: ProgressCb) -> bool:
+        """Cache isabetinde pipeline atlanır; sonuç tek RESET olarak yayınlanır."""
+        cached = self.result_cache.get(key)
+        if cached is None:
+            return False
+
+        df = self.apply_overrides(cached.df.copy(deep=False), overrides)
+        DataStore.set_df(df)
+        self.last_df = df
+        self.last_result_key = key
+        self.last_from_cache = True
+        if not cached.reference_ok:
+            self.config.checkbox_status = True
+        progress(100, "Sonuç önbellekten yüklendi.")
+        return True
+
+    @staticmethod
+    def apply_overrides(df: pd.DataFrame, overrides: Dict[str, Any]) -> pd.DataFrame:
+        """{Kuyu No: değer} manuel düzeltmelerini Nihai Sonuç kolonuna yazar."""
+        if not overrides or OVERRIDE_COL not in df.columns:
+            return df
+        wells = WellIndex.build(df)
+        col = df.columns.get_loc(OVERRIDE_COL)
+        for well_id, value in overrides.items():
+            row = wells.row_of_well(well_id)
+            if row is not None:
+                ensure_category(df, OVERRIDE_COL, value)
+                df.iloc[row, col] = value
+        return df
\ No newline at end of file
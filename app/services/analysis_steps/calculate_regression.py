@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import logging
+from typing import Sequence
+
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
+
+from app.services.analysis_steps.channel_pairs import (
+    DEFAULT_CHANNEL_PAIRS,
+    ChannelPair,
+    ChannelPairEngine,
+    PairColumns,
+    ct_col,
+    end_rfu_col,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class CalculateRegression:
-    def __init__(self):
+    def __init__(self, pairs: Sequence[ChannelPair] = DEFAULT_CHANNEL_PAIRS):
         self.df: pd.DataFrame | None = None
+        self.pairs = tuple(pairs)
 
     def process(self, df: pd.DataFrame | None = None) -> pd.DataFrame:
         if df is None:
@@ -23,92 +34,45 @@ class CalculateRegression:
         # Pipeline kontratı: df üzerinde in-place oynamak istemiyorsak burada kopyalarız
         self.df = df.copy(deep=False)
         self.calculate_regration()
-        print("Regresyon adımı tamamlandı."),
-        print("--------------------------")
+        logger.debug("Regresyon adımı tamamlandı.")
         return self.df
 
     def calculate_regration(self) -> None:
         if self.df is None:
             raise ValueError("DataFrame yok.")
 
-        required_columns = ["fam_end_rfu", "hex_end_rfu", "HEX Ct"]
+        primary = self.pairs[0]
+        required_columns = [end_rfu_col(primary.target), end_rfu_col(primary.reference), ct_col(primary.reference)]
         missing = [c for c in required_columns if c not in self.df.columns]
         if missing:
             raise ValueError(f"Eksik sütun(lar): {', '.join(missing)}")
 
-        filtered_df = self.df.dropna(subset=["fam_end_rfu", "hex_end_rfu", "HEX Ct"])
-        if filtered_df.empty:
+        # (satır, çift) matrisleri: x = hedef son RFU, y = referans son RFU
+        x = self._matrix([end_rfu_col(p.target) for p in self.pairs])
+        y = self._matrix([end_rfu_col(p.reference) for p in self.pairs])
+        ref_ct = self._matrix([ct_col(p.reference) for p in self.pairs])
+        valid = ~(np.isnan(x) | np.isnan(y) | np.isnan(ref_ct))
+        if not valid[:, 0].any():
             raise ValueError("Gerekli sütunlarda işlem yapılacak veri yok.")
 
-        logger.debug("Regresyon için filtrelenmiş satır: %d", len(filtered_df))
-
-        if len(filtered_df) > 50:
-            model, clean_df = self.iterative_regression(filtered_df, "fam_end_rfu", "hex_end_rfu")
-        else:
-            model, clean_df = self.mad_based_regression(filtered_df, "fam_end_rfu", "hex_end_rfu")
-
-        # Varsayılan: riskli
-        self.df["Regresyon"] = "Riskli Alan"
-        self.df.loc[clean_df.index, "Regresyon"] = "Güvenli Bölge"
-
-        # Uyarı durumlarında regresyon "-"
-        if "Uyarı" in self.df.columns:
-            self.df.loc[self.df["Uyarı"].isin(["Yetersiz DNA", "Boş Kuyu"]), "Regresyon"] = "-"
-
-    def iterative_regression(self, df: pd.DataFrame, x_col: str, y_col: str, threshold: float = 2.0, max_iter: int = 10):
-        filtered_df = df.copy()
-        model = LinearRegression()
-
-        for _ in range(max_iter):
-            X = filtered_df[x_col].values.reshape(-1, 1)
-            y = filtered_df[y_col].values
-
-            model.fit(X, y)
-            y_pred = model.predict(X)
-
-            residuals = y - y_pred
-            sigma = float(np.std(residuals))
-
-            # (Mevcut yaklaşımı koruyarak) maske
-            mask_upper = np.abs(residuals) <= (threshold + 10) + 2.2 * sigma
-            mask_lower = np.abs(residuals) >= (threshold) - 2.2 * sigma
-            mask = mask_upper & mask_lower
-
-            new_filtered_df = filtered_df[mask]
-            if new_filtered_df.shape[0] == filtered_df.shape[0]:
-                break
-            filtered_df = new_filtered_df
-
-        return model, filtered_df
-
-    def mad_based_regression(self, df: pd.DataFrame, x_col: str, y_col: str, threshold: float = 3.5):
-        filtered_df = df.copy()
-        if filtered_df.empty:
-            return LinearRegression(), filtered_df
-
-        X = filtered_df[x_col].values.reshape(-1, 1)
-        y = filtered_df[y_col].values
-
-        model = LinearRegression()
-        model.fit(X, y)
-        y_pred = model.predict(X)
-
-        residuals = y - y_pred
-        median = float(np.median(residuals))
-        abs_deviation = np.abs(residuals - median)
-        mad = float(np.median(abs_deviation))
-
-        if mad == 0:
-            logger.debug("MAD=0, temizleme yapılmadan dönülüyor.")
-            return model, filtered_df
+        logger.debug("Regresyon için filtrelenmiş satır: %s", valid.sum(axis=0).tolist())
 
-        modified_z_scores = 0.6745 * (residuals - median) / mad
-        mask = np.abs(modified_z_scores) <= threshold
+        safe = ChannelPairEngine.safe_zones(x, y, valid)
 
-        new_filtered_df = filtered_df[mask]
-        if new_filtered_df.shape[0] < 3:
-            logger.debug("Yeterli güvenli örnek kalmadı (%d). Fallback.", new_filtered_df.shape[0])
-            return model, filtered_df
+        for p, pair in enumerate(self.pairs):
+            cols = PairColumns.for_pair(pair, primary=(p == 0))
+            col = cols.regression
+            # Varsayılan: riskli
+            self.df[col] = "Riskli Alan"
+            self.df.loc[safe[:, p], col] = "Güvenli Bölge"
 
-        return model, new_filtered_df
+            # Çiftin kendi uyarı durumlarında regresyon "-"
+            if cols.warning in self.df.columns:
+                self.df.loc[self.df[cols.warning].isin(["Yetersiz DNA", "Boş Kuyu"]), col] = "-"
 
+    def _matrix(self, columns: Sequence[str]) -> np.ndarray:
+        out = np.full((len(self.df), len(columns)), np.nan, dtype=np.float64)
+        for k, col in enumerate(columns):
+            if col in self.df.columns:
+                out[:, k] = pd.to_numeric(self.df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        return out
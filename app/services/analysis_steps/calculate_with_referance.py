@@ -2,17 +2,31 @@
 # app/services/analysis_steps/calculate_with_referance.py
 from __future__ import annotations
 
+from typing import Sequence
+
+import numpy as np
 import pandas as pd
 
+from app.services.analysis_steps.channel_pairs import DEFAULT_CHANNEL_PAIRS, ChannelPair, ChannelPairEngine, PairColumns
+from app.services.well_index import WellIndex
+
 
 class CalculateWithReferance:
-    def __init__(self, referance_well: str, carrier_range: float, uncertain_range: float):
+    def __init__(
+        self,
+        referance_well: str,
+        carrier_range: float,
+        uncertain_range: float,
+        pairs: Sequence[ChannelPair] = DEFAULT_CHANNEL_PAIRS,
+    ):
         self.df: pd.DataFrame | None = None
+        self.pairs = tuple(pairs)
         self.referance_well = str(referance_well)
         self.carrier_range = float(carrier_range)
         self.uncertain_range = float(uncertain_range)
         self.last_success = True
         self.initial_static_value = None
+        self._reference_row: int | None = None
 
     def process(self, df: pd.DataFrame | None = None) -> pd.DataFrame:
         if df is None:
@@ -23,7 +37,8 @@ class CalculateWithReferance:
         self.df = df  # Pipeline kontratı: mümkünse copy etme; pipeline yönetecek
         self.last_success = self._set_reference_value()
 
-        valid_mask = (self.df["Uyarı"].isnull()) | (self.df["Uyarı"] == "Düşük RFU Değeri")
+        valid_mask = self._valid_rows("Uyarı")
+        self._secondary_ratios()
         valid_data = self.df[valid_mask].copy()
         invalid_data = self.df[~valid_mask].copy()
 
@@ -41,19 +56,43 @@ class CalculateWithReferance:
         if "Kuyu No" not in self.df.columns or "Δ Ct" not in self.df.columns:
             raise ValueError("'Kuyu No' veya 'Δ Ct' sütunu eksik.")
 
-        if self.referance_well not in set(self.df["Kuyu No"].astype(str).values):
+        row = WellIndex.build(self.df).row_of_well(self.referance_well)
+        if row is None:
             raise ValueError(f"Referans kuyu '{self.referance_well}' bulunamadı.")
 
-        vals = self.df.loc[self.df["Kuyu No"] == self.referance_well, "Δ Ct"].values
-        if len(vals) == 0:
-            raise ValueError(f"Referans kuyu '{self.referance_well}' için Δ Ct bulunamadı.")
-
-        self.initial_static_value = vals[0]
+        self._reference_row = row
+        self.initial_static_value = self.df["Δ Ct"].iloc[row]
         if pd.isna(self.initial_static_value):
             # referans kuyusu var ama ΔCt boş: fatal yapmayıp step başarısız sayalım
             return False
         return True
 
+    def _valid_rows(self, warning: str) -> pd.Series:
+        """Uyarısı olmayan veya yalnızca düşük RFU uyarılı satırlar."""
+        if warning not in self.df.columns:
+            return pd.Series(True, index=self.df.index)
+        return (self.df[warning].isnull()) | (self.df[warning] == "Düşük RFU Değeri")
+
+    def _secondary_ratios(self) -> None:
+        """
+        İkincil çiftler: referans kuyusunun ΔCt'sine göre ΔΔCt ve oran (tüm çiftler tek matris).
+        Her çiftin geçerli satırları kendi uyarı kolonundan belirlenir.
+        """
+        secondary = [PairColumns.for_pair(p, primary=False) for p in self.pairs[1:]]
+        if not secondary or self._reference_row is None:
+            return
+
+        delta_ct = np.column_stack(
+            [pd.to_numeric(self.df[c.delta_ct], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan) for c in secondary]
+        )
+        valid = np.column_stack([self._valid_rows(c.warning).to_numpy() for c in secondary])
+        reference = delta_ct[self._reference_row]
+        delta_delta = np.where(valid, delta_ct - reference, np.nan)
+        ratio = np.where(valid, ChannelPairEngine.ratio(delta_ct, reference), np.nan)
+        for k, cols in enumerate(secondary):
+            self.df[cols.delta_delta_ct] = delta_delta[:, k]
+            self.df[cols.ratio] = ratio[:, k]
+
     def _finalize_data(self, valid_data: pd.DataFrame) -> pd.DataFrame:
         if self.initial_static_value is None or pd.isna(self.initial_static_value):
             # referans başarısızsa valid_data'yı bozmadan döndür
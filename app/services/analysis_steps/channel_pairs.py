@@ -0,0 +1,240 @@
+# app\services\analysis_steps\channel_pairs.py
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Any, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from app.services.curve_store import end_values
+
+
+def ct_col(channel: str) -> str:
+    return f"{channel} Ct"
+
+
+def coord_col(channel: str) -> str:
+    return f"{channel} koordinat list"
+
+
+def end_rfu_col(channel: str) -> str:
+    return f"{channel.lower()}_end_rfu"
+
+
+@dataclass(frozen=True)
+class ChannelPair:
+    """Hedef / referans boya çifti (ör. FAM/HEX, SMN1/IC)."""
+
+    target: str
+    reference: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.target}/{self.reference}"
+
+    @classmethod
+    def parse(cls, raw: Any) -> "ChannelPair":
+        """ChannelPair, "FAM/HEX" veya ("FAM", "HEX") kabul eder."""
+        if isinstance(raw, ChannelPair):
+            return raw
+        parts = raw.split("/") if isinstance(raw, str) else list(raw)
+        if len(parts) != 2:
+            raise ValueError(f"Geçersiz kanal çifti: {raw!r} (beklenen: 'HEDEF/REFERANS')")
+        target, reference = (str(p).strip().upper() for p in parts)
+        if not target or not reference or target == reference:
+            raise ValueError(f"Geçersiz kanal çifti: {raw!r}")
+        return cls(target, reference)
+
+
+PRIMARY_PAIR = ChannelPair("FAM", "HEX")
+DEFAULT_CHANNEL_PAIRS: Tuple[ChannelPair, ...] = (PRIMARY_PAIR,)
+
+
+@dataclass(frozen=True)
+class PairColumns:
+    """
+    Bir çiftin sonuç kolonları. İlk (birincil) çift mevcut kolon adlarını
+    kullanır; diğerleri "HEDEF/REFERANS " önekiyle yazılır.
+    warning: çiftin yalnızca kendi kanallarından türetilen uyarısı
+    """
+
+    delta_ct: str
+    rfu_diff: str
+    regression: str
+    delta_delta_ct: str
+    ratio: str
+    warning: str
+
+    @classmethod
+    def for_pair(cls, pair: ChannelPair, *, primary: bool) -> "PairColumns":
+        if primary:
+            return cls("Δ Ct", "rfu_diff", "Regresyon", "Δ_Δ Ct", "Standart Oranı", "Uyarı")
+        p = f"{pair.label} "
+        return cls(p + "Δ Ct", p + "rfu_diff", p + "Regresyon", p + "Δ_Δ Ct", p + "Standart Oranı", p + "Uyarı")
+
+
+def parse_pairs(raw: Iterable[Any] | None) -> Tuple[ChannelPair, ...]:
+    """Tekrarları atar, sırayı korur; boşsa varsayılan FAM/HEX."""
+    pairs: list[ChannelPair] = []
+    for item in raw or ():
+        pair = ChannelPair.parse(item)
+        if pair not in pairs:
+            pairs.append(pair)
+    return tuple(pairs) or DEFAULT_CHANNEL_PAIRS
+
+
+def channels_of(pairs: Iterable[ChannelPair]) -> Tuple[str, ...]:
+    out: list[str] = []
+    for pair in pairs:
+        for ch in (pair.target, pair.reference):
+            if ch not in out:
+                out.append(ch)
+    return tuple(out)
+
+
+def pair_output_columns(pairs: Iterable[ChannelPair]) -> Tuple[str, ...]:
+    """FAM/HEX dışındaki kanal kolonları ve ikincil çiftlerin sonuç kolonları (sıralı)."""
+    pairs = tuple(pairs)
+    out: list[str] = []
+    for ch in channels_of(pairs):
+        if ch not in (PRIMARY_PAIR.target, PRIMARY_PAIR.reference):
+            out += [ct_col(ch), end_rfu_col(ch), coord_col(ch)]
+    for pair in pairs[1:]:
+        cols = PairColumns.for_pair(pair, primary=False)
+        out += [cols.warning, cols.delta_ct, cols.rfu_diff, cols.regression, cols.delta_delta_ct, cols.ratio]
+    return tuple(out)
+
+
+@dataclass(frozen=True)
+class PairMatrices:
+    """
+    Tüm çiftler için (satır, çift) matrisleri.
+    ct / end_rfu kanallar üzerinden (satır, kanal); target / reference kanal indeksleri.
+    """
+
+    channels: Tuple[str, ...]
+    target: NDArray[np.intp]
+    reference: NDArray[np.intp]
+    ct: NDArray[np.float64]
+    end_rfu: NDArray[np.float64]
+
+    @property
+    def delta_ct(self) -> NDArray[np.float64]:
+        return self.ct[:, self.target] - self.ct[:, self.reference]
+
+    @property
+    def rfu_diff(self) -> NDArray[np.float64]:
+        return self.end_rfu[:, self.target] - self.end_rfu[:, self.reference]
+
+
+class ChannelPairEngine:
+    """
+    Hedef/referans çiftlerinin ΔCt, son RFU, regresyon güvenli bölgesi ve oranlarını
+    tüm çiftler için tek matris işlemiyle hesaplar (çift başına döngü yok).
+    """
+
+    @staticmethod
+    def compute(df: pd.DataFrame, pairs: Iterable[ChannelPair]) -> PairMatrices:
+        pairs = tuple(pairs)
+        channels = channels_of(pairs)
+        n = len(df)
+
+        ct = np.full((n, len(channels)), np.nan, dtype=np.float64)
+        end_rfu = np.zeros((n, len(channels)), dtype=np.float64)
+        for k, ch in enumerate(channels):
+            if ct_col(ch) in df.columns:
+                ct[:, k] = pd.to_numeric(df[ct_col(ch)], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            if coord_col(ch) in df.columns:
+                end_rfu[:, k] = np.nan_to_num(end_values(df[coord_col(ch)].tolist()), nan=0.0)
+
+        index = {ch: k for k, ch in enumerate(channels)}
+        return PairMatrices(
+            channels=channels,
+            target=np.array([index[p.target] for p in pairs], dtype=np.intp),
+            reference=np.array([index[p.reference] for p in pairs], dtype=np.intp),
+            ct=ct,
+            end_rfu=end_rfu,
+        )
+
+    # ---- Regresyon ----
+    @staticmethod
+    def safe_zones(x: NDArray[np.float64], y: NDArray[np.float64], valid: NDArray[np.bool_]) -> NDArray[np.bool_]:
+        """
+        Her kolon (çift) için y ~ x doğrusal regresyonunda güvenli bölge maskesi.
+        50'den fazla geçerli satırda iteratif sigma temizliği, aksi halde MAD.
+        """
+        out = np.zeros(valid.shape, dtype=bool)
+        iterative = valid.sum(axis=0) > 50
+        if iterative.any():
+            out[:, iterative] = _iterative_mask(x[:, iterative], y[:, iterative], valid[:, iterative])
+        if (~iterative).any():
+            out[:, ~iterative] = _mad_mask(x[:, ~iterative], y[:, ~iterative], valid[:, ~iterative])
+        return out
+
+    @staticmethod
+    def ratio(delta_ct: NDArray[np.float64], static_value: NDArray[np.float64]) -> NDArray[np.float64]:
+        """2^-(ΔCt - statik), çift başına statik değer."""
+        return 2 ** -(delta_ct - static_value)
+
+
+def _residuals(x: NDArray[np.float64], y: NDArray[np.float64], mask: NDArray[np.bool_]) -> NDArray[np.float64]:
+    """Kolon bazında maskeli en küçük kareler (y = a*x + b) artıkları."""
+    k = mask.sum(axis=0)
+    safe_k = np.maximum(k, 1)
+    xm = np.where(mask, x, 0.0).sum(axis=0) / safe_k
+    ym = np.where(mask, y, 0.0).sum(axis=0) / safe_k
+    dx = np.where(mask, x - xm, 0.0)
+    dy = np.where(mask, y - ym, 0.0)
+    sxx = (dx * dx).sum(axis=0)
+    slope = np.divide((dx * dy).sum(axis=0), sxx, out=np.zeros_like(sxx), where=sxx > 0)
+    return (y - ym) - slope * (x - xm)
+
+
+def _iterative_mask(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    valid: NDArray[np.bool_],
+    threshold: float = 2.0,
+    max_iter: int = 10,
+) -> NDArray[np.bool_]:
+    mask = valid.copy()
+    active = mask.any(axis=0)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        r = _residuals(x, y, mask)
+        k = np.maximum(mask.sum(axis=0), 1)
+        r_mean = np.where(mask, r, 0.0).sum(axis=0) / k
+        sigma = np.sqrt((np.where(mask, r - r_mean, 0.0) ** 2).sum(axis=0) / k)
+
+        abs_r = np.abs(r)
+        keep = mask & (abs_r <= (threshold + 10) + 2.2 * sigma) & (abs_r >= threshold - 2.2 * sigma)
+        changed = active & (keep.sum(axis=0) != mask.sum(axis=0))
+        mask[:, changed] = keep[:, changed]
+        active = changed
+    return mask
+
+
+def _mad_mask(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    valid: NDArray[np.bool_],
+    threshold: float = 3.5,
+) -> NDArray[np.bool_]:
+    r = np.where(valid, _residuals(x, y, valid), np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # geçerli satırı olmayan kolonlar
+        median = np.nanmedian(r, axis=0)
+        mad = np.nanmedian(np.abs(r - median), axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = 0.6745 * (r - median) / mad
+    keep = valid & (np.abs(z) <= threshold)
+
+    # MAD=0 veya 3'ten az güvenli örnek: temizleme yapılmaz
+    fallback = ~(mad > 0) | (keep.sum(axis=0) < 3)
+    keep[:, fallback] = valid[:, fallback]
+    return keep
@@ -3,12 +3,14 @@
 import string
 
 from app.constants.table_config import CSV_FILE_HEADERS
+from app.services.analysis_steps.channel_pairs import DEFAULT_CHANNEL_PAIRS, pair_output_columns
 
 
 class ConfigurateResultCSV:
-    def __init__(self, checkbox_status: bool):
+    def __init__(self, checkbox_status: bool, pairs=DEFAULT_CHANNEL_PAIRS):
         self.df = None
         self.checkbox_status = checkbox_status
+        self.pairs = tuple(pairs)
 
     def process(self, df=None):
         if df is None:
@@ -62,7 +64,9 @@ class ConfigurateResultCSV:
 
     def reorder_columns(self):
         """Kolon sırasını düzenler."""
-        desired_order = CSV_FILE_HEADERS
+        # Ek kanal / çift kolonları standart başlıkların sonuna eklenir
+        desired_order = list(CSV_FILE_HEADERS)
+        desired_order += [c for c in pair_output_columns(self.pairs) if c not in desired_order]
         # Sadece mevcut kolonları al
         columns_to_include = [col for col in desired_order if col in self.df.columns]
         self.df = self.df[columns_to_include]
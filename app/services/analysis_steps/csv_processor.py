@@ -2,64 +2,72 @@
 # app/services/analysis_steps/csv_processor.py
 from __future__ import annotations
 
-import ast
+from dataclasses import astuple
+from typing import Sequence
+
+import numpy as np
 import pandas as pd
 
+from app.services.analysis_steps.channel_pairs import (
+    DEFAULT_CHANNEL_PAIRS,
+    ChannelPair,
+    ChannelPairEngine,
+    PairColumns,
+    channels_of,
+    coord_col,
+    ct_col,
+    end_rfu_col,
+    pair_output_columns,
+)
+
 
 class CSVProcessor:
     @staticmethod
-    def process(df: pd.DataFrame | None = None) -> pd.DataFrame:
+    def process(
+        df: pd.DataFrame | None = None,
+        pairs: Sequence[ChannelPair] = DEFAULT_CHANNEL_PAIRS,
+    ) -> pd.DataFrame:
         if df is None:
             raise ValueError("CSVProcessor.process Pipeline tarafından df ile çağrılmalıdır.")
         if df.empty:
             raise ValueError("İşlenecek merkezi DataFrame mevcut değil veya boş.")
-        return CSVProcessor.improved_preprocess(df)
+        return CSVProcessor.improved_preprocess(df, pairs)
 
     @staticmethod
-    def improved_preprocess(df: pd.DataFrame) -> pd.DataFrame:
-        def safe_literal_eval(val):
-            if isinstance(val, str):
-                try:
-                    return ast.literal_eval(val)
-                except Exception:
-                    return None
-            return None
+    def improved_preprocess(
+        df: pd.DataFrame,
+        pairs: Sequence[ChannelPair] = DEFAULT_CHANNEL_PAIRS,
+    ) -> pd.DataFrame:
+        channels = channels_of(pairs)
 
         cols_to_clear = [
             "Δ Ct", "Δ_Δ Ct", "İstatistik Oranı", "Yazılım Hasta Sonucu",
             "rfu_diff", "fam_end_rfu", "hex_end_rfu", "Kuyu No", "Cluster"
         ]
+        cols_to_clear += [end_rfu_col(ch) for ch in channels]
+        for pair in pairs[1:]:
+            cols_to_clear += astuple(PairColumns.for_pair(pair, primary=False))
         df = df.drop(columns=[c for c in cols_to_clear if c in df.columns], errors="ignore")
 
         df = CSVProcessor.fill_missing_react_ids(df)
 
-        df["FAM koordinat list"] = df.get("FAM koordinat list", "[]")
-        df["HEX koordinat list"] = df.get("HEX koordinat list", "[]")
-
-        df["FAM koordinat list"] = df["FAM koordinat list"].fillna("[]").astype(str)
-        df["HEX koordinat list"] = df["HEX koordinat list"].fillna("[]").astype(str)
-
-        fam_end = []
-        hex_end = []
-
-        for val in df["FAM koordinat list"].values:
-            parsed = safe_literal_eval(val)
-            fam_end.append(parsed[-1][-1] if parsed else None)
-
-        for val in df["HEX koordinat list"].values:
-            parsed = safe_literal_eval(val)
-            hex_end.append(parsed[-1][-1] if parsed else None)
-
-        df["fam_end_rfu"] = pd.to_numeric(pd.Series(fam_end), errors="coerce").fillna(0.0)
-        df["hex_end_rfu"] = pd.to_numeric(pd.Series(hex_end), errors="coerce").fillna(0.0)
-        df["rfu_diff"] = df["fam_end_rfu"] - df["hex_end_rfu"]
-
-        df["FAM Ct"] = pd.to_numeric(df.get("FAM Ct"), errors="coerce")
-        df["HEX Ct"] = pd.to_numeric(df.get("HEX Ct"), errors="coerce")
-        df["Δ Ct"] = df["FAM Ct"] - df["HEX Ct"]
+        for ch in channels:
+            col = coord_col(ch)
+            df[col] = df[col].fillna("[]").astype(str) if col in df.columns else "[]"
+            df[ct_col(ch)] = pd.to_numeric(df[ct_col(ch)], errors="coerce") if ct_col(ch) in df.columns else np.nan
+
+        # Tüm kanalların son RFU'ları ve tüm çiftlerin farkları tek matris işlemi
+        m = ChannelPairEngine.compute(df, pairs)
+        for k, ch in enumerate(m.channels):
+            df[end_rfu_col(ch)] = m.end_rfu[:, k]
+        delta_ct, rfu_diff = m.delta_ct, m.rfu_diff
+        for p, pair in enumerate(pairs):
+            cols = PairColumns.for_pair(pair, primary=(p == 0))
+            df[cols.rfu_diff] = rfu_diff[:, p]
+            df[cols.delta_ct] = delta_ct[:, p]
 
         df["Kuyu No"] = CSVProcessor.generate_kuyu_no(len(df))
-        df = CSVProcessor.apply_conditions(df)
+        df = CSVProcessor.apply_conditions(df, pairs)
         return df
 
     @staticmethod
@@ -94,31 +102,40 @@ class CSVProcessor:
         return df.sort_values("React ID", kind="mergesort").reset_index(drop=True)
 
     @staticmethod
-    def apply_conditions(df: pd.DataFrame) -> pd.DataFrame:
-        df["Uyarı"] = None
+    def apply_conditions(
+        df: pd.DataFrame,
+        pairs: Sequence[ChannelPair] = DEFAULT_CHANNEL_PAIRS,
+    ) -> pd.DataFrame:
+        # Her çiftin uyarısı yalnızca kendi kanallarından: ikincil bir boyanın zayıf
+        # sinyali birincil sınıflandırmayı (Uyarı) etkilemez
+        for p, pair in enumerate(pairs):
+            warning = PairColumns.for_pair(pair, primary=(p == 0)).warning
+            CSVProcessor._apply_pair_conditions(df, (pair.target, pair.reference), warning)
+
+        column_order = [
+            "React ID", "Barkot No", "Hasta Adı", "Uyarı", "Kuyu No",
+            "FAM Ct", "HEX Ct", "Δ Ct", "rfu_diff", "fam_end_rfu", "hex_end_rfu",
+            "FAM koordinat list", "HEX koordinat list",
+        ]
+        column_order += [c for c in pair_output_columns(pairs) if c not in column_order]
+        return df[[c for c in column_order if c in df.columns]]
+
+    @staticmethod
+    def _apply_pair_conditions(df: pd.DataFrame, channels: Sequence[str], warning: str) -> None:
+        df[warning] = None
 
         if "Barkot No" in df.columns:
-            df.loc[(df["Barkot No"].isna() | (df["Barkot No"] == "")) & (df["Uyarı"].isnull()), "Uyarı"] = "Boş Kuyu"
+            df.loc[(df["Barkot No"].isna() | (df["Barkot No"] == "")) & (df[warning].isnull()), warning] = "Boş Kuyu"
 
+        # Çiftin herhangi bir kanalının Ct'si yoksa veya 30'dan büyükse
+        ct = df[[ct_col(ch) for ch in channels]]
         df.loc[
-            (
-                (df["FAM Ct"] > 30)
-                | (df["HEX Ct"] > 30)
-                | (df["FAM Ct"].isna())
-                | (df["HEX Ct"].isna())
-            )
-            & (df["Uyarı"].isnull()),
-            "Uyarı",
+            ((ct > 30) | ct.isna()).any(axis=1) & (df[warning].isnull()),
+            warning,
         ] = "Yetersiz DNA"
 
+        end_rfu = df[[end_rfu_col(ch) for ch in channels]]
         df.loc[
-            ((df["fam_end_rfu"] < 1200) | (df["hex_end_rfu"] < 1200)) & (df["Uyarı"].isnull()),
-            "Uyarı",
+            (end_rfu < 1200).any(axis=1) & (df[warning].isnull()),
+            warning,
         ] = "Düşük RFU Değeri"
-
-        column_order = [
-            "React ID", "Barkot No", "Hasta Adı", "Uyarı", "Kuyu No",
-            "FAM Ct", "HEX Ct", "Δ Ct", "rfu_diff", "fam_end_rfu", "hex_end_rfu",
-            "FAM koordinat list", "HEX koordinat list",
-        ]
-        return df[[c for c in column_order if c in df.columns]]
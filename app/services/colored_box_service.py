@@ -5,6 +5,8 @@ from typing import List, Optional
 
 import pandas as pd
 
+from app.services.well_index import WellIndex
+
 
 @dataclass
 class ColoredBoxConfig:
@@ -20,8 +22,16 @@ class ColoredBoxService:
     REF_COL = "Standart Oranı"
     WELL_COL = "Kuyu No"
     WARN_COL = "Uyarı"
+    # Bu kolonlardan biri değişmedikçe sonuç aynı kalır
+    DEPENDS = (STAT_COL, REF_COL, WELL_COL, WARN_COL)
 
-    def compute(self, df: Optional[pd.DataFrame], cfg: ColoredBoxConfig) -> List[bool]:
+    def compute(
+        self,
+        df: Optional[pd.DataFrame],
+        cfg: ColoredBoxConfig,
+        wells: Optional[WellIndex] = None,
+    ) -> List[bool]:
+        """wells verilmezse (snapshot dışı çağrı) df'den bir kez kurulur."""
         if df is None or df.empty:
             return [False, False, False]
 
@@ -34,32 +44,35 @@ class ColoredBoxService:
             # eksik kolon varsa güvenli fallback
             return [False, False, False]
 
+        if wells is None or len(wells) != len(df):
+            wells = WellIndex.build(df)
+
         return [
-            self._check_homozigot(df, col, cfg.homozigot_well, cfg.carrier_threshold),
-            self._check_heterozigot(df, col, cfg.heterozigot_well, cfg.carrier_threshold),
-            self._check_ntc(df, cfg.ntc_well),
+            self._check_homozigot(df, wells, col, cfg.homozigot_well, cfg.carrier_threshold),
+            self._check_heterozigot(df, wells, col, cfg.heterozigot_well, cfg.carrier_threshold),
+            self._check_ntc(df, wells, cfg.ntc_well),
         ]
 
-    def _check_homozigot(self, df: pd.DataFrame, col: str, well: str, th: float) -> bool:
-        row = df[df[self.WELL_COL] == well]
-        if row.empty:
-            return False
+    @staticmethod
+    def _ratio_at(df: pd.DataFrame, wells: WellIndex, col: str, well: str) -> Optional[float]:
+        row = wells.row_of_well(well)
+        if row is None:
+            return None
         try:
-            return float(row[col].iloc[0]) >= th
+            return float(df[col].iloc[row])
         except (TypeError, ValueError):
-            return False
+            return None
 
-    def _check_heterozigot(self, df: pd.DataFrame, col: str, well: str, th: float) -> bool:
-        row = df[df[self.WELL_COL] == well]
-        if row.empty:
-            return False
-        try:
-            return float(row[col].iloc[0]) < th
-        except (TypeError, ValueError):
-            return False
+    def _check_homozigot(self, df: pd.DataFrame, wells: WellIndex, col: str, well: str, th: float) -> bool:
+        value = self._ratio_at(df, wells, col, well)
+        return value is not None and value >= th
+
+    def _check_heterozigot(self, df: pd.DataFrame, wells: WellIndex, col: str, well: str, th: float) -> bool:
+        value = self._ratio_at(df, wells, col, well)
+        return value is not None and value < th
 
-    def _check_ntc(self, df: pd.DataFrame, well: str) -> bool:
-        row = df[df[self.WELL_COL] == well]
-        if row.empty:
+    def _check_ntc(self, df: pd.DataFrame, wells: WellIndex, well: str) -> bool:
+        row = wells.row_of_well(well)
+        if row is None:
             return False
-        return row[self.WARN_COL].iloc[0] == "Yetersiz DNA"
+        return df[self.WARN_COL].iloc[row] == "Yetersiz DNA"
@@ -0,0 +1,307 @@
+# app\services\curve_archive.py
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from app.services.curve_store import CHANNELS, CurveStore
+from app.services.well_index import WELL_COL, WellIndex
+
+logger = logging.getLogger(__name__)
+
+DATA_FILE = "curves.f32"
+INDEX_FILE = "curves.index.json"
+INDEX_FORMAT = 1
+_ITEM = np.dtype(np.float32).itemsize
+
+# Canlı blokların toplam üst sınırı; aşılınca en eski eklenen plakalar atılır
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Ölü alan (üzerine yazılmış bloklar) dosyanın bu oranını aşınca canlı bloklar yeniden yazılır
+COMPACT_DEAD_RATIO = 0.5
+# Bundan küçük dosyalar ölü alan için sıkıştırılmaz
+COMPACT_MIN_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """
+    Veri dosyasındaki tek plaka bloğu: önce cycles (C), ardından
+    values (wells, kanal, C) float32, C-sıralı.
+
+    offset: bloğun dosyadaki bayt konumu
+    """
+
+    offset: int
+    wells: int
+    channels: int
+    cycles: int
+    well_ids: Tuple[str, ...]
+
+    @property
+    def values_offset(self) -> int:
+        return self.offset + self.cycles * _ITEM
+
+    @property
+    def well_stride(self) -> int:
+        """Bir kuyunun (tüm kanallar) bayt uzunluğu."""
+        return self.channels * self.cycles * _ITEM
+
+    @property
+    def nbytes(self) -> int:
+        return (self.cycles + self.wells * self.channels * self.cycles) * _ITEM
+
+    def well_offset(self, row: int) -> int:
+        return self.values_offset + int(row) * self.well_stride
+
+    def to_json(self) -> dict:
+        return {
+            "offset": self.offset,
+            "wells": self.wells,
+            "channels": self.channels,
+            "cycles": self.cycles,
+            "well_ids": list(self.well_ids),
+        }
+
+    @classmethod
+    def from_json(cls, raw: dict) -> "ArchiveEntry":
+        return cls(
+            offset=int(raw["offset"]),
+            wells=int(raw["wells"]),
+            channels=int(raw["channels"]),
+            cycles=int(raw["cycles"]),
+            well_ids=tuple(str(w) for w in raw.get("well_ids", ())),
+        )
+
+
+class CurveArchive:
+    """
+    Çok sayıda plakanın eğrilerini tek bir yalnızca-ekleme (append-only) float32
+    dosyasında tutar; plaka/kuyu konumları küçük bir JSON indekste saklanır.
+
+    - append: yeni blok dosya sonuna yazılır, mevcut veri yeniden yazılmaz
+    - open: np.memmap ile CurveStore döner; sayfalar yalnızca kuyu çizildiğinde
+      veya analiz edildiğinde diskten okunur
+    - Aynı anahtar tekrar eklenirse indeks en yeni bloğu gösterir (eski blok ölü alan)
+    - Sıkıştırma: ölü alan oranı COMPACT_DEAD_RATIO'yu veya canlı bloklar max_bytes'ı
+      aşınca canlı bloklar (en eski eklenenler bütçeye sığana kadar atılarak) yeni bir
+      veri dosyasına yazılır; indeks yeni dosyayı gösterdikten sonra eski dosya silinir.
+      Açık memmap'ler eski dosyayı görmeye devam eder (silinemezse sonraki sıkıştırmada)
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compact_min_bytes: int = COMPACT_MIN_BYTES,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("Arşiv boyutu negatif olamaz.")
+        self.root_dir = root_dir
+        self.max_bytes = int(max_bytes)
+        self.compact_min_bytes = int(compact_min_bytes)
+        self.index_path = os.path.join(root_dir, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, ArchiveEntry]] = None
+        self._data_file = DATA_FILE
+
+    @property
+    def data_path(self) -> str:
+        """Güncel veri dosyası (sıkıştırmadan sonra değişir)."""
+        self._load_index()
+        return os.path.join(self.root_dir, self._data_file)
+
+    @classmethod
+    def default(cls) -> "CurveArchive":
+        """Uygulama veri klasöründeki arşiv (~/.pharmalyzer/curves)."""
+        from app.licensing.manager import get_app_data_dir
+
+        return cls(os.path.join(get_app_data_dir(), "curves"))
+
+    # ---- İndeks ----
+    def _load_index(self) -> Dict[str, ArchiveEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: Dict[str, ArchiveEntry] = {}
+        data_file = DATA_FILE
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                if raw.get("format") == INDEX_FORMAT:
+                    entries = {k: ArchiveEntry.from_json(v) for k, v in raw.get("plates", {}).items()}
+                    data_file = os.path.basename(str(raw.get("data_file") or DATA_FILE))
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.exception("Curve archive index could not be read; starting empty")
+                entries = {}
+
+        # Yarım kalmış yazımlar: dosya sonunu aşan bloklar yok sayılır
+        path = os.path.join(self.root_dir, data_file)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        self._data_file = data_file
+        self._entries = {k: e for k, e in entries.items() if e.offset + e.nbytes <= size}
+        return self._entries
+
+    def _write_index(self, entries: Dict[str, ArchiveEntry], data_file: Optional[str] = None) -> None:
+        data_file = data_file or self._data_file
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "format": INDEX_FORMAT,
+                    "data_file": data_file,
+                    "plates": {k: e.to_json() for k, e in entries.items()},
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp, self.index_path)
+        self._data_file = data_file
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load_index()
+
+    def keys(self) -> List[str]:
+        return list(self._load_index().keys())
+
+    def entry(self, key: str) -> Optional[ArchiveEntry]:
+        return self._load_index().get(key)
+
+    # ---- Yazma ----
+    def append(self, key: str, store: CurveStore) -> ArchiveEntry:
+        if store.values.ndim != 3 or store.values.shape[1] != len(CHANNELS):
+            raise ValueError(f"Beklenmeyen eğri tensörü boyutu: {store.values.shape}")
+
+        cycles = np.ascontiguousarray(store.cycles, dtype=np.float32)
+        values = np.ascontiguousarray(store.values, dtype=np.float32)
+
+        with self._lock:
+            os.makedirs(self.root_dir, exist_ok=True)
+            entries = dict(self._load_index())
+            # Sıra = ekleme yeniliği (sıkıştırmada en eskiler önce atılır)
+            entries.pop(key, None)
+
+            with open(self.data_path, "ab") as f:
+                offset = f.tell()
+                cycles.tofile(f)
+                values.tofile(f)
+
+            entry = ArchiveEntry(
+                offset=offset,
+                wells=int(values.shape[0]),
+                channels=int(values.shape[1]),
+                cycles=int(cycles.size),
+                well_ids=tuple(store.wells.well_ids),
+            )
+            entries[key] = entry
+            self._write_index(entries)
+            self._entries = entries
+
+            logger.debug("Curve archive append: key=%s offset=%d bytes=%d", key, offset, entry.nbytes)
+            try:
+                entry = self._maybe_compact(entries).get(key, entry)
+            except OSError:
+                # Blok zaten yazıldı; sıkıştırma sonraki eklemede tekrar denenir
+                logger.exception("Curve archive compaction failed")
+        return entry
+
+    def _maybe_compact(self, entries: Dict[str, ArchiveEntry]) -> Dict[str, ArchiveEntry]:
+        old_path = self.data_path
+        size = os.path.getsize(old_path)
+        live = sum(e.nbytes for e in entries.values())
+        if live <= self.max_bytes and (size < self.compact_min_bytes or size - live <= COMPACT_DEAD_RATIO * size):
+            return entries
+
+        keep = list(entries.items())
+        # Bütçe aşımı: en eski eklenenler atılır, son eklenen her zaman kalır
+        while len(keep) > 1 and live > self.max_bytes:
+            live -= keep.pop(0)[1].nbytes
+
+        generation = _generation(self._data_file) + 1
+        data_file = f"curves.{generation}.f32"
+        new_path = os.path.join(self.root_dir, data_file)
+        compacted: Dict[str, ArchiveEntry] = {}
+        with open(old_path, "rb") as src, open(new_path + ".tmp", "wb") as dst:
+            for key, e in keep:
+                src.seek(e.offset)
+                compacted[key] = ArchiveEntry(
+                    offset=dst.tell(),
+                    wells=e.wells,
+                    channels=e.channels,
+                    cycles=e.cycles,
+                    well_ids=e.well_ids,
+                )
+                dst.write(src.read(e.nbytes))
+        os.replace(new_path + ".tmp", new_path)
+        # İndeks yeni dosyayı gösterdikten sonra eskiler silinir (yarıda kalırsa eski indeks geçerli)
+        self._write_index(compacted, data_file)
+        self._entries = compacted
+        self._remove_stale_data_files()
+
+        logger.debug(
+            "Curve archive compacted: %d -> %d bytes, dropped=%d",
+            size,
+            os.path.getsize(new_path),
+            len(entries) - len(compacted),
+        )
+        return compacted
+
+    def _remove_stale_data_files(self) -> None:
+        for name in os.listdir(self.root_dir):
+            if name != self._data_file and name.startswith("curves") and name.endswith((".f32", ".f32.tmp")):
+                try:
+                    os.remove(os.path.join(self.root_dir, name))
+                except OSError:
+                    # Windows: açık memmap'i olan dosya silinemez; sonraki sıkıştırmada tekrar denenir
+                    logger.debug("Curve archive stale file in use: %s", name)
+
+    # ---- Okuma ----
+    def open(self, key: str, *, version: int = 0) -> Optional[CurveStore]:
+        """Anahtarın en son bloğunu diske eşlenmiş CurveStore olarak döner (yoksa None)."""
+        entry = self.entry(key)
+        if entry is None:
+            return None
+
+        cycles = np.array(
+            np.memmap(self.data_path, dtype=np.float32, mode="r", offset=entry.offset, shape=(entry.cycles,))
+        )
+        cycles.setflags(write=False)
+        values = np.memmap(
+            self.data_path,
+            dtype=np.float32,
+            mode="r",
+            offset=entry.values_offset,
+            shape=(entry.wells, entry.channels, entry.cycles),
+        )
+        wells = WellIndex.build(pd.DataFrame({WELL_COL: list(entry.well_ids)}))
+        return CurveStore(version=version, cycles=cycles, values=values, wells=wells)
+
+    def read_well(self, key: str, well_id: str) -> Optional[NDArray[np.float32]]:
+        """Tek kuyunun (kanal, döngü) eğrileri; yalnızca o kuyunun baytları okunur."""
+        entry = self.entry(key)
+        if entry is None:
+            return None
+        try:
+            row = entry.well_ids.index(str(well_id).strip().upper())
+        except ValueError:
+            return None
+
+        with open(self.data_path, "rb") as f:
+            f.seek(entry.well_offset(row))
+            out = np.fromfile(f, dtype=np.float32, count=entry.channels * entry.cycles)
+        return out.reshape(entry.channels, entry.cycles)
+
+
+def _generation(data_file: str) -> int:
+    """curves.f32 -> 0, curves.3.f32 -> 3."""
+    parts = data_file.split(".")
+    return int(parts[1]) if len(parts) == 3 and parts[1].isdigit() else 0
@@ -0,0 +1,103 @@
+# app\services\curve_codec.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.services.curve_store import CurveStore
+from app.services.well_index import WellIndex
+
+# bits -> delta dtype; en küçük değer eksik ölçüm (NaN) işaretidir.
+# 32 bit yok: int32 delta float32'den küçük değil, üstelik kayıplı (kayıpsız için bits=0)
+_DELTA_DTYPES: Dict[int, np.dtype] = {16: np.dtype(np.int16)}
+CODEC_BITS: Tuple[int, ...] = tuple(_DELTA_DTYPES)
+
+
+@dataclass(frozen=True)
+class EncodedCurves:
+    """
+    Kuantize + delta kodlu eğri tensörü.
+
+    cycles: tüm kuyularda ortak döngü ekseni (bir kez saklanır)
+    offset / scale: (wells, kanal) float64; y ≈ offset + q * scale
+    deltas: (wells, kanal, döngü) int16; q'nun döngüler boyunca farkı,
+            eksik ölçümler dtype'ın en küçük değeri
+    """
+
+    bits: int
+    cycles: NDArray[np.float32]
+    offset: NDArray[np.float64]
+    scale: NDArray[np.float64]
+    deltas: NDArray[np.signedinteger]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.cycles.nbytes + self.offset.nbytes + self.scale.nbytes + self.deltas.nbytes)
+
+    @property
+    def max_error(self) -> NDArray[np.float64]:
+        """(wells, kanal) kuantizasyon hatası üst sınırı: scale / 2 (+ float32 yuvarlaması)."""
+        return self.scale / 2.0
+
+
+class CurveCodec:
+    """
+    Arşivler için kayıplı, sınırlı hatalı eğri sıkıştırması.
+
+    - Her kuyu/kanal kendi [min, max] aralığına göre 2**(bits-1) - 1 seviyeye
+      kuantize edilir; hata en fazla aralık / (2 * seviye) olur (16 bit: aralığın ~%0.0015'i)
+    - Seviyeler döngü boyunca delta kodlanır; küçük farklar deflate ile iyi sıkışır.
+      Gerçek plakalarda oturum dosyası kayıpsız float32 arşivin ~yarısıdır
+    - Kodlama ve çözme tamamen vektörel (kuyu döngüsü yok)
+    """
+
+    @staticmethod
+    def encode(store: CurveStore, bits: int = 16) -> EncodedCurves:
+        dtype = _DELTA_DTYPES.get(int(bits))
+        if dtype is None:
+            raise ValueError(f"Desteklenmeyen kodlama bit sayısı: {bits} (geçerli: {CODEC_BITS})")
+
+        values = np.asarray(store.values, dtype=np.float64)
+        finite = np.isfinite(values)
+        levels = np.iinfo(dtype).max
+
+        lo = np.where(finite, values, np.inf).min(axis=-1)
+        hi = np.where(finite, values, -np.inf).max(axis=-1)
+        empty = ~np.isfinite(lo)
+        lo = np.where(empty, 0.0, lo)
+        span = np.where(empty, 0.0, hi - lo)
+        scale = np.where(span > 0, span / levels, 1.0)
+
+        q = np.rint((np.where(finite, values, lo[..., None]) - lo[..., None]) / scale[..., None])
+        q = np.clip(q, 0, levels).astype(np.int64)
+
+        # Eksik döngülerde son ölçülen seviye tekrarlanır (delta 0), sonra işaretlenir
+        last = np.where(finite, np.arange(values.shape[-1]), 0)
+        np.maximum.accumulate(last, axis=-1, out=last)
+        filled = np.take_along_axis(q, last, axis=-1)
+
+        deltas = np.diff(filled, axis=-1, prepend=0).astype(dtype)
+        deltas[~finite] = np.iinfo(dtype).min
+
+        for arr in (lo, scale, deltas):
+            arr.setflags(write=False)
+        cycles = np.array(store.cycles, dtype=np.float32)
+        cycles.setflags(write=False)
+        return EncodedCurves(bits=int(bits), cycles=cycles, offset=lo, scale=scale, deltas=deltas)
+
+    @staticmethod
+    def decode_values(encoded: EncodedCurves) -> NDArray[np.float32]:
+        deltas = encoded.deltas
+        missing = deltas == np.iinfo(deltas.dtype).min
+        q = np.cumsum(np.where(missing, 0, deltas), axis=-1, dtype=np.int64)
+        values = (encoded.offset[..., None] + q * encoded.scale[..., None]).astype(np.float32)
+        values[missing] = np.nan
+        values.setflags(write=False)
+        return values
+
+    @classmethod
+    def decode(cls, encoded: EncodedCurves, *, version: int, wells: WellIndex) -> CurveStore:
+        return CurveStore(version=version, cycles=encoded.cycles, values=cls.decode_values(encoded), wells=wells)
@@ -0,0 +1,261 @@
+# app\services\curve_store.py
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from app.services.well_index import WellIndex
+
+CHANNELS: Tuple[str, str] = ("FAM", "HEX")
+FAM, HEX = range(2)
+CHANNEL_COLUMNS: Tuple[str, str] = ("FAM koordinat list", "HEX koordinat list")
+
+# "[(1, -228.6), (2, -53.4)]" -> "1, -228.6, 2, -53.4"
+_STRIP_BRACKETS = str.maketrans({"[": " ", "]": " ", "(": " ", ")": " "})
+
+
+@dataclass(frozen=True)
+class PCRCoords:
+    """
+    Tek kuyunun eğri görünümleri. cycles tüm kuyularda ortak eksendir;
+    fam_y / hex_y CurveStore tensörüne kopyasız, salt-okunur görünümlerdir
+    (eksik döngüler NaN).
+
+    fam / hex: eski (N, 2) [döngü, RFU] formatı; ilk erişimde sonlu
+    noktalardan üretilir ve cache'lenir.
+    """
+
+    cycles: NDArray[np.float32]
+    fam_y: NDArray[np.float32]
+    hex_y: NDArray[np.float32]
+
+    @property
+    def has_fam(self) -> bool:
+        return bool(np.isfinite(self.fam_y).any())
+
+    @property
+    def has_hex(self) -> bool:
+        return bool(np.isfinite(self.hex_y).any())
+
+    @cached_property
+    def fam(self) -> NDArray[np.float32]:
+        return _as_xy(self.cycles, self.fam_y)
+
+    @cached_property
+    def hex(self) -> NDArray[np.float32]:
+        return _as_xy(self.cycles, self.hex_y)
+
+
+def _as_xy(cycles: NDArray[np.float32], y: NDArray[np.float32]) -> NDArray[np.float32]:
+    finite = np.isfinite(y)
+    if not finite.any():
+        out = np.empty((0, 2), dtype=np.float32)
+    else:
+        out = np.column_stack((cycles[finite], y[finite]))
+    out.setflags(write=False)
+    return out
+
+
+@dataclass(frozen=True)
+class CurveStore:
+    """
+    Tüm kuyuların eğrileri tek bitişik float32 tensörde: values[row, channel, cycle].
+    row, kaynak DataFrame'in satır pozisyonudur (WellIndex ile çözülür).
+    values np.memmap de olabilir (bkz. CurveArchive); sayfalar erişildikçe okunur.
+
+    mask[row, channel, cycle]: ölçüm var mı (values NaN değil); ilk erişimde üretilir
+    version: kurulduğu DataStore kolon versiyonu
+    """
+
+    version: int
+    cycles: NDArray[np.float32]
+    values: NDArray[np.float32]
+    wells: WellIndex
+
+    @cached_property
+    def mask(self) -> NDArray[np.bool_]:
+        mask = np.isfinite(self.values)
+        mask.setflags(write=False)
+        return mask
+
+    @property
+    def well_count(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def cycle_count(self) -> int:
+        return int(self.cycles.size)
+
+    @property
+    def nbytes(self) -> int:
+        # mask: eleman başına 1 bayt
+        return int(self.values.nbytes + self.values.size + self.cycles.nbytes)
+
+    @property
+    def is_mapped(self) -> bool:
+        return isinstance(self.values, np.memmap)
+
+    @property
+    def resident_nbytes(self) -> int:
+        """RAM'de tutulan boyut; diske eşlenmiş store'larda sayfalar işletim sistemine aittir."""
+        return 0 if self.is_mapped else self.nbytes
+
+    def coords_at(self, row: int) -> PCRCoords:
+        """Kopyasız, salt-okunur kuyu görünümü."""
+        return PCRCoords(self.cycles, self.values[row, FAM], self.values[row, HEX])
+
+    def row_of_patient(self, patient_no: int) -> Optional[int]:
+        return self.wells.row_of_patient(patient_no)
+
+    def gather(self, rows: Sequence[int]) -> NDArray[np.float32]:
+        """Seçili satırlar için tek fancy-index toplama: (len(rows), kanal, döngü)."""
+        return self.values[np.asarray(rows, dtype=np.intp)]
+
+    def coords_for_rows(self, rows: Sequence[int]) -> List[PCRCoords]:
+        batch = self.gather(rows)
+        batch.setflags(write=False)
+        return [PCRCoords(self.cycles, batch[i, FAM], batch[i, HEX]) for i in range(batch.shape[0])]
+
+    # ---- kurulum ----
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, *, version: int, wells: Optional[WellIndex] = None) -> "CurveStore":
+        missing = [c for c in CHANNEL_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"DataFrame içinde eksik kolon(lar) var: {missing}")
+
+        wells = wells if wells is not None and len(wells) == len(df) else WellIndex.build(df)
+        parsed = [_parse_column(df[col].tolist()) for col in CHANNEL_COLUMNS]
+        return cls.from_parsed(parsed, version=version, wells=wells)
+
+    @classmethod
+    def from_parsed(
+        cls,
+        parsed: Sequence[Tuple[NDArray[np.float64], NDArray[np.int64]]],
+        *,
+        version: int,
+        wells: WellIndex,
+    ) -> "CurveStore":
+        """
+        parsed[k] = (flat, counts): k kanalı için tüm kuyuların [döngü, RFU]
+        çiftleri düz dizide, counts her kuyunun çift sayısı.
+        """
+        n_wells = len(wells)
+        all_cycles = [flat[0::2] for flat, _ in parsed if flat.size]
+        if all_cycles:
+            cycles = np.unique(np.concatenate(all_cycles))
+            cycles = cycles[np.isfinite(cycles)]
+        else:
+            cycles = np.empty(0, dtype=np.float64)
+
+        values = np.full((n_wells, len(parsed), cycles.size), np.nan, dtype=np.float32)
+        for k, (flat, counts) in enumerate(parsed):
+            if not flat.size:
+                continue
+            xs, ys = flat[0::2], flat[1::2]
+            rows = np.repeat(np.arange(n_wells), counts)
+            ok = np.isfinite(xs)
+            cols = np.searchsorted(cycles, xs[ok])
+            values[rows[ok], k, cols] = ys[ok]
+
+        cycles32 = cycles.astype(np.float32)
+        for arr in (values, cycles32):
+            arr.setflags(write=False)
+        return cls(version=version, cycles=cycles32, values=values, wells=wells)
+
+
+def end_values(raw_values: List[Any]) -> NDArray[np.float64]:
+    """Her hücrenin son [döngü, RFU] çiftindeki RFU (boş/bozuk hücre NaN)."""
+    flat, counts = _parse_column(raw_values)
+    out = np.full(len(raw_values), np.nan, dtype=np.float64)
+    has = counts > 0
+    out[has] = flat[np.cumsum(counts)[has] * 2 - 1]
+    return out
+
+
+def _parse_column(raw_values: List[Any]) -> Tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Bir koordinat kolonunu tek geçişte sayısala çevirir: tüm hücreler köşeli
+    parantezlerden arındırılıp birleştirilir ve tek float dönüşümü yapılır.
+    Bozuk hücre varsa yalnızca o hücreler literal_eval ile ayrıştırılır.
+    """
+    texts: List[str] = []
+    counts = np.zeros(len(raw_values), dtype=np.int64)
+    slow: Dict[int, Any] = {}
+
+    for i, raw in enumerate(raw_values):
+        if isinstance(raw, str):
+            t = raw.translate(_STRIP_BRACKETS).strip().strip(",")
+            if not t:
+                continue
+            n_tokens = t.count(",") + 1
+            if n_tokens % 2:
+                slow[i] = raw
+                continue
+            texts.append(t)
+            counts[i] = n_tokens // 2
+        elif raw is not None and not (isinstance(raw, float) and np.isnan(raw)):
+            slow[i] = raw
+
+    try:
+        flat = np.array(",".join(texts).split(","), dtype=np.float64) if texts else np.empty(0)
+    except ValueError:
+        # Hızlı yol başarısızsa tüm hücreler için güvenli yola düş
+        return _parse_column_slow(raw_values)
+
+    if not slow:
+        return flat, counts
+    return _merge_slow(raw_values, flat, counts, slow)
+
+
+def _merge_slow(
+    raw_values: List[Any],
+    flat: NDArray[np.float64],
+    counts: NDArray[np.int64],
+    slow: Dict[int, Any],
+) -> Tuple[NDArray[np.float64], NDArray[np.int64]]:
+    parts: List[NDArray[np.float64]] = []
+    pos = 0
+    for i in range(len(raw_values)):
+        if i in slow:
+            pairs = _pairs_from_raw(slow[i])
+            counts[i] = pairs.shape[0]
+            parts.append(pairs.ravel())
+        else:
+            n = int(counts[i]) * 2
+            parts.append(flat[pos:pos + n])
+            pos += n
+    return (np.concatenate(parts) if parts else np.empty(0)), counts
+
+
+def _parse_column_slow(raw_values: List[Any]) -> Tuple[NDArray[np.float64], NDArray[np.int64]]:
+    pairs = [_pairs_from_raw(raw) for raw in raw_values]
+    counts = np.array([p.shape[0] for p in pairs], dtype=np.int64)
+    flat = np.concatenate([p.ravel() for p in pairs]) if pairs else np.empty(0)
+    return flat, counts
+
+
+def _pairs_from_raw(raw: Any) -> NDArray[np.float64]:
+    """Tek hücre: literal_eval + geçersiz öğeleri atlama (eski davranış)."""
+    if isinstance(raw, str):
+        try:
+            raw = ast.literal_eval(raw) if raw.strip() else None
+        except (ValueError, SyntaxError):
+            return np.empty((0, 2), dtype=np.float64)
+    if not isinstance(raw, (list, tuple)):
+        return np.empty((0, 2), dtype=np.float64)
+
+    out: List[Tuple[float, float]] = []
+    for item in raw:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            continue
+        try:
+            out.append((float(int(item[0])), float(item[1])))
+        except (TypeError, ValueError):
+            continue
+    return np.asarray(out, dtype=np.float64).reshape(-1, 2)
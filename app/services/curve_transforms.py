@@ -0,0 +1,174 @@
+# app\services\curve_transforms.py
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.services.curve_store import CurveStore
+
+
+class CurveMode(str, Enum):
+    """PCR grafiğinde eğrilerin gösterim biçimi."""
+
+    RAW = "raw"
+    BASELINE = "baseline"
+    NORMALIZED = "normalized"
+    LOG = "log"
+    DERIVATIVE = "derivative"
+
+    @classmethod
+    def parse(cls, raw: "CurveMode | str | None") -> "CurveMode":
+        if raw is None:
+            return cls.RAW
+        try:
+            return cls(raw)
+        except ValueError:
+            raise ValueError(f"Geçersiz eğri modu: {raw!r}") from None
+
+
+CURVE_MODE_LABELS = {
+    CurveMode.RAW: "Ham RFU",
+    CurveMode.BASELINE: "Baz çizgisi çıkarılmış",
+    CurveMode.NORMALIZED: "Normalize (0-1)",
+    CurveMode.LOG: "Log10 ΔRFU",
+    CurveMode.DERIVATIVE: "1. türev",
+}
+
+
+@dataclass(frozen=True)
+class TransformConfig:
+    """
+    baseline_start / baseline_end: doğrusal baz çizgisi uydurma döngü aralığı (dahil)
+    smooth_window / smooth_order: Savitzky-Golay penceresi (tek sayı) ve polinom derecesi
+    log_floor: log gösteriminde alt sınır (≤0 değerler bu değere kırpılır)
+    """
+
+    baseline_start: float = 3.0
+    baseline_end: float = 15.0
+    smooth_window: int = 7
+    smooth_order: int = 2
+    log_floor: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.baseline_end < self.baseline_start:
+            raise ValueError("Baz çizgisi aralığı geçersiz: bitiş başlangıçtan küçük.")
+        if self.smooth_window < 3 or self.smooth_window % 2 == 0:
+            raise ValueError(f"Yumuşatma penceresi 3 veya daha büyük tek sayı olmalı: {self.smooth_window}")
+        if not 1 <= self.smooth_order < self.smooth_window:
+            raise ValueError(f"Polinom derecesi 1 ile pencere-1 arasında olmalı: {self.smooth_order}")
+        if self.log_floor <= 0:
+            raise ValueError("log_floor pozitif olmalı.")
+
+
+class CurveTransforms:
+    """
+    (kuyu, kanal, döngü) eğri tensörü üzerinde türetilmiş gösterimler; tüm kuyular
+    tek seferde, kuyu döngüsü olmadan hesaplanır. Eksik döngüler NaN kalır.
+    """
+
+    @staticmethod
+    def apply(
+        cycles: NDArray[np.float32],
+        values: NDArray[np.float32],
+        mode: CurveMode | str,
+        config: TransformConfig | None = None,
+    ) -> NDArray[np.float32]:
+        mode = CurveMode.parse(mode)
+        config = config or TransformConfig()
+        if mode is CurveMode.RAW:
+            return values
+
+        x = np.asarray(cycles, dtype=np.float64)
+        y = np.asarray(values, dtype=np.float64)
+        slope, intercept = CurveTransforms.baseline_fit(x, y, config.baseline_start, config.baseline_end)
+        out = y - (slope[..., None] * x + intercept[..., None])
+
+        if mode is CurveMode.NORMALIZED:
+            out = _min_max(out)
+        elif mode is CurveMode.LOG:
+            out = np.log10(np.maximum(out, config.log_floor))  # NaN korunur
+        elif mode is CurveMode.DERIVATIVE:
+            out = CurveTransforms.savgol_derivative(x, out, config.smooth_window, config.smooth_order)
+
+        out = out.astype(np.float32)
+        out.setflags(write=False)
+        return out
+
+    @staticmethod
+    def baseline_fit(
+        x: NDArray[np.float64], y: NDArray[np.float64], start: float, end: float
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Eğri başına [start, end] döngülerindeki sonlu noktalara y = a*x + b (maskeli en
+        küçük kareler). Tek nokta: sabit; hiç nokta yok: sıfır baz çizgisi.
+        """
+        mask = np.isfinite(y) & ((x >= start) & (x <= end))
+        k = mask.sum(axis=-1)
+        safe_k = np.maximum(k, 1)
+        xb = np.broadcast_to(x, y.shape)
+        xm = np.where(mask, xb, 0.0).sum(axis=-1) / safe_k
+        ym = np.where(mask, y, 0.0).sum(axis=-1) / safe_k
+        dx = np.where(mask, xb - xm[..., None], 0.0)
+        dy = np.where(mask, y - ym[..., None], 0.0)
+        sxx = (dx * dx).sum(axis=-1)
+        slope = np.divide((dx * dy).sum(axis=-1), sxx, out=np.zeros_like(sxx), where=sxx > 0)
+        intercept = np.where(k > 0, ym - slope * xm, 0.0)
+        return slope, intercept
+
+    @staticmethod
+    def savgol_derivative(x: NDArray[np.float64], y: NDArray[np.float64], window: int, order: int) -> NDArray[np.float64]:
+        """
+        Son eksen boyunca Savitzky-Golay 1. türevi (dRFU/ddöngü). Kenarlarda ilk/son
+        pencereye uydurulan polinomun türevi kullanılır. NaN içeren pencere NaN verir.
+        """
+        n = y.shape[-1]
+        window = min(window, n if n % 2 else n - 1)
+        if window < 3:
+            if n < 2:
+                return np.full_like(y, np.nan)
+            return np.gradient(y, x, axis=-1)
+        order = min(order, window - 1)
+        half = window // 2
+        step = float(np.median(np.diff(x))) if n > 1 else 1.0
+        weights = _savgol_weights(window, order) / (step or 1.0)  # (pencere içi konum, pencere)
+
+        out = np.empty_like(y)
+        windows = np.lib.stride_tricks.sliding_window_view(y, window, axis=-1)
+        out[..., half : n - half] = windows @ weights[half]
+        out[..., :half] = y[..., :window] @ weights[:half].T
+        out[..., n - half :] = y[..., n - window :] @ weights[half + 1 :].T
+        return out
+
+    @staticmethod
+    def derive_store(store: CurveStore, mode: CurveMode | str, config: TransformConfig | None = None) -> CurveStore:
+        """Aynı kuyu indeksi ve döngü ekseniyle türetilmiş değerli store (RAW: kendisi)."""
+        mode = CurveMode.parse(mode)
+        if mode is CurveMode.RAW:
+            return store
+        return replace(store, values=CurveTransforms.apply(store.cycles, store.values, mode, config))
+
+
+def _min_max(y: NDArray[np.float64]) -> NDArray[np.float64]:
+    finite = np.isfinite(y)
+    lo = np.where(finite, y, np.inf).min(axis=-1, keepdims=True)
+    hi = np.where(finite, y, -np.inf).max(axis=-1, keepdims=True)
+    span = hi - lo
+    ok = np.isfinite(span) & (span > 0)
+    return np.where(ok, (y - np.where(ok, lo, 0.0)) / np.where(ok, span, 1.0), np.where(finite, 0.0, np.nan))
+
+
+def _savgol_weights(window: int, order: int) -> NDArray[np.float64]:
+    """
+    weights[t] · pencere = pencereye uydurulan polinomun t konumundaki türevi
+    (t = 0..window-1; merkez t = window // 2).
+    """
+    offsets = np.arange(window, dtype=np.float64) - window // 2
+    vander = offsets[:, None] ** np.arange(order + 1)
+    coeffs = np.linalg.pinv(vander)  # (derece, pencere)
+    powers = np.arange(1, order + 1)
+    basis = powers * offsets[:, None] ** (powers - 1)  # d/dt t^j
+    return basis @ coeffs[1:]
@@ -1,37 +1,283 @@
 # app\services\data_store.py
 # app/services/data_store.py
+import logging
 import threading
-from typing import Optional
+from dataclasses import dataclass, field
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Callable, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
 import pandas as pd
+from numpy.typing import NDArray
+
+from app.services.result_schema import ensure_category
+from app.services.well_index import PATIENT_NO_COL, WELL_COL, WellIndex
+
+logger = logging.getLogger(__name__)
+
+_PANDAS_MAJOR = int(pd.__version__.split(".", 1)[0])
+
+
+def _copy_on_write() -> bool:
+    """pandas 3'te her zaman açık; 2.x'te mode.copy_on_write seçeneğine bağlıdır."""
+    return _PANDAS_MAJOR >= 3 or pd.get_option("mode.copy_on_write") is True
+
+
+class ChangeKind(str, Enum):
+    RESET = "reset"  # tüm frame değişti (import, analiz sonucu)
+    COLUMNS = "columns"  # yalnızca belirtilen kolon/satırlar değişti
+    CLEAR = "clear"
+
+
+@dataclass(frozen=True)
+class DataChange:
+    """
+    DataStore yazımından sonra abonelere iletilen tipli olay.
+    rows None ise kolonun tüm satırları değişmiş kabul edilir.
+    """
+
+    kind: ChangeKind
+    version: int
+    previous_version: int
+    columns: FrozenSet[str] = frozenset()
+    rows: Optional[Tuple[int, ...]] = None
+
+    def touches(self, columns: Iterable[str]) -> bool:
+        """Verilen kolonlardan herhangi birine bağımlı olan tüketici yenilenmeli mi?"""
+        if self.kind != ChangeKind.COLUMNS:
+            return True
+        return not self.columns.isdisjoint(columns)
+
+
+DataListener = Callable[[DataChange], None]
+
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    """
+    DataStore'un yayınladığı değişmez görünüm.
+
+    version monoton artar; cache'ler nesne kimliği yerine bu değere göre anahtarlanmalıdır.
+    df paylaşılır: okuyucular yerinde değişiklik yapmamalı, gerekiyorsa
+    df.copy(deep=False) (copy-on-write, O(kolon)) veya DataStore.edit kullanmalıdır.
+    Copy-on-write pandas 3'te varsayılandır; 2.x'te main.py açılışta etkinleştirir.
+    Seçenek kapalıysa (testler, betikler) DataStore sığ kopya yerine derin kopya alır.
+    """
+
+    version: int
+    df: Optional[pd.DataFrame]
+    column_versions: Mapping[str, int] = field(default_factory=dict)
+    wells: Optional[WellIndex] = None
+
+    @property
+    def empty(self) -> bool:
+        return self.df is None or self.df.empty
+
+    def columns_version(self, *columns: str) -> int:
+        """
+        Verilen kolonların en son değiştiği versiyon. Yalnızca bu kolonlara
+        bağlı cache'ler, ilgisiz kolon düzenlemelerinde geçersiz olmaz.
+        """
+        if not columns:
+            return self.version
+        return max(self.column_versions.get(c, 0) for c in columns)
+
+    def column(self, name: str) -> NDArray[Any]:
+        """Kolonun salt-okunur numpy görünümü (mümkünse kopyasız)."""
+        if self.df is None:
+            raise ValueError("DataFrame yok.")
+        arr = self.df[name].to_numpy()
+        if arr.flags.writeable:
+            arr = arr.view()
+            arr.setflags(write=False)
+        return arr
 
 
 class DataStore:
+    """
+    Tek yazıcı kilidi + kilitsiz okuma.
+
+    Yazma işlemleri _lock altında yeni bir DataSnapshot üretir ve tek atamayla
+    yayınlar; okuyucular yalnızca _snapshot referansını okur (atomik), kilit beklemez.
+    """
+
     _lock = threading.RLock()
-    _df: Optional[pd.DataFrame] = None
+    _version: int = 0
+    _snapshot: DataSnapshot = DataSnapshot(version=0, df=None)
+    _listeners: List[DataListener] = []
 
+    # ---- Abonelik ----
     @classmethod
-    def set_df(cls, df: pd.DataFrame, *, copy: bool = False) -> None:
-        if df is None:
-            raise ValueError("DataFrame cannot be None.")
+    def subscribe(cls, listener: DataListener) -> None:
+        """
+        listener yazan thread üzerinde, kilit bırakıldıktan sonra çağrılır.
+        Qt tarafı için bir sinyale köprülenmelidir (bkz. MainModel.data_changed).
+        """
         with cls._lock:
-            cls._df = df.copy(deep=True) if copy else df
+            if listener not in cls._listeners:
+                cls._listeners = [*cls._listeners, listener]
 
     @classmethod
-    def get_df(cls) -> Optional[pd.DataFrame]:
+    def unsubscribe(cls, listener: DataListener) -> None:
         with cls._lock:
-            return cls._df
+            cls._listeners = [fn for fn in cls._listeners if fn != listener]
+
+    # ---- Okuma (kilitsiz) ----
+    @classmethod
+    def get_snapshot(cls) -> DataSnapshot:
+        return cls._snapshot
+
+    @classmethod
+    def version(cls) -> int:
+        return cls._snapshot.version
+
+    @classmethod
+    def get_df(cls) -> Optional[pd.DataFrame]:
+        """Paylaşılan snapshot DataFrame'i (yerinde değiştirmeyin)."""
+        return cls._snapshot.df
 
     @classmethod
     def get_df_copy(cls) -> Optional[pd.DataFrame]:
-        with cls._lock:
-            return cls._df.copy(deep=True) if cls._df is not None else None
+        df = cls._snapshot.df
+        return df.copy(deep=True) if df is not None else None
+
+    @classmethod
+    def has_df(cls) -> bool:
+        return cls._snapshot.df is not None
 
+    # ---- Yazma ----
     @classmethod
-    def clear(cls) -> None:
+    def set_df(cls, df: pd.DataFrame, *, copy: bool = False, notify: bool = True) -> DataSnapshot:
+        if df is None:
+            raise ValueError("DataFrame cannot be None.")
         with cls._lock:
-            cls._df = None
+            snapshot, change = cls._publish(df.copy(deep=True) if copy else df)
+        if notify:
+            cls._notify(change)
+        return snapshot
 
     @classmethod
-    def has_df(cls) -> bool:
+    def edit(
+        cls,
+        fn: Callable[[pd.DataFrame], Optional[pd.DataFrame]],
+        *,
+        deep: bool = False,
+        columns: Optional[Iterable[str]] = None,
+        rows: Optional[Iterable[int]] = None,
+        notify: bool = True,
+    ) -> DataSnapshot:
+        """
+        Copy-on-write düzenleme: fn mevcut snapshot'ın özel bir kopyasını alır,
+        yerinde değiştirebilir ya da yeni bir DataFrame döndürebilir.
+        deep=False iken yalnızca değiştirilen kolonlar kopyalanır (copy-on-write
+        kapalıysa derin kopya alınır).
+
+        fn kilit dışında çalışır (pipeline adımları okuyucuları bekletmez); yalnızca
+        yayınlama kilitlidir. Bu arada başka bir yazım yayınlanmışsa fn yeni
+        snapshot üzerinde tekrar çalıştırılır, bu yüzden fn yan etkisiz olmalıdır.
+
+        columns verilirse olay COLUMNS türündedir ve yalnızca bu kolonların
+        versiyonu ilerler; verilmezse tüm frame değişmiş (RESET) kabul edilir.
+        """
+        while True:
+            base = cls._snapshot
+            if base.df is None:
+                raise ValueError("DataStore boş. Düzenlenecek veri yok.")
+            work = base.df.copy(deep=deep or not _copy_on_write())
+            out = fn(work)
+            with cls._lock:
+                if cls._snapshot is not base:
+                    continue
+                snapshot, change = cls._publish(
+                    work if out is None else out,
+                    columns=columns,
+                    rows=rows,
+                )
+            break
+        if notify:
+            cls._notify(change)
+        return snapshot
+
+    @classmethod
+    def set_cell(cls, row: int, column: str, value: Any) -> DataSnapshot:
+        """Tek hücre düzenlemesi (pozisyonel satır, kolon adı)."""
+
+        def _apply(df: pd.DataFrame) -> None:
+            if column not in df.columns:
+                raise ValueError(f"Kolon bulunamadı: {column}")
+            ensure_category(df, column, value)
+            df.iloc[int(row), df.columns.get_loc(column)] = value
+
+        return cls.edit(_apply, columns=(column,), rows=(int(row),))
+
+    @classmethod
+    def clear(cls, *, notify: bool = True) -> None:
         with cls._lock:
-            return cls._df is not None
+            previous = cls._snapshot.version
+            cls._version += 1
+            cls._snapshot = DataSnapshot(version=cls._version, df=None)
+            change = DataChange(ChangeKind.CLEAR, cls._version, previous)
+        if notify:
+            cls._notify(change)
+
+    @classmethod
+    def _publish(
+        cls,
+        df: pd.DataFrame,
+        *,
+        columns: Optional[Iterable[str]] = None,
+        rows: Optional[Iterable[int]] = None,
+    ) -> Tuple[DataSnapshot, DataChange]:
+        # Sığ kopya: üreticinin elindeki nesneye sonradan yapılan değişiklikler
+        # (copy-on-write sayesinde) yayınlanmış snapshot'a yansımaz; kapalıysa derin kopya.
+        previous = cls._snapshot
+        cls._version += 1
+        version = cls._version
+
+        if columns is None:
+            column_versions = {str(c): version for c in df.columns}
+            change = DataChange(ChangeKind.RESET, version, previous.version)
+        else:
+            touched = frozenset(str(c) for c in columns)
+            column_versions = {
+                str(c): (version if c in touched else previous.column_versions.get(c, version))
+                for c in df.columns
+            }
+            change = DataChange(
+                ChangeKind.COLUMNS,
+                version,
+                previous.version,
+                columns=touched,
+                rows=tuple(int(r) for r in rows) if rows is not None else None,
+            )
+
+        snapshot = DataSnapshot(
+            version=version,
+            df=df.copy(deep=not _copy_on_write()),
+            column_versions=MappingProxyType(column_versions),
+            wells=cls._well_index_for(df, previous, change),
+        )
+        cls._snapshot = snapshot
+        return snapshot, change
+
+    @staticmethod
+    def _well_index_for(df: pd.DataFrame, previous: DataSnapshot, change: DataChange) -> Optional[WellIndex]:
+        # Kuyu kolonlarına dokunmayan hücre düzenlemelerinde indeks aynen taşınır
+        if (
+            change.kind == ChangeKind.COLUMNS
+            and previous.wells is not None
+            and len(previous.wells) == len(df)
+            and not change.touches((WELL_COL, PATIENT_NO_COL))
+        ):
+            return previous.wells
+        if WELL_COL not in df.columns and PATIENT_NO_COL not in df.columns:
+            return None
+        return WellIndex.build(df)
+
+    @classmethod
+    def _notify(cls, change: DataChange) -> None:
+        for listener in cls._listeners:
+            try:
+                listener(change)
+            except Exception:
+                logger.exception("DataStore listener failed")
@@ -28,6 +28,30 @@ class PCRSplitData:
         return max(len(self.anim_fam_x), len(self.anim_hex_x)) + 1
 
 
+@dataclass(frozen=True)
+class PlaybackFrames:
+    """
+    Döngü döngü oynatma için tek geçişte hazırlanan tamponlar.
+
+    Kanal başına segment tamponu (connect="pairs"): her segment iki nokta, segmentler
+    başlangıç döngüsüne göre sıralı; eksik noktalı segmentler atılmıştır. Böylece
+    bir karede görünen segmentler tamponun bir önekidir (offsets[kanal, kare] nokta).
+
+    frame f: statik döngüler + ilk f animasyon döngüsü açık (f = 0..frames-1)
+    ylim: kare başına (alt, üst) Y sınırı; o ana kadar açılmış noktalara göre genişler
+    """
+
+    seg_x: np.ndarray  # (kanal, 2 * segment)
+    seg_y: np.ndarray
+    offsets: np.ndarray  # (kanal, kare)
+    ylim: np.ndarray  # (kare, 2)
+    xlim: Tuple[float, float]
+
+    @property
+    def frames(self) -> int:
+        return self.offsets.shape[1]
+
+
 class PCRGraphLayoutService:
     """View'e hazır olacak şekilde PCR grafik datasını hazırlar."""
 
@@ -39,95 +63,94 @@ class PCRGraphLayoutService:
         min_y_floor: float = 5000.0,
         y_padding: float = 500.0,
     ) -> PCRSplitData:
-        fam_coords = fam_coords or []
-        hex_coords = hex_coords or []
-
-        static_fam_x: List[int] = []
-        static_fam_y: List[float] = []
-        static_hex_x: List[int] = []
-        static_hex_y: List[float] = []
-        anim_fam_x: List[int] = []
-        anim_fam_y: List[float] = []
-        anim_hex_x: List[int] = []
-        anim_hex_y: List[float] = []
-
-        for x, y in fam_coords:
-            if x < start_x:
-                static_fam_x.append(int(x)); static_fam_y.append(float(y))
-            else:
-                anim_fam_x.append(int(x)); anim_fam_y.append(float(y))
-
-        for x, y in hex_coords:
-            if x < start_x:
-                static_hex_x.append(int(x)); static_hex_y.append(float(y))
-            else:
-                anim_hex_x.append(int(x)); anim_hex_y.append(float(y))
-
-        all_coords = fam_coords + hex_coords
+        fam = _as_xy(fam_coords)
+        hex_ = _as_xy(hex_coords)
+        fam_static = fam[:, 0] < start_x
+        hex_static = hex_[:, 0] < start_x
+
         xlim: Optional[tuple[float, float]] = None
         ylim: Optional[tuple[float, float]] = None
 
-        if all_coords:
-            all_x = [x for x, _ in all_coords]
-            all_y = [y for _, y in all_coords]
-
-            if all_x:
-                xlim = (min(all_x) - 1, max(all_x) + 1)
-
-            if all_y:
-                ymax = max(all_y)
-                target_top = max(min_y_floor, ymax + y_padding)
-                ylim = (0.0, float(target_top))
+        all_xy = np.concatenate([fam, hex_])
+        if len(all_xy):
+            xlim = (float(all_xy[:, 0].min()) - 1, float(all_xy[:, 0].max()) + 1)
+            ymax = float(all_xy[:, 1].max())
+            ylim = (0.0, float(max(min_y_floor, ymax + y_padding)))
 
         return PCRSplitData(
-            static_fam_x=static_fam_x,
-            static_fam_y=static_fam_y,
-            static_hex_x=static_hex_x,
-            static_hex_y=static_hex_y,
-            anim_fam_x=anim_fam_x,
-            anim_fam_y=anim_fam_y,
-            anim_hex_x=anim_hex_x,
-            anim_hex_y=anim_hex_y,
+            static_fam_x=fam[fam_static, 0].astype(int).tolist(),
+            static_fam_y=fam[fam_static, 1].tolist(),
+            static_hex_x=hex_[hex_static, 0].astype(int).tolist(),
+            static_hex_y=hex_[hex_static, 1].tolist(),
+            anim_fam_x=fam[~fam_static, 0].astype(int).tolist(),
+            anim_fam_y=fam[~fam_static, 1].tolist(),
+            anim_hex_x=hex_[~hex_static, 0].astype(int).tolist(),
+            anim_hex_y=hex_[~hex_static, 1].tolist(),
             xlim=xlim,
             ylim=ylim,
         )
+
     @staticmethod
-    def compute_ylim_for_static_draw(
-        fam_coords: CoordsLike,
-        hex_coords: CoordsLike,
-        min_floor: float = 4500.0,
+    def build_playback(
+        cycles: np.ndarray,
+        values: np.ndarray,
+        start_x: float,
+        min_y_floor: float = 4500.0,
         y_padding: float = 500.0,
-    ) -> Optional[tuple[float, float]]:
-        fam_coords = fam_coords or []
-        hex_coords = hex_coords or []
-
-        all_y: List[float] = []
-
-        def collect_y(coords: CoordsLike) -> None:
-            for item in coords:
-                # item bir numpy array ise (N,2) bekleriz
-                if isinstance(item, np.ndarray):
-                    if item.size == 0:
-                        continue
-                    # Güvenlik: en az 2 kolon olmalı
-                    if item.ndim == 2 and item.shape[1] >= 2:
-                        all_y.extend(item[:, 1].astype(float).tolist())
-                    continue
-
-                # item tuple/list gibi (x,y) ise
-                try:
-                    x, y = item  # type: ignore[misc]
-                    all_y.append(float(y))
-                except Exception:
-                    # Beklenmeyen format: sessizce geç (istersen log ekleyebilirsin)
-                    continue
-
-        collect_y(fam_coords)
-        collect_y(hex_coords)
-
-        if not all_y:
-            return None
-
-        ymax = max(all_y)
-        top = max(min_floor, ymax + y_padding)
-        return (0.0, float(top))
\ No newline at end of file
+    ) -> PlaybackFrames:
+        """
+        values: (kuyu, kanal, döngü) eğri tensörü (CurveStore.values ile aynı düzen).
+        Tüm plaka için segment tamponları, kare başına görünür nokta sayıları ve
+        Y sınırları kuyu döngüsü olmadan tek seferde hesaplanır.
+        """
+        cycles = np.asarray(cycles, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        n_wells, n_channels, n_cycles = values.shape
+        n_static = int(np.searchsorted(cycles, start_x, side="left"))
+        n_static = min(max(n_static, 1), n_cycles) if n_cycles else 0
+        revealed = np.arange(n_static, n_cycles + 1)  # kare başına açık döngü sayısı
+
+        # (kanal, döngü, kuyu) düzeni: aynı döngünün segmentleri tamponda ardışık
+        y = values.transpose(1, 2, 0)
+        finite = np.isfinite(y)
+        valid = finite[:, :-1, :] & finite[:, 1:, :]  # (kanal, segment, kuyu)
+        per_cycle = valid.sum(axis=2)
+        # cum[k]: başlangıç döngüsü < k olan geçerli segment sayısı
+        cum = np.zeros((n_channels, max(n_cycles, 1)), dtype=np.int64)
+        np.cumsum(per_cycle, axis=1, out=cum[:, 1:n_cycles])
+        offsets = 2 * cum[:, np.maximum(revealed - 1, 0)]
+
+        width = int(valid.sum(axis=(1, 2)).max(initial=0))
+        seg_x = np.full((n_channels, 2 * width), np.nan)
+        seg_y = np.full((n_channels, 2 * width), np.nan)
+        x0 = np.broadcast_to(cycles[:-1, None], valid.shape[1:])
+        x1 = np.broadcast_to(cycles[1:, None], valid.shape[1:])
+        for ch in range(n_channels):
+            mask = valid[ch]
+            count = int(mask.sum())
+            seg_x[ch, 0 : 2 * count : 2] = x0[mask]
+            seg_x[ch, 1 : 2 * count : 2] = x1[mask]
+            seg_y[ch, 0 : 2 * count : 2] = y[ch, :-1][mask]
+            seg_y[ch, 1 : 2 * count : 2] = y[ch, 1:][mask]
+
+        # Açılan noktaların koşan min/maks değeri -> kare başına Y sınırı (alt sınır en çok 0)
+        top = np.full(len(revealed), float(min_y_floor))
+        bottom = np.zeros(len(revealed))
+        if n_cycles:
+            opened = np.maximum(revealed - 1, 0)
+            col_max = np.where(finite, y, -np.inf).max(axis=(0, 2))
+            col_min = np.where(finite, y, np.inf).min(axis=(0, 2))
+            top = np.maximum(top, np.maximum.accumulate(col_max)[opened] + y_padding)
+            bottom = np.minimum(bottom, np.minimum.accumulate(col_min)[opened])
+        ylim = np.column_stack([bottom, top])
+
+        xlim = (float(cycles[0]) - 1, float(cycles[-1]) + 1) if n_cycles else (0.0, 1.0)
+        for arr in (seg_x, seg_y, offsets, ylim):
+            arr.setflags(write=False)
+        return PlaybackFrames(seg_x=seg_x, seg_y=seg_y, offsets=offsets, ylim=ylim, xlim=xlim)
+
+
+def _as_xy(coords) -> np.ndarray:
+    if coords is None or len(coords) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.asarray(coords, dtype=np.float64).reshape(-1, 2)
@@ -0,0 +1,216 @@
+# app\services\history\history_service.py
+# app/services/history/history_service.py
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_VERSION = 1
+
+# DataFrame kolonu -> wells tablosu kolonu
+WELL_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("Kuyu No", "well_no", "TEXT"),
+    ("Hasta No", "patient_no", "INTEGER"),
+    ("Barkot No", "barcode", "TEXT"),
+    ("Hasta Adı", "patient_name", "TEXT"),
+    ("Uyarı", "warning", "TEXT"),
+    ("FAM Ct", "fam_ct", "REAL"),
+    ("HEX Ct", "hex_ct", "REAL"),
+    ("Δ Ct", "delta_ct", "REAL"),
+    ("İstatistik Oranı", "stat_ratio", "REAL"),
+    ("Standart Oranı", "ref_ratio", "REAL"),
+    ("Yazılım Hasta Sonucu", "software_result", "TEXT"),
+    ("Referans Hasta Sonucu", "reference_result", "TEXT"),
+    ("Nihai Sonuç", "final_result", "TEXT"),
+    ("Regresyon", "regression", "TEXT"),
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT UNIQUE,
+    plate_name TEXT NOT NULL,
+    rdml_path TEXT,
+    analyzed_at TEXT NOT NULL,
+    carrier_range REAL,
+    uncertain_range REAL,
+    referance_well TEXT,
+    use_without_reference INTEGER,
+    algorithm_version TEXT,
+    well_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS wells (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    analyzed_at TEXT NOT NULL,
+    {", ".join(f"{name} {sql_type}" for _, name, sql_type in WELL_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS ix_runs_analyzed_at ON runs(analyzed_at);
+CREATE INDEX IF NOT EXISTS ix_wells_barcode ON wells(barcode, analyzed_at);
+CREATE INDEX IF NOT EXISTS ix_wells_analyzed_at ON wells(analyzed_at);
+CREATE INDEX IF NOT EXISTS ix_wells_result ON wells(final_result, analyzed_at);
+CREATE INDEX IF NOT EXISTS ix_wells_run ON wells(run_id, well_no);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+_WELL_SELECT = (
+    "SELECT r.plate_name, w.analyzed_at, "
+    + ", ".join(f"w.{name}" for _, name, _ in WELL_COLUMNS)
+    + " FROM wells w JOIN runs r ON r.id = w.run_id"
+)
+
+
+class HistoryService:
+    """
+    Analiz edilen plakaların kalıcı geçmişi (gömülü SQLite).
+
+    - record_run: plakanın tüm kuyuları tek transaction'da executemany ile yazılır;
+      aynı run_key tekrar kaydedilirse önceki kayıt değiştirilir
+    - Barkod, tarih ve sonuç sınıfı indeksli; sorgular DataFrame döner
+    - Her çağrı kendi bağlantısını açar (thread-safe, Qt bağımlılığı yok)
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._initialized = False
+
+    @classmethod
+    def default(cls) -> "HistoryService":
+        """Uygulama veri klasöründeki veritabanı (~/.pharmalyzer/history.sqlite3)."""
+        from app.licensing.manager import get_app_data_dir
+
+        return cls(os.path.join(get_app_data_dir(), "history.sqlite3"))
+
+    # ---------------- Bağlantı ----------------
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    # ---------------- Yazma ----------------
+    def record_run(
+        self,
+        df: pd.DataFrame,
+        *,
+        plate_name: str,
+        rdml_path: str = "",
+        config: Optional[Mapping[str, Any]] = None,
+        algorithm_version: str = "",
+        run_key: Optional[str] = None,
+        analyzed_at: Optional[datetime] = None,
+    ) -> int:
+        if df is None or df.empty:
+            raise ValueError("Geçmişe kaydedilecek DataFrame boş.")
+
+        config = dict(config or {})
+        stamp = (analyzed_at or datetime.now()).isoformat(timespec="seconds")
+        rows = self._well_rows(df, stamp)
+
+        with closing(self._connect()) as conn, conn:
+            if run_key:
+                conn.execute("DELETE FROM runs WHERE run_key = ?", (run_key,))
+            cur = conn.execute(
+                "INSERT INTO runs (run_key, plate_name, rdml_path, analyzed_at, carrier_range, "
+                "uncertain_range, referance_well, use_without_reference, algorithm_version, well_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_key,
+                    str(plate_name),
+                    str(rdml_path),
+                    stamp,
+                    config.get("carrier_range"),
+                    config.get("uncertain_range"),
+                    config.get("referance_well"),
+                    None if "checkbox_status" not in config else int(bool(config["checkbox_status"])),
+                    str(algorithm_version),
+                    len(rows),
+                ),
+            )
+            run_id = int(cur.lastrowid)
+            placeholders = ", ".join("?" * (len(WELL_COLUMNS) + 2))
+            conn.executemany(
+                f"INSERT INTO wells (run_id, analyzed_at, {', '.join(n for _, n, _ in WELL_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                ((run_id, *row) for row in rows),
+            )
+        return run_id
+
+    def update_final_result(self, run_key: str, well_no: str, value: Optional[str]) -> None:
+        """Kayıtlı bir çalıştırmada manuel Nihai Sonuç düzeltmesi."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE wells SET final_result = ? "
+                "WHERE run_id = (SELECT id FROM runs WHERE run_key = ?) AND well_no = ?",
+                (value, run_key, str(well_no).strip().upper()),
+            )
+
+    @staticmethod
+    def _well_rows(df: pd.DataFrame, stamp: str) -> List[Tuple[Any, ...]]:
+        n = len(df)
+        columns: List[Sequence[Any]] = [[stamp] * n]
+        for src, _, sql_type in WELL_COLUMNS:
+            if src not in df.columns:
+                columns.append([None] * n)
+                continue
+            col = df[src]
+            if sql_type == "REAL":
+                arr = pd.to_numeric(col, errors="coerce").to_numpy(dtype=np.float64)
+                columns.append([None if np.isnan(v) else float(v) for v in arr])
+            elif sql_type == "INTEGER":
+                arr = pd.to_numeric(col, errors="coerce")
+                columns.append([None if pd.isna(v) else int(v) for v in arr])
+            else:
+                columns.append([None if pd.isna(v) else str(v) for v in col.astype(object)])
+        return list(zip(*columns))
+
+    # ---------------- Okuma ----------------
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> pd.DataFrame:
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(sql, conn, params=tuple(params))
+
+    def results_for_barcode(self, barcode: str) -> pd.DataFrame:
+        """Barkodun tüm geçmiş sonuçları (yeniden eskiye)."""
+        return self._query(
+            f"{_WELL_SELECT} WHERE w.barcode = ? ORDER BY w.analyzed_at DESC",
+            (str(barcode).strip(),),
+        )
+
+    def results_between(
+        self,
+        start: date | datetime,
+        end: date | datetime,
+        *,
+        result: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """[start, end] aralığındaki kuyular; result verilirse Nihai Sonuç'a göre süzülür."""
+        lo, hi = _as_bound(start, end=False), _as_bound(end, end=True)
+        if result is None:
+            return self._query(
+                f"{_WELL_SELECT} WHERE w.analyzed_at BETWEEN ? AND ? ORDER BY w.analyzed_at",
+                (lo, hi),
+            )
+        return self._query(
+            f"{_WELL_SELECT} WHERE w.final_result = ? AND w.analyzed_at BETWEEN ? AND ? "
+            "ORDER BY w.analyzed_at",
+            (result, lo, hi),
+        )
+
+    def runs(self, limit: int = 100) -> pd.DataFrame:
+        return self._query("SELECT * FROM runs ORDER BY analyzed_at DESC LIMIT ?", (int(limit),))
+
+
+def _as_bound(value: date | datetime, *, end: bool) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    # Tarih verilirse günün tamamı dahil
+    return f"{value.isoformat()}T23:59:59" if end else f"{value.isoformat()}T00:00:00"
@@ -2,27 +2,21 @@
 # app/services/pcr_data_service.py
 from __future__ import annotations
 
-import ast
 import logging
-from dataclasses import dataclass
-from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Tuple
+from dataclasses import replace
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-import numpy as np
 import pandas as pd
-from numpy.typing import NDArray
 
-from app.services.data_store import DataStore
+from app.services.curve_store import CurveStore, PCRCoords
+from app.services.curve_transforms import CurveMode, CurveTransforms, TransformConfig
+from app.services.data_store import DataSnapshot, DataStore
+from app.services.well_index import WellIndex
+from app.utils import well_mapping
 
 logger = logging.getLogger(__name__)
 
-Coord = Tuple[int, float]
-from app.utils import well_mapping
-
-@dataclass(frozen=True)
-class PCRCoords:
-    fam: NDArray[np.float_]
-    hex: NDArray[np.float_]
+__all__ = ["PCRCoords", "PCRDataService"]
 
 
 class PCRDataService:
@@ -31,55 +25,119 @@ class PCRDataService:
     UI/Qt bağımlılığı yoktur.
 
     Performans:
-    - get_df_copy() yerine get_df() kullanır (kopya yok)
-    - literal_eval sonuçlarını cache'ler
+    - DataStore snapshot'ını kopyasız okur
+    - Tüm eğriler tek bir CurveStore tensöründe tutulur; koordinat kolonlarının
+      versiyonu değişmedikçe yeniden kurulmaz
+    - Türetilmiş gösterimler (baz çizgisi, normalize, log, türev) store ve mod başına
+      bir kez hesaplanır; mod değişimi yeniden hesaplama yapmaz. Her türetilmiş
+      store'un kendi cache token'ı vardır.
     """
 
     HASTA_NO_COL = "Hasta No"
     FAM_COL = "FAM koordinat list"
     HEX_COL = "HEX koordinat list"
 
-    _coords_cache: Dict[int, PCRCoords] = {}
-    _cached_df_id: int | None = None
+    _store: Optional[CurveStore] = None
+    _cached_version: int | None = None
     _cache_token: int = 0
+    _token_seq: int = 0
+    _mode: CurveMode = CurveMode.RAW
+    _transform_config: TransformConfig = TransformConfig()
+    # mod -> (kaynak store, türetilmiş store, token)
+    _derived: Dict[CurveMode, Tuple[CurveStore, CurveStore, int]] = {}
 
     @staticmethod
     def get_coords(patient_no: Any) -> PCRCoords:
-        df = DataStore.get_df()
-        if df is None or df.empty:
-            raise ValueError("DataStore boş. Veri yüklenmedi.")
-
-        PCRDataService._validate_columns(df)
-        PCRDataService._ensure_cache(df)
-
+        store = PCRDataService.get_curve_store()
         pn = PCRDataService._normalize_patient_no(patient_no)
-        cached = PCRDataService._coords_cache.get(pn)
-        if cached is None:
+        row = store.row_of_patient(pn)
+        if row is None:
             raise ValueError(f"Hasta No '{pn}' için bir kayıt bulunamadı.")
-        return cached
+        return store.coords_at(row)
 
     @staticmethod
-    def get_coords_for_wells(wells: Iterable[str]) -> Dict[str, PCRCoords]:
-        """Birden fazla kuyu için koordinatları tek seferde getirir."""
+    def get_coords_for_wells(wells: Iterable[str], mode: CurveMode | str | None = None) -> Dict[str, PCRCoords]:
+        """
+        Birden fazla kuyu için koordinatları tek fancy-index toplamasıyla getirir.
+        mode: eğri gösterimi (None: set_curve_mode ile seçilen mod)
+        """
         valid_wells = [w.strip().upper() for w in wells or [] if well_mapping.is_valid_well_id(w)]
         if not valid_wells:
             return {}
 
-        df = DataStore.get_df()
-        if df is None or df.empty:
+        store = PCRDataService.get_display_store(mode)
+
+        found_wells = []
+        rows = []
+        for well_id in valid_wells:
+            row = store.row_of_patient(well_mapping.well_id_to_patient_no(well_id))
+            if row is not None:
+                found_wells.append(well_id)
+                rows.append(row)
+
+        return dict(zip(found_wells, store.coords_for_rows(rows)))
+
+    @staticmethod
+    def get_curve_store() -> CurveStore:
+        snapshot = DataStore.get_snapshot()
+        if snapshot.empty:
             raise ValueError("DataStore boş. Veri yüklenmedi.")
 
-        PCRDataService._validate_columns(df)
-        PCRDataService._ensure_cache(df)
+        # Düşük bellek modunda koordinat stringleri atılmış olabilir; benimsenen store yeterli
+        adopted = PCRDataService.peek_curve_store()
+        if adopted is not None:
+            return adopted
 
-        coords_map: Dict[str, PCRCoords] = {}
-        for well_id in valid_wells:
-            pn = well_mapping.well_id_to_patient_no(well_id)
-            cached = PCRDataService._coords_cache.get(pn)
-            if cached is not None:
-                coords_map[well_id] = cached
+        PCRDataService._validate_columns(snapshot.df)
+        return PCRDataService._ensure_cache(snapshot)
+
+    @staticmethod
+    def get_display_store(mode: CurveMode | str | None = None) -> CurveStore:
+        """Seçili (veya verilen) moddaki store; ham modda get_curve_store ile aynıdır."""
+        return PCRDataService._derived_entry(mode)[0]
+
+    @staticmethod
+    def set_curve_mode(mode: CurveMode | str) -> bool:
+        """Gösterim modunu değiştirir; değiştiyse True."""
+        mode = CurveMode.parse(mode)
+        if mode is PCRDataService._mode:
+            return False
+        PCRDataService._mode = mode
+        return True
+
+    @staticmethod
+    def curve_mode() -> CurveMode:
+        return PCRDataService._mode
 
-        return coords_map
+    @staticmethod
+    def set_transform_config(config: TransformConfig) -> None:
+        """Baz çizgisi / yumuşatma ayarları değişince türetilmiş store'lar yeniden kurulur."""
+        if config == PCRDataService._transform_config:
+            return
+        PCRDataService._transform_config = config
+        PCRDataService._derived = {}
+
+    @staticmethod
+    def _derived_entry(mode: CurveMode | str | None) -> Tuple[CurveStore, int]:
+        base = PCRDataService.get_curve_store()
+        mode = PCRDataService._mode if mode is None else CurveMode.parse(mode)
+        if mode is CurveMode.RAW:
+            return base, PCRDataService._cache_token
+
+        cached = PCRDataService._derived.get(mode)
+        if cached is not None and cached[0] is base:
+            return cached[1], cached[2]
+
+        derived = CurveTransforms.derive_store(base, mode, PCRDataService._transform_config)
+        token = PCRDataService._next_token()
+        PCRDataService._derived[mode] = (base, derived, token)
+        logger.debug("Derived curves built: mode=%s version=%s", mode.value, base.version)
+        return derived, token
+
+    @staticmethod
+    def _next_token() -> int:
+        PCRDataService._token_seq += 1
+        return PCRDataService._token_seq
 
     @staticmethod
     def _validate_columns(df: pd.DataFrame) -> None:
@@ -105,97 +163,83 @@ class PCRDataService:
 
     @staticmethod
     def _find_row_by_patient_no(df: pd.DataFrame, pn: int) -> pd.DataFrame:
-        # Not: Bu conversion her çağrıda yapılır; eğer çok büyük DF olursa
-        # "Hasta No" kolonunu import aşamasında Int'a normalize etmek daha iyi.
-        hasta_no_series = pd.to_numeric(df[PCRDataService.HASTA_NO_COL], errors="coerce").astype("Int64")
-        row = df[hasta_no_series == pn]
-        if row.empty:
+        # Snapshot ile yayınlanan kuyu indeksi varsa O(1); yoksa df için bir kez kurulur.
+        snapshot = DataStore.get_snapshot()
+        if snapshot.df is df and snapshot.wells is not None:
+            wells = snapshot.wells
+        else:
+            wells = WellIndex.build(df)
+
+        row = wells.row_of_patient(pn)
+        if row is None:
             raise ValueError(f"Hasta No '{pn}' için bir kayıt bulunamadı.")
-        return row
-
-    @staticmethod
-    @lru_cache(maxsize=4096)
-    def _literal_eval_cached(raw: str) -> Any:
-        # raw string için cache'li literal_eval
-        return ast.literal_eval(raw)
-
-    @staticmethod
-    @lru_cache(maxsize=4096)
-    def _parse_coords_from_str(raw: str, label: str) -> NDArray[np.float_]:
-        parsed = PCRDataService._literal_eval_cached(raw)
-        return PCRDataService._coords_from_iterable(parsed, label)
+        return df.iloc[[row]]
 
     @staticmethod
-    def _coords_from_iterable(raw: Any, label: str) -> NDArray[np.float_]:
-        if raw is None:
-            return np.empty((0, 2), dtype=float)
-
-        if not isinstance(raw, (list, tuple)):
-            raise ValueError(f"{label} koordinat listesi list formatında değil: {type(raw)}")
-
-        out: List[Coord] = []
-        for item in raw:
-            if not isinstance(item, (list, tuple)) or len(item) != 2:
-                continue
-            try:
-                cyc = int(item[0])
-                fluor = float(item[1])
-                out.append((cyc, fluor))
-            except (TypeError, ValueError):
-                continue
-
-        arr = np.asarray(out, dtype=float)
-        arr.setflags(write=False)
-        return arr
+    def _ensure_cache(snapshot: DataSnapshot) -> CurveStore:
+        # Yalnızca koordinat/Hasta No kolonları değişince yeniden kurulur;
+        # örn. "Nihai Sonuç" düzenlemesi cache'i geçersiz kılmaz.
+        version = snapshot.columns_version(
+            PCRDataService.HASTA_NO_COL, PCRDataService.FAM_COL, PCRDataService.HEX_COL
+        )
+        store = PCRDataService._store
+        if store is not None and PCRDataService._cached_version == version:
+            return store
+
+        store = CurveStore.from_frame(snapshot.df, version=version, wells=snapshot.wells)
+        PCRDataService._store = store
+        PCRDataService._cached_version = version
+        PCRDataService._cache_token = PCRDataService._next_token()
+        PCRDataService._derived = {}
+        logger.debug(
+            "CurveStore rebuilt: version=%s wells=%d cycles=%d (%d bytes)",
+            version, store.well_count, store.cycle_count, store.nbytes,
+        )
+        return store
 
     @staticmethod
-    def _parse_coords_cached(raw: Any, label: str) -> NDArray[np.float_]:
-        if isinstance(raw, str):
-            try:
-                return PCRDataService._parse_coords_from_str(raw, label)
-            except Exception as e:
-                raise ValueError(f"{label} koordinat listesi parse edilemedi: {e}")
-
-        return PCRDataService._coords_from_iterable(raw, label)
+    def peek_curve_store() -> Optional[CurveStore]:
+        """Güncel snapshot için kurulmuş store varsa döner; yoksa kurmaz."""
+        snapshot = DataStore.get_snapshot()
+        store = PCRDataService._store
+        if snapshot.empty or store is None:
+            return None
+        version = snapshot.columns_version(
+            PCRDataService.HASTA_NO_COL, PCRDataService.FAM_COL, PCRDataService.HEX_COL
+        )
+        return store if PCRDataService._cached_version == version else None
 
     @staticmethod
-    def _ensure_cache(df: pd.DataFrame) -> None:
-        df_id = id(df)
-        if PCRDataService._cached_df_id == df_id and PCRDataService._coords_cache:
-            return
-
-        PCRDataService._coords_cache.clear()
-        PCRDataService._cached_df_id = df_id
-        PCRDataService._cache_token += 1
-        PCRDataService._literal_eval_cached.cache_clear()
-
-        for _, row in df.iterrows():
-            try:
-                pn = PCRDataService._normalize_patient_no(row[PCRDataService.HASTA_NO_COL])
-            except ValueError:
-                continue
-
-            fam_raw = row[PCRDataService.FAM_COL]
-            hex_raw = row[PCRDataService.HEX_COL]
-            fam_coords = PCRDataService._parse_coords_cached(fam_raw, label="FAM")
-            hex_coords = PCRDataService._parse_coords_cached(hex_raw, label="HEX")
-            PCRDataService._coords_cache[pn] = PCRCoords(fam=fam_coords, hex=hex_coords)
+    def adopt_store(store: CurveStore, snapshot: DataSnapshot) -> None:
+        """
+        Aynı DataFrame'den daha önce kurulmuş bir store'u (ör. plaka oturumu)
+        yeni snapshot'a bağlar; tensör yeniden ayrıştırılmaz.
+        """
+        if snapshot.empty or store.well_count != len(snapshot.df):
+            raise ValueError("CurveStore snapshot ile uyumsuz.")
+        version = snapshot.columns_version(
+            PCRDataService.HASTA_NO_COL, PCRDataService.FAM_COL, PCRDataService.HEX_COL
+        )
+        wells = snapshot.wells if snapshot.wells is not None else store.wells
+        PCRDataService._store = replace(store, version=version, wells=wells)
+        PCRDataService._cached_version = version
+        PCRDataService._cache_token = PCRDataService._next_token()
+        PCRDataService._derived = {}
 
     @staticmethod
-    def get_cache_token() -> int:
-        df = DataStore.get_df()
-        if df is None or df.empty:
+    def get_cache_token(mode: CurveMode | str | None = None) -> int:
+        """Güncel store'un (ve seçili/verilen modun) token'ı; veri veya mod değişince değişir."""
+        snapshot = DataStore.get_snapshot()
+        if snapshot.empty:
             return PCRDataService._cache_token
 
-        PCRDataService._validate_columns(df)
-        PCRDataService._ensure_cache(df)
-        return PCRDataService._cache_token
+        return PCRDataService._derived_entry(mode)[1]
 
     # DataStore güncellendiğinde cache temizlemek istersen:
     @staticmethod
     def clear_cache() -> None:
-        PCRDataService._literal_eval_cached.cache_clear()
-        PCRDataService._coords_cache.clear()
-        PCRDataService._cached_df_id = None
-        PCRDataService._cache_token += 1
-        logger.debug("PCRDataService literal_eval cache cleared")
\ No newline at end of file
+        PCRDataService._store = None
+        PCRDataService._cached_version = None
+        PCRDataService._cache_token = PCRDataService._next_token()
+        PCRDataService._derived = {}
+        logger.debug("PCRDataService curve store cleared")
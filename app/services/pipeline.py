@@ -32,16 +32,13 @@ class Pipeline:
     """
     
     @staticmethod
-    def apply(step: Step, copy_input: bool = False) -> pd.DataFrame:
-        """DataStore'daki mevcut veriyi alır ve adımı uygular."""
-        df = DataStore.get_df_copy() if copy_input else DataStore.get_df()
-        
-        # Fonksiyonu çalıştır ve sonucu al
-        result_df = step.fn(df)
-        
-        # Sonucu DataStore'a geri yaz
-        DataStore.set_df(result_df)
-        return result_df
+    def apply(step: Step, copy_input: bool = False, notify: bool = True) -> pd.DataFrame:
+        """
+        DataStore'daki mevcut snapshot üzerinde adımı copy-on-write olarak uygular;
+        sonuç yeni bir versiyon olarak yayınlanır, okuyucuların elindeki snapshot değişmez.
+        """
+        snapshot = DataStore.edit(step.fn, deep=copy_input, notify=notify)
+        return snapshot.df
 
     @staticmethod
     def run(
@@ -79,7 +76,12 @@ class Pipeline:
             report(idx, f"Başlıyor: {step.name}")
             
             # Adımı icra et
-            last_df = Pipeline.apply(step, copy_input=copy_input_each_step)
+            # Ara adımlar abonelere bildirilmez; yalnızca nihai sonuç yayınlanır
+            last_df = Pipeline.apply(
+                step,
+                copy_input=copy_input_each_step,
+                notify=idx == total - 1,
+            )
             
             # Adım bitti raporu
             report(idx + 1, f"Bitti: {step.name}")
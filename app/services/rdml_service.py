@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any
+from typing import Any, List, Sequence
 
 import pandas as pd
 
@@ -32,11 +32,18 @@ class RDMLService:
     """
 
     @staticmethod
-    def rdml_to_dataframe(file_path: str) -> pd.DataFrame:
+    def rdml_to_dataframe(file_path: str, extra_channels: Sequence[str] = ()) -> pd.DataFrame:
+        """
+        extra_channels: FAM/HEX dışında okunacak kanallar (ör. ikincil kanal çiftleri için
+        CY5); her biri için "<KANAL> Ct" ve "<KANAL> koordinat list" kolonları eklenir.
+        """
         RDMLService._validate_path(file_path)
+        extra_channels = [
+            ch for ch in dict.fromkeys(str(c).strip().upper() for c in extra_channels) if ch not in ("FAM", "HEX")
+        ]
 
         root = read_rdml_root(file_path)
-        rows = merge_fam_hex_rows(root)
+        rows = merge_fam_hex_rows(root, extra_channels)
 
         if rows is None:
             raise ValueError("RDML parse sonucu boş döndü (rows=None).")
@@ -44,16 +51,16 @@ class RDMLService:
         df = pd.DataFrame(rows)
 
         # Kolonları stabilize et (eksikse ekle) - tip dostu defaultlar
-        RDMLService._ensure_columns(df)
+        RDMLService._ensure_columns(df, extra_channels)
 
         # Sıralama sabit
-        df = df[DEFAULT_HEADERS]
+        df = df[RDMLService.headers(extra_channels)]
 
         if df.empty:
             raise ValueError("RDML içinden veri üretilemedi (DataFrame boş).")
 
         # Hafif normalize (agresif değil)
-        df = RDMLService._light_normalize(df)
+        df = RDMLService._light_normalize(df, extra_channels)
 
         logger.info("RDML okundu: %s (rows=%d)", os.path.basename(file_path), len(df))
         return df
@@ -71,14 +78,21 @@ class RDMLService:
             logger.warning("Dosya uzantısı .rdml değil: %s", file_path)
 
     @staticmethod
-    def _ensure_columns(df: pd.DataFrame) -> None:
+    def headers(extra_channels: Sequence[str] = ()) -> List[str]:
+        out = list(DEFAULT_HEADERS)
+        for ch in extra_channels:
+            out += [f"{ch} Ct", f"{ch} koordinat list"]
+        return out
+
+    @staticmethod
+    def _ensure_columns(df: pd.DataFrame, extra_channels: Sequence[str] = ()) -> None:
         # Text columns
         for col in ("Barkot No", "Hasta Adı"):
             if col not in df.columns:
                 df[col] = ""
 
         # Numeric-ish Ct columns: NA daha sağlıklı
-        for col in ("FAM Ct", "HEX Ct"):
+        for col in ["FAM Ct", "HEX Ct"] + [f"{ch} Ct" for ch in extra_channels]:
             if col not in df.columns:
                 df[col] = pd.NA
 
@@ -87,25 +101,26 @@ class RDMLService:
             df["React ID"] = pd.NA
 
         # Coord list columns: string "[]" downstream için daha stabil (CSVProcessor literal_eval yapıyor)
-        for col in ("FAM koordinat list", "HEX koordinat list"):
+        for col in ["FAM koordinat list", "HEX koordinat list"] + [f"{ch} koordinat list" for ch in extra_channels]:
             if col not in df.columns:
                 df[col] = "[]"
 
         # Eğer ileride yeni kolonlar gelirse df içinde kalabilir ama biz sadece DEFAULT_HEADERS basıyoruz.
 
     @staticmethod
-    def _light_normalize(df: pd.DataFrame) -> pd.DataFrame:
+    def _light_normalize(df: pd.DataFrame, extra_channels: Sequence[str] = ()) -> pd.DataFrame:
         out = df.copy(deep=False)
 
         # React ID: numeric'e dönüştür (bozamıyorsa NA)
         out["React ID"] = pd.to_numeric(out["React ID"], errors="coerce")
 
         # Ct: numeric'e dönüştür (bozamıyorsa NA)
-        out["FAM Ct"] = pd.to_numeric(out["FAM Ct"], errors="coerce")
-        out["HEX Ct"] = pd.to_numeric(out["HEX Ct"], errors="coerce")
+        for ch in ["FAM", "HEX", *extra_channels]:
+            out[f"{ch} Ct"] = pd.to_numeric(out[f"{ch} Ct"], errors="coerce")
 
         # Coord list: None/NA ise "[]"
-        for c in ("FAM koordinat list", "HEX koordinat list"):
+        for ch in ["FAM", "HEX", *extra_channels]:
+            c = f"{ch} koordinat list"
             out[c] = out[c].fillna("[]").astype(str)
 
         # Text: None/NA -> ""
@@ -0,0 +1,203 @@
+# app\services\result_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import zipfile
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.services.session_archive import read_frame, write_frame
+
+logger = logging.getLogger(__name__)
+
+# Varsayılan disk bütçesi (sıkıştırılmış sonuç frame'leri)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+_ENTRY_SUFFIX = ".pzresult"
+# Eski pickle girdileri okunmaz; yalnızca bütçede sayılıp LRU ile temizlenir
+_LEGACY_SUFFIX = ".pkl.gz"
+_MANIFEST = "manifest.json"
+OVERRIDES_FILE = "overrides.json"
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """
+    Pipeline'ın hesapladığı sonuç (manuel düzeltmeler hariç).
+    reference_ok: referans kuyusu hesaplaması başarılı mıydı (değilse checkbox zorlanır)
+    """
+
+    df: pd.DataFrame
+    reference_ok: bool = True
+
+
+class ResultCache:
+    """
+    Kalıcı analiz sonucu cache'i: anahtar = hash(girdi özeti + config + algoritma versiyonu).
+
+    - Girdi özeti (input_digest) analiz çıktısı yazılmadan önceki ham frame'den alınır;
+      yeniden analiz ve manuel düzenlemeler anahtarı değiştirmez
+    - Her sonuç ayrı bir zip dosyasıdır (manifest + kolon başına .npy, SessionArchive
+      kodlaması, pickle yok); toplam boyut max_bytes'ı aşınca en eski kullanılan
+      (mtime) dosyalar silinir
+    - Manuel "Nihai Sonuç" düzeltmeleri ayrı bir JSON'da kuyu bazında tutulur;
+      hesaplanan çıktıya asla yazılmaz ve cache tahliyesinden etkilenmez
+    """
+
+    def __init__(self, root_dir: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("Cache boyutu negatif olamaz.")
+        self.root_dir = root_dir
+        self.max_bytes = int(max_bytes)
+        self.overrides_path = os.path.join(root_dir, OVERRIDES_FILE)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> "ResultCache":
+        """Uygulama veri klasöründeki cache (~/.pharmalyzer/results)."""
+        from app.licensing.manager import get_app_data_dir
+
+        return cls(os.path.join(get_app_data_dir(), "results"), max_bytes)
+
+    # ---- Anahtar ----
+    @staticmethod
+    def input_digest(df: pd.DataFrame) -> str:
+        """Girdi içeriğinin (kolon adları + değerler) özeti; ham/import frame'i üzerinden alınmalı."""
+        h = hashlib.sha256()
+        h.update(json.dumps([str(c) for c in df.columns]).encode("utf-8"))
+        h.update(str(len(df)).encode("utf-8"))
+        if len(df.columns):
+            rows = pd.util.hash_pandas_object(df, index=False).to_numpy(dtype=np.uint64)
+            h.update(rows.tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def key_for_digest(digest: str, config: Mapping[str, Any], algorithm_version: str) -> str:
+        h = hashlib.sha256()
+        h.update(str(algorithm_version).encode("utf-8"))
+        h.update(json.dumps(dict(config), sort_keys=True, default=str).encode("utf-8"))
+        h.update(str(digest).encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def key_for(df: pd.DataFrame, config: Mapping[str, Any], algorithm_version: str) -> str:
+        """Girdi frame'i, config alanları ve algoritma versiyonu."""
+        return ResultCache.key_for_digest(ResultCache.input_digest(df), config, algorithm_version)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.root_dir, key + _ENTRY_SUFFIX)
+
+    # ---- Sonuçlar ----
+    def get(self, key: str) -> Optional[CachedResult]:
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with zipfile.ZipFile(path, "r") as zf:
+                meta = json.loads(zf.read(_MANIFEST).decode("utf-8"))
+                df = read_frame(zf, "df", meta["columns"])
+            result = CachedResult(df=df, reference_ok=bool(meta.get("reference_ok", True)))
+        except Exception:
+            logger.exception("Result cache entry unreadable, dropping: %s", key)
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)  # LRU: son kullanım
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, df: pd.DataFrame, *, reference_ok: bool = True) -> None:
+        if self.max_bytes == 0:
+            return
+        with self._lock:
+            os.makedirs(self.root_dir, exist_ok=True)
+            path = self._entry_path(key)
+            tmp = path + ".tmp"
+            with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                columns = write_frame(zf, "df", df)
+                meta = {"reference_ok": bool(reference_ok), "columns": columns}
+                zf.writestr(_MANIFEST, json.dumps(meta, ensure_ascii=False, default=str))
+            os.replace(tmp, path)
+            self._enforce_budget()
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._entry_path(key))
+
+    def size_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        if not os.path.isdir(self.root_dir):
+            return []
+        out = []
+        for name in os.listdir(self.root_dir):
+            if not name.endswith((_ENTRY_SUFFIX, _LEGACY_SUFFIX)):
+                continue
+            path = os.path.join(self.root_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            out.append((st.st_mtime, path, st.st_size))
+        return out
+
+    def _enforce_budget(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # ---- Manuel düzeltmeler ----
+    def _load_overrides(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.overrides_path):
+            return {}
+        try:
+            with open(self.overrides_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return raw if isinstance(raw, dict) else {}
+        except (OSError, ValueError):
+            logger.exception("Overrides file unreadable; ignoring")
+            return {}
+
+    def overrides(self, key: str) -> Dict[str, Any]:
+        """{Kuyu No: Nihai Sonuç} manuel düzeltmeleri."""
+        return dict(self._load_overrides().get(key, {}))
+
+    def set_override(self, key: str, well_id: str, value: Any) -> None:
+        """value None ise kuyunun düzeltmesi kaldırılır."""
+        well_id = str(well_id).strip().upper()
+        with self._lock:
+            data = self._load_overrides()
+            plate = dict(data.get(key, {}))
+            if value is None:
+                plate.pop(well_id, None)
+            else:
+                plate[well_id] = value
+            if plate:
+                data[key] = plate
+            else:
+                data.pop(key, None)
+
+            os.makedirs(self.root_dir, exist_ok=True)
+            tmp = self.overrides_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.overrides_path)
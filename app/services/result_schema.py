@@ -0,0 +1,95 @@
+# app\services\result_schema.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.curve_store import CHANNEL_COLUMNS
+from app.services.well_index import PATIENT_NO_COL, PLATE_SIZE, WELL_COL
+from app.utils import well_mapping
+
+# Tekrarlanan Türkçe etiket kolonları -> categorical.
+# Bilinen değerler kategori olarak baştan eklenir; dropdown düzenlemeleri yeni kategori üretmez.
+LABEL_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "Uyarı": ("Boş Kuyu", "Yetersiz DNA", "Düşük RFU Değeri"),
+    "Regresyon": ("Güvenli Bölge", "Riskli Alan", "-"),
+    "Yazılım Hasta Sonucu": ("Sağlıklı", "Taşıyıcı", "Belirsiz", "Tekrar"),
+    "Referans Hasta Sonucu": ("Sağlıklı", "Taşıyıcı", "Belirsiz", "Tekrar"),
+    "Nihai Sonuç": ("Sağlıklı", "Taşıyıcı", "Belirsiz", "Tekrar", "Test Tekrarı", "Yeni Numune"),
+}
+
+# Ct / RFU / oran kolonları -> float32
+FLOAT32_COLUMNS: Tuple[str, ...] = (
+    "İstatistik Oranı", "Standart Oranı",
+    "FAM Ct", "HEX Ct", "Δ Ct", "Δ_Δ Ct",
+    "rfu_diff", "fam_end_rfu", "hex_end_rfu",
+)
+
+# Kuyu No: plakanın sabit 96 kuyusu üzerinde categorical (int8 kodlar)
+WELL_CATEGORIES: Tuple[str, ...] = tuple(
+    well_mapping.patient_no_to_well_id(pn) for pn in range(1, PLATE_SIZE + 1)
+)
+
+COORDINATE_COLUMNS: Tuple[str, ...] = CHANNEL_COLUMNS
+
+
+def compact_result_frame(df: pd.DataFrame, *, drop_coordinates: bool = False) -> pd.DataFrame:
+    """
+    Düşük bellek şeması: etiketler categorical, Ct/RFU/oranlar float32,
+    Kuyu No sabit kuyu kategorileri (tamsayı kodlar), Hasta No int16.
+
+    drop_coordinates=True yalnızca eğriler başka yerde (CurveStore / arşiv)
+    tutuluyorsa kullanılmalıdır; koordinat stringleri kaldırılır.
+    Etiket kolonlarında `==`/isin string karşılaştırması aynen çalışır.
+    """
+    out = df.copy(deep=False)
+
+    for col, known in LABEL_COLUMNS.items():
+        if col in out.columns and not isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = _as_category(out[col], known)
+
+    for col in FLOAT32_COLUMNS:
+        if col in out.columns and out[col].dtype != np.float32:
+            out[col] = pd.to_numeric(out[col], errors="coerce").astype(np.float32)
+
+    if WELL_COL in out.columns and not isinstance(out[WELL_COL].dtype, pd.CategoricalDtype):
+        out[WELL_COL] = _as_category(out[WELL_COL].astype(str).str.strip().str.upper(), WELL_CATEGORIES)
+
+    if PATIENT_NO_COL in out.columns and out[PATIENT_NO_COL].notna().all():
+        out[PATIENT_NO_COL] = out[PATIENT_NO_COL].astype(np.int16)
+
+    if drop_coordinates:
+        out = without_coordinates(out)
+
+    return out
+
+
+def without_coordinates(df: pd.DataFrame) -> pd.DataFrame:
+    """Koordinat string kolonlarını atar; eğriler CurveStore / arşivde tutuluyorsa kullanılır."""
+    return df.drop(columns=[c for c in COORDINATE_COLUMNS if c in df.columns])
+
+
+def has_coordinates(df: pd.DataFrame | None) -> bool:
+    return df is not None and all(c in df.columns for c in COORDINATE_COLUMNS)
+
+
+def ensure_category(df: pd.DataFrame, column: str, value: Any) -> None:
+    """Categorical kolona kategoride olmayan bir değer yazılacaksa önce kategoriyi ekler."""
+    col = df[column]
+    if not isinstance(col.dtype, pd.CategoricalDtype) or pd.isna(value):
+        return
+    if value not in col.cat.categories:
+        df[column] = col.cat.add_categories([value])
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """String içerikleri dahil DataFrame bellek kullanımı."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def _as_category(values: pd.Series, known: Iterable[str]) -> pd.Series:
+    known = list(known)
+    extra = sorted({v for v in values.dropna().unique() if v not in set(known)}, key=str)
+    return values.astype(pd.CategoricalDtype(categories=known + extra))
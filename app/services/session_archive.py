@@ -0,0 +1,254 @@
+# app\services\session_archive.py
+from __future__ import annotations
+
+import json
+import os
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.curve_codec import CurveCodec, EncodedCurves
+from app.services.curve_store import CurveStore
+from app.services.result_schema import without_coordinates
+from app.services.well_index import WellIndex
+
+ARCHIVE_FORMAT = 1
+ARCHIVE_SUFFIX = ".pzsession"
+MANIFEST = "manifest.json"
+
+
+@dataclass(frozen=True)
+class ArchivedPlate:
+    """
+    Oturum arşivindeki tek plaka. curves varsa df koordinat stringleri
+    olmadan saklanır; eğriler curves tensöründedir.
+    """
+
+    run_id: str
+    rdml_path: str
+    file_name: str
+    df: pd.DataFrame
+    curves: Optional[CurveStore] = None
+    result_key: Optional[str] = None
+    input_key: Optional[str] = None
+    analyzed: bool = False
+    overrides: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class SessionArchiveData:
+    plates: Tuple[ArchivedPlate, ...]
+    active_id: Optional[str] = None
+    config: Dict[str, Any] = field(default_factory=dict)
+    selection: Tuple[str, ...] = ()
+
+
+class SessionArchive:
+    """
+    Oturumu tek zip dosyasına yazar: manifest.json + her dizi için bir .npy girdisi.
+
+    - Sayısal kolonlar dtype'ı korunarak doğrudan dizi olarak saklanır
+    - Metin/etiket kolonları (kodlar, kategoriler) olarak saklanır
+    - Eğri tensörleri (cycles, values) CurveStore'a kopyasız bağlanır;
+      curve_bits verilirse CurveCodec ile kuantize + delta kodlu saklanır
+    Yükleme RDMLService / Pipeline'a uğramaz.
+    """
+
+    @staticmethod
+    def save(path: str, data: SessionArchiveData, *, curve_bits: Optional[int] = None) -> None:
+        manifest: Dict[str, Any] = {
+            "format": ARCHIVE_FORMAT,
+            "active_id": data.active_id,
+            "config": data.config,
+            "selection": list(data.selection),
+            "plates": [],
+        }
+
+        tmp = path + ".tmp"
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for i, plate in enumerate(data.plates):
+                prefix = f"plates/{i}"
+                df = plate.df
+                if plate.curves is not None:
+                    # Eğriler tensörde; koordinat stringleri tekrar saklanmaz
+                    df = without_coordinates(df)
+                columns = write_frame(zf, prefix, df)
+
+                codec = None
+                if plate.curves is not None and curve_bits:
+                    encoded = CurveCodec.encode(plate.curves, bits=curve_bits)
+                    codec = {"bits": encoded.bits, "shape": list(encoded.deltas.shape)}
+                    _write_array(zf, f"{prefix}/cycles.npy", encoded.cycles)
+                    _write_array(zf, f"{prefix}/offset.npy", encoded.offset)
+                    _write_array(zf, f"{prefix}/scale.npy", encoded.scale)
+                    _write_array(zf, f"{prefix}/deltas.npy", _byte_planes(encoded.deltas))
+                elif plate.curves is not None:
+                    _write_array(zf, f"{prefix}/cycles.npy", np.asarray(plate.curves.cycles))
+                    _write_array(zf, f"{prefix}/values.npy", np.asarray(plate.curves.values))
+
+                manifest["plates"].append(
+                    {
+                        "run_id": plate.run_id,
+                        "rdml_path": plate.rdml_path,
+                        "file_name": plate.file_name,
+                        "result_key": plate.result_key,
+                        "input_key": plate.input_key,
+                        "analyzed": bool(plate.analyzed),
+                        "overrides": dict(plate.overrides),
+                        "rows": int(len(df)),
+                        "columns": columns,
+                        "curves": plate.curves is not None,
+                        "curve_codec": codec,
+                    }
+                )
+
+            zf.writestr(MANIFEST, json.dumps(manifest, ensure_ascii=False, default=str))
+        os.replace(tmp, path)
+
+    @staticmethod
+    def load(path: str) -> SessionArchiveData:
+        try:
+            zf = zipfile.ZipFile(path, "r")
+        except (OSError, zipfile.BadZipFile) as e:
+            raise ValueError(f"Oturum dosyası açılamadı: {e}") from e
+
+        with zf:
+            try:
+                manifest = json.loads(zf.read(MANIFEST).decode("utf-8"))
+            except KeyError:
+                raise ValueError("Oturum dosyasında manifest bulunamadı.")
+            if manifest.get("format") != ARCHIVE_FORMAT:
+                raise ValueError(f"Desteklenmeyen oturum formatı: {manifest.get('format')}")
+
+            plates: List[ArchivedPlate] = []
+            for i, meta in enumerate(manifest.get("plates", [])):
+                prefix = f"plates/{i}"
+                df = read_frame(zf, prefix, meta["columns"])
+
+                curves = None
+                codec = meta.get("curve_codec")
+                if meta.get("curves") and codec:
+                    encoded = EncodedCurves(
+                        bits=int(codec["bits"]),
+                        cycles=_read_array(zf, f"{prefix}/cycles.npy"),
+                        offset=_read_array(zf, f"{prefix}/offset.npy"),
+                        scale=_read_array(zf, f"{prefix}/scale.npy"),
+                        deltas=_from_byte_planes(
+                            _read_array(zf, f"{prefix}/deltas.npy"), int(codec["bits"]), codec["shape"]
+                        ),
+                    )
+                    curves = CurveCodec.decode(encoded, version=0, wells=WellIndex.build(df))
+                elif meta.get("curves"):
+                    cycles = _read_array(zf, f"{prefix}/cycles.npy")
+                    values = _read_array(zf, f"{prefix}/values.npy")
+                    for arr in (cycles, values):
+                        arr.setflags(write=False)
+                    curves = CurveStore(version=0, cycles=cycles, values=values, wells=WellIndex.build(df))
+
+                plates.append(
+                    ArchivedPlate(
+                        run_id=meta["run_id"],
+                        rdml_path=meta.get("rdml_path", ""),
+                        file_name=meta.get("file_name", ""),
+                        df=df,
+                        curves=curves,
+                        result_key=meta.get("result_key"),
+                        input_key=meta.get("input_key"),
+                        analyzed=bool(meta.get("analyzed")),
+                        overrides=dict(meta.get("overrides") or {}),
+                    )
+                )
+
+        return SessionArchiveData(
+            plates=tuple(plates),
+            active_id=manifest.get("active_id"),
+            config=dict(manifest.get("config") or {}),
+            selection=tuple(manifest.get("selection") or ()),
+        )
+
+
+def write_frame(zf: zipfile.ZipFile, prefix: str, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Kolonları prefix altına .npy girdileri olarak yazar; manifest'e konacak kolon tanımlarını döner."""
+    columns = []
+    for k, name in enumerate(df.columns):
+        spec, arrays = _encode_column(df[name])
+        spec["name"] = str(name)
+        for suffix, arr in arrays.items():
+            _write_array(zf, f"{prefix}/col{k}.{suffix}.npy", arr)
+        columns.append(spec)
+    return columns
+
+
+def read_frame(zf: zipfile.ZipFile, prefix: str, columns: List[Dict[str, Any]]) -> pd.DataFrame:
+    """write_frame'in tersi; pickle kullanılmaz (allow_pickle=False)."""
+    data: Dict[str, pd.Series] = {}
+    for k, spec in enumerate(columns):
+        arrays = {suffix: _read_array(zf, f"{prefix}/col{k}.{suffix}.npy") for suffix in spec.get("arrays", ())}
+        data[spec["name"]] = _decode_column(spec, arrays)
+    return pd.DataFrame(data, columns=[c["name"] for c in columns])
+
+
+def _write_array(zf: zipfile.ZipFile, name: str, arr: np.ndarray) -> None:
+    with zf.open(name, "w") as f:
+        np.lib.format.write_array(f, np.ascontiguousarray(arr), allow_pickle=False)
+
+
+def _read_array(zf: zipfile.ZipFile, name: str) -> np.ndarray:
+    with zf.open(name, "r") as f:
+        return np.lib.format.read_array(f, allow_pickle=False)
+
+
+def _byte_planes(arr: np.ndarray) -> np.ndarray:
+    """Tamsayıları bayt düzlemlerine ayırır; küçük deltaların üst baytları deflate ile neredeyse yok olur."""
+    flat = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<")).reshape(-1)
+    return np.ascontiguousarray(flat.view(np.uint8).reshape(flat.size, flat.itemsize).T)
+
+
+def _from_byte_planes(planes: np.ndarray, bits: int, shape: List[int]) -> np.ndarray:
+    dtype = np.dtype(f"<i{bits // 8}")
+    out = np.ascontiguousarray(planes.T).view(dtype).reshape(shape).astype(dtype.newbyteorder("="))
+    out.setflags(write=False)
+    return out
+
+
+def _encode_column(col: pd.Series) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    dtype = col.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return (
+            {"kind": "category", "categories": dtype.categories.tolist(), "arrays": ["codes"]},
+            {"codes": col.cat.codes.to_numpy()},
+        )
+    if dtype.kind in "biuf":
+        return {"kind": "numeric", "arrays": ["values"]}, {"values": col.to_numpy()}
+
+    # Metin / karışık: kodlar + benzersiz değerler (None/NaN -> -1)
+    codes, uniques = pd.factorize(col, use_na_sentinel=True)
+    return (
+        {"kind": "labels", "dtype": str(dtype), "uniques": list(uniques.tolist()), "arrays": ["codes"]},
+        {"codes": codes.astype(np.int32)},
+    )
+
+
+def _decode_column(spec: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> pd.Series:
+    kind = spec.get("kind")
+    if kind == "numeric":
+        return pd.Series(arrays["values"])
+    if kind == "category":
+        return pd.Series(pd.Categorical.from_codes(arrays["codes"], categories=spec["categories"]))
+    if kind == "labels":
+        codes = arrays["codes"]
+        values = np.empty(codes.size, dtype=object)
+        valid = codes >= 0
+        values[valid] = np.asarray(spec["uniques"], dtype=object)[codes[valid]]
+        values[~valid] = None
+        series = pd.Series(values, dtype=object)
+        if spec.get("dtype") not in (None, "object"):
+            try:
+                series = series.astype(spec["dtype"])
+            except (TypeError, ValueError):
+                pass
+        return series
+    raise ValueError(f"Bilinmeyen kolon türü: {kind}")
@@ -0,0 +1,242 @@
+# app\services\session_store.py
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from app.services.curve_archive import CurveArchive
+from app.services.curve_store import CurveStore
+from app.services.result_cache import ResultCache
+from app.services.result_schema import compact_result_frame, has_coordinates, without_coordinates
+from app.services.summary_engine import SummaryEngine
+
+logger = logging.getLogger(__name__)
+
+# Aktif olmayan plakaların eğri tensörleri için varsayılan bellek bütçesi
+DEFAULT_CURVE_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class PlateSession:
+    """
+    Tek plakanın (run) bellekte tutulan durumu.
+
+    df: plakanın son yayınlanan DataFrame'i (import veya analiz sonucu + düzenlemeler)
+    summary_engine: analiz yapıldıysa özet motoru (hafif, her zaman bellekte)
+    result_key: analiz sonucunun ResultCache anahtarı (manuel düzeltmeler buna bağlanır)
+    input_key: import edilen ham frame'in özeti; df analiz sonucuyla değişse de sabit
+               kalır ve sonuç anahtarı bundan türetilir
+    curves: CurveStore tensörü; bütçe aşılınca aktif olmayan plakalarda boşaltılır
+            (arşiv varsa diske eşlenmiş store ile değiştirilir), yoksa tekrar aktif
+            olunca koordinat kolonlarından tembel olarak yeniden kurulur
+    """
+
+    run_id: str
+    rdml_path: str
+    file_name: str
+    df: pd.DataFrame
+    summary_engine: Optional[SummaryEngine] = None
+    curves: Optional[CurveStore] = None
+    result_key: Optional[str] = None
+    input_key: Optional[str] = None
+
+    @property
+    def analyzed(self) -> bool:
+        return self.summary_engine is not None
+
+    @property
+    def has_coordinates(self) -> bool:
+        return has_coordinates(self.df)
+
+    @property
+    def curve_nbytes(self) -> int:
+        return self.curves.resident_nbytes if self.curves is not None else 0
+
+
+class SessionStore:
+    """
+    run_id ile anahtarlanmış çoklu plaka oturumları.
+
+    Plakalar arası geçiş O(1) sözlük erişimidir; DataFrame yeniden
+    ayrıştırılmaz. Aktif olmayan plakaların eğri dizileri LRU sırasıyla,
+    toplamları curve_budget_bytes'ı aşmayacak şekilde boşaltılır.
+    Aktif plakanın eğrileri asla boşaltılmaz. archive verilirse boşaltılan
+    tensör diske eklenir ve np.memmap görünümüyle değiştirilir.
+
+    Eğriler CurveStore'da tutuluyorsa koordinat stringleri (eğrilerin birkaç katı
+    yer kaplar) lean modda veya arşiv varken atılır; aksi halde eğrileri boşaltmak
+    neredeyse hiç bellek kazandırmaz. Arşivsiz normal modda stringler, boşaltılan
+    eğrilerin yeniden kurulabilmesi için kalır. Koordinatı atılmış bir plakanın
+    eğrileri arşive taşınamazsa bütçeye rağmen bellekte kalır.
+
+    lean=True: yakalanan DataFrame'ler ayrıca düşük bellek şemasına çevrilir.
+    """
+
+    def __init__(
+        self,
+        curve_budget_bytes: int = DEFAULT_CURVE_BUDGET_BYTES,
+        *,
+        archive: Optional[CurveArchive] = None,
+        lean: bool = False,
+    ) -> None:
+        if curve_budget_bytes < 0:
+            raise ValueError("Eğri bellek bütçesi negatif olamaz.")
+        self.curve_budget_bytes = int(curve_budget_bytes)
+        self.archive = archive
+        self.lean = bool(lean)
+        self._sessions: "OrderedDict[str, PlateSession]" = OrderedDict()
+        self._active_id: Optional[str] = None
+
+    @staticmethod
+    def run_id_for(rdml_path: str) -> str:
+        """Aynı dosyanın farklı yazımları aynı run_id'ye eşlenir."""
+        return os.path.normcase(os.path.abspath(rdml_path))
+
+    # ---- Okuma ----
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, run_id: str) -> bool:
+        return run_id in self._sessions
+
+    def get(self, run_id: str) -> Optional[PlateSession]:
+        return self._sessions.get(run_id)
+
+    @property
+    def active_id(self) -> Optional[str]:
+        return self._active_id
+
+    @property
+    def active(self) -> Optional[PlateSession]:
+        return self._sessions.get(self._active_id) if self._active_id is not None else None
+
+    def run_ids(self) -> List[str]:
+        """En eski kullanılandan en yeniye."""
+        return list(self._sessions.keys())
+
+    def curve_bytes(self) -> int:
+        return sum(s.curve_nbytes for s in self._sessions.values())
+
+    def curves_for(self, run_id: str) -> Optional[CurveStore]:
+        """
+        Plakanın eğri tensörü: bellekteki (veya arşive eşlenmiş) store, yoksa arşivdeki
+        son blok, o da yoksa koordinat kolonlarından kurulan yeni store. Bütçe dışıdır;
+        karşılaştırma gibi salt okunur kullanım içindir.
+        """
+        session = self._sessions.get(run_id)
+        if session is None:
+            return None
+        if session.curves is not None:
+            return session.curves
+        if self.archive is not None and run_id in self.archive:
+            return self.archive.open(run_id)
+        if session.has_coordinates:
+            return CurveStore.from_frame(session.df, version=0)
+        return None
+
+    # ---- Yazma ----
+    def add(
+        self,
+        run_id: str,
+        df: pd.DataFrame,
+        *,
+        rdml_path: str = "",
+        file_name: str = "",
+        input_key: Optional[str] = None,
+    ) -> PlateSession:
+        """
+        Yeni plakayı ekler (varsa üzerine yazar) ve aktif yapar.
+        input_key verilmezse df'in ham girdi olduğu varsayılıp özeti alınır.
+        """
+        if df is None:
+            raise ValueError("DataFrame cannot be None.")
+        if input_key is None:
+            input_key = ResultCache.input_digest(df)
+        session = PlateSession(run_id=run_id, rdml_path=rdml_path, file_name=file_name, df=df, input_key=input_key)
+        self._sessions[run_id] = session
+        self._activate(run_id)
+        return session
+
+    def activate(self, run_id: str) -> Optional[PlateSession]:
+        """Kayıtlı plakayı aktif yapar; yoksa None."""
+        if run_id not in self._sessions:
+            return None
+        self._activate(run_id)
+        return self._sessions[run_id]
+
+    def capture(
+        self,
+        run_id: str,
+        df: Optional[pd.DataFrame],
+        *,
+        summary_engine: Optional[SummaryEngine] = None,
+        curves: Optional[CurveStore] = None,
+        result_key: Optional[str] = None,
+    ) -> None:
+        """Aktif plakanın güncel durumunu (düzenlemeler, analiz, eğriler) oturuma yazar."""
+        session = self._sessions.get(run_id)
+        if session is None:
+            return
+        if df is not None:
+            session.df = df
+        session.summary_engine = summary_engine
+        session.result_key = result_key
+        if curves is not None and curves.well_count == len(session.df):
+            session.curves = curves
+        drop_coordinates = session.curves is not None and (self.lean or self.archive is not None)
+        if self.lean:
+            session.df = compact_result_frame(session.df, drop_coordinates=drop_coordinates)
+        elif drop_coordinates:
+            session.df = without_coordinates(session.df)
+        self._enforce_budget()
+
+    def remove(self, run_id: str) -> None:
+        self._sessions.pop(run_id, None)
+        if self._active_id == run_id:
+            self._active_id = None
+
+    def clear(self) -> None:
+        self._sessions.clear()
+        self._active_id = None
+
+    def _activate(self, run_id: str) -> None:
+        self._sessions.move_to_end(run_id)
+        self._active_id = run_id
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        total = self.curve_bytes()
+        if total <= self.curve_budget_bytes:
+            return
+
+        evicted: Dict[str, int] = {}
+        for run_id, session in self._sessions.items():
+            if total <= self.curve_budget_bytes:
+                break
+            freed = session.curve_nbytes
+            if run_id == self._active_id or freed == 0:
+                continue
+            spilled = self._spill(run_id, session.curves)
+            if spilled is None and not has_coordinates(session.df):
+                continue
+            session.curves = spilled
+            total -= freed
+            evicted[run_id] = freed
+
+        if evicted:
+            logger.debug("SessionStore evicted curves: %s (remaining=%d bytes)", evicted, total)
+
+    def _spill(self, run_id: str, curves: CurveStore) -> Optional[CurveStore]:
+        if self.archive is None:
+            return None
+        try:
+            self.archive.append(run_id, curves)
+            return self.archive.open(run_id, version=curves.version)
+        except (OSError, ValueError):
+            logger.exception("Curve archive spill failed: %s", run_id)
+            return None
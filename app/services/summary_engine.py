@@ -0,0 +1,184 @@
+# app\services\summary_engine.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from app.services.analysis_summary import AnalysisSummary
+from app.services.threshold_sweep import REPEAT_RATIO_FLOOR, STAT_RATIO_COL, REF_RATIO_COL
+
+# Sağlıklı ortalama/std/CV penceresi (eşiklerden bağımsız, uçlar dahil)
+STATS_WINDOW: Tuple[float, float] = (0.70, 1.3)
+SAFE_ZONE = "Güvenli Bölge"
+RISKY_AREA = "Riskli Alan"
+EMPTY_WELL = "Boş Kuyu"
+# Özetin bağımlı olduğu kolonlar (DataChange.touches ile kontrol edilir)
+SUMMARY_COLUMNS: Tuple[str, ...] = ("Uyarı", "Regresyon", STAT_RATIO_COL, REF_RATIO_COL)
+
+
+@dataclass(frozen=True)
+class RatioIndex:
+    """
+    Tek oran kolonunun analiz başına bir kez hazırlanan sıralı görünümü.
+
+    sorted_ratios: sonlu oranlar (sınıf sayımları için)
+    stats_ratios: Güvenli Bölge'deki sonlu oranlar
+    stats_sum / stats_sumsq: stats_ratios üzerinde başında 0 olan kümülatif toplamlar;
+    kayıplı çıkarmayı azaltmak için değerler `shift` kadar kaydırılarak tutulur.
+    """
+
+    sorted_ratios: NDArray[np.float64]
+    stats_ratios: NDArray[np.float64]
+    stats_sum: NDArray[np.float64]
+    stats_sumsq: NDArray[np.float64]
+    shift: float
+
+    @classmethod
+    def build(cls, ratios: NDArray[np.float64], safe_zone: NDArray[np.bool_]) -> "RatioIndex":
+        finite = np.isfinite(ratios)
+        sorted_ratios = np.sort(ratios[finite])
+        stats = np.sort(ratios[finite & safe_zone])
+
+        shift = float(stats.mean()) if stats.size else 0.0
+        centered = stats - shift
+        stats_sum = np.concatenate(([0.0], np.cumsum(centered)))
+        stats_sumsq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+        return cls(sorted_ratios, stats, stats_sum, stats_sumsq, shift)
+
+    def class_counts(self, carrier: float, uncertain: float) -> Tuple[int, int, int]:
+        """(sağlıklı, taşıyıcı, belirsiz) sayıları; analiz adımlarıyla aynı kural seti."""
+        s = self.sorted_ratios
+        n = s.size
+        floor_le, c_le, u_le = np.searchsorted(s, (REPEAT_RATIO_FLOOR, carrier, uncertain), side="right")
+        healthy = n - int(u_le)
+        carrier_count = max(int(c_le) - int(floor_le), 0)
+        uncertain_count = max(int(u_le) - int(c_le), 0)
+        return healthy, carrier_count, uncertain_count
+
+    def window_stats(self, lo: float, hi: float) -> Tuple[float, float, float]:
+        """[lo, hi] aralığındaki oranlar için (ortalama, std(ddof=0), CV%)."""
+        a = int(np.searchsorted(self.stats_ratios, lo, side="left"))
+        b = int(np.searchsorted(self.stats_ratios, hi, side="right"))
+        n = b - a
+        if n <= 0:
+            return 0.0, 0.0, 0.0
+
+        s1 = self.stats_sum[b] - self.stats_sum[a]
+        s2 = self.stats_sumsq[b] - self.stats_sumsq[a]
+        m = s1 / n
+        mean = m + self.shift
+        std = float(np.sqrt(max(s2 / n - m * m, 0.0)))
+        cv = (std / mean) * 100 if mean != 0 else 0.0
+        return float(mean), std, float(cv)
+
+
+class SummaryEngine:
+    """
+    Analiz sonucundan bir kez kurulur; eşik değişimlerinde özet
+    O(log n) searchsorted + kümülatif toplam farkları ile yeniden üretilir.
+    """
+
+    def __init__(
+        self,
+        indexes: Dict[bool, RatioIndex],
+        *,
+        analyzed_well_count: int,
+        safezone_count: int,
+        riskyarea_count: int,
+    ) -> None:
+        self._indexes = indexes
+        self.analyzed_well_count = int(analyzed_well_count)
+        self.safezone_count = int(safezone_count)
+        self.riskyarea_count = int(riskyarea_count)
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame | None) -> "SummaryEngine":
+        if df is None or df.empty:
+            return cls({}, analyzed_well_count=0, safezone_count=0, riskyarea_count=0)
+
+        if "Uyarı" in df.columns:
+            analyzed = int((df["Uyarı"] != EMPTY_WELL).sum())
+        else:
+            analyzed = int(len(df))
+
+        if "Regresyon" in df.columns:
+            regression = df["Regresyon"].to_numpy(dtype=object)
+            safe_zone = regression == SAFE_ZONE
+            risky = int((regression == RISKY_AREA).sum())
+        else:
+            safe_zone = np.zeros(len(df), dtype=bool)
+            risky = 0
+
+        indexes: Dict[bool, RatioIndex] = {}
+        for use_without_reference, col in ((True, STAT_RATIO_COL), (False, REF_RATIO_COL)):
+            if col not in df.columns:
+                continue
+            ratios = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+            indexes[use_without_reference] = RatioIndex.build(ratios, safe_zone)
+
+        return cls(
+            indexes,
+            analyzed_well_count=analyzed,
+            safezone_count=int(safe_zone.sum()),
+            riskyarea_count=risky,
+        )
+
+    def ratio_index(self, use_without_reference: bool) -> Optional[RatioIndex]:
+        return self._indexes.get(bool(use_without_reference))
+
+    def summary(
+        self,
+        carrier_range: float,
+        uncertain_range: float,
+        *,
+        use_without_reference: bool,
+    ) -> AnalysisSummary:
+        index = self.ratio_index(use_without_reference)
+        if index is None:
+            healthy = carrier = uncertain = 0
+            h_avg_val, std_val, cv_val = 0.0, 0.0, 0.0
+        else:
+            healthy, carrier, uncertain = index.class_counts(float(carrier_range), float(uncertain_range))
+            h_avg_val, std_val, cv_val = index.window_stats(*STATS_WINDOW)
+
+        return format_summary(
+            analyzed_well_count=self.analyzed_well_count,
+            safezone_count=self.safezone_count,
+            riskyarea_count=self.riskyarea_count,
+            healthy_count=healthy,
+            carrier_count=carrier,
+            uncertain_count=uncertain,
+            healthy_avg=h_avg_val,
+            std=std_val,
+            cv=cv_val,
+        )
+
+
+def format_summary(
+    *,
+    analyzed_well_count: int,
+    safezone_count: int,
+    riskyarea_count: int,
+    healthy_count: int,
+    carrier_count: int,
+    uncertain_count: int,
+    healthy_avg: float,
+    std: float,
+    cv: float,
+) -> AnalysisSummary:
+    # Değerlerin başına ":" ekleyerek ve istenen basamak hassasiyetiyle stringe çeviriyoruz
+    return AnalysisSummary(
+        analyzed_well_count=f": {analyzed_well_count}",
+        safezone_count=f": {safezone_count}",
+        riskyarea_count=f": {riskyarea_count}",
+        healthy_count=f": {healthy_count}",
+        carrier_count=f": {carrier_count}",
+        uncertain_count=f": {uncertain_count}",
+        healthy_avg=f": {healthy_avg:.3f}",
+        std=f": {std:.3f}",
+        cv=f": {cv:.2f}",
+    )
@@ -0,0 +1,282 @@
+# app\services\threshold_sweep.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+# Sınıf kodları: counts[..., k] sırası bu tuple ile aynıdır.
+CLASS_LABELS: Tuple[str, str, str, str] = ("Sağlıklı", "Taşıyıcı", "Belirsiz", "Tekrar")
+HEALTHY, CARRIER, UNCERTAIN, REPEAT = range(4)
+
+# Analiz adımlarındaki sabit alt sınır (0.1 < oran <= taşıyıcı -> Taşıyıcı)
+REPEAT_RATIO_FLOOR = 0.1
+
+STAT_RATIO_COL = "İstatistik Oranı"
+REF_RATIO_COL = "Standart Oranı"
+WELL_COL = "Kuyu No"
+
+
+def ratio_column(use_without_reference: bool) -> str:
+    return STAT_RATIO_COL if use_without_reference else REF_RATIO_COL
+
+
+def classify_ratios(ratios: NDArray[np.float64], carrier: float, uncertain: float) -> NDArray[np.int8]:
+    """
+    CalculateWithReferance / CalculateWithoutReference ile aynı kural seti.
+    NaN oranlar REPEAT kodunu alır; çağıran taraf gerekirse maskeler.
+    """
+    r = np.asarray(ratios, dtype=float)
+    codes = np.full(r.shape, REPEAT, dtype=np.int8)
+    codes[(r > REPEAT_RATIO_FLOOR) & (r <= carrier)] = CARRIER
+    codes[(r > carrier) & (r <= uncertain)] = UNCERTAIN
+    codes[r > uncertain] = HEALTHY
+    return codes
+
+
+@dataclass(frozen=True)
+class ThresholdSweepResult:
+    """
+    2-D eşik ızgarası sonucu.
+
+    counts[i, j, k]: carrier_values[i] / uncertain_values[j] çiftinde k sınıfındaki kuyu sayısı
+    flip_counts[i, j]: baseline sınıflandırmasına göre sınıfı değişen kuyu sayısı
+    well_flip_counts[w]: w kuyusunun geçerli ızgara noktalarından kaçında sınıf değiştirdiği
+    valid[i, j]: carrier < uncertain koşulu (geçersiz hücrelerde sayımlar 0'dır)
+    """
+
+    carrier_values: NDArray[np.float64]
+    uncertain_values: NDArray[np.float64]
+    baseline: Tuple[float, float]
+    counts: NDArray[np.int64]
+    flip_counts: NDArray[np.int64]
+    valid: NDArray[np.bool_]
+    ratios: NDArray[np.float64]
+    well_keys: NDArray[np.str_]
+    plate_ids: NDArray[np.str_]
+    baseline_codes: NDArray[np.int8]
+    well_flip_counts: NDArray[np.int64]
+
+    @property
+    def well_count(self) -> int:
+        return int(self.ratios.size)
+
+    def class_counts(self, label: str) -> NDArray[np.int64]:
+        return self.counts[:, :, CLASS_LABELS.index(label)]
+
+    def codes_at(self, i: int, j: int) -> NDArray[np.int8]:
+        return classify_ratios(self.ratios, float(self.carrier_values[i]), float(self.uncertain_values[j]))
+
+    def flipped_wells(self, i: int, j: int) -> NDArray[np.str_]:
+        """Baseline'a göre (i, j) noktasında sınıfı değişen kuyular."""
+        if not self.valid[i, j]:
+            return np.array([], dtype=str)
+        changed = self.codes_at(i, j) != self.baseline_codes
+        return self.well_keys[changed]
+
+
+class ThresholdSweepService:
+    """
+    Hesaplanmış oran vektörleri üzerinde carrier/uncertain eşik taraması.
+    Pipeline tekrar çalıştırılmaz; oranlar bir kez sıralanır, her ızgara noktası
+    searchsorted ile O(log n) sayılır. UI/Qt bağımlılığı yoktur.
+
+    Not: CalculateWithoutReference içindeki gradyan düzeltmesi sınıftan bağımsız olarak
+    0.25-1.75 aralığındaki tüm oranlara uygulanır; eşikler yalnızca düzeltmenin çalışıp
+    çalışmayacağını belirler (0.8-1.2 aralığında sağlıklı sınıflanan en az bir kuyu gerekir).
+    uncertain < 0.8 olan ızgaralarda bu koşul eşikten bağımsızdır; nihai oranlar
+    değişmez ve tarama tam analizle aynı sonucu verir.
+    """
+
+    @staticmethod
+    def default_grid(
+        carrier: float,
+        uncertain: float,
+        *,
+        span: float = 0.1,
+        steps: int = 21,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        carrier_values = np.linspace(carrier - span, carrier + span, steps)
+        uncertain_values = np.linspace(uncertain - span, uncertain + span, steps)
+        carrier_values = carrier_values[carrier_values > 0]
+        uncertain_values = uncertain_values[uncertain_values > 0]
+        return carrier_values, uncertain_values
+
+    @staticmethod
+    def sweep(
+        ratios: Iterable[float],
+        carrier_values: Sequence[float],
+        uncertain_values: Sequence[float],
+        *,
+        baseline: Tuple[float, float],
+        well_keys: Optional[Sequence[str]] = None,
+        plate_ids: Optional[Sequence[str]] = None,
+    ) -> ThresholdSweepResult:
+        r = np.asarray(list(ratios) if not isinstance(ratios, np.ndarray) else ratios, dtype=float)
+        keys = np.asarray(well_keys if well_keys is not None else [str(i) for i in range(r.size)], dtype=str)
+        plates = np.asarray(plate_ids if plate_ids is not None else [""] * r.size, dtype=str)
+        if keys.size != r.size or plates.size != r.size:
+            raise ValueError("well_keys/plate_ids uzunluğu oran sayısıyla eşleşmiyor.")
+
+        finite = np.isfinite(r)
+        r, keys, plates = r[finite], keys[finite], plates[finite]
+
+        c = np.asarray(carrier_values, dtype=float).ravel()
+        u = np.asarray(uncertain_values, dtype=float).ravel()
+        if c.size == 0 or u.size == 0:
+            raise ValueError("Eşik ızgarası boş olamaz.")
+        c0, u0 = float(baseline[0]), float(baseline[1])
+        if c0 >= u0:
+            raise ValueError("Taşıyıcı aralığı belirsiz aralığından düşük olmalıdır.")
+
+        sorted_r = np.sort(r)
+        n = sorted_r.size
+
+        def n_le(x: NDArray[np.float64] | float) -> NDArray[np.int64]:
+            return np.searchsorted(sorted_r, x, side="right")
+
+        cc = c[:, None]
+        uu = u[None, :]
+        valid = cc < uu
+
+        floor_le = int(n_le(REPEAT_RATIO_FLOOR))
+        c_le = n_le(cc)
+        u_le = n_le(uu)
+
+        counts = np.zeros((c.size, u.size, 4), dtype=np.int64)
+        counts[:, :, REPEAT] = np.minimum(c_le, floor_le)
+        counts[:, :, CARRIER] = np.maximum(c_le - floor_le, 0)
+        counts[:, :, UNCERTAIN] = u_le - c_le
+        counts[:, :, HEALTHY] = n - u_le
+        counts[~valid] = 0
+
+        # Baseline ile aynı sınıfta kalan kuyular: dört aralığın kesişimleri
+        c_min, c_max = np.minimum(cc, c0), np.maximum(cc, c0)
+        same = (
+            (n - n_le(np.maximum(uu, u0)))
+            + np.maximum(n_le(np.minimum(uu, u0)) - n_le(c_max), 0)
+            + np.maximum(n_le(c_min) - floor_le, 0)
+            + n_le(np.minimum(c_min, REPEAT_RATIO_FLOOR))
+        )
+        flip_counts = np.where(valid, n - same, 0).astype(np.int64)
+
+        baseline_codes = classify_ratios(r, c0, u0)
+        well_flip_counts = ThresholdSweepService._well_flip_counts(r, baseline_codes, c, u, valid)
+
+        return ThresholdSweepResult(
+            carrier_values=c,
+            uncertain_values=u,
+            baseline=(c0, u0),
+            counts=counts,
+            flip_counts=flip_counts,
+            valid=valid,
+            ratios=r,
+            well_keys=keys,
+            plate_ids=plates,
+            baseline_codes=baseline_codes,
+            well_flip_counts=well_flip_counts,
+        )
+
+    @staticmethod
+    def _well_flip_counts(
+        r: NDArray[np.float64],
+        baseline_codes: NDArray[np.int8],
+        c: NDArray[np.float64],
+        u: NDArray[np.float64],
+        valid: NDArray[np.bool_],
+    ) -> NDArray[np.int64]:
+        """
+        Her kuyu için baseline sınıfını koruyan geçerli hücre sayısı, geçerlilik
+        matrisinin 2-D kümülatif toplamı ile O(log g) hesaplanır.
+        """
+        if r.size == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        c_order = np.argsort(c, kind="mergesort")
+        u_order = np.argsort(u, kind="mergesort")
+        cs, us = c[c_order], u[u_order]
+        v = valid[np.ix_(c_order, u_order)].astype(np.int64)
+
+        # prefix[a, b] = i < a ve j < b olan geçerli hücre sayısı
+        prefix = np.zeros((cs.size + 1, us.size + 1), dtype=np.int64)
+        prefix[1:, 1:] = v.cumsum(axis=0).cumsum(axis=1)
+        total = int(prefix[-1, -1])
+
+        k_c = np.searchsorted(cs, r, side="left")  # c_i < r
+        k_u = np.searchsorted(us, r, side="left")  # u_j < r
+
+        healthy_cells = prefix[-1, k_u]
+        uncertain_cells = prefix[k_c, -1] - prefix[k_c, k_u]
+        carrier_cells = total - healthy_cells - uncertain_cells
+
+        # r <= c_i hücrelerinde sınıf, r'nin 0.1 tabanına göre Taşıyıcı ya da Tekrar'dır;
+        # her iki baseline için de korunan hücre sayısı carrier_cells olur.
+        same = np.select(
+            [baseline_codes == HEALTHY, baseline_codes == UNCERTAIN],
+            [healthy_cells, uncertain_cells],
+            default=carrier_cells,
+        )
+        return (total - same).astype(np.int64)
+
+    # ---- DataFrame girişleri ----
+    @staticmethod
+    def sweep_frame(
+        df: pd.DataFrame,
+        carrier_values: Sequence[float],
+        uncertain_values: Sequence[float],
+        *,
+        baseline: Tuple[float, float],
+        use_without_reference: bool,
+        plate_id: str = "",
+    ) -> ThresholdSweepResult:
+        return ThresholdSweepService.sweep_frames(
+            {plate_id: df},
+            carrier_values,
+            uncertain_values,
+            baseline=baseline,
+            use_without_reference=use_without_reference,
+        )
+
+    @staticmethod
+    def sweep_frames(
+        frames: Mapping[str, pd.DataFrame],
+        carrier_values: Sequence[float],
+        uncertain_values: Sequence[float],
+        *,
+        baseline: Tuple[float, float],
+        use_without_reference: bool,
+    ) -> ThresholdSweepResult:
+        """Birden fazla plaka (arşiv) için oranları birleştirip tek geçişte tarar."""
+        col = ratio_column(use_without_reference)
+        ratio_parts = []
+        key_parts = []
+        plate_parts = []
+
+        for plate_id, df in frames.items():
+            if df is None or df.empty or col not in df.columns:
+                continue
+            ratios = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+            wells = (
+                df[WELL_COL].astype(str).to_numpy()
+                if WELL_COL in df.columns
+                else np.arange(ratios.size).astype(str)
+            )
+            prefix = f"{plate_id}:" if plate_id and len(frames) > 1 else ""
+            ratio_parts.append(ratios)
+            key_parts.append(np.char.add(prefix, wells.astype(str)) if prefix else wells.astype(str))
+            plate_parts.append(np.full(ratios.size, str(plate_id)))
+
+        if not ratio_parts:
+            raise ValueError(f"Tarama için '{col}' kolonu içeren analiz sonucu bulunamadı.")
+
+        return ThresholdSweepService.sweep(
+            np.concatenate(ratio_parts),
+            carrier_values,
+            uncertain_values,
+            baseline=baseline,
+            well_keys=np.concatenate(key_parts),
+            plate_ids=np.concatenate(plate_parts),
+        )
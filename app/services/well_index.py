@@ -0,0 +1,97 @@
+# app\services\well_index.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from app.utils import well_mapping
+
+WELL_COL = "Kuyu No"
+PATIENT_NO_COL = "Hasta No"
+PLATE_SIZE = len(well_mapping.ROWS) * len(well_mapping.COLUMNS)
+
+# Sabit eşleme: Kuyu No -> Hasta No (kolon öncelikli, 1..96)
+_PATIENT_NO_BY_WELL: Dict[str, int] = {
+    well_mapping.patient_no_to_well_id(pn): pn for pn in range(1, PLATE_SIZE + 1)
+}
+
+
+@dataclass(frozen=True)
+class WellIndex:
+    """
+    Kuyu No <-> Hasta No <-> satır pozisyonu eşlemesi.
+
+    DataStore her snapshot ile birlikte yayınlar; servisler maske/tarama yerine
+    O(1) sözlük/dizi erişimi ile satır bulur. Aynı kuyu birden fazla satırda
+    varsa ilk satır kullanılır (eski iloc[0] davranışı).
+
+    row_by_patient[pn]: Hasta No -> satır (-1: yok), boyut PLATE_SIZE + 1
+    patient_no_by_row[r]: satır -> Hasta No (0: geçersiz kuyu)
+    """
+
+    well_ids: Tuple[str, ...]
+    patient_no_by_row: NDArray[np.int16]
+    row_by_patient: NDArray[np.int32]
+    row_by_well: Mapping[str, int]
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "WellIndex":
+        n = len(df)
+        if WELL_COL in df.columns:
+            wells = df[WELL_COL].astype(str).str.strip().str.upper()
+            patient = wells.map(_PATIENT_NO_BY_WELL)
+        elif PATIENT_NO_COL in df.columns:
+            patient = pd.to_numeric(df[PATIENT_NO_COL], errors="coerce")
+            patient = patient.where((patient >= 1) & (patient <= PLATE_SIZE))
+            wells = patient.map(
+                lambda pn: well_mapping.patient_no_to_well_id(int(pn)) if pd.notna(pn) else ""
+            )
+        else:
+            raise ValueError(f"'{WELL_COL}' veya '{PATIENT_NO_COL}' kolonu bulunamadı.")
+
+        patient_no_by_row = patient.fillna(0).to_numpy(dtype=np.int16)
+        well_ids = tuple(wells.tolist())
+
+        row_by_patient = np.full(PLATE_SIZE + 1, -1, dtype=np.int32)
+        valid_rows = np.flatnonzero(patient_no_by_row > 0)
+        pns, first = np.unique(patient_no_by_row[valid_rows], return_index=True)
+        row_by_patient[pns] = valid_rows[first]
+
+        row_by_well: Dict[str, int] = {}
+        for r in range(n - 1, -1, -1):
+            row_by_well[well_ids[r]] = r
+
+        patient_no_by_row.setflags(write=False)
+        row_by_patient.setflags(write=False)
+        return cls(well_ids, patient_no_by_row, row_by_patient, row_by_well)
+
+    def __len__(self) -> int:
+        return len(self.well_ids)
+
+    def row_of_well(self, well_id: str | None) -> Optional[int]:
+        if not well_id:
+            return None
+        return self.row_by_well.get(str(well_id).strip().upper())
+
+    def row_of_patient(self, patient_no: int) -> Optional[int]:
+        if patient_no < 1 or patient_no > PLATE_SIZE:
+            return None
+        r = int(self.row_by_patient[patient_no])
+        return r if r >= 0 else None
+
+    def rows_of_wells(self, well_ids: Iterable[str]) -> Dict[str, int]:
+        """Bulunan kuyular için {kuyu: satır}."""
+        out: Dict[str, int] = {}
+        for w in well_ids:
+            r = self.row_of_well(w)
+            if r is not None:
+                out[str(w).strip().upper()] = r
+        return out
+
+    def patient_no_of_row(self, row: int) -> Optional[int]:
+        pn = int(self.patient_no_by_row[row])
+        return pn or None
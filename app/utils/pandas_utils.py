@@ -6,3 +6,16 @@ def ensure_non_empty_df(df: pd.DataFrame, msg: str = "DataFrame boş.") -> pd.Da
     if df is None or df.empty:
         raise ValueError(msg)
     return df
+
+
+def round_numeric(values: pd.Series, digits: int) -> pd.Series:
+    """
+    Vektörel yuvarlama (hücre başına apply yok). object kolonda yalnızca sayılar
+    varsa sayıya çevrilip yuvarlanır; metin içeren kolon olduğu gibi döner.
+    """
+    if not pd.api.types.is_numeric_dtype(values):
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.notna().sum() != values.notna().sum():
+            return values
+        values = numeric
+    return values.round(digits)
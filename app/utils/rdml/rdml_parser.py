@@ -1,7 +1,10 @@
 # app\utils\rdml\rdml_parser.py
 import ast
+import logging
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
 
 RDML_NS = {"rdml": "http://www.rdml.org"}
 
@@ -45,9 +48,27 @@ def parse_react(react: ET.Element, run_id: str) -> Dict:
     return row
 
 
-def merge_fam_hex_rows(root: ET.Element) -> List[Dict]:
-    fam_run = extract_run(root, "Amp Step 3_FAM")
-    hex_run = extract_run(root, "Amp Step 3_HEX")
+def run_id_for_channel(channel: str) -> str:
+    return f"Amp Step 3_{channel}"
+
+
+def merge_fam_hex_rows(root: ET.Element, extra_channels: Sequence[str] = ()) -> List[Dict]:
+    """
+    FAM koşusundaki her react için FAM/HEX satırı; extra_channels (ör. CY5) için
+    aynı react id'li Ct ve koordinat kolonları eklenir. Dosyada olmayan ek kanal
+    koşusu hata değildir: kolonları boş kalır (analizde o çift "Yetersiz DNA" olur).
+    """
+    fam_run = extract_run(root, run_id_for_channel("FAM"))
+    hex_run = extract_run(root, run_id_for_channel("HEX"))
+
+    extra_maps: Dict[str, Dict[str, ET.Element]] = {}
+    for channel in extra_channels:
+        try:
+            run = extract_run(root, run_id_for_channel(channel))
+        except ValueError:
+            logger.warning("RDML içinde %s koşusu yok; kolonlar boş bırakıldı.", channel)
+            run = None
+        extra_maps[channel] = _react_map(run) if run is not None else {}
 
     rows: List[Dict] = []
 
@@ -71,6 +92,21 @@ def merge_fam_hex_rows(root: ET.Element) -> List[Dict]:
             row["HEX Ct"] = ""
             row["HEX koordinat list"] = ""
 
+        for channel, react_map in extra_maps.items():
+            react = react_map.get(rid)
+            parsed = parse_react(react, run_id=channel) if react is not None else {}
+            row[f"{channel} Ct"] = parsed.get(f"{channel} Ct", "")
+            row[f"{channel} koordinat list"] = parsed.get(f"{channel} koordinat list", "")
+
         rows.append(row)
 
     return rows
+
+
+def _react_map(run: ET.Element) -> Dict[str, ET.Element]:
+    out = {}
+    for react in run.findall("rdml:react", namespaces=RDML_NS):
+        rid = react.get("id", "")
+        if rid:
+            out[rid] = react
+    return out
@@ -6,6 +6,7 @@ from PyQt5.QtWidgets import QMainWindow, QMessageBox, QFileDialog
 
 from app.views.ui.ui import Ui_MainWindow
 from app.services.analysis_summary import AnalysisSummary
+from app.services.session_archive import ARCHIVE_SUFFIX as SESSION_SUFFIX
 
 
 class MainView(QMainWindow):
@@ -22,7 +23,10 @@ class MainView(QMainWindow):
     carrier_range_changed = QtCore.pyqtSignal(float)
     uncertain_range_changed = QtCore.pyqtSignal(float)
     close_requested = QtCore.pyqtSignal()
-    
+    threshold_sweep_requested = QtCore.pyqtSignal()
+    session_save_requested = QtCore.pyqtSignal()
+    session_open_requested = QtCore.pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.ui = Ui_MainWindow()
@@ -48,6 +52,14 @@ class MainView(QMainWindow):
         ui.doubleSpinBox_tasiyici.valueChanged.connect(self.carrier_range_changed)
         ui.doubleSpinBox_belirsiz.valueChanged.connect(self.uncertain_range_changed)
 
+        sweep_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+T"), self)
+        sweep_shortcut.activated.connect(self.threshold_sweep_requested)
+
+        save_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+S"), self)
+        save_shortcut.activated.connect(self.session_save_requested)
+        open_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+O"), self)
+        open_shortcut.activated.connect(self.session_open_requested)
+
     # ---- UI helpers ----
     def set_title_label(self, text: str) -> None:
         self.ui.label_title.setText(text)
@@ -99,6 +111,39 @@ class MainView(QMainWindow):
         file_name = QtCore.QFileInfo(file_path).fileName()
         return file_path, file_name
 
+    # ---- Session archive ----
+    def select_session_save_path(self, default_name: str = "") -> str:
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Oturumu Kaydet",
+            f"{default_name or 'oturum'}{SESSION_SUFFIX}",
+            f"Pharmalyzer Oturumu (*{SESSION_SUFFIX})",
+        )
+        if file_path and not file_path.lower().endswith(SESSION_SUFFIX):
+            file_path += SESSION_SUFFIX
+        return file_path or ""
+
+    def select_session_open_path(self) -> str:
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Oturum Aç",
+            "",
+            f"Pharmalyzer Oturumu (*{SESSION_SUFFIX});;Tüm Dosyalar (*)",
+        )
+        return file_path or ""
+
+    def set_analysis_config(self, carrier: float, uncertain: float, use_without_reference: bool) -> None:
+        """Yüklenen oturumun eşiklerini ve istatistik seçimini kontrollere yansıtır."""
+        ui = self.ui
+        # Aralık doğrulaması sırasına takılmamak için önce genişleyen taraf yazılır
+        if uncertain > ui.doubleSpinBox_belirsiz.value():
+            ui.doubleSpinBox_belirsiz.setValue(uncertain)
+            ui.doubleSpinBox_tasiyici.setValue(carrier)
+        else:
+            ui.doubleSpinBox_tasiyici.setValue(carrier)
+            ui.doubleSpinBox_belirsiz.setValue(uncertain)
+        ui.checkBox_istatistik.setChecked(bool(use_without_reference))
+
     # ---- Colored boxes ----
     def set_widget_color(self, widget: QtWidgets.QWidget, color_code: str) -> None:
         if not isinstance(color_code, str) or not color_code.startswith("#"):
@@ -0,0 +1,167 @@
+# app\views\plotting\figure_export\exporter.py
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from PyQt5 import QtCore, QtGui, QtSvg
+
+from app.constants.pcr_graph_style import PCRGraphStyle
+from app.constants.regression_plot_style import RegressionPlotStyle
+
+from .figures import PCRFigure, RegressionFigure, paint_pcr, paint_regression
+
+logger = logging.getLogger(__name__)
+
+FIGURE_FORMATS = (".png", ".svg")
+
+
+@dataclass(frozen=True)
+class FigureJob:
+    """
+    Tek görsel: figür + hedef dosya. Biçim uzantıdan seçilir (.png / .svg).
+    size: mantıksal piksel; scale: PNG için piksel yoğunluğu (2.0 -> rapor kalitesi).
+    style None ise figür türünün varsayılan stili kullanılır.
+    """
+
+    figure: PCRFigure | RegressionFigure
+    path: str
+    size: Tuple[int, int] = (1600, 1000)
+    scale: float = 1.0
+    style: PCRGraphStyle | RegressionPlotStyle | None = None
+
+    def __post_init__(self) -> None:
+        if self.fmt not in FIGURE_FORMATS:
+            raise ValueError(f"Desteklenmeyen görsel formatı: {self.path} (desteklenen: {', '.join(FIGURE_FORMATS)})")
+        if self.size[0] <= 0 or self.size[1] <= 0 or self.scale <= 0:
+            raise ValueError(f"Geçersiz görsel boyutu: {self.size} x{self.scale}")
+
+    @property
+    def fmt(self) -> str:
+        return os.path.splitext(self.path)[1].lower()
+
+
+def render_figure(job: FigureJob) -> str:
+    """
+    Figürü offscreen çizip dosyaya yazar (QImage / QSvgGenerator; widget yok).
+    Herhangi bir thread'den çağrılabilir; QGuiApplication mevcut olmalıdır.
+    """
+    width, height = job.size
+    if job.fmt == ".svg":
+        device = QtSvg.QSvgGenerator()
+        device.setFileName(job.path)
+        device.setSize(QtCore.QSize(width, height))
+        device.setViewBox(QtCore.QRect(0, 0, width, height))
+        device.setTitle(job.figure.title)
+    else:
+        # Figür arka planı opak; alfa kanalsız PNG kodlaması belirgin şekilde hızlı
+        device = QtGui.QImage(round(width * job.scale), round(height * job.scale), QtGui.QImage.Format_RGB32)
+        device.fill(QtCore.Qt.black)
+        device.setDotsPerMeterX(round(3780 * job.scale))  # 96 dpi * scale
+        device.setDotsPerMeterY(round(3780 * job.scale))
+
+    painter = QtGui.QPainter(device)
+    try:
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing)
+        if job.fmt == ".png":
+            painter.scale(job.scale, job.scale)
+        if isinstance(job.figure, PCRFigure):
+            paint_pcr(painter, job.size, job.figure, job.style or PCRGraphStyle())
+        else:
+            paint_regression(painter, job.size, job.figure, job.style or RegressionPlotStyle())
+    finally:
+        painter.end()
+
+    if job.fmt == ".png" and not device.save(job.path, "PNG"):
+        raise OSError(f"Görsel yazılamadı: {job.path}")
+    return job.path
+
+
+class _FigureTask(QtCore.QRunnable):
+    def __init__(self, exporter: "FigureExporter", seq: int, job: FigureJob):
+        super().__init__()
+        self._exporter = exporter
+        self._seq = seq
+        self._job = job
+
+    def run(self) -> None:
+        # İptal edilen toplu işin kalan görselleri atlanır
+        if self._seq != self._exporter._seq:  # noqa
+            return
+        error = ""
+        try:
+            render_figure(self._job)
+        except Exception as exc:
+            logger.exception("Figure export failed: %s", self._job.path)
+            error = str(exc) or exc.__class__.__name__
+        try:
+            self._exporter._done.emit(self._seq, self._job.path, error)  # noqa
+        except RuntimeError:
+            pass  # exporter kapandı
+
+
+class FigureExporter(QtCore.QObject):
+    """
+    Görselleri iş parçacığı havuzunda üretir; UI thread'i beklemez. Çizim QPainter
+    çağrılarında GIL bırakıldığından görseller paralel çizilir.
+
+    progress(tamamlanan, toplam) ve failed(yol, hata) her görselde, finished(yazılan
+    yollar) toplu iş bitince UI thread'inde yayılır. Yeni export çağrısı öncekini iptal eder.
+    """
+
+    progress = QtCore.pyqtSignal(int, int)
+    failed = QtCore.pyqtSignal(str, str)
+    finished = QtCore.pyqtSignal(list)
+    _done = QtCore.pyqtSignal(int, str, str)
+
+    def __init__(self, parent: QtCore.QObject | None = None, max_workers: int | None = None):
+        super().__init__(parent)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max_workers or max(QtCore.QThread.idealThreadCount(), 1))
+        self._seq = 0
+        self._total = 0
+        self._completed = 0
+        self._written: List[str] = []
+        self._done.connect(self._on_done, QtCore.Qt.QueuedConnection)
+
+    @property
+    def busy(self) -> bool:
+        return self._completed < self._total
+
+    def export(self, jobs: Sequence[FigureJob]) -> None:
+        self.cancel()
+        self._total = len(jobs)
+        self._completed = 0
+        self._written = []
+        if not jobs:
+            self.finished.emit([])
+            return
+        for job in jobs:
+            self._pool.start(_FigureTask(self, self._seq, job))
+
+    def cancel(self) -> None:
+        self._seq += 1
+        self._pool.clear()
+        self._total = self._completed = 0
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Havuzu bekleyip sonuç sinyallerini teslim eder (testler ve betikler için)."""
+        done = self._pool.waitForDone(msecs)
+        QtCore.QCoreApplication.sendPostedEvents(self)
+        return done
+
+    @QtCore.pyqtSlot(int, str, str)
+    def _on_done(self, seq: int, path: str, error: str) -> None:
+        if seq != self._seq:
+            return
+        self._completed += 1
+        if error:
+            self.failed.emit(path, error)
+        else:
+            self._written.append(path)
+        self.progress.emit(self._completed, self._total)
+        if self._completed == self._total:
+            self.finished.emit(list(self._written))
@@ -0,0 +1,345 @@
+# app\views\plotting\figure_export\figures.py
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+
+from app.constants.pcr_graph_style import PCRGraphStyle
+from app.constants.regression_plot_style import RegressionPlotStyle
+from app.i18n import t
+from app.services.curve_store import FAM, HEX, CurveStore
+from app.services.regression_plot_service import RegressionPlotData
+from app.views.plotting.pcr_graph_pg.axes import axis_ticks
+from app.views.plotting.regression.adapters import series_label
+
+_WELL_RE = re.compile(r"^([A-Z])(\d+)$")
+
+
+@dataclass(frozen=True)
+class PCRFigure:
+    """
+    Dışa aktarılacak PCR grafiği. values: (kuyu, kanal, döngü) kopyası; iş parçacığı
+    güvenli olması için store'dan bağımsızdır.
+    small_multiples: True ise her kuyu plaka düzeninde ayrı küçük panelde çizilir.
+    """
+
+    title: str
+    cycles: np.ndarray
+    values: np.ndarray
+    wells: Tuple[str, ...]
+    small_multiples: bool = False
+    fam_visible: bool = True
+    hex_visible: bool = True
+
+    @classmethod
+    def from_store(
+        cls,
+        store: CurveStore,
+        *,
+        title: str,
+        wells: Optional[Iterable[str]] = None,
+        small_multiples: bool = False,
+    ) -> "PCRFigure":
+        ids = store.wells.well_ids
+        if wells is None:
+            rows = list(range(len(ids)))
+        else:
+            rows = [r for r in (store.wells.row_of_well(w) for w in wells) if r is not None]
+        values = np.array(store.gather(rows), dtype=np.float32)
+        return cls(
+            title=title,
+            cycles=np.array(store.cycles, dtype=np.float64),
+            values=values,
+            wells=tuple(ids[r] for r in rows),
+            small_multiples=small_multiples,
+        )
+
+
+@dataclass(frozen=True)
+class RegressionFigure:
+    """Dışa aktarılacak regresyon grafiği; etiketler UI thread'inde çevrilir."""
+
+    title: str
+    data: RegressionPlotData
+    series_labels: Tuple[str, ...]
+    line_label: str
+
+    @classmethod
+    def from_data(cls, data: RegressionPlotData, *, title: str) -> "RegressionFigure":
+        return cls(
+            title=title,
+            data=data,
+            series_labels=tuple(series_label(s.label) for s in data.series),
+            line_label=t("regression.plot.regression_line"),
+        )
+
+
+@dataclass(frozen=True)
+class _Colors:
+    background: QtGui.QColor
+    plot_background: QtGui.QColor
+    grid: QtGui.QColor
+    text: QtGui.QColor
+    title: QtGui.QColor
+
+
+class _Frame:
+    """Veri koordinatı -> piksel dönüşümü; yollar piksele çevrilip öyle çizilir (SVG'de de aynı)."""
+
+    def __init__(self, rect: QtCore.QRectF, xlim: Tuple[float, float], ylim: Tuple[float, float]):
+        self.rect = rect
+        self.xlim = xlim
+        self.ylim = ylim
+        sx = rect.width() / ((xlim[1] - xlim[0]) or 1.0)
+        sy = -rect.height() / ((ylim[1] - ylim[0]) or 1.0)
+        self.transform = QtGui.QTransform(sx, 0.0, 0.0, sy, rect.left() - xlim[0] * sx, rect.bottom() - ylim[0] * sy)
+
+    def map_path(self, x: np.ndarray, y: np.ndarray, connect="finite") -> QtGui.QPainterPath:
+        if len(x) == 0:
+            return QtGui.QPainterPath()
+        return self.transform.map(pg.arrayToQPath(np.asarray(x, float), np.asarray(y, float), connect=connect))
+
+    def map_point(self, x: float, y: float) -> QtCore.QPointF:
+        return self.transform.map(QtCore.QPointF(x, y))
+
+
+# ---- PCR ----
+def paint_pcr(painter: QtGui.QPainter, size: Tuple[int, int], figure: PCRFigure, style: PCRGraphStyle) -> None:
+    axes = style.axes
+    colors = _Colors(
+        background=QtGui.QColor(axes.fig_facecolor),
+        plot_background=QtGui.QColor(axes.ax_facecolor),
+        grid=_with_alpha(axes.grid_color, 0.2),
+        text=QtGui.QColor(axes.label_color),
+        title=QtGui.QColor(axes.title_color),
+    )
+    width, height = size
+    painter.fillRect(QtCore.QRectF(0, 0, width, height), colors.background)
+    ylim = pcr_ylim(figure, style)
+    xlim = (float(axes.default_xlim[0]), float(max(axes.default_xlim[1], np.nanmax(figure.cycles, initial=0.0))))
+
+    if not figure.small_multiples:
+        frame = _Frame(QtCore.QRectF(70, 44, width - 90, height - 84), xlim, ylim)
+        _draw_axes(painter, frame, colors, figure.title)
+        painter.save()
+        painter.setClipRect(frame.rect)
+        _draw_pcr_curves(painter, frame, figure, style, np.arange(len(figure.wells)))
+        painter.restore()
+        _draw_legend(painter, frame.rect, _pcr_legend(figure, style), QtGui.QColor(style.legend_text_color))
+        return
+
+    _draw_title(painter, QtCore.QRectF(0, 0, width, 36), figure.title, colors.title)
+    grid = _plate_grid(figure.wells)
+    n_rows = max(len(grid["rows"]), 1)
+    n_cols = max(len(grid["cols"]), 1)
+    gap = 4.0
+    cell_w = (width - 20 - gap * (n_cols - 1)) / n_cols
+    cell_h = (height - 46 - gap * (n_rows - 1)) / n_rows
+    font = QtGui.QFont("Arial", 7)
+    painter.setFont(font)
+    for i, well in enumerate(figure.wells):
+        pos = grid["cells"].get(well)
+        if pos is None:
+            continue
+        r, c = pos
+        rect = QtCore.QRectF(10 + c * (cell_w + gap), 36 + r * (cell_h + gap), cell_w, cell_h)
+        painter.fillRect(rect, colors.plot_background)
+        painter.setPen(QtGui.QPen(colors.grid, 1))
+        painter.drawRect(rect)
+        frame = _Frame(rect.adjusted(2, 2, -2, -2), xlim, ylim)
+        painter.save()
+        painter.setClipRect(frame.rect)
+        _draw_pcr_curves(painter, frame, figure, style, np.array([i]))
+        painter.restore()
+        painter.setPen(colors.text)
+        painter.drawText(rect.adjusted(3, 1, 0, 0), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, well)
+
+
+def pcr_ylim(figure: PCRFigure, style: PCRGraphStyle) -> Tuple[float, float]:
+    """Grafikteki politika: en az varsayılan üst sınır, tepe + 500 pay; negatif değerler için taban."""
+    channels = [ch for ch, on in ((FAM, figure.fam_visible), (HEX, figure.hex_visible)) if on]
+    values = figure.values[:, channels, :] if figure.values.size and channels else np.empty(0)
+    finite = values[np.isfinite(values)]
+    lo_default, hi_default = style.axes.default_ylim
+    if finite.size == 0:
+        return float(lo_default), float(hi_default)
+    hi = max(float(hi_default), float(finite.max()) + 500.0)
+    lo = min(float(lo_default), float(finite.min()))
+    if lo < 0:
+        lo -= 0.05 * (hi - lo)
+    return lo, hi
+
+
+def _draw_pcr_curves(painter, frame: _Frame, figure: PCRFigure, style: PCRGraphStyle, rows: np.ndarray) -> None:
+    for ch, visible, color, pen_spec in (
+        (HEX, figure.hex_visible, style.hex_color, style.hex_pen),
+        (FAM, figure.fam_visible, style.fam_color, style.fam_pen),
+    ):
+        if not visible or len(rows) == 0:
+            continue
+        curves = figure.values[rows, ch, :].astype(np.float64)
+        pen = QtGui.QPen(_with_alpha(color, float(pen_spec.get("alpha", 1.0))), float(pen_spec.get("linewidth", 1.0)))
+        pen.setCapStyle(QtCore.Qt.RoundCap)
+        pen.setJoinStyle(QtCore.Qt.RoundJoin)
+        painter.setPen(pen)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        # Eğri başına ayrı yol: kenar yumuşatmalı yarı saydam kalemde tek büyük yolun
+        # çizimi (kendisiyle kesişen dış hat) kuyu sayısıyla kat kat yavaşlar
+        for curve in curves:
+            painter.drawPath(frame.map_path(figure.cycles, curve))
+
+
+def _pcr_legend(figure: PCRFigure, style: PCRGraphStyle) -> List[Tuple[str, QtGui.QColor, str]]:
+    entries = []
+    if figure.fam_visible:
+        entries.append(("FAM", QtGui.QColor(style.fam_color), "line"))
+    if figure.hex_visible:
+        entries.append(("HEX", QtGui.QColor(style.hex_color), "line"))
+    return entries
+
+
+def _plate_grid(wells: Iterable[str]) -> Dict[str, object]:
+    parsed = {}
+    for well in wells:
+        m = _WELL_RE.match(well)
+        if m:
+            parsed[well] = (m.group(1), int(m.group(2)))
+    rows = sorted({p[0] for p in parsed.values()})
+    cols = sorted({p[1] for p in parsed.values()})
+    row_of = {r: i for i, r in enumerate(rows)}
+    col_of = {c: i for i, c in enumerate(cols)}
+    cells = {w: (row_of[r], col_of[c]) for w, (r, c) in parsed.items()}
+    return {"rows": rows, "cols": cols, "cells": cells}
+
+
+# ---- Regresyon ----
+def paint_regression(
+    painter: QtGui.QPainter, size: Tuple[int, int], figure: RegressionFigure, style: RegressionPlotStyle
+) -> None:
+    colors = _Colors(
+        background=QtGui.QColor(style.background_hex),
+        plot_background=QtGui.QColor(*style.widget_background_rgb),
+        grid=QtGui.QColor(*style.grid_color_rgb, int(255 * style.grid_alpha)),
+        text=QtGui.QColor(*style.axis_text_rgb),
+        title=QtGui.QColor(*style.axis_text_rgb),
+    )
+    width, height = size
+    painter.fillRect(QtCore.QRectF(0, 0, width, height), colors.background)
+    # Görünümdeki sabit aralık (min-max ölçekli eksenler)
+    frame = _Frame(QtCore.QRectF(60, 44, width - 80, height - 84), (0.0, 1.1), (0.0, 1.1))
+    _draw_axes(painter, frame, colors, figure.title)
+
+    data = figure.data
+    painter.save()
+    painter.setClipRect(frame.rect)
+    band = data.safe_band
+    if band.x_sorted.size:
+        xs = np.concatenate([band.x_sorted, band.x_sorted[::-1]])
+        ys = np.concatenate([band.upper, band.lower[::-1]])
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(*style.safe_band_brush_rgba))
+        painter.drawPath(frame.map_path(xs, ys, connect="all"))
+
+    legend: List[Tuple[str, QtGui.QColor, str]] = []
+    if data.reg_line.x_sorted.size:
+        line_color = QtGui.QColor(*style.reg_line_pen)
+        painter.setPen(QtGui.QPen(line_color, style.reg_line_width))
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawPath(frame.map_path(data.reg_line.x_sorted, data.reg_line.y_pred_sorted))
+        legend.append((figure.line_label, line_color, "line"))
+
+    radius = style.scatter_size / 2.0
+    for series, label in zip(data.series, figure.series_labels):
+        series_style = style.series.get(series.label)
+        brush = QtGui.QColor(*(series_style.brush if series_style else (200, 200, 200)))
+        pen = QtGui.QColor(*(series_style.pen if series_style else (255, 255, 255)))
+        path = QtGui.QPainterPath()
+        for x, y in zip(np.asarray(series.x, float), np.asarray(series.y, float)):
+            if np.isfinite(x) and np.isfinite(y):
+                path.addEllipse(frame.map_point(x, y), radius, radius)
+        painter.setPen(QtGui.QPen(pen, style.scatter_pen_width))
+        painter.setBrush(brush)
+        painter.drawPath(path)
+        legend.append((label, brush, "dot"))
+    painter.restore()
+    _draw_legend(painter, frame.rect, legend, colors.text)
+
+
+# ---- ortak ----
+def _draw_axes(painter: QtGui.QPainter, frame: _Frame, colors: _Colors, title: str) -> None:
+    rect = frame.rect
+    painter.fillRect(rect, colors.plot_background)
+    painter.setFont(QtGui.QFont("Arial", 9))
+    metrics = painter.fontMetrics()
+
+    for value, label in axis_ticks(frame.xlim, target_ticks=7):
+        p = frame.map_point(value, frame.ylim[0])
+        painter.setPen(QtGui.QPen(colors.grid, 1))
+        painter.drawLine(QtCore.QPointF(p.x(), rect.top()), QtCore.QPointF(p.x(), rect.bottom()))
+        painter.setPen(colors.text)
+        w = metrics.horizontalAdvance(label)
+        painter.drawText(QtCore.QPointF(p.x() - w / 2, rect.bottom() + metrics.height() + 2), label)
+
+    for value, label in axis_ticks(frame.ylim, target_ticks=6):
+        p = frame.map_point(frame.xlim[0], value)
+        painter.setPen(QtGui.QPen(colors.grid, 1))
+        painter.drawLine(QtCore.QPointF(rect.left(), p.y()), QtCore.QPointF(rect.right(), p.y()))
+        painter.setPen(colors.text)
+        w = metrics.horizontalAdvance(label)
+        painter.drawText(QtCore.QPointF(rect.left() - w - 8, p.y() + metrics.ascent() / 2), label)
+
+    painter.setPen(QtGui.QPen(colors.text, 1))
+    painter.setBrush(QtCore.Qt.NoBrush)
+    painter.drawRect(rect)
+    _draw_title(painter, QtCore.QRectF(0, 0, rect.right() + rect.left(), rect.top()), title, colors.title)
+
+
+def _draw_title(painter: QtGui.QPainter, rect: QtCore.QRectF, title: str, color: QtGui.QColor) -> None:
+    if not title:
+        return
+    font = QtGui.QFont("Arial", 12)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(color)
+    painter.drawText(rect, QtCore.Qt.AlignCenter, title)
+
+
+def _draw_legend(
+    painter: QtGui.QPainter, plot_rect: QtCore.QRectF, entries: List[Tuple[str, QtGui.QColor, str]], text: QtGui.QColor
+) -> None:
+    if not entries:
+        return
+    painter.setFont(QtGui.QFont("Arial", 9))
+    metrics = painter.fontMetrics()
+    row_h = metrics.height() + 4
+    box = QtCore.QRectF(
+        plot_rect.left() + 10,
+        plot_rect.top() + 10,
+        max(metrics.horizontalAdvance(name) for name, _, _ in entries) + 44,
+        row_h * len(entries) + 6,
+    )
+    painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255, 60), 1))
+    painter.setBrush(QtGui.QColor(0, 0, 0, 90))
+    painter.drawRect(box)
+    for i, (name, color, kind) in enumerate(entries):
+        y = box.top() + 3 + row_h * i + row_h / 2
+        if kind == "dot":
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawEllipse(QtCore.QPointF(box.left() + 18, y), 4, 4)
+        else:
+            painter.setPen(QtGui.QPen(color, 3))
+            painter.drawLine(QtCore.QPointF(box.left() + 8, y), QtCore.QPointF(box.left() + 28, y))
+        painter.setPen(text)
+        painter.drawText(QtCore.QPointF(box.left() + 36, y + metrics.ascent() / 2 - 1), name)
+
+
+def _with_alpha(color: str, alpha: float) -> QtGui.QColor:
+    qcolor = QtGui.QColor(color)
+    qcolor.setAlphaF(max(0.0, min(1.0, alpha)))
+    return qcolor
@@ -52,16 +52,17 @@ def set_axis_ticks(plot_item: pg.PlotItem, xlim: Tuple[float, float], ylim: Tupl
     bottom_axis = plot_item.getAxis("bottom")
     left_axis = plot_item.getAxis("left")
 
-    x_range = xlim[1] - xlim[0]
-    y_range = ylim[1] - ylim[0]
-    if x_range <= 0 or y_range <= 0:
+    if xlim[1] - xlim[0] <= 0 or ylim[1] - ylim[0] <= 0:
         return
 
-    x_step = _nice_step(x_range, target_ticks=7)
-    y_step = _nice_step(y_range, target_ticks=6)
+    bottom_axis.setTicks([axis_ticks(xlim, target_ticks=7)])
+    left_axis.setTicks([axis_ticks(ylim, target_ticks=6)])
 
-    bottom_axis.setTicks([build_ticks(xlim[0], xlim[1], step=x_step, force_end=True, align_to=0)])
-    left_axis.setTicks([build_ticks(ylim[0], ylim[1], step=y_step, force_end=True, align_to=0)])
+
+def axis_ticks(lim: Tuple[float, float], target_ticks: int) -> List[tuple[float, str]]:
+    """Aralık için 'yuvarlak' adımlı tick listesi (grafik ve dışa aktarılan görseller ortak)."""
+    step = _nice_step(lim[1] - lim[0], target_ticks=target_ticks)
+    return build_ticks(lim[0], lim[1], step=step, force_end=True, align_to=0)
 
 def build_ticks(start: float, end: float, step: float, force_end: bool = False, align_to: float = 0) -> List[tuple[float, str]]:
     ticks: List[tuple[float, str]] = []
@@ -133,14 +134,16 @@ def apply_axis_ranges(
     *,
     xlim: Tuple[float, float],
     ylim: Tuple[float, float],
+    ymin: float | None = None,
 ) -> None:
-    custom_ymin = -500.0
+    # ymin None: ham RFU için sabit -500 tabanı; türetilmiş gösterimler kendi tabanını verir
+    custom_ymin = -500.0 if ymin is None else float(ymin)
     custom_xmin = 0.0
     
     plot_item.enableAutoRange(x=False, y=False)
     
     # Padding: Verinin en üstte eksene yapışmaması için %10 pay
-    actual_ymax = ylim[1] * 1.1 
+    actual_ymax = ylim[1] * 1.1 if ymin is None else ylim[1] + 0.1 * (ylim[1] - custom_ymin)
 
     plot_item.setLimits(
         xMin=custom_xmin, 
@@ -0,0 +1,122 @@
+# app\views\plotting\pcr_graph_pg\batches_pg.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtGui
+
+CHANNELS: Tuple[str, ...] = ("fam", "hex")
+# Alt katmandan üst katmana stil kovaları
+BUCKETS: Tuple[str, ...] = ("inactive", "base", "preview", "selected")
+
+PenFactory = Callable[[object, str, str], Tuple[QtGui.QPen, float]]
+
+
+def bucket_of(well: str, selected: Set[str], preview: Set[str]) -> str:
+    if well in selected:
+        return "selected"
+    if well in preview:
+        return "preview"
+    return "inactive" if selected else "base"
+
+
+@dataclass
+class CurveBatch:
+    """
+    Bir kanalın tüm eğrileri tek tamponda: her kuyu (döngü + 1) uzunluğunda,
+    sonu NaN ayraçlı bir satırdır (connect="finite" çizgiyi orada keser).
+
+    Stil kovası başına tek PlotDataItem vardır; kuyunun kovası değişince yalnızca
+    ilgili kovaların satır indeksleri yeniden yazılır (item eklenmez/silinmez).
+    """
+
+    items: Dict[str, pg.PlotDataItem]
+    x: np.ndarray = field(default_factory=lambda: np.empty((0, 1)))
+    y: np.ndarray = field(default_factory=lambda: np.empty((0, 1)))
+    rows: Dict[str, int] = field(default_factory=dict)
+    members: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_curves(self, wells: Sequence[str], xs: Sequence[np.ndarray], ys: Sequence[np.ndarray]) -> None:
+        width = max((len(v) for v in xs), default=0) + 1
+        self.x = np.full((len(wells), width), np.nan, dtype=np.float64)
+        self.y = np.full((len(wells), width), np.nan, dtype=np.float64)
+        for row, (xv, yv) in enumerate(zip(xs, ys)):
+            self.x[row, : len(xv)] = xv
+            self.y[row, : len(yv)] = yv
+        self.rows = {well: row for row, well in enumerate(wells)}
+        self.members = {}
+        for item in self.items.values():
+            item.setData([], [])
+
+    def assign(self, buckets: Dict[str, List[int]]) -> bool:
+        """Kova -> satırlar; yalnızca üyeliği değişen kovaların tamponu yeniden yazılır."""
+        changed = False
+        for bucket, item in self.items.items():
+            rows = tuple(sorted(buckets.get(bucket, ())))
+            if self.members.get(bucket, ()) == rows:
+                continue
+            self.members[bucket] = rows
+            if rows:
+                idx = np.fromiter(rows, dtype=np.intp, count=len(rows))
+                item.setData(self.x[idx].ravel(), self.y[idx].ravel())
+            else:
+                item.setData([], [])
+            changed = True
+        return changed
+
+
+def ensure_batches(renderer, pen_for: PenFactory) -> None:
+    """Kanal başına kova item'larını bir kez oluşturur; kalem ve z kovaya sabittir."""
+    for channel in CHANNELS:
+        if channel in renderer._batches:  # noqa
+            continue
+        color = renderer._style.fam_color if channel == "fam" else renderer._style.hex_color  # noqa
+        items: Dict[str, pg.PlotDataItem] = {}
+        for bucket in BUCKETS:
+            pen, z_value = pen_for(renderer, color, bucket)
+            item = pg.PlotDataItem(connect="finite", name=channel.upper(), pen=pen)
+            item.setZValue(z_value)
+            renderer._plot_item.addItem(item)  # noqa
+            items[bucket] = item
+        renderer._batches[channel] = CurveBatch(items=items)  # noqa
+    apply_batch_visibility(renderer)
+
+
+def update_batches(
+    renderer,
+    curves: Dict[str, Tuple[List[str], List[np.ndarray], List[np.ndarray]]],
+    pen_for: PenFactory,
+) -> None:
+    ensure_batches(renderer, pen_for)
+    for channel in CHANNELS:
+        wells, xs, ys = curves.get(channel, ([], [], []))
+        renderer._batches[channel].set_curves(wells, xs, ys)  # noqa
+
+
+def assign_batch_buckets(renderer, selected: Set[str], preview: Set[str]) -> bool:
+    """Gösterilen kuyuları kovalara dağıtır; gizli kuyular hiçbir kovada yer almaz."""
+    shown = renderer._shown_wells  # noqa
+    changed = False
+    for batch in renderer._batches.values():  # noqa
+        buckets: Dict[str, List[int]] = {}
+        for well, row in batch.rows.items():
+            if well not in shown:
+                continue
+            buckets.setdefault(bucket_of(well, selected, preview), []).append(row)
+        changed = batch.assign(buckets) or changed
+    return changed
+
+
+def apply_batch_visibility(renderer) -> None:
+    # Oynatma sürerken kova item'ları gizli kalır; oynatma kendi item'larını çizer
+    playing = renderer._playback is not None  # noqa
+    for channel, batch in renderer._batches.items():  # noqa
+        visible = (renderer._fam_visible if channel == "fam" else renderer._hex_visible) and not playing  # noqa
+        for item in batch.items.values():
+            item.setVisible(visible)
@@ -0,0 +1,158 @@
+# app\views\plotting\pcr_graph_pg\compare_pg.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from app.services.curve_store import FAM, HEX, CurveStore
+from app.services.curve_transforms import CurveTransforms
+
+from .lod import EnvelopePyramid, band_arrays, build_pyramid, line_arrays
+
+CHANNELS: Tuple[Tuple[str, int], ...] = (("fam", FAM), ("hex", HEX))
+# Karşılaştırma plakaları aktif plakanın altında çizilir
+BAND_Z = -20
+LINE_Z = -10
+
+
+@dataclass
+class ComparePlate:
+    """
+    Karşılaştırma plakası: kanal başına zarf piramidi ve iki yol item'ı
+    (tam eğriler + zarf bantları). Son çizilen seçim saklanır; görünüm değişip
+    seviye/düğümler aynı kaldıysa yol yeniden kurulmaz.
+    """
+
+    label: str
+    store: CurveStore
+    color: QtGui.QColor
+    pyramids: Dict[str, EnvelopePyramid] = field(default_factory=dict)
+    lines: Dict[str, QtWidgets.QGraphicsPathItem] = field(default_factory=dict)
+    bands: Dict[str, QtWidgets.QGraphicsPathItem] = field(default_factory=dict)
+    drawn: Dict[str, Tuple[int, bytes, bytes]] = field(default_factory=dict)
+
+    def items(self):
+        yield from self.bands.values()
+        yield from self.lines.values()
+
+
+def set_compare_plates(renderer, plates: Mapping[str, CurveStore]) -> None:
+    """Karşılaştırma plakalarını değiştirir; piramitler etkin eğri moduna göre kurulur."""
+    clear_compare_plates(renderer)
+    count = len(plates)
+    for i, (label, store) in enumerate(plates.items()):
+        color = pg.intColor(i, hues=max(count, 1), sat=180)
+        plate = ComparePlate(label=str(label), store=store, color=color)
+        for channel, _ in CHANNELS:
+            line_color = QtGui.QColor(color)
+            line_color.setAlphaF(0.6)
+            pen = pg.mkPen(line_color, width=renderer._style.compare_line_width)  # noqa
+            pen.setCosmetic(True)
+            if channel == "hex":
+                pen.setStyle(QtCore.Qt.DashLine)
+            line = QtWidgets.QGraphicsPathItem()
+            line.setPen(pen)
+            line.setZValue(LINE_Z)
+
+            fill = QtGui.QColor(color)
+            fill.setAlphaF(renderer._style.compare_band_alpha)  # noqa
+            band = QtWidgets.QGraphicsPathItem()
+            band.setPen(QtGui.QPen(QtCore.Qt.NoPen))
+            band.setBrush(QtGui.QBrush(fill))
+            band.setZValue(BAND_Z)
+
+            plate.lines[channel] = line
+            plate.bands[channel] = band
+        renderer._compare_plates.append(plate)  # noqa
+
+    add_compare_items(renderer)
+    rebuild_compare_pyramids(renderer)
+
+
+def clear_compare_plates(renderer) -> None:
+    for plate in renderer._compare_plates:  # noqa
+        for item in plate.items():
+            if item.scene() is not None:
+                renderer._plot_item.removeItem(item)  # noqa
+    renderer._compare_plates = []  # noqa
+
+
+def add_compare_items(renderer) -> None:
+    """Sahne temizlendikten sonra (reset) item'ları yeniden ekler."""
+    for plate in renderer._compare_plates:  # noqa
+        for item in plate.items():
+            if item.scene() is None:
+                renderer._plot_item.addItem(item, ignoreBounds=True)  # noqa
+    apply_compare_visibility(renderer)
+
+
+def rebuild_compare_pyramids(renderer) -> None:
+    """Eğri modu değişince piramitler türetilmiş değerlerden yeniden kurulur."""
+    for plate in renderer._compare_plates:  # noqa
+        store = CurveTransforms.derive_store(plate.store, renderer._curve_mode)  # noqa
+        wells = store.wells.well_ids
+        for channel, ch in CHANNELS:
+            plate.pyramids[channel] = build_pyramid(store.cycles, store.values[:, ch, :], wells)
+        plate.drawn.clear()
+    update_compare_lod(renderer)
+
+
+def apply_compare_visibility(renderer) -> None:
+    for plate in renderer._compare_plates:  # noqa
+        for channel, _ in CHANNELS:
+            visible = renderer._fam_visible if channel == "fam" else renderer._hex_visible  # noqa
+            plate.lines[channel].setVisible(visible)
+            plate.bands[channel].setVisible(visible)
+
+
+def update_compare_lod(renderer) -> None:
+    """
+    Görünür X/Y aralığına göre her plaka/kanal için seviye seçer: bütçeye sığan görünür
+    eğriler tam çizilir, sığmazsa zarf bantları çizilir. Gösterilen (seçili) kuyuların
+    karşılıkları her seviyede tam eğri olarak çizilir.
+    """
+    plates = renderer._compare_plates  # noqa
+    if not plates:
+        return
+    x_range, (y0, y1) = renderer._view_box.viewRange()  # noqa
+    active = [c for c, _ in CHANNELS if (renderer._fam_visible if c == "fam" else renderer._hex_visible)]  # noqa
+    budget = max(1, renderer._style.compare_curve_budget // max(1, len(plates) * len(active)))  # noqa
+    shown = renderer._shown_wells  # noqa
+
+    for plate in plates:
+        for channel in active:
+            pyramid = plate.pyramids.get(channel)
+            if pyramid is None:
+                continue
+            level, nodes = pyramid.pick((y0, y1), budget, x_range=(x_range[0], x_range[1]))
+            exact = pyramid.rows_of(shown)
+            if level == 0:
+                exact = np.union1d(exact, nodes)
+            key = (level, nodes.tobytes(), exact.tobytes())
+            if plate.drawn.get(channel) == key:
+                continue
+            plate.drawn[channel] = key
+
+            cycles = pyramid.cycles
+            if pyramid.levels:
+                plate.lines[channel].setPath(_path(*line_arrays(cycles, pyramid.levels[0].lo[exact])))
+            else:
+                plate.lines[channel].setPath(QtGui.QPainterPath())
+            if level > 0:
+                lvl = pyramid.levels[level]
+                band = _path(*band_arrays(cycles, lvl.lo[nodes], lvl.hi[nodes]))
+                # Örtüşen bantlar çift-tek kuralında delik bırakır
+                band.setFillRule(QtCore.Qt.WindingFill)
+                plate.bands[channel].setPath(band)
+            else:
+                plate.bands[channel].setPath(QtGui.QPainterPath())
+
+
+def _path(x: np.ndarray, y: np.ndarray, connect: np.ndarray) -> QtGui.QPainterPath:
+    if len(x) == 0:
+        return QtGui.QPainterPath()
+    return pg.arrayToQPath(x, y, connect=connect)
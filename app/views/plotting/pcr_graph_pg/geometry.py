@@ -0,0 +1,432 @@
+# app\views\plotting\pcr_graph_pg\geometry.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.services.pcr_data_service import PCRCoords
+
+WellGeoms = Dict[str, Dict[str, np.ndarray]]
+
+CHANNELS: Tuple[str, ...] = ("fam", "hex")
+# Hücre başına hedeflenen ortalama segment sayısı ve eksen başına üst sınır
+_SEGMENTS_PER_CELL = 4
+_MAX_CELLS_PER_AXIS = 256
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+@dataclass(frozen=True)
+class SegmentGridIndex:
+    """
+    Görünür kanallardaki tüm eğri segmentleri tek dizide; segmentler sınır kutularına
+    göre veri uzayında düzgün bir ızgaraya kovalanır (CSR: cell_start / cell_segments).
+    Sorgular dokunulan hücrelerdeki segmentler üzerinde tek vektörel işlemdir.
+
+    wells / boxes: indeksteki kuyular ve (N, 4) sınırları: xmin, xmax, ymin, ymax
+    seg: (S, 4) x0, y0, x1, y1; seg_well: kuyu indeksi; seg_channel: CHANNELS indeksi
+    """
+
+    wells: List[str]
+    boxes: np.ndarray
+    seg: np.ndarray
+    seg_well: np.ndarray
+    seg_channel: np.ndarray
+    origin: Tuple[float, float]
+    cell_size: Tuple[float, float]
+    shape: Tuple[int, int]
+    cell_start: np.ndarray
+    cell_segments: np.ndarray
+
+    def segments_in(self, x0: float, x1: float, y0: float, y1: float) -> np.ndarray:
+        """Dikdörtgenin dokunduğu hücrelerdeki segment indeksleri (tekrarsız, sıralı)."""
+        nx, ny = self.shape
+        cx = _cell_range(x0, x1, self.origin[0], self.cell_size[0], nx)
+        cy = _cell_range(y0, y1, self.origin[1], self.cell_size[1], ny)
+        if cx is None or cy is None:
+            return _EMPTY
+
+        cells = (np.arange(cx[0], cx[1] + 1)[:, None] * ny + np.arange(cy[0], cy[1] + 1)[None, :]).ravel()
+        starts = self.cell_start[cells]
+        counts = self.cell_start[cells + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return _EMPTY
+
+        # Hücre aralıklarını tek seferde aç: her aralık kendi başlangıcından sayar
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return np.unique(self.cell_segments[offsets])
+
+    def select(
+        self,
+        segments: np.ndarray,
+        *,
+        fam_visible: bool,
+        hex_visible: bool,
+        shown: Optional[Set[str]] = None,
+    ) -> np.ndarray:
+        """Kanal görünürlüğü ve gösterilen kuyulara göre segment süzgeci."""
+        if segments.size == 0:
+            return segments
+        channel_ok = np.array([fam_visible, hex_visible], dtype=bool)
+        keep = channel_ok[self.seg_channel[segments]]
+        if shown is not None:
+            well_ok = np.fromiter((w in shown for w in self.wells), dtype=bool, count=len(self.wells))
+            keep &= well_ok[self.seg_well[segments]]
+        return segments[keep]
+
+
+def build_spatial_index(
+    well_geoms: WellGeoms,
+    *,
+    fam_visible: bool,
+    hex_visible: bool,
+) -> Optional[SegmentGridIndex]:
+    visible = [k for k, ok in enumerate((fam_visible, hex_visible)) if ok]
+
+    # Tüm eğriler tek nokta dizisinde; aralarına NaN ayraç konur ki segment oluşmasın
+    candidates: List[str] = []
+    arrays: List[np.ndarray] = []
+    owner_well: List[int] = []
+    owner_channel: List[int] = []
+    for well, coords in well_geoms.items():
+        for k in visible:
+            arr = coords.get(CHANNELS[k])
+            if arr is None or arr.size == 0:
+                continue
+            if not candidates or candidates[-1] != well:
+                candidates.append(well)
+            arrays.append(np.asarray(arr, dtype=float).reshape(-1, 2))
+            owner_well.append(len(candidates) - 1)
+            owner_channel.append(k)
+    if not arrays:
+        return None
+
+    seg, seg_array = _segments_of(arrays)
+    return _index_from_segments(
+        seg,
+        np.asarray(owner_well, dtype=np.intp)[seg_array],
+        np.asarray(owner_channel, dtype=np.intp)[seg_array],
+        candidates,
+    )
+
+
+def index_from_curves(cycles: np.ndarray, values: np.ndarray, wells: Sequence[str]) -> Optional[SegmentGridIndex]:
+    """
+    CurveStore düzenindeki (kuyu, kanal, döngü) tensörden tüm kanallar için indeks;
+    eksik döngüler çizimdeki gibi (connect="finite") eğriyi böler. Kuyu döngüsü yok.
+    """
+    finite = np.isfinite(values)
+    pair = finite[..., :-1] & finite[..., 1:]
+    w, c, k = np.nonzero(pair)
+    seg = np.column_stack((cycles[k], values[w, c, k], cycles[k + 1], values[w, c, k + 1]))
+
+    # Tek sonlu noktası olan kanal: sıfır uzunluklu segment
+    lone = (finite.sum(axis=-1) == 1) & ~pair.any(axis=-1)
+    if lone.any():
+        lw, lc, lk = np.nonzero(finite & lone[..., None])
+        seg = np.vstack([seg, np.column_stack((cycles[lk], values[lw, lc, lk], cycles[lk], values[lw, lc, lk]))])
+        w, c = np.concatenate([w, lw]), np.concatenate([c, lc])
+        order = np.argsort(w, kind="stable")
+        seg, w, c = seg[order], w[order], c[order]
+    return _index_from_segments(seg, w.astype(np.intp), c.astype(np.intp), list(wells))
+
+
+def _index_from_segments(
+    seg: np.ndarray, seg_well: np.ndarray, seg_channel: np.ndarray, candidates: List[str]
+) -> Optional[SegmentGridIndex]:
+    """seg_well kuyu sırasına göre sıralı olmalıdır (sınır kutuları reduceat ile)."""
+    if seg.size == 0:
+        return None
+
+    # Sonlu noktası olmayan kuyular indekse girmez
+    present, seg_well = np.unique(seg_well, return_inverse=True)
+    wells = [candidates[i] for i in present]
+
+    starts = np.flatnonzero(np.r_[True, seg_well[1:] != seg_well[:-1]])
+    xs = seg[:, [0, 2]]
+    ys = seg[:, [1, 3]]
+    boxes = np.column_stack(
+        (
+            np.minimum.reduceat(xs.min(axis=1), starts),
+            np.maximum.reduceat(xs.max(axis=1), starts),
+            np.minimum.reduceat(ys.min(axis=1), starts),
+            np.maximum.reduceat(ys.max(axis=1), starts),
+        )
+    )
+
+    origin, cell_size, shape, cell_start, cell_segments = _bucket_segments(seg, boxes)
+    return SegmentGridIndex(
+        wells=wells,
+        boxes=boxes,
+        seg=seg,
+        seg_well=seg_well,
+        seg_channel=seg_channel,
+        origin=origin,
+        cell_size=cell_size,
+        shape=shape,
+        cell_start=cell_start,
+        cell_segments=cell_segments,
+    )
+
+
+@dataclass(frozen=True)
+class PCRGeometry:
+    """
+    Bir veri token'ı için grafiğin tüm türetilmiş geometrisi; arka planda kurulur ve
+    renderer'a tek seferde takılır. Token renderer'ınkiyle eşleşmiyorsa atılır.
+
+    index: tüm kanalların segment indeksi (kanal görünürlüğü sorguda süzülür)
+    peaks / lows: kuyu -> en yüksek / en düşük değer (Y ekseni gösterilen kuyulardan)
+    centers: (N, 2) kuyu ağırlık merkezleri; center_has_fam / center_has_hex kanal bayrakları
+    """
+
+    token: int
+    well_geoms: WellGeoms
+    index: Optional[SegmentGridIndex]
+    peaks: Dict[str, float]
+    lows: Dict[str, float]
+    center_ids: List[str]
+    centers: np.ndarray
+    center_has_fam: np.ndarray
+    center_has_hex: np.ndarray
+
+    def ylim(self, wells: Iterable[str], *, min_floor: float = 4500.0, y_padding: float = 500.0) -> Optional[Tuple[float, float]]:
+        peaks = [self.peaks[w] for w in wells if w in self.peaks]
+        if not peaks:
+            return None
+        return 0.0, float(max(min_floor, max(peaks) + y_padding))
+
+    def span(self, wells: Iterable[str]) -> Optional[Tuple[float, float]]:
+        """Gösterilen kuyuların değer aralığı (türetilmiş gösterimler için; taban sabit değil)."""
+        wells = [w for w in wells if w in self.peaks]
+        if not wells:
+            return None
+        return float(min(self.lows[w] for w in wells)), float(max(self.peaks[w] for w in wells))
+
+
+def build_geometry(token: int, data: Mapping[str, PCRCoords]) -> PCRGeometry:
+    """Sınır kutuları, merkezler, tepe değerler ve isabet indeksi; tensör üzerinde vektörel."""
+    wells = sorted(data)
+    if not wells:
+        return PCRGeometry(token, {}, None, {}, {}, [], np.empty((0, 2)), np.array([], dtype=bool), np.array([], dtype=bool))
+
+    coords = [data[w] for w in wells]
+    cycles, values = _stack_curves(coords)
+    finite = np.isfinite(values)
+    has = finite.any(axis=-1)  # (kuyu, kanal)
+    counts = finite.sum(axis=(1, 2))
+    present = counts > 0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        peaks = np.where(finite, values, -np.inf).max(axis=(1, 2))
+        lows = np.where(finite, values, np.inf).min(axis=(1, 2))
+        cx = np.where(finite, cycles, 0.0).sum(axis=(1, 2)) / counts
+        cy = np.where(finite, values, 0.0).sum(axis=(1, 2)) / counts
+
+    empty = np.empty((0, 2), dtype=np.float32)
+    well_geoms = {
+        w: {"fam": c.fam if has[i, 0] else empty, "hex": c.hex if has[i, 1] else empty}
+        for i, (w, c) in enumerate(zip(wells, coords))
+    }
+    rows = np.flatnonzero(present)
+    return PCRGeometry(
+        token=token,
+        well_geoms=well_geoms,
+        index=index_from_curves(cycles, values, wells),
+        peaks={wells[i]: float(peaks[i]) for i in rows},
+        lows={wells[i]: float(lows[i]) for i in rows},
+        center_ids=[wells[i] for i in rows],
+        centers=np.column_stack((cx[rows], cy[rows])),
+        center_has_fam=has[rows, 0],
+        center_has_hex=has[rows, 1],
+    )
+
+
+def _stack_curves(coords: Sequence[PCRCoords]) -> Tuple[np.ndarray, np.ndarray]:
+    """(kuyu, kanal, döngü) float64 tensör; döngü eksenleri farklıysa NaN ile doldurulur."""
+    cycles = np.asarray(coords[0].cycles, dtype=float)
+    if all(c.cycles is coords[0].cycles or len(c.cycles) == len(cycles) for c in coords):
+        return cycles, np.stack([np.stack((c.fam_y, c.hex_y)) for c in coords]).astype(float)
+
+    longest = max(coords, key=lambda c: len(c.cycles))
+    cycles = np.asarray(longest.cycles, dtype=float)
+    values = np.full((len(coords), 2, len(cycles)), np.nan)
+    for i, c in enumerate(coords):
+        values[i, 0, : len(c.fam_y)] = c.fam_y
+        values[i, 1, : len(c.hex_y)] = c.hex_y
+    return cycles, values
+
+
+def wells_in_rect(
+    index: Optional[SegmentGridIndex],
+    well_geoms: WellGeoms,
+    x0: float,
+    x1: float,
+    y0: float,
+    y1: float,
+    *,
+    fam_visible: bool,
+    hex_visible: bool,
+    shown: Optional[Set[str]] = None,
+) -> Set[str]:
+    """Dikdörtgeni kesen en az bir segmenti olan kuyular (segmentler indekste; well_geoms okunmaz)."""
+    if index is None:
+        return set()
+
+    x0, x1 = sorted([x0, x1])
+    y0, y1 = sorted([y0, y1])
+    candidates = index.select(
+        index.segments_in(x0, x1, y0, y1), fam_visible=fam_visible, hex_visible=hex_visible, shown=shown
+    )
+    if candidates.size == 0:
+        return set()
+
+    hits = candidates[_segments_hit_rect(index.seg[candidates], x0, x1, y0, y1)]
+    return {index.wells[i] for i in np.unique(index.seg_well[hits])}
+
+
+def nearest_well(
+    index: Optional[SegmentGridIndex],
+    well_geoms: WellGeoms,
+    x: float,
+    y: float,
+    tol_x: float,  # Bu genellikle sahne birimidir
+    tol_y: float,
+    *,
+    fam_visible: bool,
+    hex_visible: bool,
+    shown: Optional[Set[str]] = None,
+) -> Optional[str]:
+    """
+    Toleranslar içindeki en yakın segmentin kuyusu. Mesafe eksen başına toleransla
+    ölçeklenir (piksel uzayı); sınır tolerans kutusunun köşesi: (dx/tx)² + (dy/ty)² <= 2.
+    """
+    if index is None:
+        return None
+
+    candidates = index.select(
+        index.segments_in(x - tol_x, x + tol_x, y - tol_y, y + tol_y),
+        fam_visible=fam_visible,
+        hex_visible=hex_visible,
+        shown=shown,
+    )
+    if candidates.size == 0:
+        return None
+
+    eps = np.finfo(float).eps
+    dist_sq = _scaled_distance_sq(index.seg[candidates], x, y, max(abs(tol_x), eps), max(abs(tol_y), eps))
+    best = int(np.argmin(dist_sq))
+    if dist_sq[best] > 2.0:
+        return None
+    return index.wells[int(index.seg_well[candidates[best]])]
+
+
+def _segments_of(arrays: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (N, 2) nokta dizilerinden ardışık sonlu nokta çiftleri: (S, 4) segmentler ve her
+    segmentin dizi indeksi (dizi sırasında). Tek sonlu noktası olan dizi sıfır uzunluklu segmenttir.
+    """
+    lengths = np.fromiter((len(a) for a in arrays), dtype=np.intp, count=len(arrays))
+    separator = np.full((1, 2), np.nan)
+    pts = np.concatenate([block for arr in arrays for block in (arr, separator)])
+    array_of = np.repeat(np.arange(len(arrays), dtype=np.intp), lengths + 1)
+
+    finite = np.isfinite(pts).all(axis=1)
+    pair = finite[:-1] & finite[1:]
+    seg = np.hstack([pts[:-1][pair], pts[1:][pair]])
+    seg_array = array_of[:-1][pair]
+
+    lone = (np.bincount(seg_array, minlength=len(arrays)) == 0) & (
+        np.bincount(array_of[finite], minlength=len(arrays)) > 0
+    )
+    if lone.any():
+        single = finite & lone[array_of]
+        seg = np.vstack([seg, np.hstack([pts[single], pts[single]])])
+        seg_array = np.concatenate([seg_array, array_of[single]])
+        order = np.argsort(seg_array, kind="stable")
+        seg, seg_array = seg[order], seg_array[order]
+    return seg, seg_array
+
+
+def _bucket_segments(seg: np.ndarray, boxes: np.ndarray):
+    xmin, xmax = float(boxes[:, 0].min()), float(boxes[:, 1].max())
+    ymin, ymax = float(boxes[:, 2].min()), float(boxes[:, 3].max())
+    span_x, span_y = xmax - xmin, ymax - ymin
+
+    # Izgara eksen başına ortalama segment boyuna göre (eğriler x'te kısa, y'de dik);
+    # böylece segment başına birkaç hücre yazılır. Hücre sayısı segment sayısıyla sınırlı.
+    limit = max(1, len(seg) // _SEGMENTS_PER_CELL)
+    nx = _axis_cells(span_x, np.abs(seg[:, 2] - seg[:, 0]).mean(), limit)
+    ny = _axis_cells(span_y, np.abs(seg[:, 3] - seg[:, 1]).mean(), max(1, limit // nx))
+    shape = (nx, ny)
+    cw = span_x / nx if span_x > 0 else 1.0
+    ch = span_y / ny if span_y > 0 else 1.0
+
+    sx0 = _cell_of(np.minimum(seg[:, 0], seg[:, 2]), xmin, cw, nx)
+    sx1 = _cell_of(np.maximum(seg[:, 0], seg[:, 2]), xmin, cw, nx)
+    sy0 = _cell_of(np.minimum(seg[:, 1], seg[:, 3]), ymin, ch, ny)
+    sy1 = _cell_of(np.maximum(seg[:, 1], seg[:, 3]), ymin, ch, ny)
+
+    # Her segment sınır kutusunun kapladığı tüm hücrelere yazılır
+    span_cells_y = sy1 - sy0 + 1
+    counts = (sx1 - sx0 + 1) * span_cells_y
+    owner = np.repeat(np.arange(len(seg), dtype=np.intp), counts)
+    local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    cells = (sx0[owner] + local // span_cells_y[owner]) * ny + sy0[owner] + local % span_cells_y[owner]
+
+    order = np.argsort(cells, kind="stable")
+    cell_start = np.zeros(nx * ny + 1, dtype=np.intp)
+    np.cumsum(np.bincount(cells, minlength=nx * ny), out=cell_start[1:])
+    return (xmin, ymin), (cw, ch), shape, cell_start, owner[order]
+
+
+def _axis_cells(span: float, mean_extent: float, limit: int) -> int:
+    if span <= 0:
+        return 1
+    wanted = span / mean_extent if mean_extent > 0 else limit
+    return int(np.clip(np.ceil(wanted), 1, min(limit, _MAX_CELLS_PER_AXIS)))
+
+
+def _cell_of(values: np.ndarray, origin: float, size: float, n: int) -> np.ndarray:
+    return np.clip(np.floor((values - origin) / size), 0, n - 1).astype(np.intp)
+
+
+def _cell_range(v0: float, v1: float, origin: float, size: float, n: int) -> Optional[Tuple[int, int]]:
+    lo = np.floor((v0 - origin) / size)
+    hi = np.floor((v1 - origin) / size)
+    if hi < 0 or lo > n - 1:
+        return None
+    return int(max(lo, 0)), int(min(hi, n - 1))
+
+
+def _segments_hit_rect(seg: np.ndarray, x0: float, x1: float, y0: float, y1: float) -> np.ndarray:
+    """Liang–Barsky kırpması, tüm segmentler için tek seferde."""
+    sx, sy, ex, ey = seg[:, 0], seg[:, 1], seg[:, 2], seg[:, 3]
+    dx = ex - sx
+    dy = ey - sy
+    u1 = np.zeros(len(seg), dtype=float)
+    u2 = np.ones(len(seg), dtype=float)
+    valid = np.ones(len(seg), dtype=bool)
+
+    for p, q in ((-dx, sx - x0), (dx, x1 - sx), (-dy, sy - y0), (dy, y1 - sy)):
+        parallel = p == 0
+        valid &= ~(parallel & (q < 0))
+        ratio = np.divide(q, p, out=np.zeros_like(q), where=~parallel)
+        u1 = np.where(p < 0, np.maximum(u1, ratio), u1)
+        u2 = np.where(p > 0, np.minimum(u2, ratio), u2)
+    return valid & (u1 <= u2)
+
+
+def _scaled_distance_sq(seg: np.ndarray, x: float, y: float, sx: float, sy: float) -> np.ndarray:
+    """Nokta-segment uzaklığının karesi, eksenler sx / sy ile ölçeklenmiş."""
+    ax, ay = (seg[:, 0] - x) / sx, (seg[:, 1] - y) / sy
+    bx, by = (seg[:, 2] - x) / sx, (seg[:, 3] - y) / sy
+    dx, dy = bx - ax, by - ay
+    denom = dx * dx + dy * dy
+    t = np.clip(np.divide(-(ax * dx + ay * dy), denom, out=np.zeros_like(denom), where=denom > 0), 0.0, 1.0)
+    px = ax + t * dx
+    py = ay + t * dy
+    return px * px + py * py
@@ -0,0 +1,75 @@
+# app/views/plotting/pcr_graph_pg/geometry_builder_pg.py
+from __future__ import annotations
+
+import logging
+from typing import Dict
+
+from PyQt5 import QtCore
+
+from app.services.pcr_data_service import PCRCoords
+
+from .geometry import PCRGeometry, build_geometry
+
+logger = logging.getLogger(__name__)
+
+
+class _GeometryJob(QtCore.QRunnable):
+    def __init__(self, builder: "GeometryBuilder", seq: int, token: int, data: Dict[str, PCRCoords]):
+        super().__init__()
+        self._builder = builder
+        self._seq = seq
+        self._token = token
+        self._data = data
+
+    def run(self) -> None:
+        # Arka plan thread'i: yalnızca numpy; Qt item'larına dokunulmaz
+        if self._seq != self._builder._seq:  # noqa
+            return
+        try:
+            geometry = build_geometry(self._token, self._data)
+        except Exception:
+            logger.exception("PCR geometry could not be built")
+            return
+        try:
+            self._builder._built.emit(self._seq, geometry)  # noqa
+        except RuntimeError:
+            pass  # renderer kapandı; sonuç sahipsiz
+
+
+class GeometryBuilder(QtCore.QObject):
+    """
+    PCR grafiği geometrisini (sınır kutuları, merkezler, tepe değerler, isabet indeksi)
+    tek thread'lik havuzda kurar. Yalnızca son istek teslim edilir; arada gelen yeni
+    istek öncekini geçersiz kılar. ready sinyali UI thread'inde yayılır.
+    """
+
+    ready = QtCore.pyqtSignal(object)  # PCRGeometry
+    _built = QtCore.pyqtSignal(int, object)
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._seq = 0
+        self._built.connect(self._on_built, QtCore.Qt.QueuedConnection)
+
+    def request(self, token: int, data: Dict[str, PCRCoords]) -> None:
+        self._seq += 1
+        self._pool.clear()  # henüz başlamamış eski işler
+        self._pool.start(_GeometryJob(self, self._seq, token, dict(data)))
+
+    def cancel(self) -> None:
+        self._seq += 1
+        self._pool.clear()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Bekleyen işi bitirip sonucu teslim eder (testler ve ölçümler için)."""
+        done = self._pool.waitForDone(msecs)
+        QtCore.QCoreApplication.sendPostedEvents(self)
+        return done
+
+    @QtCore.pyqtSlot(int, object)
+    def _on_built(self, seq: int, geometry: PCRGeometry) -> None:
+        if seq != self._seq:
+            return
+        self.ready.emit(geometry)
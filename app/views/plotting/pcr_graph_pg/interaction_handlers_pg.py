@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import Optional, Set
 
 
-from .hit_test import nearest_well, wells_in_rect
+from .geometry import nearest_well, wells_in_rect
 from .render_scheduler_pg import schedule_render
 from .overlays_pg import update_overlays
 from time import perf_counter
@@ -64,6 +64,7 @@ def handle_hover(renderer, pos: Optional[tuple[float, float]]) -> None:
         tol_x, tol_y,
         fam_visible=renderer._fam_visible,
         hex_visible=renderer._hex_visible,
+        shown=renderer._shown_wells,
     )
 
     # Eğer well None ise (yani mesafe tol_x/y'den büyükse), hover'ı temizle
@@ -94,6 +95,7 @@ def handle_click(renderer, pos: tuple[float, float], *, ctrl_pressed: bool) -> N
         tol_y,
         fam_visible=renderer._fam_visible,  # noqa
         hex_visible=renderer._hex_visible,  # noqa
+        shown=renderer._shown_wells,  # noqa
     )
 
     # boş yere tıklandıysa
@@ -167,6 +169,7 @@ def _apply_drag_update(renderer, start: tuple[float, float], current: tuple[floa
         y1,
         fam_visible=renderer._fam_visible,  # noqa
         hex_visible=renderer._hex_visible,  # noqa
+        shown=renderer._shown_wells,  # noqa
     )
     set_rect_preview(renderer, wells)
     schedule_render(renderer, full=False, overlay=True)
\ No newline at end of file
@@ -16,9 +16,11 @@ def refresh_legend(renderer, legend_item: pg.LegendItem) -> None:
     # 2. İçerik Ekleme
     label_style = {'color': renderer._style.legend_text_color, 'size': '9pt', 'bold': False}
     
-    if renderer._fam_visible and renderer._fam_items:
+    # Havuzda gizli kuyular da var; yalnızca gösterilen kuyu varsa lejant dolar
+    shown = bool(renderer._shown_wells)
+    if shown and renderer._fam_visible and (renderer._fam_items or renderer._batches.get("fam")):
         _add_legend_row(legend_item, "FAM", renderer._style.fam_color, label_style)
-    if renderer._hex_visible and renderer._hex_items:
+    if shown and renderer._hex_visible and (renderer._hex_items or renderer._batches.get("hex")):
         _add_legend_row(legend_item, "HEX", renderer._style.hex_color, label_style)
 
     # 3. Konumlandırma (Kritik Nokta)
@@ -0,0 +1,162 @@
+# app\views\plotting\pcr_graph_pg\lod.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class EnvelopeLevel:
+    """
+    Piramidin bir seviyesi: her düğüm ardışık 2^seviye eğrinin döngü başına
+    min/max zarfıdır. ymin/ymax düğümün Y sınırları, xmin/xmax ilk ve son sonlu
+    döngüsü (görünürlük testi için).
+    """
+
+    lo: np.ndarray  # (düğüm, döngü)
+    hi: np.ndarray
+    ymin: np.ndarray  # (düğüm,)
+    ymax: np.ndarray
+    xmin: np.ndarray
+    xmax: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ymin)
+
+
+@dataclass(frozen=True)
+class EnvelopePyramid:
+    """
+    Bir plaka/kanalın eğrileri için min/max zarf piramidi. Eğriler tepe değerine göre
+    sıralanır; böylece komşu eğriler benzer genliktedir ve üst seviyelerin zarfları dar kalır.
+
+    levels[0] eğrilerin kendisidir (lo == hi); son seviye tüm plakanın tek zarfıdır.
+    """
+
+    cycles: np.ndarray
+    wells: Tuple[str, ...]  # seviye 0 satır sırası
+    levels: Tuple[EnvelopeLevel, ...]
+
+    @property
+    def curve_count(self) -> int:
+        return len(self.wells)
+
+    def visible(
+        self,
+        level: int,
+        y_range: Tuple[float, float],
+        x_range: Tuple[float, float] | None = None,
+    ) -> np.ndarray:
+        lvl = self.levels[level]
+        mask = (lvl.ymax >= y_range[0]) & (lvl.ymin <= y_range[1])
+        if x_range is not None:
+            mask &= (lvl.xmax >= x_range[0]) & (lvl.xmin <= x_range[1])
+        return np.flatnonzero(mask)
+
+    def pick(
+        self,
+        y_range: Tuple[float, float],
+        budget: int,
+        x_range: Tuple[float, float] | None = None,
+    ) -> Tuple[int, np.ndarray]:
+        """
+        Görünür düğüm sayısı bütçeyi aşmayan en ince seviye ve o seviyedeki görünür
+        düğümler. Hiçbir seviye sığmazsa en kaba seviye döner.
+        """
+        if not self.levels:
+            return 0, np.empty(0, dtype=np.intp)
+        for level in range(len(self.levels)):
+            nodes = self.visible(level, y_range, x_range)
+            if len(nodes) <= budget or level == len(self.levels) - 1:
+                return level, nodes
+        raise AssertionError("unreachable")
+
+    def rows_of(self, wells: Iterable[str]) -> np.ndarray:
+        """Verilen kuyuların seviye 0 satırları (piramitte olmayanlar atlanır)."""
+        wanted = set(wells)
+        if not wanted:
+            return np.empty(0, dtype=np.intp)
+        return np.fromiter((i for i, w in enumerate(self.wells) if w in wanted), dtype=np.intp)
+
+
+def build_pyramid(cycles: np.ndarray, values: np.ndarray, wells: Sequence[str]) -> EnvelopePyramid:
+    """
+    values: (kuyu, döngü) tek kanal eğrileri; hiç sonlu noktası olmayan kuyular atlanır.
+    Her seviye bir öncekinin ikili min/max indirgemesidir (tek sayıda düğümde son düğüm
+    kendisiyle eşlenir). Eksik döngüler fmin/fmax ile yok sayılır.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    finite = np.isfinite(values)
+    keep = finite.any(axis=1)
+    values = values[keep]
+    kept_wells = [w for w, k in zip(wells, keep) if k]
+
+    peaks = np.where(finite[keep], values, -np.inf).max(axis=1)
+    order = np.argsort(peaks, kind="stable")
+    lo = hi = values[order]
+
+    cycles = np.asarray(cycles, dtype=np.float64)
+    levels = [_level(cycles, lo, hi)] if len(lo) else []
+    while len(lo) > 1:
+        if len(lo) % 2:
+            lo = np.concatenate([lo, lo[-1:]])
+            hi = np.concatenate([hi, hi[-1:]])
+        lo = np.fmin(lo[0::2], lo[1::2])
+        hi = np.fmax(hi[0::2], hi[1::2])
+        levels.append(_level(cycles, lo, hi))
+
+    return EnvelopePyramid(
+        cycles=cycles,
+        wells=tuple(kept_wells[i] for i in order),
+        levels=tuple(levels),
+    )
+
+
+def line_arrays(cycles: np.ndarray, curves: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(eğri, döngü) -> tek yol için x, y, connect; eğri sonlarında ve NaN boşluklarında kopar."""
+    xs = np.broadcast_to(cycles, curves.shape)
+    return _flatten(xs, curves, break_gaps=True)
+
+
+def band_arrays(cycles: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Zarf düğümleri -> kapalı çokgenler (üst kenar ileri, alt kenar geri). Eksik döngüler
+    atlanır; çokgen boşluk üzerinden kapanır.
+    """
+    xs = np.broadcast_to(np.concatenate([cycles, cycles[::-1]]), (len(lo), 2 * len(cycles)))
+    ys = np.concatenate([hi, lo[:, ::-1]], axis=1)
+    return _flatten(xs, ys, break_gaps=False)
+
+
+def _level(cycles: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> EnvelopeLevel:
+    ymin = np.where(np.isfinite(lo), lo, np.inf).min(axis=1)
+    ymax = np.where(np.isfinite(hi), hi, -np.inf).max(axis=1)
+    # Atlanan kuyular sayesinde her düğümün en az bir sonlu döngüsü var
+    finite = np.isfinite(hi)
+    first = finite.argmax(axis=1)
+    last = finite.shape[1] - 1 - finite[:, ::-1].argmax(axis=1)
+    return EnvelopeLevel(lo=lo, hi=hi, ymin=ymin, ymax=ymax, xmin=cycles[first], xmax=cycles[last])
+
+
+def _flatten(xs: np.ndarray, ys: np.ndarray, *, break_gaps: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if ys.size == 0:
+        empty = np.empty(0)
+        return empty, empty, np.empty(0, dtype=bool)
+    finite = np.isfinite(ys)
+    width = ys.shape[1]
+    # connect[i]: i ile i+1 arasında çizgi; satır sonunda kopar
+    connect = np.ones(ys.shape, dtype=bool)
+    connect[:, -1] = False
+    if break_gaps:
+        connect[:, :-1] &= finite[:, 1:]
+    flat = finite.ravel()
+    x = np.asarray(xs, dtype=np.float64).ravel()[flat]
+    y = np.asarray(ys, dtype=np.float64).ravel()[flat]
+    conn = connect.ravel()[flat]
+    if not break_gaps:
+        # Atlanan son noktalar satır sınırını kaybettirmesin
+        row = np.repeat(np.arange(ys.shape[0]), width)[flat]
+        conn = np.append(row[1:] == row[:-1], False)
+    return x, y, conn
@@ -0,0 +1,164 @@
+# app\views\plotting\pcr_graph_pg\playback_pg.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import List, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+
+from app.services.curve_transforms import CurveMode
+from app.services.graph.pcr_graph_layout_service import PlaybackFrames
+
+from .items_pg import refresh_axes_limits
+from .styles import apply_static_visibility, build_pen
+
+CHANNELS: Tuple[str, ...] = ("fam", "hex")
+PLAYBACK_Z = 5
+# Oynatma kalemi: 1 px cosmetic çizgi Qt'nin hızlı çizgi yolunda kalır; normal
+# eğrilerin 1.2 px kalemi her karede geniş çizgi stroker'ına düşer (~10x yavaş)
+PLAYBACK_WIDTH = 1.0
+
+
+@dataclass
+class PlaybackState:
+    """
+    Oynatma durumu. Tamponlar başlangıçta bir kez ayrılır; her karede yalnızca
+    kısmi döngünün uç noktaları yerinde yazılır ve item'lara önek görünümleri verilir.
+    """
+
+    frames: PlaybackFrames
+    cycles_per_second: float
+    items: List[pg.PlotCurveItem]
+    work_x: np.ndarray
+    work_y: np.ndarray
+    scratch: np.ndarray
+    started: float = field(default_factory=perf_counter)
+    partial: np.ndarray = field(default_factory=lambda: np.zeros((len(CHANNELS), 2), dtype=np.int64))
+    ylim_frame: int = -1
+
+    @property
+    def position(self) -> float:
+        """Geçen süreye göre kare konumu (kesirli kısım: açılmakta olan döngü)."""
+        return (perf_counter() - self.started) * self.cycles_per_second
+
+
+def start_playback(renderer, frames: PlaybackFrames, cycles_per_second: float = 8.0) -> None:
+    """
+    Plakayı döngü döngü oynatır. Normal eğri item'ları oynatma boyunca gizli kalır
+    (görünürlük güncellemeleri _playback'e bakar); kanal başına tek connect="pairs"
+    item'ı önceden hesaplanmış segment tamponunun önekini çizer.
+    """
+    if cycles_per_second <= 0:
+        raise ValueError(f"Oynatma hızı pozitif olmalı: {cycles_per_second}")
+    stop_playback(renderer)
+    if frames.frames == 0 or frames.seg_x.shape[1] == 0:
+        return
+
+    style = renderer._style  # noqa
+    items: List[pg.PlotCurveItem] = []
+    for channel in CHANNELS:
+        color = style.fam_color if channel == "fam" else style.hex_color
+        item = pg.PlotCurveItem(
+            pen=build_pen(color, PLAYBACK_WIDTH, 1.0),
+            connect="pairs",
+            skipFiniteCheck=True,
+            antialias=pg.getConfigOption("antialias"),
+        )
+        # Ayrık segmentler: yol kurmak yerine drawLines ile çizilir
+        item.setSegmentedLineMode("on")
+        item.setZValue(PLAYBACK_Z)
+        renderer._plot_item.addItem(item, ignoreBounds=True)  # noqa
+        items.append(item)
+
+    # Kısmi döngü tek seferde en çok bir döngünün segmentleri kadar yer ister
+    widest = int(np.diff(frames.offsets, axis=1).max(initial=0)) // 2
+    state = PlaybackState(
+        frames=frames,
+        cycles_per_second=float(cycles_per_second),
+        items=items,
+        work_x=frames.seg_x.copy(),
+        work_y=frames.seg_y.copy(),
+        scratch=np.empty(max(widest, 1), dtype=frames.seg_x.dtype),
+    )
+    renderer._playback = state  # noqa
+    apply_static_visibility(renderer)
+    advance_playback(renderer)
+
+
+def stop_playback(renderer, *, restore: bool = True) -> None:
+    state = renderer._playback  # noqa
+    if state is None:
+        return
+    renderer._playback = None  # noqa
+    for item in state.items:
+        if item.scene() is not None:
+            renderer._plot_item.removeItem(item)  # noqa
+    if restore:
+        # Gizlenmiş liste yerine güncel durumdan: oynatma sırasındaki seçim/kanal değişiklikleri geçerli
+        apply_static_visibility(renderer)
+        refresh_axes_limits(renderer)
+
+
+def advance_playback(renderer) -> bool:
+    """
+    Zamana göre sıradaki kareyi çizer; oynatma sürüyorsa True. Tamamlanınca normal
+    eğriler geri getirilir.
+    """
+    state: PlaybackState | None = renderer._playback  # noqa
+    if state is None:
+        return False
+
+    frames = state.frames
+    last = frames.frames - 1
+    position = min(state.position, float(last))
+    frame = int(position)
+    frac = position - frame
+
+    for ch, item in enumerate(state.items):
+        visible = renderer._fam_visible if ch == 0 else renderer._hex_visible  # noqa
+        item.setVisible(visible)
+        end = _sync_partial(state, ch, frame, frac)
+        if visible:
+            item.setData(state.work_x[ch, :end], state.work_y[ch, :end])
+
+    if frame != state.ylim_frame:
+        # Eksen yalnızca açılan döngüler üst sınırı büyüttüğünde değişir
+        ylim = frames.ylim[frame]
+        if state.ylim_frame < 0 or not np.array_equal(ylim, frames.ylim[state.ylim_frame]):
+            # Ham RFU sabit tabanı korur; türetilmiş gösterimler açılan en küçük değeri taban alır
+            ymin = None if renderer._curve_mode is CurveMode.RAW else float(ylim[0])  # noqa
+            renderer._apply_axis_ranges(xlim=frames.xlim, ylim=(float(ylim[0]), float(ylim[1])), ymin=ymin)  # noqa
+        state.ylim_frame = frame
+
+    if position >= last:
+        stop_playback(renderer)
+        return False
+    return True
+
+
+def _sync_partial(state: PlaybackState, ch: int, frame: int, frac: float) -> int:
+    """
+    Açılmakta olan döngünün segment uçlarını frac kadar ilerletir (yerinde, ayırma yok)
+    ve çizilecek önekin sonunu döner. Önceki karenin kısmi aralığı özgün değerlere döner.
+    """
+    frames = state.frames
+    start = end = int(frames.offsets[ch, frame])
+    if frac > 0.0 and frame + 1 < frames.frames:
+        end = int(frames.offsets[ch, frame + 1])
+
+    prev_start, prev_end = state.partial[ch]
+    if prev_end > prev_start and (prev_start, prev_end) != (start, end):
+        np.copyto(state.work_x[ch, prev_start:prev_end], frames.seg_x[ch, prev_start:prev_end])
+        np.copyto(state.work_y[ch, prev_start:prev_end], frames.seg_y[ch, prev_start:prev_end])
+    state.partial[ch] = (start, end)
+
+    tmp = state.scratch[: (end - start) // 2]
+    for src, dst in ((frames.seg_x[ch], state.work_x[ch]), (frames.seg_y[ch], state.work_y[ch])):
+        head = src[start:end:2]
+        np.subtract(src[start + 1 : end : 2], head, out=tmp)
+        np.multiply(tmp, frac, out=tmp)
+        np.add(head, tmp, out=dst[start + 1 : end : 2])
+    return end
+
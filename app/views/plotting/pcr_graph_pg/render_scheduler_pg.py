@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from time import perf_counter
 
+from .playback_pg import advance_playback
+
 
 def schedule_render(renderer, *, full: bool = False, overlay: bool = False, force_flush: bool = False) -> None:
     renderer._pending_full_draw = renderer._pending_full_draw or full  # noqa
@@ -27,6 +29,11 @@ def flush_pending_render(renderer) -> None:
     renderer._pending_full_draw = False  # noqa
     renderer._pending_overlay = False  # noqa
 
+    # Oynatma sürerken zamanlayıcı her karede yeniden kurulur
+    if advance_playback(renderer):
+        full = True
+        renderer._render_timer.start(renderer._frame_interval_ms)  # noqa
+
     if full or overlay:
         renderer.update()
 
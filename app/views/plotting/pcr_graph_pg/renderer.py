@@ -3,22 +3,38 @@ from __future__ import annotations
 
 import logging
 from time import perf_counter
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 import numpy as np
 import pyqtgraph as pg
 from PyQt5 import QtCore, QtGui
 
 from app.constants.pcr_graph_style import PCRGraphStyle
+from app.services.curve_store import CurveStore
+from app.services.curve_transforms import CurveMode
+from app.services.graph.pcr_graph_layout_service import PlaybackFrames
 from app.services.interaction_store import InteractionStore
 from app.services.pcr_data_service import PCRCoords
 from app.utils import well_mapping
 
 from .axes import apply_axis_ranges, apply_axes_style, set_axis_ticks
+from .batches_pg import CurveBatch
+from .compare_pg import (
+    ComparePlate,
+    add_compare_items,
+    apply_compare_visibility,
+    clear_compare_plates as clear_compare_plates_impl,
+    rebuild_compare_pyramids,
+    set_compare_plates as set_compare_plates_impl,
+    update_compare_lod,
+)
+from .geometry import PCRGeometry
+from .geometry_builder_pg import GeometryBuilder
 from .interactions import PCRGraphViewBox
 from .styles import InteractionStyleChange, StyleState, apply_interaction_styles, set_channel_visibility
 
-from .items_pg import update_items, refresh_legend_pg, rebuild_spatial_index
+from .items_pg import update_items, refresh_axes_limits, refresh_legend_pg
+from .playback_pg import PlaybackState, start_playback as start_playback_impl, stop_playback as stop_playback_impl
 from .overlays_pg import build_overlay, make_hover_pen, make_preview_pen, update_overlays
 from .interaction_handlers_pg import (
     handle_hover as handle_hover_impl,
@@ -38,7 +54,7 @@ class PCRGraphRendererPG(pg.PlotWidget):
     """
     PyQtGraph-based PCR grafiği: yüksek FPS için optimize edildi.
     """
-    def __init__(self, parent=None, style: PCRGraphStyle | None = None):
+    def __init__(self, parent=None, style: PCRGraphStyle | None = None, *, batched: bool | None = None):
         self._style = style or PCRGraphStyle()
         self._title = "PCR Grafik"
 
@@ -55,6 +71,13 @@ class PCRGraphRendererPG(pg.PlotWidget):
 
         self._fam_items: Dict[str, pg.PlotDataItem] = {}
         self._hex_items: Dict[str, pg.PlotDataItem] = {}
+        # Toplu çizim: kanal başına stil kovası kadar item (kuyu başına item yok).
+        # Kenar yumuşatma açıkken tek büyük yolun boyanması kuyu başına yollardan
+        # kat kat yavaş (scripts/bench_rendering.py); varsayılan buna göre seçilir.
+        if batched is None:
+            batched = not pg.getConfigOption("antialias")
+        self._batched = bool(batched)
+        self._batches: Dict[str, CurveBatch] = {}
         self._hover_well: Optional[str] = None
 
         # overlays
@@ -63,8 +86,22 @@ class PCRGraphRendererPG(pg.PlotWidget):
 
         self._fam_visible = True
         self._hex_visible = True
+        # Eğri gösterimi yalnızca eksen politikasını belirler; veriyi etkileşimci getirir
+        self._curve_mode = CurveMode.RAW
+        # Karşılaştırma plakaları: görünüm değiştikçe zarf piramidinden seviye seçilir
+        self._compare_plates: List[ComparePlate] = []
+        # Döngü döngü oynatma: kareler çizim zamanlayıcısı üzerinden ilerler
+        self._playback: Optional[PlaybackState] = None
+        # Havuz: aktif plakanın tüm kuyuları veri versiyonu başına bir kez yüklenir;
+        # seçim yalnızca gösterilen kuyuları (görünürlük/stil) değiştirir
         self._rendered_wells: Set[str] = set()
+        self._shown_wells: Set[str] = set()
         self._data_cache_token: int = 0
+        # Geometri (isabet indeksi, merkezler, tepe değerler) arka planda kurulur;
+        # gelene kadar isabet testi boş döner, eksenler varsayılandır
+        self._geometry: Optional[PCRGeometry] = None
+        self._geometry_builder = GeometryBuilder(self)
+        self._geometry_builder.ready.connect(self._on_geometry_ready)
         self._well_geoms: Dict[str, Dict[str, np.ndarray]] = {}
         self._spatial_index = None
         self._rect_preview_wells: Set[str] = set()
@@ -128,19 +165,17 @@ class PCRGraphRendererPG(pg.PlotWidget):
         # state
         self._fam_items.clear()
         self._hex_items.clear()
+        self._batches.clear()
         self._rendered_wells.clear()
-        self._well_geoms.clear()
-        self._spatial_index = None
+        self._shown_wells.clear()
+        self._geometry_builder.cancel()
+        self._adopt_geometry(None)
         self._data_cache_token = 0
         self._style_state = None
         self._hover_well = None
         self._rect_preview_wells.clear()
-        self._well_centers = np.empty((0, 2), dtype=float)
-        self._well_center_ids = []
-        self._well_center_has_fam = np.array([], dtype=bool)
-        self._well_center_has_hex = np.array([], dtype=bool)
-        self._well_center_index = {}
         self._pending_drag = None
+        stop_playback_impl(self, restore=False)
 
         # scene cleanup
         try:
@@ -166,6 +201,7 @@ class PCRGraphRendererPG(pg.PlotWidget):
         self._plot_item.addItem(self._hover_overlay)
         self._plot_item.addItem(self._preview_overlay)
         self._plot_item.addItem(self._preview_proxy, ignoreBounds=True)
+        add_compare_items(self)
 
         # axes
         self._setup_axes()
@@ -184,6 +220,7 @@ class PCRGraphRendererPG(pg.PlotWidget):
             self._drag_throttle_timer.stop()
         if self._tick_update_timer.isActive():
             self._tick_update_timer.stop()
+        self._geometry_builder.cancel()
         try:
             self._legend.clear()
         except Exception:
@@ -191,31 +228,65 @@ class PCRGraphRendererPG(pg.PlotWidget):
         super().closeEvent(event)
 
     # ---- public api ----
-    def render_wells(self, data: Dict[str, PCRCoords], *, cache_token: int | None = None) -> None:
+    def render_wells(
+        self,
+        data: Dict[str, PCRCoords],
+        *,
+        cache_token: int | None = None,
+        shown: Iterable[str] | None = None,
+    ) -> None:
+        """
+        data: havuza yüklenecek kuyular (tipik olarak plakanın tümü)
+        shown: gösterilecek kuyular (None: hepsi)
+        Havuz aynı kuyular ve token ile zaten yüklüyse sahne kurulmaz, yalnızca stil değişir.
+        """
+        stop_playback_impl(self)
         incoming_wells = set(data.keys())
         token = cache_token if cache_token is not None else self._data_cache_token
-        selected = set(self._store.selected_wells) if self._store else set()
-        preview = self._collect_preview_wells()
+        shown_wells = incoming_wells if shown is None else set(shown) & incoming_wells
 
         if incoming_wells and incoming_wells == self._rendered_wells and token == self._data_cache_token:
-            change = self._apply_interaction_styles(hovered=self._hover_well, selected=selected, preview=preview)
-            self._update_overlays(change)
-            self._schedule_render(full=change.base_dirty, overlay=change.overlay_dirty or change.base_dirty)
+            self.show_wells(shown_wells)
             return
 
-        plot_was_empty = not self._fam_items and not self._hex_items
+        plot_was_empty = not self._fam_items and not self._hex_items and not self._batches
 
         self._style_state = None
         self._rendered_wells = incoming_wells
+        self._shown_wells = shown_wells
         self._data_cache_token = token
 
+        # Eski geometri yeni eğrilere uymaz; yenisi hazır olana kadar isabet testi yok
+        self._geometry_builder.request(token, data)
+        self._adopt_geometry(None)
         update_items(self, data)
-        rebuild_spatial_index(self)
 
-        change = self._apply_interaction_styles(hovered=self._hover_well, selected=selected, preview=preview)
+        change = self._apply_interaction_styles(
+            hovered=self._hover_well,
+            selected=set(self._store.selected_wells) if self._store else set(),
+            preview=self._collect_preview_wells(),
+        )
         self._update_overlays(change)
+        update_compare_lod(self)
         self._schedule_render(full=True, overlay=True, force_flush=plot_was_empty)
 
+    def show_wells(self, wells: Iterable[str]) -> None:
+        """Havuzdaki kuyulardan gösterilecekleri belirler; item eklenmez/silinmez."""
+        shown = set(wells) & self._rendered_wells
+        if shown != self._shown_wells:
+            self._shown_wells = shown
+            refresh_axes_limits(self)
+            refresh_legend_pg(self)
+            update_compare_lod(self)
+
+        change = self._apply_interaction_styles(
+            hovered=self._hover_well,
+            selected=set(self._store.selected_wells) if self._store else set(),
+            preview=self._collect_preview_wells(),
+        )
+        self._update_overlays(change)
+        self._schedule_render(full=change.base_dirty, overlay=True)
+
     def set_hover(self, well: Optional[str]) -> None:
         normalized = well if well_mapping.is_valid_well_id(well) else None
         if normalized == self._hover_well:
@@ -254,7 +325,8 @@ class PCRGraphRendererPG(pg.PlotWidget):
             return
 
         refresh_legend_pg(self)
-        rebuild_spatial_index(self)
+        apply_compare_visibility(self)
+        update_compare_lod(self)
         self._update_preview_proxy(self._collect_preview_wells())
 
         change = self._apply_interaction_styles(
@@ -265,6 +337,49 @@ class PCRGraphRendererPG(pg.PlotWidget):
         self._update_overlays(change)
         self._schedule_render(full=True, overlay=True)
 
+    def wait_for_geometry(self, msecs: int = -1) -> bool:
+        """Bekleyen geometriyi senkron olarak takar (testler ve ölçümler için)."""
+        return self._geometry_builder.wait(msecs)
+
+    def apply_curve_mode(self, mode: CurveMode | str) -> None:
+        """Eksen politikasını gösterim moduna göre ayarlar (ham RFU: sabit taban)."""
+        mode = CurveMode.parse(mode)
+        if mode is self._curve_mode:
+            return
+        self._curve_mode = mode
+        refresh_axes_limits(self)
+        rebuild_compare_pyramids(self)
+        self._schedule_render(full=True, overlay=True)
+
+    def set_compare_plates(self, plates: Mapping[str, CurveStore]) -> None:
+        """
+        Karşılaştırma için diğer plakaları (etiket -> CurveStore, ör. CurveArchive.open)
+        aktif plakanın altına bindirir. Uzaklaştırınca zarf bantları, yakınlaştırınca
+        ya da seçili kuyular için tam eğriler çizilir.
+        """
+        set_compare_plates_impl(self, plates)
+        self._schedule_render(full=True)
+
+    def clear_compare_plates(self) -> None:
+        clear_compare_plates_impl(self)
+        self._schedule_render(full=True)
+
+    def start_playback(self, frames: PlaybackFrames, *, cycles_per_second: float = 8.0) -> None:
+        """
+        Plakayı döngü döngü oynatır (PCRGraphLayoutService.build_playback kareleri).
+        Kareler çizim zamanlayıcısıyla ilerler; bitince normal eğriler geri gelir.
+        """
+        start_playback_impl(self, frames, cycles_per_second)
+        self._schedule_render(full=True)
+
+    def stop_playback(self) -> None:
+        stop_playback_impl(self)
+        self._schedule_render(full=True, overlay=True)
+
+    @property
+    def playing(self) -> bool:
+        return self._playback is not None
+
     def set_title(self, title: str) -> None:
         self._title = title
         self._plot_item.setTitle(self._title, color=self._style.axes.title_color)
@@ -279,6 +394,43 @@ class PCRGraphRendererPG(pg.PlotWidget):
     def handle_drag(self, start: tuple[float, float], current: tuple[float, float], *, finished: bool) -> None:
         return handle_drag_impl(self, start, current, finished=finished)
 
+    # ---- geometry ----
+    def _on_geometry_ready(self, geometry: PCRGeometry) -> None:
+        if geometry.token != self._data_cache_token or not self._rendered_wells:
+            return  # eski veri versiyonu
+
+        self._adopt_geometry(geometry)
+        refresh_axes_limits(self)
+        self._update_preview_proxy(self._collect_preview_wells())
+        self._style_state = None
+        change = self._apply_interaction_styles(
+            hovered=self._hover_well,
+            selected=set(self._store.selected_wells) if self._store else set(),
+            preview=self._collect_preview_wells(),
+        )
+        self._update_overlays(change)
+        self._schedule_render(full=True, overlay=True)
+
+    def _adopt_geometry(self, geometry: Optional[PCRGeometry]) -> None:
+        """Geometriyi tek adımda takar; alanlar aynı nesneden okunur (karışık sürüm yok)."""
+        self._geometry = geometry
+        if geometry is None:
+            self._well_geoms = {}
+            self._spatial_index = None
+            self._well_centers = np.empty((0, 2), dtype=float)
+            self._well_center_ids = []
+            self._well_center_has_fam = np.array([], dtype=bool)
+            self._well_center_has_hex = np.array([], dtype=bool)
+            self._well_center_index = {}
+            return
+        self._well_geoms = geometry.well_geoms
+        self._spatial_index = geometry.index
+        self._well_centers = geometry.centers
+        self._well_center_ids = geometry.center_ids
+        self._well_center_has_fam = geometry.center_has_fam
+        self._well_center_has_hex = geometry.center_has_hex
+        self._well_center_index = {well: idx for idx, well in enumerate(geometry.center_ids)}
+
     # ---- internal render helpers ----
     def _setup_axes(self) -> None:
         apply_axes_style(
@@ -339,8 +491,8 @@ class PCRGraphRendererPG(pg.PlotWidget):
     def _flush_pending_drag(self) -> None:
         return flush_pending_drag_impl(self)
 
-    def _apply_axis_ranges(self, *, xlim: tuple[float, float], ylim: tuple[float, float]) -> None:
-        apply_axis_ranges(self._plot_item, self._view_box, xlim=xlim, ylim=ylim)
+    def _apply_axis_ranges(self, *, xlim: tuple[float, float], ylim: tuple[float, float], ymin: float | None = None) -> None:
+        apply_axis_ranges(self._plot_item, self._view_box, xlim=xlim, ylim=ylim, ymin=ymin)
 
     def _on_view_range_changed(self, view_box, range_) -> None:
         if not range_ or len(range_) < 2:
@@ -366,4 +518,5 @@ class PCRGraphRendererPG(pg.PlotWidget):
         x_range, y_range = self._pending_tick_range
         self._pending_tick_range = None
         self._last_tick_range = (x_range, y_range)
-        set_axis_ticks(self._plot_item, x_range, y_range)
\ No newline at end of file
+        set_axis_ticks(self._plot_item, x_range, y_range)
+        update_compare_lod(self)
\ No newline at end of file
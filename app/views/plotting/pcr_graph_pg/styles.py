@@ -9,6 +9,8 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt5 import QtGui, QtCore
 
+from .batches_pg import apply_batch_visibility, assign_batch_buckets, bucket_of
+
 PenKey = Tuple[str, float, float, QtCore.Qt.PenStyle]
 
 _PEN_CACHE: Dict[PenKey, QtGui.QPen] = {}
@@ -27,6 +29,7 @@ class StyleState:
     prev_selected: Set[str] = field(default_factory=set)
     prev_preview: Set[str] = field(default_factory=set)
     prev_hover: Optional[str] = None
+    prev_shown: Set[str] = field(default_factory=set)
     initialized: bool = False
 
 
@@ -46,8 +49,22 @@ def build_pen(color: str, width: float, alpha: float, style: QtCore.Qt.PenStyle
     return pen
 
 
+def bucket_pen(r, color: str, bucket: str) -> Tuple[QtGui.QPen, float]:
+    """Stil kovasının kalemi ve z değeri; kuyu başına ve toplu çizim aynı görünümü kullanır."""
+    if bucket == "selected":
+        # %100 görünürlük, en üst katman
+        return build_pen(color, r._style.selected_width, 1.0), 100
+    if bucket == "preview":
+        return build_pen(color, r._style.overlay_preview_width, 1.0, QtCore.Qt.DashLine), 80
+    if bucket == "inactive":
+        # Seçim varken diğerleri arkada 'hayalet' (en alt katman)
+        return build_pen(color, r._style.base_width, r._style.inactive_alpha), 1
+    # Hiçbir seçim yoksa herkes eşit ve orta görünürlükte
+    return build_pen(color, r._style.base_width, 0.8), 10
+
+
 def apply_interaction_styles(r, hovered: Optional[str], selected: Set[str], preview: Set[str]) -> InteractionStyleChange:
-    if not r._fam_items and not r._hex_items:
+    if not r._fam_items and not r._hex_items and not r._batches:
         return InteractionStyleChange(False, False, [], [])
 
     if r._style_state is None:
@@ -63,6 +80,7 @@ def apply_interaction_styles(r, hovered: Optional[str], selected: Set[str], prev
     state.prev_hover = hovered
     state.prev_preview = set(preview)
     state.prev_selected = set(selected)
+    state.prev_shown = set(r._shown_wells)
 
     return InteractionStyleChange(
         base_dirty=base_dirty,
@@ -76,64 +94,52 @@ def _update_interaction_styles(r, selected: Set[str], preview: Set[str], state:
     if not state.initialized:
         changed = set(r._fam_items.keys()) | set(r._hex_items.keys())
         state.initialized = True
+        if r._batches:
+            assign_batch_buckets(r, selected, preview)
+            return True
     else:
         changed = (
             state.prev_selected.symmetric_difference(selected)
             | state.prev_preview.symmetric_difference(preview)
+            | state.prev_shown.symmetric_difference(r._shown_wells)
         )
 
     if not changed:
         return False
 
+    if r._batches:
+        # Toplu çizim: kuyular kovalar arasında taşınır, item başına stil yok
+        return assign_batch_buckets(r, selected, preview)
+
     for well in changed:
         _style_well(r, well, selected, preview)
     return True
 
 def _style_well(r, well: str, selected: Set[str], preview: Set[str]) -> None:
-    is_selected = well in selected
-    is_preview = well in preview
-    any_selection = len(selected) > 0
-
-    if is_selected:
-        target_alpha = 1.0  # %100 görünürlük
-        target_width = r._style.selected_width
-        z_value = 100 # En üst katman
-        target_style = QtCore.Qt.SolidLine
-    elif is_preview:
-        target_alpha = 1.0
-        target_width = r._style.overlay_preview_width
-        z_value = 80
-        target_style = QtCore.Qt.DashLine
-    elif any_selection:
-        target_alpha = r._style.inactive_alpha  # %15 opaklık
-        target_width = r._style.base_width
-        z_value = 1  # En alt katman
-        target_style = QtCore.Qt.SolidLine
-    else:
-        # Hiçbir seçim yoksa herkes eşit ve orta görünürlükte
-        target_alpha = 0.8
-        target_width = r._style.base_width
-        z_value = 10
-        target_style = QtCore.Qt.SolidLine
+    bucket = bucket_of(well, selected, preview)
+    shown = well in r._shown_wells
 
     # FAM Uygulaması
     fam_item = r._fam_items.get(well)
     if fam_item:
-        pen = build_pen(r._style.fam_color, target_width, target_alpha, target_style)
+        pen, z_value = bucket_pen(r, r._style.fam_color, bucket)
         fam_item.setPen(pen)
         fam_item.setZValue(z_value)
-        fam_item.setVisible(r._fam_visible and bool(fam_item.property("has_data")))
+        fam_item.setVisible(shown and _static_visible(r, fam_item, r._fam_visible))
 
     # HEX Uygulaması
     hex_item = r._hex_items.get(well)
     if hex_item:
-        pen = build_pen(r._style.hex_color, target_width, target_alpha, target_style)
+        pen, z_value = bucket_pen(r, r._style.hex_color, bucket)
         hex_item.setPen(pen)
         hex_item.setZValue(z_value)
+        hex_item.setVisible(shown and _static_visible(r, hex_item, r._hex_visible))
 
 def _build_segments_for_wells(r, wells: Iterable[str]) -> List[np.ndarray]:
     segments: List[np.ndarray] = []
     for well in wells:
+        if well not in r._shown_wells:
+            continue
         coords = r._well_geoms.get(well)
         if not coords:
             continue
@@ -155,9 +161,21 @@ def set_channel_visibility(r, fam_visible: bool | None = None, hex_visible: bool
     if hex_changed:
         r._hex_visible = bool(hex_visible)
 
-    for item in r._fam_items.values():
-        item.setVisible(r._fam_visible and bool(item.property("has_data")))
-    for item in r._hex_items.values():
-        item.setVisible(r._hex_visible and bool(item.property("has_data")))
-
+    apply_static_visibility(r)
     return True
+
+
+def apply_static_visibility(r) -> None:
+    """
+    Eğri item'larının görünürlüğünü durumdan yeniden hesaplar (gösterilen kuyular,
+    kanal görünürlüğü, veri varlığı). Oynatma sürerken eğri item'ları gizli kalır.
+    """
+    for well, item in r._fam_items.items():
+        item.setVisible(well in r._shown_wells and _static_visible(r, item, r._fam_visible))
+    for well, item in r._hex_items.items():
+        item.setVisible(well in r._shown_wells and _static_visible(r, item, r._hex_visible))
+    apply_batch_visibility(r)
+
+
+def _static_visible(r, item, channel_visible: bool) -> bool:
+    return channel_visible and r._playback is None and bool(item.property("has_data"))
@@ -11,9 +11,15 @@ from app.views.plotting.regression.styles import RegressionPlotStyle
 
 
 class PyqtgraphRegressionRenderer:
+    """
+    Regresyon item'larını plot'a bağlar. Sahne her render'da temizlenmez: mevcut item'lar
+    yerinde güncellenir, yalnızca eklenen/çıkan item'lar sahneye eklenir/çıkarılır.
+    """
+
     def __init__(self, style: RegressionPlotStyle):
         self._renderer = RegressionRenderer(style=style)
         self._interaction = RegressionInteraction()
+        self._items: list[pg.GraphicsObject] = []
 
     def render(
         self,
@@ -23,16 +29,20 @@ class PyqtgraphRegressionRenderer:
         hover_text_item: pg.TextItem | None = None,
         interaction_store: InteractionStore | None = None,
     ) -> list[pg.GraphicsObject]:
-        plot_item.clear()
-
         result = self._renderer.render(data)
-        if hover_text_item is not None:
-            plot_item.addItem(hover_text_item)
 
+        current = {id(item) for item in result.items}
+        for item in self._items:
+            if id(item) not in current:
+                plot_item.removeItem(item)
+        # reset() sonrası (plot_item.clear) item'lar sahnede olmayabilir
         for item in result.items:
-            plot_item.addItem(item)
+            if item.scene() is None:
+                plot_item.addItem(item)
+        if hover_text_item is not None and hover_text_item.scene() is None:
+            plot_item.addItem(hover_text_item)
+        self._items = list(result.items)
 
-        self._interaction.detach()
         if enable_hover and hover_text_item is not None and not result.hover_points.is_empty:
             self._interaction.attach(
                 plot_item=plot_item,
@@ -40,13 +50,21 @@ class PyqtgraphRegressionRenderer:
                 hover_points=result.hover_points,
                 interaction_store=interaction_store,
             )
-        elif hover_text_item is not None:
-            hover_text_item.hide()
+        else:
+            self._interaction.detach()
+            if hover_text_item is not None:
+                hover_text_item.hide()
 
         return result.items
 
     def update_styles(self, selected_wells: set[str] | None, hover_well: str | None) -> None:
         self._renderer.update_styles(selected_wells, hover_well)
 
+    def update_selection(self, selected_wells: set[str] | None) -> None:
+        self._renderer.update_selection(selected_wells)
+
+    def update_hover(self, hover_well: str | None) -> None:
+        self._renderer.update_hover(hover_well)
+
     def detach_hover(self) -> None:
-        self._interaction.detach()
\ No newline at end of file
+        self._interaction.detach()
@@ -10,6 +10,7 @@ from app.i18n import t
 from app.services.regression_plot_service import RegressionLine, SafeBand, ScatterSeries
 from app.views.plotting.regression.styles import (
     RegressionPlotStyle,
+    brighten,
     get_series_style,
     make_brush,
     make_pen,
@@ -18,7 +19,9 @@ from app.views.plotting.regression.styles import (
 
 @dataclass
 class ScatterHandle:
-    # Overlay mimarisi: base sabit, selected/hover ayrı item
+    # Overlay mimarisi: base sabit, selected/hover ayrı item.
+    # Item'lar seri etiketi başına bir kez kurulur; veri değişince setData ile güncellenir.
+    label: str
     base_item: pg.ScatterPlotItem
     selected_item: pg.ScatterPlotItem
     hover_item: pg.ScatterPlotItem
@@ -32,6 +35,9 @@ class ScatterHandle:
     base_pen: tuple[int, ...]
     selection_pen: tuple[int, ...]
 
+    def items(self) -> list[pg.ScatterPlotItem]:
+        return [self.base_item, self.selected_item, self.hover_item]
+
 
 @dataclass
 class HoverPoints:
@@ -52,13 +58,6 @@ class HoverPoints:
         return self.x.size == 0
 
 
-@dataclass
-class SeriesBuildResult:
-    scatter_items: list[pg.ScatterPlotItem]
-    scatter_handles: list[ScatterHandle]
-    hover_points: HoverPoints
-
-
 def build_safe_band_items(safe_band: SafeBand, style: RegressionPlotStyle) -> list[pg.GraphicsObject]:
     upper_curve = pg.PlotDataItem(
         safe_band.x_sorted,
@@ -80,6 +79,13 @@ def build_safe_band_items(safe_band: SafeBand, style: RegressionPlotStyle) -> li
     return [upper_curve, lower_curve, fill]
 
 
+def set_safe_band_data(items: list[pg.GraphicsObject], safe_band: SafeBand) -> None:
+    """build_safe_band_items çıktısını günceller; dolgu eğri sinyalleriyle kendini yeniler."""
+    upper_curve, lower_curve, _ = items
+    upper_curve.setData(safe_band.x_sorted, safe_band.upper)
+    lower_curve.setData(safe_band.x_sorted, safe_band.lower)
+
+
 def build_regression_line_item(reg_line: RegressionLine, style: RegressionPlotStyle) -> pg.PlotDataItem:
     line = pg.PlotDataItem(
         reg_line.x_sorted,
@@ -91,7 +97,7 @@ def build_regression_line_item(reg_line: RegressionLine, style: RegressionPlotSt
     return line
 
 
-def _translate_label(label: str) -> str:
+def series_label(label: str) -> str:
     return {
         "Sağlıklı": t("regression.plot.legend.healthy"),
         "Taşıyıcı": t("regression.plot.legend.carrier"),
@@ -99,97 +105,83 @@ def _translate_label(label: str) -> str:
     }.get(label, label)
 
 
-def build_series_items(series: list[ScatterSeries], style: RegressionPlotStyle) -> SeriesBuildResult:
-    scatter_items: list[pg.ScatterPlotItem] = []
-    scatter_handles: list[ScatterHandle] = []
-
-    hover_x: list[np.ndarray] = []
-    hover_y: list[np.ndarray] = []
-    hover_wells: list[np.ndarray] = []
-
-    for s in series:
-        series_style = get_series_style(style, s.label)
-
-        if series_style is None:
-            brush = (200, 200, 200)
-            pen = (255, 255, 255)
-            sel_pen = (255, 255, 0)
-        else:
-            brush = series_style.brush
-            pen = series_style.pen
-            sel_pen = series_style.selection_pen
-
-        label_name = _translate_label(s.label)
-
-        # 1) Base scatter: tüm noktalar (legend’de sadece bu görünsün)
-        base_sc = pg.ScatterPlotItem(
-            x=s.x,
-            y=s.y,
-            size=style.scatter_size,
-            brush=make_brush(brush),
-            pen=make_pen(pen, width=style.scatter_pen_width),
-            name=label_name,
-        )
-        base_sc.setZValue(3)
-        scatter_items.append(base_sc)
-
-        # 2) Selected overlay: name YOK (legend/tabloya düşmesin)
-        selected_sc = pg.ScatterPlotItem(
-            x=[],
-            y=[],
-            size=style.scatter_size + 4,
-            brush=make_brush(brush),
-            pen=make_pen(sel_pen, width=4),
-        )
-        selected_sc.setZValue(50)
-        scatter_items.append(selected_sc)
-
-        # 3) Hover overlay: name YOK (legend/tabloya düşmesin)
-        hover_sc = pg.ScatterPlotItem(
-            x=[],
-            y=[],
-            size=style.scatter_size + 7,
-            brush=make_brush(brush),
-            pen=make_pen(sel_pen, width=4),
-        )
-        hover_sc.setZValue(100)
-        scatter_items.append(hover_sc)
-
-        hx = np.asarray(s.x, dtype=float)
-        hy = np.asarray(s.y, dtype=float)
-        hw = np.asarray(s.wells, dtype=str)
-
-        well_to_index = {str(w): i for i, w in enumerate(hw)}
-
-        hover_x.append(hx)
-        hover_y.append(hy)
-        hover_wells.append(hw)
-
-        scatter_handles.append(
-            ScatterHandle(
-                base_item=base_sc,
-                selected_item=selected_sc,
-                hover_item=hover_sc,
-                x=hx,
-                y=hy,
-                wells=hw,
-                well_to_index=well_to_index,
-                base_brush=brush,
-                base_pen=pen,
-                selection_pen=sel_pen,
-            )
-        )
+def build_series_handle(label: str, style: RegressionPlotStyle) -> ScatterHandle:
+    """
+    Seri için base/selected/hover item'larını boş veriyle kurar. Pen, brush ve boyut
+    burada bir kez atanır; sonraki setData çağrıları yalnızca koordinat taşır.
+    """
+    series_style = get_series_style(style, label)
+
+    if series_style is None:
+        brush = (200, 200, 200)
+        pen = (255, 255, 255)
+        sel_pen = (255, 255, 0)
+    else:
+        brush = series_style.brush
+        pen = series_style.pen
+        sel_pen = series_style.selection_pen
+
+    # 1) Base scatter: tüm noktalar (legend’de sadece bu görünsün)
+    base_sc = pg.ScatterPlotItem(
+        x=[],
+        y=[],
+        size=style.scatter_size,
+        brush=make_brush(brush),
+        pen=make_pen(pen, width=style.scatter_pen_width),
+        name=series_label(label),
+    )
+    base_sc.setZValue(3)
+
+    # 2) Selected overlay: name YOK (legend/tabloya düşmesin)
+    selected_sc = pg.ScatterPlotItem(
+        x=[],
+        y=[],
+        size=style.scatter_size + 4,
+        brush=make_brush(brighten(brush, 60)),
+        pen=make_pen(sel_pen, width=4),
+    )
+    selected_sc.setZValue(50)
+
+    # 3) Hover overlay: orijinde tek nokta; hover'da yalnızca item taşınır (setPos)
+    hover_sc = pg.ScatterPlotItem(
+        x=[0.0],
+        y=[0.0],
+        size=style.scatter_size + 7,
+        brush=make_brush(brighten(brush, 80)),
+        pen=make_pen(sel_pen, width=4),
+    )
+    hover_sc.setZValue(100)
+    hover_sc.hide()
+
+    empty = np.array([], dtype=float)
+    return ScatterHandle(
+        label=label,
+        base_item=base_sc,
+        selected_item=selected_sc,
+        hover_item=hover_sc,
+        x=empty,
+        y=empty,
+        wells=np.array([], dtype=str),
+        well_to_index={},
+        base_brush=brush,
+        base_pen=pen,
+        selection_pen=sel_pen,
+    )
+
+
+def set_series_data(handle: ScatterHandle, series: ScatterSeries) -> None:
+    handle.x = np.asarray(series.x, dtype=float)
+    handle.y = np.asarray(series.y, dtype=float)
+    handle.wells = np.asarray(series.wells, dtype=str)
+    handle.well_to_index = {str(w): i for i, w in enumerate(handle.wells)}
+    handle.base_item.setData(x=handle.x, y=handle.y)
 
-    hover_points = HoverPoints.empty()
-    if hover_x:
-        hover_points = HoverPoints(
-            x=np.concatenate(hover_x),
-            y=np.concatenate(hover_y),
-            wells=np.concatenate(hover_wells),
-        )
 
-    return SeriesBuildResult(
-        scatter_items=scatter_items,
-        scatter_handles=scatter_handles,
-        hover_points=hover_points,
+def collect_hover_points(handles: list[ScatterHandle]) -> HoverPoints:
+    if not handles:
+        return HoverPoints.empty()
+    return HoverPoints(
+        x=np.concatenate([h.x for h in handles]),
+        y=np.concatenate([h.y for h in handles]),
+        wells=np.concatenate([h.wells for h in handles]),
     )
@@ -15,8 +15,10 @@ class RegressionInteraction:
     def __init__(self):
         self._hover_proxy = None
         self._click_proxy = None
+        self._plot_item: pg.PlotItem | None = None
         self._store: InteractionStore | None = None
         self._hover_points: HoverPoints = HoverPoints.empty()
+        self._text_well: str | None = None
 
     def attach(
         self,
@@ -25,16 +27,20 @@ class RegressionInteraction:
         hover_points: HoverPoints,
         interaction_store: InteractionStore | None,
     ) -> None:
-        self.detach()
-        self._store = interaction_store
-        self._hover_points = hover_points
-
         if hover_points.is_empty:
+            self.detach()
             hover_text_item.hide()
             return
 
-        self._attach_hover(plot_item, hover_text_item)
-        self._attach_click(plot_item, hover_text_item)
+        # Aynı plot'a bağlıysa yalnızca veri değişir; fare sinyalleri yeniden bağlanmaz
+        if self._plot_item is not plot_item or self._hover_proxy is None:
+            self.detach()
+            self._attach_hover(plot_item, hover_text_item)
+            self._attach_click(plot_item, hover_text_item)
+            self._plot_item = plot_item
+        self._store = interaction_store
+        self._hover_points = hover_points
+        self._text_well = None
 
     def detach(self) -> None:
         for proxy in (self._hover_proxy, self._click_proxy):
@@ -50,8 +56,10 @@ class RegressionInteraction:
                 pass
         self._hover_proxy = None
         self._click_proxy = None
+        self._plot_item = None
         self._store = None
         self._hover_points = HoverPoints.empty()
+        self._text_well = None
 
     # ---- hover / click ----
     def _attach_hover(self, plot_item: pg.PlotItem, hover_text_item: pg.TextItem) -> None:
@@ -74,25 +82,7 @@ class RegressionInteraction:
                     self._store.set_hover(None)
                 return
 
-            well = self._hover_points.wells[well_idx] if well_idx < self._hover_points.wells.size else ""
-            text_color = "#FFFFFF"  # Beyaz yazı
-            bg_color = "rgba(40, 44, 52, 200)"  # Yarı saydam koyu arka plan
-            border_color = "#FFD700"  # Altın sarısı çerçeve (Ampul rengi)
-
-            well_text = t("regression.plot.hover.well_no", well=well)
-            html_text = (
-                f'<div style="background-color: {bg_color}; '
-                f'border: 1px solid {border_color}; '
-                f'border-radius: 4px; '
-                f'padding: 3px 6px;">'
-                f'<span style="color: {text_color}; font-weight: bold; font-family: Arial;">'
-                f'{well_text}'
-                f'</span></div>'
-            )
-            hover_text_item.setHtml(html_text)
-            hover_text_item.setPos(float(self._hover_points.x[well_idx]), float(self._hover_points.y[well_idx]))
-            hover_text_item.show()
-
+            well = self._show_hover_text(hover_text_item, well_idx)
             if self._store is not None:
                 self._store.set_hover(well)
 
@@ -124,23 +114,7 @@ class RegressionInteraction:
                     else:
                         self._store.set_selection({well})
                     self._store.set_hover(well)
-                text_color = "#FFFFFF"  # Beyaz yazı
-                bg_color = "rgba(40, 44, 52, 200)"  # Yarı saydam koyu arka plan
-                border_color = "#FFD700"  # Altın sarısı çerçeve (Ampul rengi)
-
-                well_text = t("regression.plot.hover.well_no", well=well)
-                html_text = (
-                    f'<div style="background-color: {bg_color}; '
-                    f'border: 1px solid {border_color}; '
-                    f'border-radius: 4px; '
-                    f'padding: 3px 6px;">'
-                    f'<span style="color: {text_color}; font-weight: bold; font-family: Arial;">'
-                    f'{well_text}'
-                    f'</span></div>'
-                )
-                hover_text_item.setHtml(html_text)
-                hover_text_item.setPos(float(self._hover_points.x[well_idx]), float(self._hover_points.y[well_idx]))
-                hover_text_item.show()
+                self._show_hover_text(hover_text_item, well_idx)
                 mouse_evt.accept()
                 return
 
@@ -152,6 +126,30 @@ class RegressionInteraction:
         plot_item.scene().sigMouseClicked.connect(on_mouse_clicked)
         self._click_proxy = (plot_item.scene().sigMouseClicked, on_mouse_clicked)
 
+    def _show_hover_text(self, hover_text_item: pg.TextItem, well_idx: int) -> str:
+        """Etiketi noktaya taşır; HTML yalnızca kuyu değişince yeniden kurulur."""
+        well = self._hover_points.wells[well_idx] if well_idx < self._hover_points.wells.size else ""
+        if well != self._text_well:
+            text_color = "#FFFFFF"  # Beyaz yazı
+            bg_color = "rgba(40, 44, 52, 200)"  # Yarı saydam koyu arka plan
+            border_color = "#FFD700"  # Altın sarısı çerçeve (Ampul rengi)
+
+            well_text = t("regression.plot.hover.well_no", well=well)
+            html_text = (
+                f'<div style="background-color: {bg_color}; '
+                f'border: 1px solid {border_color}; '
+                f'border-radius: 4px; '
+                f'padding: 3px 6px;">'
+                f'<span style="color: {text_color}; font-weight: bold; font-family: Arial;">'
+                f'{well_text}'
+                f'</span></div>'
+            )
+            hover_text_item.setHtml(html_text)
+            hover_text_item.setPos(float(self._hover_points.x[well_idx]), float(self._hover_points.y[well_idx]))
+            self._text_well = well
+        hover_text_item.show()
+        return well
+
     def _nearest_well_index(self, mx: float, my: float, plot_item: pg.PlotItem) -> int | None:
         dx = self._hover_points.x - mx
         dy = self._hover_points.y - my
@@ -162,8 +160,7 @@ class RegressionInteraction:
 
         i = int(np.argmin(d2))
 
-        xr = plot_item.viewRange()[0]
-        yr = plot_item.viewRange()[1]
+        xr, yr = plot_item.viewRange()
         thresh = ((xr[1] - xr[0]) * 0.01) ** 2 + ((yr[1] - yr[0]) * 0.01) ** 2
         if float(d2[i]) > float(thresh):
             return None
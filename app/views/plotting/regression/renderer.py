@@ -3,18 +3,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pyqtgraph as pg
 
 from app.services.regression_plot_service import RegressionPlotData
 from app.views.plotting.regression.adapters import (
     HoverPoints,
     ScatterHandle,
-    SeriesBuildResult,
     build_regression_line_item,
     build_safe_band_items,
-    build_series_items,
+    build_series_handle,
+    collect_hover_points,
+    set_safe_band_data,
+    set_series_data,
 )
-from app.views.plotting.regression.styles import RegressionPlotStyle, make_brush, make_pen
+from app.views.plotting.regression.styles import RegressionPlotStyle
 
 
 @dataclass
@@ -24,31 +27,68 @@ class RegressionRenderResult:
     scatter_handles: list[ScatterHandle]
 
 
+_EMPTY = np.array([], dtype=float)
+_UNSET = object()
+
+
 class RegressionRenderer:
+    """
+    Retained-mode regresyon çizimi: bant, regresyon çizgisi ve seri başına üç scatter
+    item'ı bir kez kurulur, sonraki render'larda setData ile güncellenir. Seçim ve
+    hover yalnızca değişen overlay'e dokunur; hover tek noktalık item'ı taşır.
+    """
+
     def __init__(self, style: RegressionPlotStyle):
         self._style = style
+        self._band_items: list[pg.GraphicsObject] = []
+        self._line_item: pg.PlotDataItem | None = None
+        self._handles: dict[str, ScatterHandle] = {}
         self._scatter_handles: list[ScatterHandle] = []
         self._hover_points: HoverPoints = HoverPoints.empty()
+        self._hover_well: object = _UNSET
+        self._hover_handle: ScatterHandle | None = None
 
     @property
     def hover_points(self) -> HoverPoints:
         return self._hover_points
 
     def render(self, data: RegressionPlotData) -> RegressionRenderResult:
-        self._scatter_handles = []
-        self._hover_points = HoverPoints.empty()
+        self._hover_well = _UNSET
+        if self._hover_handle is not None:
+            self._hover_handle.hover_item.hide()
+            self._hover_handle = None
 
         if data.reg_line.x_sorted.size == 0:
+            # Boş veri: item'lar bırakılır (çağıran sahneden kaldırır)
+            self._band_items = []
+            self._line_item = None
+            self._handles = {}
+            self._scatter_handles = []
+            self._hover_points = HoverPoints.empty()
             return RegressionRenderResult(items=[], hover_points=self._hover_points, scatter_handles=[])
 
-        items: list[pg.GraphicsObject] = []
-        items.extend(build_safe_band_items(data.safe_band, self._style))
-        items.append(build_regression_line_item(data.reg_line, self._style))
-
-        series_result: SeriesBuildResult = build_series_items(data.series, self._style)
-        items.extend(series_result.scatter_items)
-        self._scatter_handles = series_result.scatter_handles
-        self._hover_points = series_result.hover_points
+        if self._band_items:
+            set_safe_band_data(self._band_items, data.safe_band)
+        else:
+            self._band_items = build_safe_band_items(data.safe_band, self._style)
+
+        if self._line_item is not None:
+            self._line_item.setData(data.reg_line.x_sorted, data.reg_line.y_pred_sorted)
+        else:
+            self._line_item = build_regression_line_item(data.reg_line, self._style)
+
+        handles: dict[str, ScatterHandle] = {}
+        for s in data.series:
+            handle = self._handles.get(s.label) or build_series_handle(s.label, self._style)
+            set_series_data(handle, s)
+            handles[s.label] = handle
+        self._handles = handles
+        self._scatter_handles = list(handles.values())
+        self._hover_points = collect_hover_points(self._scatter_handles)
+
+        items: list[pg.GraphicsObject] = [*self._band_items, self._line_item]
+        for handle in self._scatter_handles:
+            items.extend(handle.items())
 
         return RegressionRenderResult(
             items=items,
@@ -57,61 +97,41 @@ class RegressionRenderer:
         )
 
     def update_styles(self, selected_wells: set[str] | None, hover_well: str | None) -> None:
-        selected_wells = selected_wells or set()
+        self.update_selection(selected_wells)
+        self.update_hover(hover_well)
+
+    def update_selection(self, selected_wells: set[str] | None) -> None:
+        """Seçili kuyular seri başına tek isin maskesiyle bulunur; pen/brush item'da sabittir."""
+        keys = np.array(list(selected_wells), dtype=str) if selected_wells else None
 
         for handle in self._scatter_handles:
-            # ---- Selected overlay ----
-            if selected_wells:
-                idxs: list[int] = []
-                for w in selected_wells:
-                    i = handle.well_to_index.get(w)
-                    if i is not None:
-                        idxs.append(i)
-
-                if idxs:
-                    sel_x = handle.x[idxs]
-                    sel_y = handle.y[idxs]
-
-                    base = handle.base_brush
-                    if len(base) == 4:
-                        r, g, b, a = base
-                        bright = (min(r + 60, 255), min(g + 60, 255), min(b + 60, 255), a)
-                    else:
-                        r, g, b = base
-                        bright = (min(r + 60, 255), min(g + 60, 255), min(b + 60, 255))
-
-                    handle.selected_item.setData(
-                        x=sel_x,
-                        y=sel_y,
-                        size=self._style.scatter_size + 4,
-                        brush=make_brush(bright),
-                        pen=make_pen(handle.selection_pen, width=4),
-                    )
-                else:
-                    handle.selected_item.setData(x=[], y=[])
-            else:
-                handle.selected_item.setData(x=[], y=[])
-
-            # ---- Hover overlay (single point) ----
-            if hover_well is not None:
-                hi = handle.well_to_index.get(hover_well)
-                if hi is not None:
-                    base = handle.base_brush
-                    if len(base) == 4:
-                        r, g, b, a = base
-                        bright = (min(r + 80, 255), min(g + 80, 255), min(b + 80, 255), a)
-                    else:
-                        r, g, b = base
-                        bright = (min(r + 80, 255), min(g + 80, 255), min(b + 80, 255))
-
-                    handle.hover_item.setData(
-                        x=[float(handle.x[hi])],
-                        y=[float(handle.y[hi])],
-                        size=self._style.scatter_size + 7,
-                        brush=make_brush(bright),
-                        pen=make_pen(handle.selection_pen, width=4),
-                    )
-                else:
-                    handle.hover_item.setData(x=[], y=[])
-            else:
-                handle.hover_item.setData(x=[], y=[])
+            if keys is None or handle.wells.size == 0:
+                handle.selected_item.setData(x=_EMPTY, y=_EMPTY)
+                continue
+            mask = np.isin(handle.wells, keys)
+            handle.selected_item.setData(x=handle.x[mask], y=handle.y[mask])
+
+    def update_hover(self, hover_well: str | None) -> None:
+        """Hover değişince yalnızca önceki ve yeni overlay güncellenir (veri yeniden kurulmaz)."""
+        if hover_well == self._hover_well:
+            return
+        self._hover_well = hover_well
+
+        target: ScatterHandle | None = None
+        index = None
+        if hover_well is not None:
+            for handle in self._scatter_handles:
+                index = handle.well_to_index.get(hover_well)
+                if index is not None:
+                    target = handle
+                    break
+
+        previous = self._hover_handle
+        if previous is not None and previous is not target:
+            previous.hover_item.hide()
+        self._hover_handle = target
+        if target is None:
+            return
+
+        target.hover_item.setPos(float(target.x[index]), float(target.y[index]))
+        target.hover_item.show()
@@ -6,16 +6,35 @@ import pyqtgraph as pg
 from app.constants.regression_plot_style import RegressionPlotStyle, SeriesStyle
 
 
+# Aynı renk/kalınlık için tek nesne: hover/seçim güncellemelerinde yeni pen/brush üretilmez.
+# Paylaşılan nesneler değiştirilmemelidir.
+_PEN_CACHE: dict[tuple[tuple[int, ...], int], pg.QtGui.QPen] = {}
+_BRUSH_CACHE: dict[tuple[int, ...], pg.QtGui.QBrush] = {}
+
+
 def make_pen(color: tuple[int, ...], width: int = 1) -> pg.QtGui.QPen:
-    return pg.mkPen(*color, width=width)
+    key = (tuple(color), width)
+    pen = _PEN_CACHE.get(key)
+    if pen is None:
+        pen = _PEN_CACHE[key] = pg.mkPen(*color, width=width)
+    return pen
 
 
 def make_brush(color: tuple[int, ...]) -> pg.QtGui.QBrush:
-    return pg.mkBrush(*color)
+    key = tuple(color)
+    brush = _BRUSH_CACHE.get(key)
+    if brush is None:
+        brush = _BRUSH_CACHE[key] = pg.mkBrush(*color)
+    return brush
+
+
+def brighten(color: tuple[int, ...], amount: int) -> tuple[int, ...]:
+    """RGB kanallarını amount kadar açar (alfa korunur)."""
+    return tuple(min(c + amount, 255) for c in color[:3]) + tuple(color[3:])
 
 
 def get_series_style(style: RegressionPlotStyle, label: str) -> SeriesStyle | None:
     return style.series.get(label)
 
 
-__all__ = ["RegressionPlotStyle", "SeriesStyle", "get_series_style", "make_pen", "make_brush"]
\ No newline at end of file
+__all__ = ["RegressionPlotStyle", "SeriesStyle", "brighten", "get_series_style", "make_pen", "make_brush"]
\ No newline at end of file
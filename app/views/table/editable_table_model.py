@@ -1,20 +1,26 @@
 # app\views\table\editable_table_model.py
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, Iterable, List, Optional
 
 import pandas as pd
-from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
 from PyQt5.QtGui import QBrush, QColor
 
+from app.services.result_schema import ensure_category
+
 
 class EditableTableModel(QAbstractTableModel):
+    # (satır, kolon adı, yeni değer): kullanıcı düzenlemesi, DataStore'a controller yazar
+    cellEdited = pyqtSignal(int, str, object)
+
     INSUFFICIENT_DNA = "Yetersiz DNA"
     EMPTY_WELL = "Boş Kuyu"
     OUTLIER = "Riskli Alan"
     SAFE_ZONE = "Güvenli Bölge"
 
     PATIENT_NO_COL = "Hasta No"
+    THRESHOLD_COLUMNS = ("İstatistik Oranı", "Standart Oranı")
 
     def __init__(
         self,
@@ -136,9 +142,13 @@ class EditableTableModel(QAbstractTableModel):
             return False
 
         if index.column() == self.dropdown_column:
+            if self._data.iloc[index.row(), index.column()] == value:
+                return False
+            ensure_category(self._data, str(self._data.columns[index.column()]), value)
             self._data.iloc[index.row(), index.column()] = value
             # ✅ dropdown renge de etki ediyor; BackgroundRole dahil
             self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+            self.cellEdited.emit(index.row(), str(self._data.columns[index.column()]), value)
             return True
 
         return False
@@ -173,6 +183,48 @@ class EditableTableModel(QAbstractTableModel):
             self.uncertain_range = float(uncertain_range)
         self.endResetModel()
 
+    def set_thresholds(self, carrier_range: float, uncertain_range: float) -> None:
+        """Eşik değişimi yalnızca oran kolonlarının arka plan rengini etkiler."""
+        carrier_range = float(carrier_range)
+        uncertain_range = float(uncertain_range)
+        if carrier_range == self.carrier_range and uncertain_range == self.uncertain_range:
+            return
+        self.carrier_range = carrier_range
+        self.uncertain_range = uncertain_range
+
+        if not len(self._data):
+            return
+        last_row = len(self._data) - 1
+        for cname in self.THRESHOLD_COLUMNS:
+            if cname in self._data.columns:
+                col = self._data.columns.get_loc(cname)
+                self.dataChanged.emit(self.index(0, col), self.index(last_row, col), [Qt.BackgroundRole])
+
+    def update_column(self, column: str, values: pd.Series, rows: Optional[Iterable[int]] = None) -> None:
+        """
+        Tek kolonu (gerekirse yalnızca verilen satırları) günceller ve
+        sadece etkilenen hücre aralığı için dataChanged yayar.
+        """
+        if column not in self._data.columns or len(values) != len(self._data):
+            return
+        col = self._data.columns.get_loc(column)
+        target = range(len(self._data)) if rows is None else sorted({int(r) for r in rows})
+
+        changed: List[int] = []
+        for r in target:
+            if r < 0 or r >= len(self._data):
+                continue
+            new = values.iloc[r]
+            old = self._data.iloc[r, col]
+            if (pd.isna(new) and pd.isna(old)) or new == old:
+                continue
+            self._data.iloc[r, col] = new
+            changed.append(r)
+
+        if changed:
+            roles = [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole]
+            self.dataChanged.emit(self.index(changed[0], col), self.index(changed[-1], col), roles)
+
     # ---- TableInteractionController helper ----
     def get_patient_no(self, row: int):
         """
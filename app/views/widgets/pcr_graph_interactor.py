@@ -4,6 +4,8 @@ from __future__ import annotations
 import logging
 from typing import Optional, Set
 
+from app.services.curve_transforms import CurveMode
+from app.services.graph.pcr_graph_layout_service import PCRGraphLayoutService
 from app.services.interaction_store import InteractionStore
 from app.services.pcr_data_service import PCRDataService
 from app.utils import well_mapping
@@ -38,38 +40,86 @@ class PCRGraphInteractor:
         self.store.hoverChanged.connect(self._on_hover_changed)
         self._apply_current_state()
 
+    def set_curve_mode(self, mode) -> None:
+        """
+        Gösterim modunu değiştirir. Türetilmiş veri servis tarafında sürüm başına
+        önbelleklenir; mod değişince token değiştiği için plaka yeniden yüklenir.
+        """
+        self.renderer.apply_curve_mode(mode)
+        if self.data_service is None or not self.data_service.set_curve_mode(mode):
+            return
+        self._apply_current_state()
+
+    def play_run(self, *, cycles_per_second: float = 8.0) -> None:
+        """
+        Tüm plakayı etkin gösterimde döngü döngü oynatır. Kareler curve tensöründen
+        tek geçişte hazırlanır; oynatma sırasında veri servisine dönülmez.
+        """
+        if self.data_service is None:
+            logger.warning("PCRGraphInteractor: data_service ayarlanmadı, oynatma yapılamıyor.")
+            return
+        try:
+            store = self.data_service.get_display_store()
+        except Exception as exc:
+            logger.warning("PCR eğrileri alınamadı: %s", exc, exc_info=True)
+            return
+        if store.values.size == 0:
+            return
+
+        raw = self.renderer._curve_mode is CurveMode.RAW
+        frames = PCRGraphLayoutService.build_playback(
+            store.cycles,
+            store.values,
+            start_x=float(store.cycles[0]),
+            min_y_floor=4500.0 if raw else 0.0,
+            y_padding=500.0 if raw else 0.0,
+        )
+        self.renderer.start_playback(frames, cycles_per_second=cycles_per_second)
+
     def dispose(self) -> None:
         self._disconnect_store()
         self.store = None
 
     # ---- signal handlers ----
     def _on_selection_changed(self, wells: Set[str]) -> None:
+        """
+        Plakanın tüm kuyuları veri versiyonu başına bir kez yüklenir; seçim
+        yalnızca gösterilen kuyuları değiştirir (sahne sıfırlanmaz).
+        """
         if self.data_service is None:
             logger.warning("PCRGraphInteractor: data_service ayarlanmadı, render yapılamıyor.")
             self.renderer.reset()
             return
 
         normalized_wells = {w for w in wells if well_mapping.is_valid_well_id(w)}
-        if not normalized_wells:
+        if not normalized_wells and self._last_cache_token is None:
+            # Havuz henüz yüklenmedi; gösterilecek bir şey yok
             self._last_selection = set()
-            self._last_cache_token = None
-            self.renderer.reset()
             return
 
         try:
-            data = self.data_service.get_coords_for_wells(normalized_wells)
             cache_token = self.data_service.get_cache_token()
+            data = None
+            if cache_token != self._last_cache_token:
+                data = self.data_service.get_coords_for_wells(well_mapping.all_well_ids())
         except Exception as exc:
             logger.warning("PCR koordinatları alınamadı: %s", exc, exc_info=True)
+            self._last_selection = set()
+            self._last_cache_token = None
             self.renderer.reset()
             return
 
-        if normalized_wells == self._last_selection and cache_token == self._last_cache_token:
+        if data is not None:
+            self._last_selection = normalized_wells
+            self._last_cache_token = cache_token
+            self.renderer.render_wells(data, cache_token=cache_token, shown=normalized_wells)
+            return
+
+        if normalized_wells == self._last_selection:
             return
 
         self._last_selection = normalized_wells
-        self._last_cache_token = cache_token
-        self.renderer.render_wells(data, cache_token=cache_token)
+        self.renderer.show_wells(normalized_wells)
 
     def _on_hover_changed(self, well: Optional[str]) -> None:
         normalized = well if well_mapping.is_valid_well_id(well) else None
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from app.constants.pcr_graph_style import PCRGraphStyle
+from app.services.curve_transforms import CurveMode
 from app.services.interaction_store import InteractionStore
 from app.services.pcr_data_service import PCRDataService
 from app.views.widgets.pcr_graph_interactor import PCRGraphInteractor
@@ -28,3 +29,11 @@ class PCRGraphView(PCRGraphRendererPG):
         """
         self._interactor.set_interaction_store(store=store, data_service=data_service)
 
+
+    def set_curve_mode(self, mode: CurveMode | str) -> None:
+        """Eğri gösterimini değiştirir (ham, baz çizgisi, normalize, log, türev)."""
+        self._interactor.set_curve_mode(mode)
+
+    def play_run(self, *, cycles_per_second: float = 8.0) -> None:
+        """Plakayı döngü döngü oynatır; stop_playback ile durdurulur."""
+        self._interactor.play_run(cycles_per_second=cycles_per_second)
@@ -6,7 +6,7 @@ import pandas as pd
 import pyqtgraph as pg
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 
-from app.services.regression_plot_service import RegressionPlotService
+from app.services.regression_plot_service import RegressionPlotData, RegressionPlotService
 from app.views.plotting.pyqtgraph_regression_renderer import PyqtgraphRegressionRenderer
 from app.views.plotting.regression.styles import RegressionPlotStyle
 from app.services.interaction_store import InteractionStore
@@ -93,7 +93,10 @@ class RegressionGraphView(QWidget):
             self.plot_item.addLegend(offset=(10, 10))
 
     def update(self, df: pd.DataFrame):
-        data = RegressionPlotService.build(df)
+        self.render_data(RegressionPlotService.build(df))
+
+    def render_data(self, data: RegressionPlotData) -> None:
+        """Hazır plot verisini (ör. worker'da kurulmuş) çizer; DataFrame taranmaz."""
         self._last_data = data
         self._renderer.render(
             self.plot_item,
@@ -148,7 +151,7 @@ class RegressionGraphView(QWidget):
         return start, end
 
     def _on_store_selection_changed(self, wells):
-        self._renderer.update_styles(wells, self._store.hover_well if self._store else None)
+        self._renderer.update_selection(wells)
 
     def _on_store_hover_changed(self, well):
-        self._renderer.update_styles(self._store.selected_wells if self._store else set(), well)
\ No newline at end of file
+        self._renderer.update_hover(well)
\ No newline at end of file
@@ -0,0 +1,138 @@
+# app\views\widgets\threshold_sweep_view.py
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QComboBox, QDialog, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from app.constants.app_styles import COLOR_STYLES
+from app.services.threshold_sweep import CLASS_LABELS, ThresholdSweepResult
+
+
+class ThresholdSweepView(QDialog):
+    """
+    Eşik tarama ısı haritası.
+    x: belirsiz aralığı, y: taşıyıcı aralığı. Hücre değeri seçili metriğe göre
+    sınıf değiştiren kuyu sayısı ya da sınıf sayımıdır. Tıklanan hücrede sınıfı
+    değişen kuyular alt bilgide listelenir.
+    """
+
+    _FLIP_METRIC = "Sınıf Değişimi"
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setWindowTitle("Eşik Duyarlılık Taraması")
+        self.resize(720, 560)
+
+        self._result: Optional[ThresholdSweepResult] = None
+
+        self.metric_combo = QComboBox(self)
+        self.metric_combo.addItems([self._FLIP_METRIC, *CLASS_LABELS])
+        self.metric_combo.currentIndexChanged.connect(self._refresh_image)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground(COLOR_STYLES.PLOT_BG_HEX)
+        self.plot_item = self.plot_widget.getPlotItem()
+        self.plot_item.setLabel("bottom", "Belirsiz aralığı")
+        self.plot_item.setLabel("left", "Taşıyıcı aralığı")
+        self.plot_item.getViewBox().setMouseEnabled(x=False, y=False)
+
+        self.image_item = pg.ImageItem(axisOrder="row-major")
+        self.image_item.setColorMap(pg.colormap.get("viridis"))
+        self.plot_item.addItem(self.image_item)
+
+        self.baseline_marker = pg.ScatterPlotItem(
+            size=12, symbol="+", pen=pg.mkPen("#FF4D4D", width=2), brush=None
+        )
+        self.baseline_marker.setZValue(10)
+        self.plot_item.addItem(self.baseline_marker)
+
+        self.info_label = QLabel(self)
+        self.info_label.setWordWrap(True)
+        self.info_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
+        top = QHBoxLayout()
+        top.addWidget(QLabel("Metrik:", self))
+        top.addWidget(self.metric_combo)
+        top.addStretch(1)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.plot_widget, 1)
+        layout.addWidget(self.info_label)
+
+        self.plot_widget.scene().sigMouseClicked.connect(self._on_mouse_clicked)
+
+    # ---- Public API ----
+    def set_result(self, result: ThresholdSweepResult) -> None:
+        self._result = result
+
+        c, u = result.carrier_values, result.uncertain_values
+        x0, x1 = float(u.min()), float(u.max())
+        y0, y1 = float(c.min()), float(c.max())
+        dx = (x1 - x0) / max(u.size - 1, 1)
+        dy = (y1 - y0) / max(c.size - 1, 1)
+        # Hücre merkezleri ızgara değerlerine denk gelsin
+        self.image_item.setRect(x0 - dx / 2, y0 - dy / 2, dx * u.size, dy * c.size)
+
+        self.baseline_marker.setData([result.baseline[1]], [result.baseline[0]])
+        self._refresh_image()
+        self._show_cell_info(*self._baseline_cell())
+
+    # ---- Internals ----
+    def _metric_matrix(self) -> np.ndarray:
+        assert self._result is not None
+        metric = self.metric_combo.currentText()
+        if metric == self._FLIP_METRIC:
+            data = self._result.flip_counts
+        else:
+            data = self._result.class_counts(metric)
+        return np.where(self._result.valid, data, np.nan).astype(float)
+
+    def _refresh_image(self) -> None:
+        if self._result is None:
+            return
+        data = self._metric_matrix()
+        finite = data[np.isfinite(data)]
+        hi = float(finite.max()) if finite.size else 1.0
+        self.image_item.setImage(data, autoLevels=False, levels=(0.0, max(hi, 1.0)))
+
+    def _baseline_cell(self) -> tuple[int, int]:
+        assert self._result is not None
+        c0, u0 = self._result.baseline
+        i = int(np.abs(self._result.carrier_values - c0).argmin())
+        j = int(np.abs(self._result.uncertain_values - u0).argmin())
+        return i, j
+
+    def _on_mouse_clicked(self, event) -> None:
+        if self._result is None:
+            return
+        vb = self.plot_item.getViewBox()
+        if not vb.sceneBoundingRect().contains(event.scenePos()):
+            return
+        p = vb.mapSceneToView(event.scenePos())
+        i = int(np.abs(self._result.carrier_values - p.y()).argmin())
+        j = int(np.abs(self._result.uncertain_values - p.x()).argmin())
+        self._show_cell_info(i, j)
+
+    def _show_cell_info(self, i: int, j: int) -> None:
+        r = self._result
+        if r is None:
+            return
+        c = float(r.carrier_values[i])
+        u = float(r.uncertain_values[j])
+        if not r.valid[i, j]:
+            self.info_label.setText(f"Taşıyıcı {c:.4f} / Belirsiz {u:.4f}: geçersiz (taşıyıcı ≥ belirsiz)")
+            return
+
+        counts = ", ".join(f"{label}: {int(r.counts[i, j, k])}" for k, label in enumerate(CLASS_LABELS))
+        flipped = r.flipped_wells(i, j)
+        wells = ", ".join(flipped.tolist()) if flipped.size else "-"
+        self.info_label.setText(
+            f"Taşıyıcı {c:.4f} / Belirsiz {u:.4f} — {counts}\n"
+            f"Sınıfı değişen kuyular ({int(r.flip_counts[i, j])}): {wells}"
+        )
@@ -4,6 +4,7 @@ from __future__ import annotations
 import sys
 import logging
 
+import pandas as pd
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication
@@ -17,6 +18,9 @@ from app.bootstrap.warmup import run_warmup
 from app.licensing.ui import ensure_license_or_exit
 from app.constants.asset_paths import IMAGE_PATHS
 
+from app.services.curve_archive import CurveArchive
+from app.services.result_cache import ResultCache
+from app.services.history.history_service import HistoryService
 from app.controllers.main_controller import MainController
 from app.models.main_model import MainModel
 from app.views.main_view import MainView
@@ -31,6 +35,10 @@ logger = logging.getLogger(__name__)
 def configure_app() -> AppSettings:
     settings = AppSettings.from_env()
 
+    # DataStore snapshot'ları sığ kopyalarla paylaşılır; pandas 3'te varsayılan
+    if int(pd.__version__.split(".", 1)[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
     # i18n init (explicit, no side-effects)
     init_i18n()
 
@@ -73,7 +81,15 @@ def main() -> int:
         except Exception:
             pass
 
-    model = MainModel()
+    model = MainModel(
+        curve_budget_bytes=settings.session_curve_budget_mb * 1024 * 1024,
+        curve_archive=CurveArchive.default(),
+        low_memory=settings.low_memory,
+        result_cache=ResultCache.default(settings.result_cache_mb * 1024 * 1024),
+        history=HistoryService.default(),
+        session_curve_bits=settings.session_curve_bits,
+        channel_pairs=settings.channel_pairs,
+    )
     app.aboutToQuit.connect(model.shutdown)
 
     if settings.warmup_enabled:
@@ -0,0 +1,497 @@
+# scripts\bench_rendering.py
+"""
+PCR grafiği ve regresyon görünümü için offscreen render ölçümü.
+
+Kullanım:
+    QT_QPA_PLATFORM=offscreen python scripts/bench_rendering.py [--repeat 30] [--plates 4] [--out rapor.json]
+
+Sentetik (sigmoid + gürültü) eğrilerle PCRGraphRendererPG, uygulamadaki
+etkileşimci gibi sürülür: havuz yükleme (render_wells), seçim (show_wells),
+hover, sürükleyerek seçim ve kanal aç/kapa; çoklu plakada plaka geçişi.
+Karşılaştırma senaryosunda aktif plakanın altına çok sayıda 384 kuyuluk plaka
+bindirilir ve yakınlaştırma/kaydırma (zarf piramidinden seviye seçimi) ölçülür.
+Oynatma senaryosunda 96/384 kuyunun döngü döngü oynatılmasında kare başına
+ilerletme ve boyama süresi ölçülür (60 fps için kare bütçesi ~16 ms).
+Her işlem için gecikme (boyama kapalıyken olay kuyruğu boşaltılana kadar) ve
+ardından zorlanan senkron boyamanın süresi ayrı ayrı yüzdelik olarak raporlanır.
+
+Renderer yalnızca 96 kuyuluk plaka düzenini (A01-H12) çizer; 384 kuyu
+senaryosu Qt'siz geometri (indeks kurma, hover/dikdörtgen isabet testi) ve
+regresyon görünümü üzerinden ölçülür. Süreler milisaniyedir.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+from time import perf_counter
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+
+CYCLES = 40
+CLASSES = ("Sağlıklı", "Taşıyıcı", "Belirsiz")
+
+
+# ---- sentetik veri ----
+def _curves(n: int, cycles: int, seed: int) -> np.ndarray:
+    """(kuyu, kanal, döngü) float32 amplifikasyon eğrileri; ~%8 kuyu NTC (düz)."""
+    rng = np.random.default_rng(seed)
+    x = np.arange(1, cycles + 1, dtype=np.float64)
+    ct = rng.uniform(18.0, 32.0, (n, 2, 1))
+    amp = rng.uniform(1500.0, 9000.0, (n, 2, 1))
+    amp[rng.random(n) < 0.08] = 0.0
+    base = rng.uniform(100.0, 400.0, (n, 2, 1))
+    y = base + amp / (1.0 + np.exp(-(x - ct) / 1.6)) + rng.normal(0.0, 25.0, (n, 2, cycles))
+    return y.astype(np.float32)
+
+
+def _plate(seed: int, cycles: int):
+    from app.services.pcr_data_service import PCRCoords
+    from app.utils import well_mapping
+
+    wells = sorted(well_mapping.all_well_ids(), key=well_mapping.well_id_to_patient_no)
+    values = _curves(len(wells), cycles, seed)
+    x = np.arange(1, cycles + 1, dtype=np.float32)
+    return {w: PCRCoords(x, values[i, 0], values[i, 1]) for i, w in enumerate(wells)}
+
+
+def _regression_frame(n: int, seed: int):
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    hex_end = rng.uniform(2000.0, 8000.0, n)
+    fam_end = 0.8 * hex_end + rng.normal(0.0, 300.0, n)
+    return pd.DataFrame(
+        {
+            "hex_end_rfu": hex_end,
+            "fam_end_rfu": fam_end,
+            "Kuyu No": [f"{chr(65 + (i // 12) % 8)}{i % 12 + 1:02d}" for i in range(n)],
+            "Nihai Sonuç": rng.choice(CLASSES, n),
+            "Regresyon": np.where(rng.random(n) < 0.9, "Güvenli Bölge", "Riskli Alan"),
+        }
+    )
+
+
+# ---- ölçüm ----
+class Recorder:
+    def __init__(self) -> None:
+        self.samples: Dict[str, Dict[str, List[float]]] = {}
+
+    def add(self, op: str, kind: str, ms: float) -> None:
+        self.samples.setdefault(op, {}).setdefault(kind, []).append(ms)
+
+    def report(self) -> dict:
+        out = {}
+        for op, kinds in self.samples.items():
+            out[op] = {kind: _stats(values) for kind, values in kinds.items()}
+        return out
+
+
+def _stats(values: List[float]) -> dict:
+    arr = np.asarray(values, dtype=float)
+    p50, p90, p99 = np.percentile(arr, [50, 90, 99])
+    return {
+        "n": int(arr.size),
+        "mean": round(float(arr.mean()), 3),
+        "p50": round(float(p50), 3),
+        "p90": round(float(p90), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(arr.max()), 3),
+    }
+
+
+class Surface:
+    """Ölçülen görünüm: gecikme boyamasız, boyama ayrıca ve senkron ölçülür."""
+
+    def __init__(self, view, flush: Callable[[], None] | None = None):
+        self.viewport = view.viewport()
+        self._flush = flush
+
+    def paint(self) -> None:
+        self.viewport.setUpdatesEnabled(True)
+        if self._flush is not None:
+            self._flush()
+        self.viewport.repaint()
+
+
+def _timed(app, rec: Recorder, op: str, fn: Callable[[], None], surface: Surface | None) -> None:
+    # Kuyruklu sinyaller (ör. önizleme) gecikmeye dahil; boyama olayları değil
+    if surface is not None:
+        surface.viewport.setUpdatesEnabled(False)
+    t0 = perf_counter()
+    fn()
+    app.processEvents()
+    rec.add(op, "latency_ms", (perf_counter() - t0) * 1e3)
+    if surface is not None:
+        t0 = perf_counter()
+        surface.paint()
+        rec.add(op, "paint_ms", (perf_counter() - t0) * 1e3)
+
+
+def _pcr_surface(renderer) -> Surface:
+    def flush() -> None:
+        # Çizim zamanlayıcısını beklemeden bekleyen çizimi boşalt
+        if renderer._render_timer.isActive():  # noqa
+            renderer._render_timer.stop()  # noqa
+        renderer._flush_pending_render()  # noqa
+
+    return Surface(renderer, flush)
+
+
+def bench_pcr(app, *, batched: bool, plates: int, repeat: int, cycles: int, seed: int) -> dict:
+    from app.services.interaction_store import InteractionStore
+    from app.views.plotting.pcr_graph_pg.renderer import PCRGraphRendererPG
+
+    rng = np.random.default_rng(seed)
+    data = [_plate(seed + k, cycles) for k in range(max(plates, 1))]
+    wells = sorted(data[0])
+
+    renderer = PCRGraphRendererPG(batched=batched)
+    renderer.resize(1000, 700)
+    renderer.show()
+    # Ölçülen işlemin kendisi; sürükleme kısıtlaması (throttle) ayrıca raporlanır
+    drag_throttle_ms = renderer._drag_throttle_ms  # noqa
+    renderer._drag_throttle_ms = 0  # noqa
+    store = InteractionStore()
+    renderer.bind_interaction_store(store)
+    store.hoverChanged.connect(renderer.set_hover)
+    surface = _pcr_surface(renderer)
+    rec = Recorder()
+    token = 0
+
+    def load(plate: dict, shown) -> None:
+        nonlocal token
+        token += 1
+        renderer.render_wells(plate, cache_token=token, shown=shown)
+
+    def reload(op: str, plate: dict) -> None:
+        # render_wells yalnızca UI thread'i; geometri arka planda, bekleme ayrıca
+        surface.viewport.setUpdatesEnabled(False)
+        _timed(app, rec, op, lambda: load(plate, wells), None)
+        t0 = perf_counter()
+        renderer.wait_for_geometry()
+        app.processEvents()
+        rec.add(op, "geometry_wait_ms", (perf_counter() - t0) * 1e3)
+        t0 = perf_counter()
+        surface.paint()
+        rec.add(op, "paint_ms", (perf_counter() - t0) * 1e3)
+
+    # ısınma
+    load(data[0], wells)
+    renderer.wait_for_geometry()
+    app.processEvents()
+    surface.paint()
+
+    for _ in range(max(repeat // 4, 3)):
+        reload("render_wells", data[0])
+
+    for _ in range(repeat):
+        sel = set(rng.choice(wells, size=int(rng.integers(1, len(wells) + 1)), replace=False))
+        _timed(app, rec, "select", lambda: (store.set_selection(sel), renderer.show_wells(sel)), surface)
+    store.set_selection(wells)
+    renderer.show_wells(wells)
+    app.processEvents()
+
+    geoms = renderer._well_geoms  # noqa
+    for _ in range(repeat):
+        well = wells[int(rng.integers(len(wells)))]
+        pts = geoms[well]["fam"] if geoms[well]["fam"].size else geoms[well]["hex"]
+        if pts.size == 0:
+            continue
+        x, y = pts[int(rng.integers(len(pts)))]
+        _timed(app, rec, "hover", lambda: renderer.handle_hover((float(x), float(y))), surface)
+        _timed(app, rec, "set_hover", lambda: renderer.set_hover(wells[int(rng.integers(len(wells)))]), surface)
+    _timed(app, rec, "hover", lambda: renderer.handle_hover(None), surface)
+
+    (x_min, x_max), (y_min, y_max) = renderer._view_box.viewRange()  # noqa
+    for _ in range(max(repeat // 10, 1)):
+        x0, y0 = rng.uniform(x_min, x_max), rng.uniform(y_min, y_max)
+        for step in np.linspace(0.05, 1.0, 10):
+            x1 = x0 + step * (x_max - x0)
+            y1 = y0 + step * (y_max - y0)
+            _timed(app, rec, "drag", lambda: renderer.handle_drag((x0, y0), (x1, y1), finished=False), surface)
+        _timed(app, rec, "drag_end", lambda: renderer.handle_drag((x0, y0), (x1, y1), finished=True), surface)
+
+    for k in range(max(repeat // 5, 2)):
+        fam, hex_ = [(False, True), (True, False), (True, True)][k % 3]
+        _timed(app, rec, "channel_toggle", lambda: renderer.set_channel_visibility(fam, hex_), surface)
+    renderer.set_channel_visibility(True, True)
+
+    if len(data) > 1:
+        for k in range(max(repeat // 4, len(data))):
+            reload("plate_switch", data[k % len(data)])
+
+    total_points = sum(int(np.isfinite(c.fam_y).sum() + np.isfinite(c.hex_y).sum()) for c in data[0].values())
+    result = {
+        "mode": "batched" if batched else "per_well",
+        "wells": len(wells),
+        "plates": len(data),
+        "points_per_plate": total_points,
+        "large_dataset": bool(renderer._large_dataset),  # noqa
+        "frame_interval_ms": renderer._frame_interval_ms,  # noqa
+        "drag_throttle_ms": drag_throttle_ms,
+        "ops": rec.report(),
+    }
+    renderer.close()
+    renderer.deleteLater()
+    app.processEvents()
+    return result
+
+
+def _compare_stores(count: int, wells: int, cycles: int, seed: int) -> dict:
+    import pandas as pd
+
+    from app.services.curve_store import CurveStore
+    from app.services.well_index import WellIndex
+
+    x = np.arange(1, cycles + 1, dtype=np.float32)
+    ids = [f"{r}{c:02d}" for r in "ABCDEFGHIJKLMNOP" for c in range(1, 25)][:wells]
+    index = WellIndex.build(pd.DataFrame({"Kuyu No": ids}))
+    return {
+        f"P{k + 1}": CurveStore(version=k, cycles=x, values=_curves(len(ids), cycles, seed + 100 + k), wells=index)
+        for k in range(count)
+    }
+
+
+def bench_compare(app, *, plates: int, repeat: int, cycles: int, seed: int) -> dict:
+    from app.views.plotting.pcr_graph_pg.renderer import PCRGraphRendererPG
+
+    rng = np.random.default_rng(seed)
+    stores = _compare_stores(plates, 384, cycles, seed)
+    active = _plate(seed, cycles)
+    wells = sorted(active)
+
+    renderer = PCRGraphRendererPG()
+    renderer.resize(1000, 700)
+    renderer.show()
+    renderer.render_wells(active, cache_token=1, shown=wells[:8])
+    renderer.wait_for_geometry()
+    app.processEvents()
+    surface = _pcr_surface(renderer)
+    rec = Recorder()
+
+    def set_range(x_range, y_range) -> None:
+        renderer._view_box.setRange(xRange=x_range, yRange=y_range, padding=0)  # noqa
+        renderer._tick_update_timer.stop()  # noqa
+        renderer._flush_pending_ticks()  # noqa
+
+    for _ in range(max(repeat // 10, 2)):
+        _timed(app, rec, "set_compare_plates", lambda: renderer.set_compare_plates(stores), surface)
+
+    (x_min, x_max), (y_min, y_max) = renderer._view_box.viewRange()  # noqa
+    for _ in range(repeat):
+        # Rastgele yakınlaştırma (tüm görünümden ~%2 genişliğe)
+        zoom = float(rng.uniform(0.02, 1.0))
+        cx, cy = rng.uniform(x_min, x_max), rng.uniform(0, y_max)
+        half_x, half_y = zoom * (x_max - x_min) / 2, zoom * (y_max - y_min) / 2
+        _timed(app, rec, "zoom", lambda: set_range((cx - half_x, cx + half_x), (cy - half_y, cy + half_y)), surface)
+        for step in range(5):
+            dy = (step + 1) * half_y * 0.2
+            _timed(app, rec, "pan", lambda: set_range((cx - half_x, cx + half_x), (cy - half_y + dy, cy + half_y + dy)), surface)
+
+    result = {
+        "plates": plates,
+        "curves": int(sum(p.pyramids[c].curve_count for p in renderer._compare_plates for c in p.pyramids)),  # noqa
+        "curve_budget": renderer._style.compare_curve_budget,  # noqa
+        "ops": rec.report(),
+    }
+    renderer.close()
+    renderer.deleteLater()
+    app.processEvents()
+    return result
+
+
+def bench_playback(app, *, wells: int, repeat: int, cycles: int, seed: int) -> dict:
+    from app.services.graph.pcr_graph_layout_service import PCRGraphLayoutService
+    from app.views.plotting.pcr_graph_pg.renderer import PCRGraphRendererPG
+
+    renderer = PCRGraphRendererPG()
+    renderer.resize(1000, 700)
+    renderer.show()
+    renderer.render_wells(_plate(seed, cycles), cache_token=1)
+    renderer.wait_for_geometry()
+    app.processEvents()
+    surface = _pcr_surface(renderer)
+    rec = Recorder()
+
+    x = np.arange(1, cycles + 1, dtype=np.float32)
+    values = _curves(wells, cycles, seed)
+    t0 = perf_counter()
+    frames = PCRGraphLayoutService.build_playback(x, values, start_x=float(x[0]))
+    rec.add("build_playback", "latency_ms", (perf_counter() - t0) * 1e3)
+
+    renderer.start_playback(frames, cycles_per_second=1.0)
+    renderer._render_timer.stop()  # noqa
+    steps = max(repeat * 4, frames.frames)
+    for step in range(steps):
+        # Konum zamandan okunur; kareler tüm oynatmayı kesirli adımlarla tarar
+        position = step * (frames.frames - 1) / steps
+        renderer._playback.started = perf_counter() - position  # noqa
+        _timed(app, rec, "frame", lambda: renderer._flush_pending_render(), surface)  # noqa
+        renderer._render_timer.stop()  # noqa
+    renderer.stop_playback()
+
+    result = {"wells": wells, "frames": frames.frames, "segments": int(frames.offsets[:, -1].sum() // 2), "ops": rec.report()}
+    renderer.close()
+    renderer.deleteLater()
+    app.processEvents()
+    return result
+
+
+def bench_geometry(*, wells: int, repeat: int, cycles: int, seed: int) -> dict:
+    from app.services.pcr_data_service import PCRCoords
+    from app.views.plotting.pcr_graph_pg.geometry import build_geometry, nearest_well, wells_in_rect
+
+    rng = np.random.default_rng(seed)
+    values = _curves(wells, cycles, seed)
+    x = np.arange(1, cycles + 1, dtype=np.float32)
+    data = {f"W{i:04d}": PCRCoords(x, values[i, 0], values[i, 1]) for i in range(wells)}
+    rec = Recorder()
+
+    for _ in range(max(repeat // 4, 3)):
+        t0 = perf_counter()
+        geo = build_geometry(1, data)
+        rec.add("build_geometry", "latency_ms", (perf_counter() - t0) * 1e3)
+
+    y_max = float(np.nanmax(values))
+    tol_x, tol_y = 0.1, y_max / 300.0  # ~1000x700 px görünümde birkaç piksel
+    for _ in range(repeat):
+        px, py = rng.uniform(1, cycles), rng.uniform(0, y_max)
+        t0 = perf_counter()
+        nearest_well(geo.index, geo.well_geoms, px, py, tol_x, tol_y, fam_visible=True, hex_visible=True)
+        rec.add("hover_hit_test", "latency_ms", (perf_counter() - t0) * 1e3)
+
+        x0, y0 = rng.uniform(1, cycles), rng.uniform(0, y_max)
+        x1, y1 = x0 + rng.uniform(1, cycles / 2), y0 + rng.uniform(0, y_max / 2)
+        t0 = perf_counter()
+        wells_in_rect(geo.index, geo.well_geoms, x0, x1, y0, y1, fam_visible=True, hex_visible=True)
+        rec.add("rect_hit_test", "latency_ms", (perf_counter() - t0) * 1e3)
+
+    return {"wells": wells, "segments": int(len(geo.index.seg)) if geo.index else 0, "ops": rec.report()}
+
+
+def bench_regression(app, *, rows: int, repeat: int, seed: int) -> dict:
+    from app.services.interaction_store import InteractionStore
+    from app.services.regression_plot_service import RegressionPlotService
+    from app.views.widgets.regression_graph_view import RegressionGraphView
+
+    rng = np.random.default_rng(seed)
+    plot_data = RegressionPlotService.build(_regression_frame(rows, seed))
+    view = RegressionGraphView()
+    view.resize(700, 700)
+    view.show()
+    store = InteractionStore()
+    view.set_interaction_store(store)
+    surface = Surface(view.plot_widget)
+    wells = sorted({str(w) for s in plot_data.series for w in s.wells})
+    rec = Recorder()
+
+    view.render_data(plot_data)
+    app.processEvents()
+    surface.paint()
+
+    for _ in range(max(repeat // 4, 3)):
+        _timed(app, rec, "render", lambda: view.render_data(plot_data), surface)
+    for _ in range(repeat):
+        sel = set(rng.choice(wells, size=int(rng.integers(1, len(wells) + 1)), replace=False))
+        _timed(app, rec, "select", lambda: store.set_selection(sel), surface)
+        _timed(app, rec, "hover", lambda: store.set_hover(wells[int(rng.integers(len(wells)))]), surface)
+
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return {"rows": rows, "ops": rec.report()}
+
+
+def _environment() -> dict:
+    import pyqtgraph as pg
+    from PyQt5 import QtCore
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt": QtCore.QT_VERSION_STR,
+        "pyqt": QtCore.PYQT_VERSION_STR,
+        "pyqtgraph": pg.__version__,
+        "numpy": np.__version__,
+        "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+    }
+
+
+def _print_summary(report: dict) -> None:
+    for name, scenario in report["scenarios"].items():
+        print(f"[{name}]")
+        for op, kinds in scenario["ops"].items():
+            cols = "  ".join(f"{kind[:-3]} p50 {s['p50']:7.2f} p99 {s['p99']:7.2f}" for kind, s in kinds.items())
+            print(f"  {op:16}{cols}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=30, help="işlem başına örnek sayısı")
+    parser.add_argument("--plates", type=int, default=4, help="çoklu plaka senaryosundaki plaka sayısı")
+    parser.add_argument("--compare-plates", type=int, default=20, help="karşılaştırma senaryosundaki 384 kuyuluk plaka sayısı")
+    parser.add_argument("--cycles", type=int, default=CYCLES, help="döngü sayısı (nokta yoğunluğu)")
+    parser.add_argument("--mode", choices=("batched", "per_well", "both"), default="both")
+    parser.add_argument("--antialias", choices=("on", "off"), default="on", help="kenar yumuşatma (uygulama açılışta açar)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", default="bench_rendering.json", help="JSON rapor yolu")
+    args = parser.parse_args(argv)
+
+    import pyqtgraph as pg
+    from PyQt5 import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    antialias = args.antialias == "on"
+    pg.setConfigOptions(antialias=antialias)
+    modes = (True, False) if args.mode == "both" else (args.mode == "batched",)
+
+    scenarios = {}
+    for batched in modes:
+        label = "batched" if batched else "per_well"
+        scenarios[f"pcr96_{label}"] = bench_pcr(
+            app, batched=batched, plates=1, repeat=args.repeat, cycles=args.cycles, seed=args.seed
+        )
+        scenarios[f"pcr96x{args.plates}_{label}"] = bench_pcr(
+            app, batched=batched, plates=args.plates, repeat=args.repeat, cycles=args.cycles, seed=args.seed
+        )
+    scenarios[f"compare384x{args.compare_plates}"] = bench_compare(
+        app, plates=args.compare_plates, repeat=args.repeat, cycles=args.cycles, seed=args.seed
+    )
+    for wells in (96, 384):
+        scenarios[f"playback{wells}"] = bench_playback(app, wells=wells, repeat=args.repeat, cycles=args.cycles, seed=args.seed)
+    for wells in (96, 384):
+        scenarios[f"geometry{wells}"] = bench_geometry(wells=wells, repeat=args.repeat, cycles=args.cycles, seed=args.seed)
+    # RegressionGraphView kenar yumuşatmayı global açar; bu yüzden en sonda
+    for rows in (96, 384):
+        scenarios[f"regression{rows}"] = bench_regression(app, rows=rows, repeat=args.repeat, seed=args.seed)
+
+    report = {
+        "environment": _environment(),
+        "params": {
+            "repeat": args.repeat,
+            "plates": args.plates,
+            "compare_plates": args.compare_plates,
+            "cycles": args.cycles,
+            "antialias": antialias,
+            "seed": args.seed,
+        },
+        "scenarios": scenarios,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    _print_summary(report)
+    print(f"rapor: {os.path.abspath(args.out)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
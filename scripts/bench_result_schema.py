@@ -0,0 +1,158 @@
+# scripts\bench_result_schema.py
+"""
+Düşük bellek sonuç şeması ölçümü (çoklu plaka oturumu).
+
+Kullanım:
+    python scripts/bench_result_schema.py [--plates 8] [rdml ...]
+
+Her şema (full / lean) ayrı bir alt süreçte ölçülür; RSS farkı yalnızca
+tutulan sonuç frame'lerini yansıtır. Etiket karşılaştırma hızı tüm plakaların
+birleştirilmiş frame'i üzerinde ölçülür.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import glob
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+COMPARISONS = (
+    ("Regresyon", "Güvenli Bölge"),
+    ("Uyarı", "Boş Kuyu"),
+    ("Yazılım Hasta Sonucu", "Sağlıklı"),
+    ("Nihai Sonuç", "Taşıyıcı"),
+)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource  # Unix; peak RSS (KB)
+
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+
+
+def _analyze(path: str):
+    from app.services.analysis_service import AnalysisService
+    from app.services.data_store import DataStore
+    from app.services.rdml_service import RDMLService
+
+    DataStore.set_df(RDMLService.rdml_to_dataframe(path), notify=False)
+    if not AnalysisService().run():
+        raise RuntimeError(f"Analiz başarısız: {path}")
+    return DataStore.get_df()
+
+
+def _measure(schema: str, paths: list[str]) -> dict:
+    import contextlib
+    import io
+
+    import pandas as pd
+
+    from app.services.curve_store import CurveStore
+    from app.services.data_store import DataStore
+    from app.services.result_schema import compact_result_frame, frame_nbytes
+
+    # Analiz adımlarının konsol çıktısını sustur; parse/analiz ısınması
+    with contextlib.redirect_stdout(io.StringIO()):
+        _analyze(paths[0])
+    DataStore.clear(notify=False)
+    gc.collect()
+    rss_before = _rss_bytes()
+
+    frames = []
+    curves = []
+    for path in paths:
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = _analyze(path)
+        if schema == "lean":
+            # lean modda eğriler CurveStore'da kalır, koordinat stringleri atılır
+            curves.append(CurveStore.from_frame(df, version=0))
+            df = compact_result_frame(df, drop_coordinates=True)
+        else:
+            df = df.copy(deep=True)
+        frames.append(df)
+    DataStore.clear(notify=False)
+    gc.collect()
+    rss_after = _rss_bytes()
+
+    combined = pd.concat(frames, ignore_index=True)
+    if schema == "lean":
+        combined = compact_result_frame(combined)
+
+    timings = {}
+    for col, label in COMPARISONS:
+        if col not in combined.columns:
+            continue
+        series = combined[col]
+        timings[col] = min(timeit.repeat(lambda: series == label, number=200, repeat=5)) / 200
+
+    return {
+        "schema": schema,
+        "plates": len(paths),
+        "rows": int(len(combined)),
+        "frame_bytes": sum(frame_nbytes(f) for f in frames),
+        "curve_bytes": sum(c.nbytes for c in curves),
+        "rss_delta_bytes": rss_after - rss_before,
+        "eq_seconds": timings,
+    }
+
+
+def _run_child(schema: str, paths: list[str]) -> dict:
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", schema, *paths],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _mb(n: float) -> str:
+    return f"{n / (1024 * 1024):8.2f} MB"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("rdml", nargs="*", help="RDML dosyaları (varsayılan: depo kökündeki *.rdml)")
+    parser.add_argument("--plates", type=int, default=8, help="oturumdaki plaka sayısı (dosyalar döngüsel)")
+    parser.add_argument("--child", choices=("full", "lean"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_measure(args.child, args.rdml)))
+        return 0
+
+    files = args.rdml or sorted(glob.glob(os.path.join(ROOT, "*.rdml")))
+    if not files:
+        parser.error("RDML dosyası bulunamadı.")
+    paths = [files[i % len(files)] for i in range(max(args.plates, 1))]
+
+    full = _run_child("full", paths)
+    lean = _run_child("lean", paths)
+
+    print(f"plakalar: {full['plates']}  satır: {full['rows']}")
+    print(f"{'':22}{'full':>12}{'lean':>12}")
+    print(f"{'frame (deep)':22}{_mb(full['frame_bytes'])}{_mb(lean['frame_bytes'])}")
+    print(f"{'curve store':22}{_mb(full['curve_bytes'])}{_mb(lean['curve_bytes'])}")
+    print(f"{'RSS delta':22}{_mb(full['rss_delta_bytes'])}{_mb(lean['rss_delta_bytes'])}")
+    for col, t_full in full["eq_seconds"].items():
+        t_lean = lean["eq_seconds"].get(col)
+        if t_lean:
+            print(f"{col + ' ==':22}{t_full * 1e6:9.1f} µs{t_lean * 1e6:9.1f} µs  x{t_full / t_lean:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
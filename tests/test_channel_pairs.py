@@ -0,0 +1,98 @@
+# tests\test_channel_pairs.py
+from __future__ import annotations
+
+import ast
+import contextlib
+import io
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.analysis_steps.calculate_regression import CalculateRegression
+from app.services.analysis_steps.channel_pairs import ChannelPair, ChannelPairEngine, parse_pairs
+from app.services.analysis_steps.csv_processor import CSVProcessor
+
+
+def _coords(end: float) -> str:
+    return f"[(1, {end / 4}), (2, {end / 2}), (3, {end})]"
+
+
+def _raw(n: int = 96, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    fam = rng.uniform(2000, 6000, n)
+    hex_ = 0.8 * fam + rng.normal(0, 150, n)
+    cy5 = rng.uniform(1500, 5000, n)
+    return pd.DataFrame(
+        {
+            "React ID": np.arange(1, n + 1),
+            "Barkot No": [f"B{i}" for i in range(n)],
+            "Hasta Adı": [""] * n,
+            "FAM Ct": rng.uniform(20, 26, n),
+            "HEX Ct": rng.uniform(20, 26, n),
+            "CY5 Ct": rng.uniform(20, 26, n),
+            "FAM koordinat list": [_coords(v) for v in fam],
+            "HEX koordinat list": [_coords(v) for v in hex_],
+            "CY5 koordinat list": [_coords(v) for v in cy5],
+        }
+    )
+
+
+def _regression(df: pd.DataFrame, pairs) -> pd.DataFrame:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return CalculateRegression(pairs).process(CSVProcessor.process(df, pairs))
+
+
+class ChannelPairTests(unittest.TestCase):
+    def test_parse(self) -> None:
+        self.assertEqual(ChannelPair.parse("fam/hex"), ChannelPair("FAM", "HEX"))
+        self.assertEqual(parse_pairs([("CY5", "HEX"), "CY5/HEX"]), (ChannelPair("CY5", "HEX"),))
+        self.assertEqual(parse_pairs(None)[0].label, "FAM/HEX")
+        with self.assertRaises(ValueError):
+            ChannelPair.parse("FAM/FAM")
+
+    def test_all_pairs_match_single_pair_runs(self) -> None:
+        raw = _raw()
+        pairs = parse_pairs(["FAM/HEX", "CY5/HEX"])
+        multi = _regression(raw.copy(), pairs)
+        fam_only = _regression(raw.drop(columns=["CY5 Ct", "CY5 koordinat list"]), parse_pairs(["FAM/HEX"]))
+        cy5_only = _regression(raw.copy(), parse_pairs(["CY5/HEX"]))
+
+        for col in ("Δ Ct", "rfu_diff", "fam_end_rfu", "hex_end_rfu", "Regresyon"):
+            pd.testing.assert_series_equal(multi[col], fam_only[col])
+        np.testing.assert_array_equal(multi["CY5/HEX Δ Ct"], cy5_only["Δ Ct"])
+        self.assertEqual(multi["CY5/HEX Regresyon"].tolist(), cy5_only["Regresyon"].tolist())
+        expected_end = [ast.literal_eval(v)[-1][-1] for v in raw["CY5 koordinat list"]]
+        self.assertEqual(multi["cy5_end_rfu"].tolist(), expected_end)
+
+    def test_warnings_follow_each_pairs_own_channels(self) -> None:
+        raw = _raw()
+        raw.loc[0, "CY5 Ct"] = 35.0  # yalnızca ikincil kanal zayıf
+        raw.loc[1, "FAM Ct"] = np.nan
+        raw.loc[2, "CY5 koordinat list"] = _coords(500.0)
+        out = CSVProcessor.process(raw, parse_pairs(["FAM/HEX", "CY5/HEX"]))
+
+        self.assertEqual(out["Uyarı"].iloc[:3].tolist(), [None, "Yetersiz DNA", None])
+        self.assertEqual(out["CY5/HEX Uyarı"].iloc[:3].tolist(), ["Yetersiz DNA", None, "Düşük RFU Değeri"])
+
+        regression = _regression(raw, parse_pairs(["FAM/HEX", "CY5/HEX"]))
+        self.assertNotEqual(regression["Regresyon"].iloc[0], "-")
+        self.assertEqual(regression["CY5/HEX Regresyon"].iloc[0], "-")
+
+    def test_safe_zones_columns_are_independent(self) -> None:
+        rng = np.random.default_rng(4)
+        x = rng.uniform(1000, 5000, (96, 3))
+        y = 0.9 * x + rng.normal(0, 80, (96, 3))
+        y[:5] += 3000  # aykırı değerler
+        valid = np.ones_like(x, dtype=bool)
+        valid[40:, 2] = False  # 40 satır: MAD yolu
+
+        together = ChannelPairEngine.safe_zones(x, y, valid)
+        for k in range(3):
+            alone = ChannelPairEngine.safe_zones(x[:, [k]], y[:, [k]], valid[:, [k]])
+            np.testing.assert_array_equal(together[:, k], alone[:, 0])
+        self.assertFalse(together[:5, :2].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests\test_curve_archive.py
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.curve_archive import CurveArchive
+from app.services.curve_store import FAM, HEX, CurveStore
+
+
+def _store(scale: float) -> CurveStore:
+    df = pd.DataFrame(
+        {
+            "Kuyu No": ["A01", "A02", "B01"],
+            "FAM koordinat list": [f"[(1, {scale}), (2, {2 * scale})]", "", f"[(1, {3 * scale})]"],
+            "HEX koordinat list": [f"[(1, {-scale}), (2, 0.5)]", "", "[(2, 7.0)]"],
+        }
+    )
+    return CurveStore.from_frame(df, version=1)
+
+
+class CurveArchiveTests(unittest.TestCase):
+    def test_append_only_roundtrip_with_memmap(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            archive = CurveArchive(root)
+            first, second = _store(1.0), _store(10.0)
+
+            archive.append("plate-1", first)
+            with open(archive.data_path, "rb") as f:
+                head = f.read()
+            archive.append("plate-2", second)
+
+            # Yeni plaka mevcut baytları yeniden yazmaz
+            with open(archive.data_path, "rb") as f:
+                self.assertEqual(f.read(len(head)), head)
+
+            reopened = CurveArchive(root)
+            self.assertEqual(sorted(reopened.keys()), ["plate-1", "plate-2"])
+
+            for key, src in (("plate-1", first), ("plate-2", second)):
+                mapped = reopened.open(key)
+                self.assertTrue(mapped.is_mapped)
+                self.assertEqual(mapped.resident_nbytes, 0)
+                np.testing.assert_array_equal(mapped.cycles, src.cycles)
+                np.testing.assert_array_equal(mapped.values, src.values)
+                self.assertEqual(mapped.row_of_patient(9), 1)  # A02 -> Hasta No 9
+                del mapped
+
+            well = reopened.read_well("plate-2", "b01")
+            np.testing.assert_array_equal(well[FAM], second.values[2, FAM])
+            np.testing.assert_array_equal(well[HEX], second.values[2, HEX])
+            self.assertIsNone(reopened.open("missing"))
+
+    def test_reappend_and_budget_compact_the_data_file(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            archive = CurveArchive(root, compact_min_bytes=0)
+            block = archive.append("plate-1", _store(1.0)).nbytes
+            mapped = archive.open("plate-1")
+
+            # Aynı anahtar tekrar eklendikçe ölü alan sıkıştırılır; dosya sınırsız büyümez
+            for i in range(10):
+                archive.append("plate-1", _store(float(i)))
+                self.assertLessEqual(os.path.getsize(archive.data_path), 2 * block)
+            np.testing.assert_array_equal(CurveArchive(root).open("plate-1").values, _store(9.0).values)
+            np.testing.assert_array_equal(mapped.values, _store(1.0).values)  # açık memmap geçerli kalır
+            del mapped
+
+            # Canlı bloklar bütçeyi aşınca en eski eklenen atılır
+            archive.max_bytes = 2 * block
+            archive.append("plate-2", _store(2.0))
+            archive.append("plate-1", _store(1.0))
+            archive.append("plate-3", _store(3.0))
+            self.assertEqual(CurveArchive(root).keys(), ["plate-1", "plate-3"])
+            self.assertEqual(os.path.getsize(archive.data_path), 2 * block)
+            self.assertEqual([n for n in os.listdir(root) if n.endswith(".f32")], [os.path.basename(archive.data_path)])
+
+    def test_truncated_block_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            archive = CurveArchive(root)
+            archive.append("plate-1", _store(1.0))
+            with open(archive.data_path, "r+b") as f:
+                f.truncate(os.path.getsize(archive.data_path) - 4)
+
+            self.assertNotIn("plate-1", CurveArchive(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# tests\test_curve_codec.py
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.curve_codec import CurveCodec
+from app.services.curve_store import CurveStore
+from app.services.session_archive import ArchivedPlate, SessionArchive, SessionArchiveData
+from app.services.well_index import WellIndex
+
+
+def _store() -> CurveStore:
+    rng = np.random.default_rng(3)
+    cycles = np.arange(1, 41, dtype=np.float32)
+    sigmoid = 4000.0 / (1.0 + np.exp(-(cycles - 25.0) / 1.5))
+    values = (sigmoid[None, None, :] * rng.uniform(0.2, 1.5, (96, 2, 1)) + rng.normal(0, 5, (96, 2, 40)))
+    values = values.astype(np.float32)
+    values[3, 0, :5] = np.nan  # baştaki eksik döngüler
+    values[7, 1, 20] = np.nan  # aradaki eksik döngü
+    values[9, :, :] = np.nan  # boş kuyu
+    values[11, 0, :] = 123.0  # sabit eğri
+    df = pd.DataFrame({"Kuyu No": [f"{r}{c:02}" for c in range(1, 13) for r in "ABCDEFGH"]})
+    return CurveStore(version=1, cycles=cycles, values=values, wells=WellIndex.build(df))
+
+
+class CurveCodecTests(unittest.TestCase):
+    def test_error_is_bounded_and_missing_points_kept(self) -> None:
+        store = _store()
+        encoded = CurveCodec.encode(store, bits=16)
+        self.assertEqual(encoded.deltas.dtype, np.int16)
+        decoded = CurveCodec.decode(encoded, version=2, wells=store.wells)
+
+        np.testing.assert_array_equal(np.isnan(decoded.values), np.isnan(store.values))
+        finite = np.isfinite(store.values)
+        err = np.abs(decoded.values.astype(np.float64) - store.values)[finite]
+        bound = (encoded.max_error[..., None] + np.abs(store.values) * np.finfo(np.float32).eps)[finite]
+        self.assertTrue(np.all(err <= bound))
+        self.assertEqual(decoded.values[11, 0, 0], 123.0)
+
+        self.assertLess(CurveCodec.encode(store).nbytes, store.values.nbytes * 0.7)
+        for bits in (8, 32):
+            with self.assertRaises(ValueError):
+                CurveCodec.encode(store, bits=bits)
+
+    def test_session_archive_with_codec(self) -> None:
+        store = _store()
+        df = pd.DataFrame({"Kuyu No": list(store.wells.well_ids)})
+        data = SessionArchiveData(plates=(ArchivedPlate("r1", "", "x", df, curves=store),))
+
+        with tempfile.TemporaryDirectory() as root:
+            plain, packed = os.path.join(root, "a.pzsession"), os.path.join(root, "b.pzsession")
+            SessionArchive.save(plain, data)
+            SessionArchive.save(packed, data, curve_bits=16)
+            self.assertLess(os.path.getsize(packed), os.path.getsize(plain) * 0.6)
+            loaded = SessionArchive.load(packed).plates[0].curves
+
+        expected = CurveCodec.decode_values(CurveCodec.encode(store, bits=16))
+        np.testing.assert_array_equal(loaded.values, expected)
+        self.assertEqual(loaded.wells.row_of_well("H12"), 95)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# tests\test_curve_store.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.curve_store import CurveStore, FAM, HEX
+
+
+class CurveStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.df = pd.DataFrame(
+            {
+                "Kuyu No": ["A01", "B01", "C01"],
+                "FAM koordinat list": ["[(1, 10.5), (2, 20.0), (3, 30.0)]", "", "[(1, 1.0), (3, 3.0)]"],
+                "HEX koordinat list": ["[(1, -1.0), (2, -2.0), (3, -3.0)]", "[]", "[(1, 'x'), (2, 2.0)]"],
+            }
+        )
+
+    def test_tensor_layout_and_mask(self) -> None:
+        store = CurveStore.from_frame(self.df, version=1)
+        self.assertEqual(store.values.shape, (3, 2, 3))
+        self.assertEqual(store.values.dtype, np.float32)
+        np.testing.assert_array_equal(store.cycles, [1, 2, 3])
+
+        self.assertFalse(store.mask[1].any())  # boş kuyu
+        np.testing.assert_array_equal(store.mask[2, FAM], [True, False, True])
+        # bozuk öğe atlanır, geçerli olanlar korunur
+        np.testing.assert_array_equal(store.mask[2, HEX], [False, True, False])
+
+    def test_views_are_read_only_and_zero_copy(self) -> None:
+        store = CurveStore.from_frame(self.df, version=1)
+        coords = store.coords_at(0)
+        self.assertTrue(np.shares_memory(coords.fam_y, store.values))
+        self.assertFalse(coords.fam_y.flags.writeable)
+        np.testing.assert_allclose(coords.fam, [[1, 10.5], [2, 20.0], [3, 30.0]])
+
+        gathered = store.coords_for_rows([2, 0])
+        np.testing.assert_allclose(gathered[0].fam, [[1, 1.0], [3, 3.0]])
+        self.assertFalse(store.coords_at(1).has_fam)
+
+
+if __name__ == "__main__":
+    unittest.main()
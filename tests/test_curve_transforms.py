@@ -0,0 +1,55 @@
+# tests\test_curve_transforms.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from app.services.curve_transforms import CurveMode, CurveTransforms, TransformConfig
+
+
+class CurveTransformsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cycles = np.arange(1, 41, dtype=np.float32)
+        x = self.cycles.astype(np.float64)
+        sigmoid = 5000.0 / (1.0 + np.exp(-(x - 25.0) / 2.0))
+        fam = 100.0 + 2.0 * x + sigmoid
+        hex_ = np.full_like(x, 50.0)
+        hex_[10] = np.nan
+        self.values = np.stack([np.stack([fam, hex_]), np.stack([3.0 * x, np.full_like(x, np.nan)])]).astype(np.float32)
+
+    def test_raw_is_identity(self) -> None:
+        out = CurveTransforms.apply(self.cycles, self.values, CurveMode.RAW)
+        self.assertIs(out, self.values)
+
+    def test_baseline_removes_linear_drift(self) -> None:
+        out = CurveTransforms.apply(self.cycles, self.values, "baseline")
+        self.assertEqual(out.dtype, np.float32)
+        self.assertFalse(out.flags.writeable)
+        np.testing.assert_allclose(out[1, 0], 0.0, atol=1e-3)  # saf doğru
+        self.assertTrue(np.isnan(out[0, 1, 10]))  # eksik döngü NaN kalır
+        self.assertTrue(np.isnan(out[1, 1]).all())
+
+    def test_normalized_range(self) -> None:
+        out = CurveTransforms.apply(self.cycles, self.values, CurveMode.NORMALIZED)
+        self.assertAlmostEqual(float(np.nanmin(out[0, 0])), 0.0, places=5)
+        self.assertAlmostEqual(float(np.nanmax(out[0, 0])), 1.0, places=5)
+
+    def test_derivative_of_line_and_peak(self) -> None:
+        x = self.cycles.astype(np.float64)
+        y = np.stack([4.0 * x + 7.0])
+        d = CurveTransforms.savgol_derivative(x, y, window=7, order=2)
+        np.testing.assert_allclose(d, 4.0, atol=1e-9)
+
+        out = CurveTransforms.apply(self.cycles, self.values, CurveMode.DERIVATIVE)
+        self.assertEqual(int(np.nanargmax(out[0, 0])), 24)  # döngü 25 bükülme noktası
+
+    def test_invalid_config(self) -> None:
+        with self.assertRaises(ValueError):
+            TransformConfig(smooth_window=4)
+        with self.assertRaises(ValueError):
+            CurveMode.parse("cubic")
+
+
+if __name__ == "__main__":
+    unittest.main()
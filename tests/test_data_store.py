@@ -0,0 +1,101 @@
+# tests\test_data_store.py
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from app.services import data_store
+from app.services.data_store import ChangeKind, DataStore
+
+
+class DataStoreSnapshotTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        DataStore.clear()
+
+    def test_edit_is_copy_on_write(self) -> None:
+        DataStore.set_df(pd.DataFrame({"Kuyu No": ["A01", "B01"], "Nihai Sonuç": ["Sağlıklı", "Tekrar"]}))
+        before = DataStore.get_snapshot()
+
+        after = DataStore.set_cell(1, "Nihai Sonuç", "Taşıyıcı")
+
+        self.assertGreater(after.version, before.version)
+        self.assertEqual(before.df.loc[1, "Nihai Sonuç"], "Tekrar")
+        self.assertEqual(after.df.loc[1, "Nihai Sonuç"], "Taşıyıcı")
+        self.assertIs(DataStore.get_snapshot(), after)
+
+    def test_old_snapshot_survives_edit(self) -> None:
+        # Copy-on-write kapalıyken (pandas 2.x, main.py dışından kullanım) derin kopyaya düşülür
+        for cow in (True, False):
+            with self.subTest(copy_on_write=cow), mock.patch.object(data_store, "_copy_on_write", return_value=cow):
+                DataStore.set_df(pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]}))
+                before = DataStore.get_snapshot()
+
+                def step(df: pd.DataFrame) -> None:
+                    df.loc[0, "x"] = 99.0
+                    df.iloc[1, 1] = -1.0
+
+                after = DataStore.edit(step, columns=("x", "y"))
+                DataStore.set_cell(1, "x", 7.0)
+
+                self.assertEqual(before.df["x"].tolist(), [1.0, 2.0])
+                self.assertEqual(before.df["y"].tolist(), [3.0, 4.0])
+                self.assertEqual(after.df["x"].tolist(), [99.0, 2.0])
+                if not cow:
+                    self.assertFalse(np.shares_memory(before.column("y"), after.column("y")))
+
+    def test_edit_runs_outside_lock_and_retries_on_conflict(self) -> None:
+        DataStore.set_df(pd.DataFrame({"x": [1.0, 2.0], "y": [0.0, 0.0]}))
+        calls = []
+
+        def step(df: pd.DataFrame) -> None:
+            calls.append(df["y"].tolist())
+            if len(calls) == 1:
+                # fn sürerken araya giren yazım kilidi beklemez; edit yeni snapshot'ta tekrar çalışır
+                DataStore.set_cell(0, "y", 5.0)
+            df["x"] = df["x"] * 10
+
+        snap = DataStore.edit(step, columns=("x",))
+        self.assertEqual(calls, [[0.0, 0.0], [5.0, 0.0]])
+        self.assertEqual(snap.df["x"].tolist(), [10.0, 20.0])
+        self.assertEqual(snap.df["y"].tolist(), [5.0, 0.0])
+
+    def test_producer_mutation_does_not_leak(self) -> None:
+        df = pd.DataFrame({"x": [1.0, 2.0]})
+        snap = DataStore.set_df(df)
+        df.loc[0, "x"] = 99.0
+        self.assertEqual(snap.df.loc[0, "x"], 1.0)
+        self.assertFalse(snap.column("x").flags.writeable)
+
+    def test_column_edit_emits_typed_change(self) -> None:
+        DataStore.set_df(pd.DataFrame({"Hasta No": [1, 2], "Nihai Sonuç": ["Sağlıklı", "Tekrar"]}))
+        curve_version = DataStore.get_snapshot().columns_version("Hasta No")
+        events = []
+        DataStore.subscribe(events.append)
+        try:
+            DataStore.set_cell(0, "Nihai Sonuç", "Belirsiz")
+        finally:
+            DataStore.unsubscribe(events.append)
+
+        (change,) = events
+        self.assertEqual(change.kind, ChangeKind.COLUMNS)
+        self.assertEqual(change.columns, frozenset({"Nihai Sonuç"}))
+        self.assertEqual(change.rows, (0,))
+        self.assertFalse(change.touches(["Hasta No"]))
+        self.assertEqual(DataStore.get_snapshot().columns_version("Hasta No"), curve_version)
+
+    def test_snapshot_publishes_well_index(self) -> None:
+        DataStore.set_df(pd.DataFrame({"Kuyu No": ["A01", "A02", "B01"], "Nihai Sonuç": ["", "", ""]}))
+        wells = DataStore.get_snapshot().wells
+        self.assertEqual(wells.row_of_well("A02"), 1)
+        self.assertEqual(wells.row_of_patient(2), 2)  # B01 -> Hasta No 2
+        self.assertIsNone(wells.row_of_patient(96))
+
+        DataStore.set_cell(0, "Nihai Sonuç", "Tekrar")
+        self.assertIs(DataStore.get_snapshot().wells, wells)
+
+
+if __name__ == "__main__":
+    unittest.main()
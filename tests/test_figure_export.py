@@ -0,0 +1,87 @@
+# tests\test_figure_export.py
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from PyQt5 import QtGui, QtWidgets
+
+from app.constants.pcr_graph_style import PCRGraphStyle
+from app.services.curve_store import CurveStore
+from app.services.regression_plot_service import RegressionLine, RegressionPlotData, SafeBand, ScatterSeries
+from app.services.well_index import WellIndex
+from app.views.plotting.figure_export.exporter import FigureExporter, FigureJob, render_figure
+from app.views.plotting.figure_export.figures import PCRFigure, RegressionFigure, pcr_ylim
+
+
+def _app() -> QtWidgets.QApplication:
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(["test", "-platform", "offscreen"])
+
+
+class FigureExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = _app()
+        self.tmp = tempfile.TemporaryDirectory()
+        cycles = np.arange(1, 41, dtype=np.float32)
+        values = np.stack(
+            [np.stack([5000.0 / (1 + np.exp(-(cycles - ct) / 2)), cycles * 10.0]) for ct in (20.0, 25.0, 30.0)]
+        ).astype(np.float32)
+        values[2, 1, 5] = np.nan
+        wells = WellIndex.build(pd.DataFrame({"Kuyu No": ["A01", "A02", "B01"]}))
+        self.store = CurveStore(version=1, cycles=cycles, values=values, wells=wells)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def test_pcr_png_and_small_multiples(self) -> None:
+        figure = PCRFigure.from_store(self.store, title="Plaka 1", wells=["B01", "A01", "Z99"])
+        self.assertEqual(figure.wells, ("B01", "A01"))
+        # Grafikteki gibi: tepe + 500 pay, en az varsayılan üst sınır
+        self.assertEqual(pcr_ylim(figure, PCRGraphStyle()), (0.0, float(np.nanmax(figure.values)) + 500.0))
+
+        render_figure(FigureJob(figure, self._path("pcr.png"), size=(400, 300), scale=2.0))
+        image = QtGui.QImage(self._path("pcr.png"))
+        self.assertEqual((image.width(), image.height()), (800, 600))
+
+        grid = PCRFigure.from_store(self.store, title="Kuyular", small_multiples=True)
+        render_figure(FigureJob(grid, self._path("grid.svg"), size=(600, 400)))
+        with open(self._path("grid.svg"), encoding="utf-8") as f:
+            self.assertIn("<svg", f.read())
+
+    def test_exporter_runs_batch_off_thread(self) -> None:
+        data = RegressionPlotData(
+            safe_band=SafeBand(np.array([0.0, 1.0]), np.array([0.2, 1.2]), np.array([0.0, 0.8])),
+            reg_line=RegressionLine(np.array([0.0, 1.0]), np.array([0.1, 1.0])),
+            series=[ScatterSeries("Sağlıklı", np.array([0.2, 0.5]), np.array([0.3, 0.6]), np.array(["A01", "A02"]))],
+        )
+        jobs = [
+            FigureJob(RegressionFigure.from_data(data, title="Regresyon"), self._path("reg.png"), size=(300, 300)),
+            FigureJob(PCRFigure.from_store(self.store, title="PCR"), self._path("pcr.svg"), size=(300, 200)),
+        ]
+        exporter = FigureExporter(max_workers=2)
+        written, progress = [], []
+        exporter.finished.connect(written.extend)
+        exporter.progress.connect(lambda done, total: progress.append((done, total)))
+        exporter.export(jobs)
+        self.assertTrue(exporter.wait(30000))
+
+        self.assertEqual(sorted(written), sorted(job.path for job in jobs))
+        self.assertEqual(progress[-1], (2, 2))
+        self.assertFalse(exporter.busy)
+
+    def test_unsupported_format(self) -> None:
+        figure = PCRFigure.from_store(self.store, title="x")
+        with self.assertRaises(ValueError):
+            FigureJob(figure, self._path("pcr.jpg"))
+        with self.assertRaises(ValueError):
+            FigureJob(figure, self._path("pcr.png"), size=(0, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# tests\test_history_service.py
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from app.services.history.history_service import HistoryService
+
+
+def _plate(barcodes, results) -> pd.DataFrame:
+    n = len(barcodes)
+    return pd.DataFrame(
+        {
+            "Kuyu No": [f"A{i + 1:02}" for i in range(n)],
+            "Hasta No": np.arange(1, n + 1),
+            "Barkot No": barcodes,
+            "Hasta Adı": [""] * n,
+            "Uyarı": [None] * n,
+            "FAM Ct": np.linspace(20, 25, n),
+            "İstatistik Oranı": [0.9, np.nan, 0.5][:n],
+            "Nihai Sonuç": results,
+        }
+    )
+
+
+class HistoryServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.history = HistoryService(os.path.join(self._tmp.name, "history.sqlite3"))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_record_and_query(self) -> None:
+        self.history.record_run(
+            _plate(["111", "222", "333"], ["Sağlıklı", "Tekrar", "Taşıyıcı"]),
+            plate_name="plate-1",
+            config={"carrier_range": 0.5999, "checkbox_status": True},
+            run_key="k1",
+            analyzed_at=datetime(2025, 1, 15, 10, 0),
+        )
+        self.history.record_run(
+            _plate(["111", "444"], ["Taşıyıcı", "Sağlıklı"]),
+            plate_name="plate-2",
+            run_key="k2",
+            analyzed_at=datetime(2025, 2, 1, 9, 30),
+        )
+
+        rows = self.history.results_for_barcode("111")
+        self.assertEqual(rows["plate_name"].tolist(), ["plate-2", "plate-1"])
+        self.assertEqual(rows["final_result"].tolist(), ["Taşıyıcı", "Sağlıklı"])
+        self.assertTrue(pd.isna(self.history.results_for_barcode("222")["stat_ratio"].iloc[0]))
+
+        carriers = self.history.results_between(date(2025, 1, 1), date(2025, 1, 31), result="Taşıyıcı")
+        self.assertEqual(carriers["barcode"].tolist(), ["333"])
+
+        # Aynı run_key tekrar kaydedilirse eski kayıt değiştirilir
+        self.history.record_run(
+            _plate(["111", "222", "333"], ["Belirsiz", "Tekrar", "Taşıyıcı"]),
+            plate_name="plate-1",
+            run_key="k1",
+            analyzed_at=datetime(2025, 1, 15, 10, 0),
+        )
+        self.assertEqual(len(self.history.runs()), 2)
+        self.history.update_final_result("k1", "a03", "Yeni Numune")
+        self.assertEqual(self.history.results_for_barcode("333")["final_result"].tolist(), ["Yeni Numune"])
+
+    def test_empty_frame_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            self.history.record_run(pd.DataFrame(), plate_name="x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# tests\test_pcr_graph_batches.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtWidgets
+
+from app.services.interaction_store import InteractionStore
+from app.services.pcr_data_service import PCRCoords
+from app.views.plotting.pcr_graph_pg.batches_pg import BUCKETS, CurveBatch
+from app.views.plotting.pcr_graph_pg.renderer import PCRGraphRendererPG
+
+
+def _app() -> QtWidgets.QApplication:
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(["test", "-platform", "offscreen"])
+
+
+class CurveBatchAssignTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = _app()
+        self.batch = CurveBatch(items={bucket: pg.PlotDataItem(connect="finite") for bucket in BUCKETS})
+        cycles = np.arange(1, 4, dtype=float)
+        self.batch.set_curves(["A01", "A02", "A03"], [cycles] * 3, [cycles * k for k in (1, 2, 3)])
+
+    def _rows(self, bucket: str) -> np.ndarray:
+        # Satırlar (döngü + 1) uzunluğunda; NaN ayraçtan önceki ilk y değeri satırı tanıtır
+        y = self.batch.items[bucket].yData
+        return np.array([]) if y is None else y[:: self.batch.y.shape[1]]
+
+    def test_only_changed_buckets_are_rewritten(self) -> None:
+        self.assertTrue(self.batch.assign({"base": [2, 0, 1]}))
+        self.assertEqual(self.batch.members["base"], (0, 1, 2))
+        np.testing.assert_array_equal(self._rows("base"), [1.0, 2.0, 3.0])
+        self.assertFalse(self.batch.assign({"base": [0, 1, 2]}))
+
+        # Seçim değişince base boşalır; satırlar yeni kovalarına taşınır
+        self.assertTrue(self.batch.assign({"selected": [1], "inactive": [2, 0]}))
+        self.assertEqual(self.batch.members["base"], ())
+        self.assertEqual(len(self._rows("base")), 0)
+        np.testing.assert_array_equal(self._rows("selected"), [2.0])
+        np.testing.assert_array_equal(self._rows("inactive"), [1.0, 3.0])
+
+        # Yalnızca preview değişir; diğer kovaların tamponu aynı kalır
+        selected_y = self.batch.items["selected"].yData
+        self.assertTrue(self.batch.assign({"selected": [1], "inactive": [2], "preview": [0]}))
+        self.assertIs(self.batch.items["selected"].yData, selected_y)
+        np.testing.assert_array_equal(self._rows("preview"), [1.0])
+
+
+class ShowWellsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = _app()
+        self.wells = ["A01", "A02", "B01", "B02"]
+        cycles = np.arange(1, 11, dtype=float)
+        # Kuyular birbirinden uzak: isabet testi tek kuyuya düşer
+        self.data = {w: PCRCoords(cycles, cycles * 100.0 * (i + 1), cycles * 100.0 * (i + 1) + 50.0) for i, w in enumerate(self.wells)}
+        self.store = InteractionStore()
+
+    def _renderer(self, batched: bool) -> PCRGraphRendererPG:
+        renderer = PCRGraphRendererPG(batched=batched)
+        self.addCleanup(renderer.deleteLater)
+        renderer.resize(400, 300)
+        renderer.bind_interaction_store(self.store)
+        renderer.render_wells(self.data, cache_token=1)
+        self.assertTrue(renderer.wait_for_geometry(5000))
+        renderer._view_box.setRange(xRange=(0.0, 11.0), yRange=(0.0, 4200.0), padding=0.0)
+        return renderer
+
+    @staticmethod
+    def _bucket_wells(renderer: PCRGraphRendererPG, channel: str) -> dict:
+        batch = renderer._batches[channel]
+        wells = {row: well for well, row in batch.rows.items()}
+        return {bucket: {wells[row] for row in rows} for bucket, rows in batch.members.items() if rows}
+
+    def test_hidden_wells_leave_buckets_after_selection_change(self) -> None:
+        renderer = self._renderer(batched=True)
+        self.assertEqual(self._bucket_wells(renderer, "fam"), {"base": set(self.wells)})
+
+        self.store.set_selection({"A02", "B01"})
+        renderer.show_wells(["A01", "A02"])
+        for channel in ("fam", "hex"):
+            self.assertEqual(self._bucket_wells(renderer, channel), {"selected": {"A02"}, "inactive": {"A01"}})
+
+        self.store.set_selection(set())
+        renderer.show_wells(self.wells[1:])
+        self.assertEqual(self._bucket_wells(renderer, "fam"), {"base": {"A02", "B01", "B02"}})
+
+    def test_hidden_wells_are_not_hit_or_listed(self) -> None:
+        for batched in (True, False):
+            with self.subTest(batched=batched):
+                self.store.set_selection(set())
+                self.store.set_preview(set())
+                renderer = self._renderer(batched=batched)
+                renderer.show_wells(["A02", "B02"])
+
+                # Dikdörtgen seçimi ve hover gizli kuyuları atlar
+                renderer.handle_drag((0.0, 0.0), (11.0, 4200.0), finished=False)
+                self.assertEqual(self.store.preview_wells, {"A02", "B02"})
+                renderer.handle_drag((0.0, 0.0), (11.0, 4200.0), finished=True)
+
+                renderer.handle_hover((5.0, 500.0))  # A01 FAM
+                self.assertIsNone(self.store.hover_well)
+                renderer.handle_hover((5.0, 1000.0))  # A02 FAM
+                self.assertEqual(self.store.hover_well, "A02")
+
+                self.assertEqual(len(renderer._legend.items), 2)
+                renderer.show_wells([])
+                self.assertEqual(len(renderer._legend.items), 0)
+                renderer.handle_hover((5.0, 1000.0))
+                self.assertIsNone(self.store.hover_well)
+
+
+if __name__ == "__main__":
+    unittest.main()
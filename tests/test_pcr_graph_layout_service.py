@@ -0,0 +1,55 @@
+# tests\test_pcr_graph_layout_service.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from app.services.graph.pcr_graph_layout_service import PCRGraphLayoutService
+
+
+class SplitStaticAnimTests(unittest.TestCase):
+    def test_split_and_limits(self) -> None:
+        split = PCRGraphLayoutService.split_static_anim([(1, 10.0), (2, 20.0), (3, 6000.0)], [(1, 1.0), (4, 2.0)], start_x=3)
+        self.assertEqual((split.static_fam_x, split.static_fam_y), ([1, 2], [10.0, 20.0]))
+        self.assertEqual((split.anim_fam_x, split.anim_hex_x), ([3], [4]))
+        self.assertEqual(split.xlim, (0.0, 5.0))
+        self.assertEqual(split.ylim, (0.0, 6500.0))
+        self.assertEqual(split.frames, 2)
+
+        empty = PCRGraphLayoutService.split_static_anim([], [], start_x=3)
+        self.assertIsNone(empty.xlim)
+        self.assertEqual(empty.static_fam_x, [])
+
+
+class BuildPlaybackTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cycles = np.arange(1, 6, dtype=np.float32)
+        # (kuyu, kanal, döngü)
+        self.values = np.stack([np.stack([k * 1000.0 * self.cycles, -k * self.cycles]) for k in (1, 2)])
+        self.values[1, 0, 2] = np.nan
+
+    def test_offsets_are_prefixes_of_cycle_ordered_segments(self) -> None:
+        frames = PCRGraphLayoutService.build_playback(self.cycles, self.values, start_x=3)
+        self.assertEqual(frames.frames, 4)  # döngü 1-2 statik, 3..5 animasyon
+        # FAM: 2. kuyunun eksik noktasına değen iki segment atılır
+        np.testing.assert_array_equal(frames.offsets[0], [4, 6, 8, 12])
+        np.testing.assert_array_equal(frames.offsets[1], [4, 8, 12, 16])
+        self.assertFalse(np.isnan(frames.seg_y[0, :12]).any())
+
+        # Her segment ardışık iki döngüyü bağlar ve başlangıç döngüsüne göre sıralıdır
+        starts = frames.seg_x[1, 0::2]
+        np.testing.assert_array_equal(frames.seg_x[1, 1::2] - starts, 1.0)
+        self.assertTrue(np.all(np.diff(starts) >= 0))
+        self.assertEqual(frames.xlim, (0.0, 6.0))
+
+    def test_ylim_grows_with_revealed_cycles(self) -> None:
+        frames = PCRGraphLayoutService.build_playback(self.cycles, self.values, start_x=3, min_y_floor=0.0, y_padding=0.0)
+        # 3. döngüde 2. kuyunun FAM değeri eksik: üst sınır bir kare sabit kalır
+        np.testing.assert_allclose(frames.ylim[:, 1], [4000.0, 4000.0, 8000.0, 10000.0])
+        np.testing.assert_allclose(frames.ylim[:, 0], [-4.0, -6.0, -8.0, -10.0])
+        self.assertFalse(frames.seg_x.flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()
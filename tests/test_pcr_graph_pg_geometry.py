@@ -5,6 +5,7 @@ import unittest
 
 import numpy as np
 
+from app.services.pcr_data_service import PCRCoords
 from app.views.plotting.pcr_graph_pg import geometry
 
 
@@ -49,6 +50,31 @@ class GeometryPGTests(unittest.TestCase):
         miss = geometry.nearest_well(index, self.geoms, 10, 10, 0.1, 0.1, fam_visible=True, hex_visible=True)
         self.assertIsNone(miss)
 
+    def test_build_geometry_matches_per_well_geometry(self) -> None:
+        cycles = np.arange(1, 4, dtype=float)
+        nan = np.full(3, np.nan, dtype=np.float32)
+        data = {
+            "A01": PCRCoords(cycles, np.array([1, 2, 3], dtype=np.float32), np.array([2, np.nan, 4], dtype=np.float32)),
+            "A02": PCRCoords(cycles, nan, np.array([np.nan, 7, np.nan], dtype=np.float32)),
+            "A03": PCRCoords(cycles, nan, nan),
+        }
+        geo = geometry.build_geometry(5, data)
+
+        self.assertEqual(geo.token, 5)
+        self.assertEqual(geo.center_ids, ["A01", "A02"])
+        np.testing.assert_allclose(geo.centers, [[2.0, 2.4], [2.0, 7.0]])
+        self.assertEqual(geo.center_has_hex.tolist(), [True, True])
+        self.assertEqual(geo.peaks, {"A01": 4.0, "A02": 7.0})
+        self.assertEqual(geo.ylim(["A02", "A03"]), (0.0, 4500.0))
+        self.assertIsNone(geo.ylim(["A03"]))
+
+        # HEX boşluğu çizimdeki gibi eğriyi böler; tek nokta sıfır uzunluklu segmenttir
+        self.assertEqual(geo.index.wells, ["A01", "A02"])
+        self.assertEqual(len(geo.index.seg), 3)
+        self.assertIsNone(geometry.nearest_well(geo.index, geo.well_geoms, 2, 3, 0.1, 0.1, fam_visible=False, hex_visible=True))
+        self.assertEqual(geometry.nearest_well(geo.index, geo.well_geoms, 2, 7, 0.1, 0.1, fam_visible=False, hex_visible=True), "A02")
+        self.assertEqual(geometry.nearest_well(geo.index, geo.well_geoms, 2, 2, 0.1, 0.1, fam_visible=True, hex_visible=False), "A01")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
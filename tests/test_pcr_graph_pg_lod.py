@@ -0,0 +1,137 @@
+# tests\test_pcr_graph_pg_lod.py
+from __future__ import annotations
+
+import unittest
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+from PyQt5 import QtWidgets
+
+from app.constants.pcr_graph_style import PCRGraphStyle
+from app.services.curve_store import CurveStore
+from app.services.pcr_data_service import PCRCoords
+from app.services.well_index import WellIndex
+from app.utils import well_mapping
+from app.views.plotting.pcr_graph_pg.lod import band_arrays, build_pyramid, line_arrays
+from app.views.plotting.pcr_graph_pg.renderer import PCRGraphRendererPG
+
+
+def _app() -> QtWidgets.QApplication:
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(["test", "-platform", "offscreen"])
+
+
+class EnvelopePyramidTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cycles = np.arange(1, 6, dtype=np.float32)
+        amplitudes = np.array([5.0, 1.0, 4.0, 2.0, 3.0])
+        self.values = amplitudes[:, None] * self.cycles[None, :]
+        self.values[3, 2] = np.nan
+        self.wells = ["A01", "A02", "A03", "A04", "A05"]
+
+    def test_levels_reduce_to_single_envelope(self) -> None:
+        pyramid = build_pyramid(self.cycles, self.values, self.wells)
+        self.assertEqual(pyramid.wells, ("A02", "A04", "A05", "A03", "A01"))  # tepe değerine göre
+        self.assertEqual([len(level) for level in pyramid.levels], [5, 3, 2, 1])
+
+        top = pyramid.levels[-1]
+        np.testing.assert_allclose(top.lo[0], np.nanmin(self.values, axis=0))
+        np.testing.assert_allclose(top.hi[0], np.nanmax(self.values, axis=0))
+        # Alt seviye zarfları üst seviyenin içinde kalır
+        for fine, coarse in zip(pyramid.levels, pyramid.levels[1:]):
+            self.assertGreaterEqual(fine.ymin.min(), coarse.ymin.min())
+            self.assertLessEqual(fine.ymax.max(), coarse.ymax.max())
+
+    def test_pick_respects_budget_and_view(self) -> None:
+        pyramid = build_pyramid(self.cycles, self.values, self.wells)
+        level, nodes = pyramid.pick((-1.0, 100.0), budget=10)
+        self.assertEqual((level, len(nodes)), (0, 5))
+
+        level, nodes = pyramid.pick((-1.0, 100.0), budget=2)
+        self.assertEqual((level, len(nodes)), (2, 2))
+
+        # Yalnızca küçük genlikli eğriler görünür: ince seviye yeterli
+        level, nodes = pyramid.pick((-1.0, 2.5), budget=2)
+        self.assertEqual(level, 0)
+        self.assertEqual([pyramid.wells[i] for i in nodes], ["A02", "A04"])
+
+        np.testing.assert_array_equal(pyramid.rows_of(["A01", "Z99"]), [4])
+
+    def test_pick_skips_nodes_outside_x_range(self) -> None:
+        values = np.full((4, 5), np.nan)
+        values[0, :2] = [1.0, 2.0]  # döngü 1-2
+        values[1, 3:] = [1.5, 2.5]  # döngü 4-5
+        values[2:, :] = [[3.0] * 5, [4.0] * 5]
+        pyramid = build_pyramid(self.cycles, values, self.wells[:4])
+        np.testing.assert_array_equal(pyramid.levels[0].xmin, [1, 4, 1, 1])
+        np.testing.assert_array_equal(pyramid.levels[0].xmax, [2, 5, 5, 5])
+
+        # Y aralığı dördünü de kapsar; X penceresinde yalnızca üç eğri var ve bütçeye sığar
+        level, nodes = pyramid.pick((0.0, 10.0), budget=3, x_range=(3.5, 6.0))
+        self.assertEqual(level, 0)
+        self.assertEqual(sorted(pyramid.wells[i] for i in nodes), ["A02", "A03", "A04"])
+        level, _ = pyramid.pick((0.0, 10.0), budget=3)
+        self.assertEqual(level, 1)
+
+    def test_path_arrays_break_at_gaps(self) -> None:
+        x, y, connect = line_arrays(np.asarray(self.cycles, float), self.values[[3]])
+        np.testing.assert_array_equal(x, [1, 2, 4, 5])
+        np.testing.assert_array_equal(connect, [True, False, True, False])
+
+        lo = self.values[[1]]
+        x, y, connect = band_arrays(np.asarray(self.cycles, float), lo, lo + 1.0)
+        self.assertEqual(len(x), 10)
+        self.assertEqual(connect.sum(), 9)
+
+    def test_empty_curves_are_skipped(self) -> None:
+        pyramid = build_pyramid(self.cycles, np.full((2, 5), np.nan), ["A01", "A02"])
+        self.assertEqual(pyramid.curve_count, 0)
+        level, nodes = pyramid.pick((0.0, 1.0), budget=5)
+        self.assertEqual(len(nodes), 0)
+
+
+
+class ComparePlatesRendererTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = _app()
+        wells = sorted(well_mapping.all_well_ids())
+        cycles = np.arange(1, 11, dtype=np.float32)
+        amplitudes = np.arange(1, len(wells) + 1, dtype=np.float32)
+        self.active = {w: PCRCoords(cycles, cycles * a, cycles * a) for w, a in zip(wells, amplitudes)}
+        values = (amplitudes[:, None, None] * cycles[None, None, :]).repeat(2, axis=1)
+        index = WellIndex.build(pd.DataFrame({"Kuyu No": wells}))
+        self.store = CurveStore(version=0, cycles=cycles, values=values, wells=index)
+
+    def _set_range(self, renderer: PCRGraphRendererPG, y_range: tuple) -> None:
+        renderer._view_box.setRange(xRange=(0.0, 11.0), yRange=y_range, padding=0.0)
+        renderer._flush_pending_ticks()
+
+    def test_compare_items_follow_view_range(self) -> None:
+        # Plaka/kanal başına 10 eğri bütçesi: tüm plaka zarf, dar görünüm tam eğri
+        renderer = PCRGraphRendererPG(style=replace(PCRGraphStyle(), compare_curve_budget=20), batched=True)
+        self.addCleanup(renderer.deleteLater)
+        renderer.resize(400, 300)
+        renderer.render_wells(self.active, cache_token=1, shown=[])
+        renderer.set_compare_plates({"P2": self.store})
+
+        (plate,) = renderer._compare_plates
+        scene = renderer._plot_item.scene()
+        self.assertTrue(all(item.scene() is scene for item in plate.items()))
+
+        self._set_range(renderer, (0.0, 1000.0))
+        coarse = plate.drawn["fam"][0]
+        self.assertGreater(coarse, 0)
+        self.assertFalse(plate.bands["fam"].path().isEmpty())
+
+        # Yalnızca en yüksek iki eğrinin geçtiği dar Y penceresi
+        self._set_range(renderer, (950.0, 965.0))
+        self.assertEqual(plate.drawn["fam"][0], 0)
+        self.assertTrue(plate.bands["fam"].path().isEmpty())
+        self.assertFalse(plate.lines["fam"].path().isEmpty())
+
+        renderer.clear_compare_plates()
+        self.assertTrue(all(item.scene() is None for item in plate.items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
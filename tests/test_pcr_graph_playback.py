@@ -0,0 +1,70 @@
+# tests\test_pcr_graph_playback.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+from PyQt5 import QtWidgets
+
+from app.services.graph.pcr_graph_layout_service import PCRGraphLayoutService
+from app.services.pcr_data_service import PCRCoords
+from app.utils import well_mapping
+from app.views.plotting.pcr_graph_pg.renderer import PCRGraphRendererPG
+
+
+def _app() -> QtWidgets.QApplication:
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(["test", "-platform", "offscreen"])
+
+
+class PlaybackVisibilityTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = _app()
+        self.wells = sorted(well_mapping.all_well_ids())
+        cycles = np.arange(1, 11, dtype=np.float32)
+        self.values = np.stack([np.stack([cycles * (i + 1), cycles * (i + 2)]) for i in range(len(self.wells))])
+        self.data = {w: PCRCoords(cycles, self.values[i, 0], self.values[i, 1]) for i, w in enumerate(self.wells)}
+        self.frames = PCRGraphLayoutService.build_playback(cycles, self.values, start_x=1.0)
+
+    def _renderer(self, batched: bool) -> PCRGraphRendererPG:
+        renderer = PCRGraphRendererPG(batched=batched)
+        self.addCleanup(renderer.deleteLater)
+        renderer.render_wells(self.data, cache_token=1)
+        # Oynatma testte zamana göre bitmesin
+        renderer.start_playback(self.frames, cycles_per_second=1e-6)
+        return renderer
+
+    @staticmethod
+    def _visible(items) -> set:
+        return {key for key, item in items.items() if item.isVisible()}
+
+    def test_per_well_items_stay_hidden_and_restore_from_state(self) -> None:
+        renderer = self._renderer(batched=False)
+        self.assertEqual(self._visible(renderer._fam_items), set())
+
+        # Oynatma sırasında kanal ve seçim değişiklikleri eğrileri geri açmaz
+        renderer.set_channel_visibility(fam_visible=False)
+        renderer.set_channel_visibility(fam_visible=True)
+        renderer.show_wells(self.wells[:5])
+        renderer.set_channel_visibility(fam_visible=False)
+        self.assertEqual(self._visible(renderer._fam_items) | self._visible(renderer._hex_items), set())
+
+        # Durdurunca görünürlük güncel durumdan hesaplanır
+        renderer.stop_playback()
+        self.assertEqual(self._visible(renderer._fam_items), set())
+        self.assertEqual(self._visible(renderer._hex_items), set(self.wells[:5]))
+
+    def test_batched_items_stay_hidden_during_playback(self) -> None:
+        renderer = self._renderer(batched=True)
+        renderer.set_channel_visibility(hex_visible=False)
+        renderer.set_channel_visibility(hex_visible=True)
+        batch_items = [item for batch in renderer._batches.values() for item in batch.items.values()]
+        self.assertFalse(any(item.isVisible() for item in batch_items))
+
+        renderer.set_channel_visibility(hex_visible=False)
+        renderer.stop_playback()
+        self.assertTrue(all(item.isVisible() for item in renderer._batches["fam"].items.values()))
+        self.assertFalse(any(item.isVisible() for item in renderer._batches["hex"].items.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests\test_regression_renderer.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtWidgets
+
+from app.services.regression_plot_service import RegressionLine, RegressionPlotData, SafeBand, ScatterSeries
+from app.views.plotting.pyqtgraph_regression_renderer import PyqtgraphRegressionRenderer
+from app.views.plotting.regression.styles import RegressionPlotStyle
+
+
+# render çıktısı: bant (üst, alt, dolgu), regresyon çizgisi, seri başına base/selected/hover
+SERIES_START = 4
+
+
+def _app() -> QtWidgets.QApplication:
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(["test", "-platform", "offscreen"])
+
+
+def _data(shift: float = 0.0, *, carriers: bool = True) -> RegressionPlotData:
+    series = [ScatterSeries("Sağlıklı", np.array([0.2, 0.5, 0.7]), np.array([0.3, 0.6, 0.8]) + shift, np.array(["A01", "A02", "A03"]))]
+    if carriers:
+        series.append(ScatterSeries("Taşıyıcı", np.array([0.4]), np.array([0.1]), np.array(["B01"])))
+    return RegressionPlotData(
+        safe_band=SafeBand(np.array([0.0, 1.0]), np.array([0.2, 1.2]), np.array([0.0, 0.8])),
+        reg_line=RegressionLine(np.array([0.0, 1.0]), np.array([0.1, 1.0 + shift])),
+        series=series,
+    )
+
+
+class RegressionRendererTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = _app()
+        self.widget = pg.PlotWidget()
+        self.plot_item = self.widget.getPlotItem()
+        self.plot_item.addLegend()
+        self.hover_text = pg.TextItem()
+        self.renderer = PyqtgraphRegressionRenderer(style=RegressionPlotStyle())
+
+    def tearDown(self) -> None:
+        self.renderer.detach_hover()
+        self.widget.deleteLater()
+
+    def test_render_updates_items_in_place(self) -> None:
+        first = self.renderer.render(self.plot_item, _data(), hover_text_item=self.hover_text)
+        second = self.renderer.render(self.plot_item, _data(0.05), hover_text_item=self.hover_text)
+        self.assertEqual([id(i) for i in first], [id(i) for i in second])
+        self.assertEqual(len(self.plot_item.legend.items), 3)  # çizgi + iki seri
+
+        base = second[SERIES_START]
+        np.testing.assert_allclose(base.getData()[1], [0.35, 0.65, 0.85])
+
+        # Seri kaybolursa item'ları sahneden ve legend'dan çıkar
+        third = self.renderer.render(self.plot_item, _data(carriers=False), hover_text_item=self.hover_text)
+        self.assertEqual(len(third), len(second) - 3)
+        self.assertTrue(all(item.scene() is None for item in second[-3:]))
+        self.assertEqual(len(self.plot_item.legend.items), 2)
+
+    def test_selection_and_hover_overlays(self) -> None:
+        items = self.renderer.render(self.plot_item, _data(), hover_text_item=self.hover_text)
+        healthy_selected, healthy_hover = items[SERIES_START + 1], items[SERIES_START + 2]
+        carrier_hover = items[SERIES_START + 5]
+
+        self.renderer.update_selection({"A03", "A01", "Z99"})
+        np.testing.assert_allclose(healthy_selected.getData()[0], [0.2, 0.7])
+
+        pen = healthy_hover.opts["pen"]
+        self.renderer.update_hover("A02")
+        self.assertTrue(healthy_hover.isVisible())
+        self.assertEqual((healthy_hover.pos().x(), healthy_hover.pos().y()), (0.5, 0.6))
+        self.assertIs(healthy_hover.opts["pen"], pen)  # pen/brush yeniden üretilmez
+
+        self.renderer.update_hover("B01")
+        self.assertFalse(healthy_hover.isVisible())
+        self.assertTrue(carrier_hover.isVisible())
+        self.renderer.update_hover(None)
+        self.assertFalse(carrier_hover.isVisible())
+
+        self.renderer.update_selection(set())
+        self.assertEqual(len(healthy_selected.getData()[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
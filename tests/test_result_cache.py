@@ -0,0 +1,89 @@
+# tests\test_result_cache.py
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from app.services.result_cache import ResultCache
+from app.services.session_store import SessionStore
+
+
+def _frame(seed: int, n: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Kuyu No": [f"W{i}" for i in range(n)],
+            "Nihai Sonuç": ["Sağlıklı"] * n,
+            "İstatistik Oranı": rng.random(n),
+        }
+    )
+
+
+class ResultCacheTests(unittest.TestCase):
+    def test_key_depends_on_input_config_and_version(self) -> None:
+        df = _frame(1)
+        config = {"carrier_range": 0.5999, "uncertain_range": 0.6199}
+        key = ResultCache.key_for(df, config, "1")
+
+        self.assertEqual(key, ResultCache.key_for(df.copy(), dict(config), "1"))
+        self.assertNotEqual(key, ResultCache.key_for(df, {**config, "carrier_range": 0.5}, "1"))
+        self.assertNotEqual(key, ResultCache.key_for(df, config, "2"))
+        changed = df.copy()
+        changed.loc[3, "İstatistik Oranı"] = 0.0
+        self.assertNotEqual(key, ResultCache.key_for(changed, config, "1"))
+
+    def test_session_input_key_is_stable_across_results(self) -> None:
+        raw = _frame(1).drop(columns=["Nihai Sonuç"])
+        store = SessionStore()
+        session = store.add("r", raw)
+        input_key = session.input_key
+
+        # Analiz sonucu ve manuel düzenleme oturum frame'ini değiştirir; girdi özeti değişmez
+        result = _frame(1)
+        result.loc[0, "Nihai Sonuç"] = "Taşıyıcı"
+        store.capture("r", result, result_key="k")
+        self.assertEqual(store.get("r").input_key, input_key)
+        self.assertEqual(input_key, ResultCache.input_digest(raw))
+        self.assertNotEqual(input_key, ResultCache.input_digest(result))
+
+    def test_entries_are_not_pickled(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            cache = ResultCache(root)
+            cache.put("a", _frame(1))
+            with zipfile.ZipFile(os.path.join(root, "a.pzresult")) as zf:
+                for name in zf.namelist():
+                    if name.endswith(".npy"):
+                        with zf.open(name) as f:
+                            np.lib.format.read_array(f, allow_pickle=False)
+
+    def test_bounded_size_and_separate_overrides(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            cache = ResultCache(root)
+            cache.put("a", _frame(1), reference_ok=False)
+            hit = cache.get("a")
+            pd.testing.assert_frame_equal(hit.df, _frame(1))
+            self.assertFalse(hit.reference_ok)
+
+            entry_size = cache.size_bytes()
+            cache.max_bytes = int(entry_size * 2.5)
+            os.utime(os.path.join(root, "a.pzresult"), (1, 1))
+            cache.put("b", _frame(2))
+            cache.put("c", _frame(3))
+            self.assertNotIn("a", cache)  # en eski kullanılan tahliye edildi
+            self.assertIn("c", cache)
+            self.assertLessEqual(cache.size_bytes(), cache.max_bytes)
+
+            cache.set_override("c", "a01", "Yeni Numune")
+            self.assertEqual(cache.overrides("c"), {"A01": "Yeni Numune"})
+            self.assertEqual(cache.get("c").df["Nihai Sonuç"].iloc[0], "Sağlıklı")
+            cache.set_override("c", "A01", None)
+            self.assertEqual(cache.overrides("c"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# tests\test_result_schema.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.data_store import DataStore
+from app.services.result_schema import compact_result_frame, has_coordinates
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Kuyu No": ["A01", "B01", "C01"],
+            "Hasta No": [1, 2, 3],
+            "Uyarı": [None, "Boş Kuyu", "Özel Uyarı"],
+            "Regresyon": ["Güvenli Bölge", "-", "Riskli Alan"],
+            "Nihai Sonuç": ["Sağlıklı", "", "Taşıyıcı"],
+            "İstatistik Oranı": [0.9, np.nan, 0.55],
+            "FAM koordinat list": ["[(1, 1.0)]"] * 3,
+            "HEX koordinat list": ["[(1, 2.0)]"] * 3,
+        }
+    )
+
+
+class ResultSchemaTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        DataStore.clear(notify=False)
+
+    def test_compact_preserves_comparisons(self) -> None:
+        df = _frame()
+        lean = compact_result_frame(df, drop_coordinates=True)
+
+        self.assertIsInstance(lean["Regresyon"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(lean["Kuyu No"].dtype, pd.CategoricalDtype)
+        self.assertEqual(lean["İstatistik Oranı"].dtype, np.float32)
+        self.assertEqual(lean["Hasta No"].dtype, np.int16)
+        self.assertFalse(has_coordinates(lean))
+        self.assertTrue(has_coordinates(df))
+
+        for col, label in (("Regresyon", "Güvenli Bölge"), ("Uyarı", "Özel Uyarı"), ("Nihai Sonuç", "")):
+            np.testing.assert_array_equal((lean[col] == label).to_numpy(), (df[col] == label).to_numpy())
+        np.testing.assert_array_equal(lean["Uyarı"].isnull().to_numpy(), df["Uyarı"].isnull().to_numpy())
+
+    def test_set_cell_adds_missing_category(self) -> None:
+        DataStore.set_df(compact_result_frame(_frame()), notify=False)
+        DataStore.set_cell(0, "Nihai Sonuç", "Elle Girilen")
+        self.assertEqual(DataStore.get_df()["Nihai Sonuç"].iloc[0], "Elle Girilen")
+
+
+if __name__ == "__main__":
+    unittest.main()
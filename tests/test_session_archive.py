@@ -0,0 +1,78 @@
+# tests\test_session_archive.py
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.curve_store import CurveStore
+from app.services.session_archive import ArchivedPlate, SessionArchive, SessionArchiveData
+from app.services.well_index import WellIndex
+
+
+def _plate() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Kuyu No": ["A01", "B01", "C01"],
+            "Hasta No": np.array([1, 2, 3], dtype=np.int64),
+            "Uyarı": [None, "Boş kuyu", None],
+            "FAM Ct": np.array([21.5, np.nan, 23.0], dtype=np.float32),
+            "Nihai Sonuç": pd.Categorical(["Sağlıklı", "Tekrar", "Taşıyıcı"]),
+            "FAM koordinat list": ["[(1, 2.0)]", "[(1, 3.0)]", "[(1, 4.0)]"],
+        }
+    )
+
+
+class SessionArchiveTests(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        df = _plate()
+        values = np.arange(3 * 2 * 4, dtype=np.float32).reshape(3, 2, 4)
+        curves = CurveStore(version=7, cycles=np.arange(1, 5), values=values, wells=WellIndex.build(df))
+        data = SessionArchiveData(
+            plates=(
+                ArchivedPlate(
+                    run_id="r1",
+                    rdml_path="x.rdml",
+                    file_name="x",
+                    df=df,
+                    curves=curves,
+                    result_key="k",
+                    analyzed=True,
+                    overrides={"B01": "Yeni Numune"},
+                ),
+            ),
+            active_id="r1",
+            config={"carrier_range": 0.5999},
+            selection=("A01", "C01"),
+        )
+
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "s.pzsession")
+            SessionArchive.save(path, data)
+            loaded = SessionArchive.load(path)
+
+        plate = loaded.plates[0]
+        expected = df.drop(columns=["FAM koordinat list"])
+        pd.testing.assert_frame_equal(plate.df, expected)
+        self.assertEqual(plate.overrides, {"B01": "Yeni Numune"})
+        self.assertTrue(plate.analyzed)
+        np.testing.assert_array_equal(plate.curves.values, values)
+        self.assertEqual(plate.curves.wells.row_of_well("C01"), 2)
+        self.assertEqual(loaded.active_id, "r1")
+        self.assertEqual(loaded.selection, ("A01", "C01"))
+        self.assertEqual(loaded.config, {"carrier_range": 0.5999})
+
+    def test_invalid_file_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "bad.pzsession")
+            with open(path, "wb") as f:
+                f.write(b"not a zip")
+            with self.assertRaises(ValueError):
+                SessionArchive.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# tests\test_session_store.py
+from __future__ import annotations
+
+import tempfile
+import unittest
+
+import pandas as pd
+
+from app.services.curve_archive import CurveArchive
+from app.services.curve_store import CurveStore
+from app.services.result_schema import has_coordinates
+from app.services.session_store import SessionStore
+
+
+def _frame(n: int = 4) -> pd.DataFrame:
+    coords = "[(1, 10.0), (2, 20.0), (3, 30.0)]"
+    return pd.DataFrame(
+        {
+            "Kuyu No": [f"A{i + 1}" for i in range(n)],
+            "FAM koordinat list": [coords] * n,
+            "HEX koordinat list": [coords] * n,
+        }
+    )
+
+
+class SessionStoreTests(unittest.TestCase):
+    def test_inactive_curves_evicted_lru_within_budget(self) -> None:
+        df = _frame()
+        curves = CurveStore.from_frame(df, version=1)
+        store = SessionStore(curve_budget_bytes=curves.nbytes * 2)
+
+        for run_id in ("a", "b", "c"):
+            store.add(run_id, df)
+            store.capture(run_id, df, curves=curves)
+
+        # "a" en eski: boşaltılır; aktif "c" ve "b" bütçeye sığar
+        self.assertIsNone(store.get("a").curves)
+        self.assertIsNotNone(store.get("b").curves)
+        self.assertIsNotNone(store.get("c").curves)
+        self.assertLessEqual(store.curve_bytes(), store.curve_budget_bytes)
+
+        # Hafif sonuçlar bellekte kalır, aktif plaka asla boşaltılmaz
+        store.capture("c", df, curves=curves)
+        session = store.activate("a")
+        self.assertIs(session.df, df)
+        self.assertEqual(store.active_id, "a")
+
+        tight = SessionStore(curve_budget_bytes=0)
+        tight.add("x", df)
+        tight.capture("x", df, curves=curves)
+        self.assertIsNotNone(tight.get("x").curves)
+
+    def test_coordinate_strings_dropped_when_curves_can_spill(self) -> None:
+        df = _frame()
+        curves = CurveStore.from_frame(df, version=1)
+        with tempfile.TemporaryDirectory() as root:
+            store = SessionStore(curve_budget_bytes=0, archive=CurveArchive(root))
+            for run_id in ("a", "b"):
+                store.add(run_id, df)
+                store.capture(run_id, df, curves=curves)
+
+            # Eğriler tutulduğu için stringler normal modda da atılır; "a" arşive taşınır
+            self.assertFalse(has_coordinates(store.get("a").df))
+            self.assertTrue(store.get("a").curves.is_mapped)
+            self.assertEqual(store.curve_bytes(), curves.resident_nbytes)
+            self.assertTrue(has_coordinates(df))
+            del store
+
+    def test_curves_for_rebuilds_evicted_curves(self) -> None:
+        df = _frame()
+        curves = CurveStore.from_frame(df, version=1)
+        store = SessionStore(curve_budget_bytes=0)
+        for run_id in ("a", "b"):
+            store.add(run_id, df)
+            store.capture(run_id, df, curves=curves)
+
+        # "a" boşaltıldı: karşılaştırma için koordinatlardan kurulur, bütçeye girmez
+        self.assertIsNone(store.get("a").curves)
+        rebuilt = store.curves_for("a")
+        self.assertEqual(rebuilt.values.tolist(), curves.values.tolist())
+        self.assertIsNone(store.get("a").curves)
+        self.assertIs(store.curves_for("b"), curves)
+        self.assertIsNone(store.curves_for("missing"))
+
+    def test_run_id_normalizes_path(self) -> None:
+        self.assertEqual(SessionStore.run_id_for("a/../plate.rdml"), SessionStore.run_id_for("plate.rdml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
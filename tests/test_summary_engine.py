@@ -0,0 +1,43 @@
+# tests\test_summary_engine.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.summary_engine import SummaryEngine
+
+
+class SummaryEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(3)
+        n = 96
+        self.df = pd.DataFrame(
+            {
+                "Uyarı": [None] * (n - 4) + ["Boş Kuyu"] * 4,
+                "Regresyon": rng.choice(["Güvenli Bölge", "Riskli Alan"], size=n, p=[0.8, 0.2]),
+                "İstatistik Oranı": rng.uniform(0.0, 1.4, n),
+                "Standart Oranı": rng.uniform(0.0, 1.4, n),
+            }
+        )
+        self.df.loc[self.df.index[-4:], ["İstatistik Oranı", "Standart Oranı"]] = np.nan
+
+    def test_counts_and_stats_match_direct_computation(self) -> None:
+        engine = SummaryEngine.from_df(self.df)
+        for carrier, uncertain in ((0.5999, 0.6199), (0.3, 0.9), (0.05, 0.08)):
+            s = engine.summary(carrier, uncertain, use_without_reference=True)
+            r = self.df["İstatistik Oranı"]
+            self.assertEqual(s.healthy_count, f": {int((r > uncertain).sum())}")
+            self.assertEqual(s.carrier_count, f": {int(((r > 0.1) & (r <= carrier)).sum())}")
+            self.assertEqual(s.uncertain_count, f": {int(((r > carrier) & (r <= uncertain)).sum())}")
+
+            window = r[(self.df["Regresyon"] == "Güvenli Bölge") & r.between(0.70, 1.3)]
+            self.assertEqual(s.healthy_avg, f": {window.mean():.3f}")
+            self.assertEqual(s.std, f": {window.std(ddof=0):.3f}")
+
+        self.assertEqual(s.analyzed_well_count, ": 92")
+
+
+if __name__ == "__main__":
+    unittest.main()
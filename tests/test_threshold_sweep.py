@@ -0,0 +1,43 @@
+# tests\test_threshold_sweep.py
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from app.services.threshold_sweep import CLASS_LABELS, ThresholdSweepService, classify_ratios
+
+
+class ThresholdSweepTests(unittest.TestCase):
+    def test_sweep_matches_direct_classification(self) -> None:
+        rng = np.random.default_rng(7)
+        ratios = np.concatenate([rng.uniform(0.0, 1.4, 200), [0.1, 0.5, 0.6, np.nan]])
+        c_vals = np.linspace(0.05, 0.75, 15)
+        u_vals = np.linspace(0.08, 0.9, 17)
+        baseline = (0.5999, 0.6199)
+
+        result = ThresholdSweepService.sweep(ratios, c_vals, u_vals, baseline=baseline)
+        finite = ratios[np.isfinite(ratios)]
+        base_codes = classify_ratios(finite, *baseline)
+        expected_well_flips = np.zeros(finite.size, dtype=int)
+
+        for i, c in enumerate(c_vals):
+            for j, u in enumerate(u_vals):
+                if c >= u:
+                    self.assertFalse(result.valid[i, j])
+                    continue
+                codes = classify_ratios(finite, c, u)
+                counts = np.bincount(codes, minlength=len(CLASS_LABELS))
+                np.testing.assert_array_equal(result.counts[i, j], counts)
+                self.assertEqual(result.flip_counts[i, j], int((codes != base_codes).sum()))
+                expected_well_flips += codes != base_codes
+
+        np.testing.assert_array_equal(result.well_flip_counts, expected_well_flips)
+
+    def test_invalid_baseline_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            ThresholdSweepService.sweep([0.5], [0.4], [0.6], baseline=(0.7, 0.6))
+
+
+if __name__ == "__main__":
+    unittest.main()